@@ -0,0 +1,65 @@
+import time
+import pygad
+import numpy
+
+"""
+Solves random instances of the travelling salesman problem (TSP) using 2 approaches:
+    1) The permutation encoding (gene_encoding="permutation") with the permutation crossovers ("ox", "pmx", "cycle", and "edge").
+    2) Integer genes with allow_duplicate_genes=False where the duplicate genes are repaired after the crossover and mutation.
+For each approach, it prints the time per generation, the length of the best tour, and the number of solutions in the last population that are not valid tours.
+"""
+
+num_generations = 20
+sol_per_pop = 50
+num_parents_mating = 20
+
+def create_cities(num_cities, seed=1):
+    rng = numpy.random.default_rng(seed)
+    return rng.random(size=(num_cities, 2))
+
+def tour_length(cities, tour):
+    tour = numpy.asarray(tour, dtype=int)
+    return numpy.sum(numpy.linalg.norm(cities[tour] - cities[numpy.roll(tour, -1)], axis=1))
+
+def benchmark(cities, **kwargs):
+    def fitness_func(ga_instance, solutions, solutions_indices):
+        solutions = numpy.asarray(solutions, dtype=int)
+        lengths = numpy.sum(numpy.linalg.norm(cities[solutions] - cities[numpy.roll(solutions, -1, axis=1)], axis=2), axis=1)
+        # Penalize the repeated cities.
+        num_missing = len(cities) - numpy.array([len(numpy.unique(solution)) for solution in solutions])
+        return -lengths - num_missing * len(cities)
+
+    ga_instance = pygad.GA(num_generations=num_generations,
+                           num_parents_mating=num_parents_mating,
+                           sol_per_pop=sol_per_pop,
+                           num_genes=len(cities),
+                           fitness_func=fitness_func,
+                           fitness_batch_size="population",
+                           gene_type=int,
+                           mutation_type="swap",
+                           suppress_warnings=True,
+                           random_seed=1,
+                           **kwargs)
+    start_time = time.perf_counter()
+    ga_instance.run()
+    time_per_generation = (time.perf_counter() - start_time) / num_generations
+
+    solution, _, _ = ga_instance.best_solution(pop_fitness=ga_instance.last_generation_fitness)
+    num_invalid = sum([len(numpy.unique(solution)) != len(cities) for solution in ga_instance.population])
+    return time_per_generation, tour_length(cities, solution), num_invalid
+
+if __name__ == '__main__':
+    for num_cities in [100, 300, 1000]:
+        cities = create_cities(num_cities)
+        print(f"Number of cities: {num_cities}")
+        for crossover_type in pygad.GA.supported_permutation_crossover_types:
+            time_per_generation, length, num_invalid = benchmark(cities,
+                                                                 gene_encoding="permutation",
+                                                                 crossover_type=crossover_type)
+            print(f"    permutation {crossover_type:<5} : {time_per_generation * 1000:9.1f} ms/generation, best tour length {length:8.2f}, invalid tours {num_invalid}")
+        # The duplicate genes are repaired for all offspring at once after the crossover and mutation.
+        time_per_generation, length, num_invalid = benchmark(cities,
+                                                             gene_space=range(num_cities),
+                                                             allow_duplicate_genes=False,
+                                                             crossover_type="two_points")
+        print(f"    duplicate genes repair  : {time_per_generation * 1000:9.1f} ms/generation, best tour length {length:8.2f}, invalid tours {num_invalid}")
@@ -1,4 +1,10 @@
 from pygad.helper import unique
 from pygad.helper import misc
+from pygad.helper import fitness_cache
+from pygad.helper import parallel
+from pygad.helper import island
+from pygad.helper import perf
+from pygad.helper import gene_space
+from pygad.helper import pareto_archive
 
 __version__ = "1.2.0"
\ No newline at end of file
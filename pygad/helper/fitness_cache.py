@@ -0,0 +1,142 @@
+"""
+The pygad.helper.fitness_cache module has a cache that maps the solutions to their fitness values.
+It is used by the cal_pop_fitness() method to reuse the fitness of the previously explored solutions instead of calling the fitness function again.
+"""
+
+import numpy
+import collections
+
+class FitnessCache:
+
+    def __init__(self, max_entries=None):
+        """
+        Creates a cache mapping the solutions to their fitness values.
+
+        Parameters:
+            max_entries (int, optional): The maximum number of solutions to keep in the cache. If None, the cache grows without limit. Otherwise, the least recently used solutions are evicted once the cache is full.
+        """
+
+        self.max_entries = max_entries
+        # The key is the canonical byte encoding of the solution and the value is its fitness.
+        self.entries = collections.OrderedDict()
+
+        # The number of lookups that found the solution in the cache.
+        self.hits = 0
+        # The number of lookups that did not find the solution in the cache.
+        self.misses = 0
+        # The number of solutions removed from the cache because it is full.
+        self.evictions = 0
+
+    @staticmethod
+    def key(solution):
+        """
+        Returns the canonical byte encoding of a solution to be used as the key in the cache.
+        Solutions with equal gene values have the same key regardless of their data type (e.g. 1 and 1.0).
+
+        Parameters:
+            solution (array-like): The solution to encode.
+
+        Returns:
+            bytes: The key of the solution.
+        """
+
+        try:
+            # Adding 0.0 maps -0.0 to 0.0 so that both have the same key.
+            return (numpy.asarray(solution, dtype=numpy.float64) + 0.0).tobytes()
+        except (TypeError, ValueError):
+            # At least one gene is not numeric.
+            return repr(list(solution)).encode()
+
+    @staticmethod
+    def keys(solutions):
+        """
+        Returns the keys of multiple solutions. It is faster than calling the key() method for each solution as the data type of all solutions is converted at once.
+
+        Parameters:
+            solutions (array-like): A 2D array of the solutions to encode.
+
+        Returns:
+            list: The key of each solution.
+        """
+
+        try:
+            solutions = numpy.asarray(solutions, dtype=numpy.float64) + 0.0
+        except (TypeError, ValueError):
+            return [FitnessCache.key(solution) for solution in solutions]
+        return [solution.tobytes() for solution in solutions]
+
+    def get(self, solution):
+        """
+        Returns the fitness of a solution if it exists in the cache. Otherwise, None is returned.
+
+        Parameters:
+            solution (array-like): The solution to look for.
+
+        Returns:
+            The fitness of the solution or None if the solution does not exist in the cache.
+        """
+
+        return self.lookup(self.key(solution))
+
+    def lookup(self, key):
+        """
+        Returns the fitness of the solution with the given key if it exists in the cache. Otherwise, None is returned.
+
+        Parameters:
+            key (bytes): The key of the solution as returned by the key() method.
+
+        Returns:
+            The fitness of the solution or None if the solution does not exist in the cache.
+        """
+
+        fitness = self.entries.get(key)
+        if fitness is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            # Mark the solution as the most recently used one.
+            self.entries.move_to_end(key)
+        return fitness
+
+    def put(self, solution, fitness):
+        """
+        Saves the fitness of a solution in the cache. If the cache is full, the least recently used solution is evicted.
+
+        Parameters:
+            solution (array-like): The solution.
+            fitness: The fitness of the solution.
+        """
+
+        self.store(self.key(solution), fitness)
+
+    def store(self, key, fitness):
+        """
+        Saves the fitness of the solution with the given key in the cache. If the cache is full, the least recently used solution is evicted.
+
+        Parameters:
+            key (bytes): The key of the solution as returned by the key() method.
+            fitness: The fitness of the solution.
+        """
+
+        self.entries[key] = fitness
+        self.entries.move_to_end(key)
+        if not (self.max_entries is None):
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """
+        Removes all the solutions from the cache and resets the counters.
+        """
+
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __contains__(self, solution):
+        return self.key(solution) in self.entries
+
+    def __len__(self):
+        return len(self.entries)
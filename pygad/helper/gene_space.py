@@ -0,0 +1,239 @@
+"""
+The pygad.helper.gene_space module has helper methods to compile the gene_space parameter into lookup tables and sample gene values from them in a vectorized way.
+The tables are built once by the constructor. They are used to create the initial population and to apply the mutation by space when duplicate genes are allowed (allow_duplicate_genes=True).
+"""
+
+import collections
+import numpy
+
+# The kinds of the gene spaces in the 'kinds' array of the GeneSpaceTable.
+# A list/tuple/range/numpy.ndarray of values or a single number. The current gene value is excluded while mutating.
+GENE_SPACE_VALUES = 0
+# A dict with the 'low', 'high', and 'step' keys. It is saved as the arguments of numpy.arange() without creating the values.
+GENE_SPACE_STEP = 1
+# A dict with only the 'low' and 'high' keys.
+GENE_SPACE_UNIFORM = 2
+# None: The value is selected randomly from the initial population range or the mutation range.
+GENE_SPACE_NONE = 3
+
+# The compiled gene space. All arrays are read-only.
+#   kinds: The kind of the space of each gene.
+#   values: The discrete values of all genes of kind GENE_SPACE_VALUES concatenated. The values of each gene are unique, sorted, rounded, and have the gene data type (saved as float64). A None value in a global gene space is saved as NaN after all other values. They are used to look up the values while mutating and solving the duplicate genes.
+#   offsets: The index of the first value of each gene in the 'values' array.
+#   lengths: The number of values of each gene. For the genes of kind GENE_SPACE_STEP, it is the length of the numpy.arange() output.
+#   raw_values: The discrete values of all genes of kind GENE_SPACE_VALUES concatenated as passed to the 'gene_space' parameter (rounded and have the gene data type) without removing the repeated values. A None value in a global gene space is saved as NaN at its position. They are used to create the initial population so that a repeated value (e.g. [0, 0, 0, 1]) is selected more often.
+#   raw_offsets: The index of the first value of each gene in the 'raw_values' array.
+#   raw_lengths: The number of values of each gene in the 'raw_values' array. For the other kinds, it equals the 'lengths' array.
+#   low: The 'low' key of the dict spaces.
+#   high: The 'high' key of the dict spaces.
+#   step: The 'step' key of the dict spaces with a step.
+GeneSpaceTable = collections.namedtuple("GeneSpaceTable",
+                                        ["kinds", "values", "offsets", "lengths", "low", "high", "step", "raw_values", "raw_offsets", "raw_lengths"])
+
+class GeneSpace:
+
+    def compile_gene_space(self):
+        """
+        Compiles the 'gene_space' attribute into a GeneSpaceTable. It is called by the constructor after the number of genes and their data types are known.
+
+        It returns a GeneSpaceTable or None if the 'gene_space' attribute is None.
+        """
+
+        if self.gene_space is None:
+            return None
+
+        kinds = numpy.zeros(self.num_genes, dtype=numpy.int8)
+        offsets = numpy.zeros(self.num_genes, dtype=numpy.int64)
+        lengths = numpy.zeros(self.num_genes, dtype=numpy.int64)
+        low = numpy.zeros(self.num_genes, dtype=float)
+        high = numpy.zeros(self.num_genes, dtype=float)
+        step = numpy.zeros(self.num_genes, dtype=float)
+        values = []
+        num_values = 0
+        raw_offsets = numpy.zeros(self.num_genes, dtype=numpy.int64)
+        raw_values = []
+        num_raw_values = 0
+
+        for gene_idx in range(self.num_genes):
+            if self.gene_space_nested:
+                space = self.gene_space[gene_idx]
+            else:
+                space = self.gene_space
+
+            if space is None:
+                kinds[gene_idx] = GENE_SPACE_NONE
+            elif type(space) is dict:
+                low[gene_idx] = space['low']
+                high[gene_idx] = space['high']
+                if 'step' in space.keys():
+                    kinds[gene_idx] = GENE_SPACE_STEP
+                    step[gene_idx] = space['step']
+                    lengths[gene_idx] = len(numpy.arange(start=space['low'],
+                                                         stop=space['high'],
+                                                         step=space['step']))
+                else:
+                    kinds[gene_idx] = GENE_SPACE_UNIFORM
+            else:
+                kinds[gene_idx] = GENE_SPACE_VALUES
+                if self.gene_space_nested:
+                    # The None values in a nested gene space are already replaced by random values in the 'gene_space_unpacked' attribute.
+                    gene_values = list(self.gene_space_unpacked[gene_idx])
+                else:
+                    # The None values in a global gene space are replaced by a new random value each time they are selected.
+                    gene_values = [numpy.nan if value is None else value for value in space]
+
+                dtype = self.get_gene_dtype(gene_index=gene_idx)
+                gene_values = numpy.array(gene_values, dtype=float)
+                none_values = numpy.isnan(gene_values)
+                if not dtype[1] is None:
+                    gene_values = numpy.round(gene_values, dtype[1])
+                gene_values[~none_values] = numpy.asarray(numpy.asarray(gene_values[~none_values], dtype=dtype[0]), dtype=float)
+
+                raw_values.append(gene_values)
+                raw_offsets[gene_idx] = num_raw_values
+                num_raw_values += len(gene_values)
+
+                gene_values = numpy.concatenate((numpy.unique(gene_values[~none_values]), gene_values[none_values]))
+
+                values.append(gene_values)
+                offsets[gene_idx] = num_values
+                lengths[gene_idx] = len(gene_values)
+                num_values += len(gene_values)
+
+        if len(values) > 0:
+            values = numpy.concatenate(values)
+            raw_values = numpy.concatenate(raw_values)
+        else:
+            values = numpy.zeros(0, dtype=float)
+            raw_values = numpy.zeros(0, dtype=float)
+
+        raw_lengths = lengths.copy()
+        raw_lengths[kinds == GENE_SPACE_VALUES] = numpy.diff(numpy.append(raw_offsets[kinds == GENE_SPACE_VALUES], num_raw_values))
+
+        gene_space_table = GeneSpaceTable(kinds=kinds,
+                                          values=values,
+                                          offsets=offsets,
+                                          lengths=lengths,
+                                          low=low,
+                                          high=high,
+                                          step=step,
+                                          raw_values=raw_values,
+                                          raw_offsets=raw_offsets,
+                                          raw_lengths=raw_lengths)
+        for array in gene_space_table:
+            array.setflags(write=False)
+        return gene_space_table
+
+    def gene_space_values(self,
+                          genes_indices,
+                          gene_type,
+                          gene_values=None):
+        """
+        Selects values from the gene space for some genes sharing the same data type at once. It is the vectorized version of the generate_gene_value_from_space() method for a single value.
+        The values are selected using the 'gene_space_table' attribute. For the initial population, the values of a discrete space are selected out of the values as passed to the 'gene_space' parameter so that a repeated value is selected more often. While mutating a gene with a discrete space, the value is selected out of the unique values and the current gene value is excluded by shifting the random index past the index of the current value. If the current value is the only value in the space, it is kept.
+        It accepts:
+            -genes_indices: A 1D array of the indices of the genes in their solutions.
+            -gene_type: The data type of the genes and its precision as a list of 2 elements.
+            -gene_values (optional): A 1D array of the values of the genes before mutation. If None, the values are selected for the initial population.
+        It returns a 1D array of the selected values.
+        """
+
+        table = self.gene_space_table
+        genes_indices = numpy.asarray(genes_indices, dtype=int)
+        num_values = len(genes_indices)
+        kinds = table.kinds[genes_indices]
+        if gene_values is None:
+            # The repeated values in a discrete space are kept for the initial population.
+            lengths = table.raw_lengths[genes_indices]
+        else:
+            lengths = table.lengths[genes_indices]
+
+        if gene_values is None:
+            # Use the initial population range.
+            range_min = numpy.asarray(self.init_range_low, dtype=float)
+            range_max = numpy.asarray(self.init_range_high, dtype=float)
+        else:
+            # Use the mutation range.
+            gene_values = numpy.asarray(gene_values, dtype=float)
+            range_min = numpy.asarray(self.random_mutation_min_val, dtype=float)
+            range_max = numpy.asarray(self.random_mutation_max_val, dtype=float)
+        range_min = numpy.broadcast_to(range_min, (self.num_genes,))[genes_indices]
+        range_max = numpy.broadcast_to(range_max, (self.num_genes,))[genes_indices]
+
+        # The index of the current gene value in its discrete space or -1 if it is not in the space.
+        current_indices = numpy.full(num_values, -1)
+        if not (gene_values is None):
+            values_indices = numpy.flatnonzero(kinds == GENE_SPACE_VALUES)
+            # Group the values by the gene index to search the space of each gene once.
+            values_indices = values_indices[numpy.argsort(genes_indices[values_indices], kind="stable")]
+            groups_starts = numpy.flatnonzero(numpy.diff(genes_indices[values_indices])) + 1
+            for group in numpy.split(values_indices, groups_starts):
+                if len(group) == 0:
+                    continue
+                gene_idx = genes_indices[group[0]]
+                space = table.values[table.offsets[gene_idx]:table.offsets[gene_idx] + table.lengths[gene_idx]]
+                positions = numpy.minimum(numpy.searchsorted(space, gene_values[group]), len(space) - 1)
+                found = space[positions] == gene_values[group]
+                current_indices[group[found]] = positions[found]
+
+        excluded = current_indices >= 0
+        num_choices = lengths - excluded
+        random_indices = numpy.floor(numpy.random.random(size=num_values) * num_choices).astype(int)
+        # Skip the index of the current gene value. If it is the only value, its index is kept.
+        random_indices[excluded & (num_choices > 0) & (random_indices >= current_indices)] += 1
+
+        new_values = numpy.empty(num_values, dtype=float)
+
+        mask = kinds == GENE_SPACE_VALUES
+        if gene_values is None:
+            space_values = table.raw_values[table.raw_offsets[genes_indices[mask]] + random_indices[mask]]
+        else:
+            space_values = table.values[table.offsets[genes_indices[mask]] + random_indices[mask]]
+        # A None value in the global gene space is replaced by a random value.
+        none_values = numpy.isnan(space_values)
+        space_values[none_values] = numpy.random.uniform(low=range_min[mask][none_values],
+                                                         high=range_max[mask][none_values])
+        new_values[mask] = space_values
+
+        mask = kinds == GENE_SPACE_STEP
+        new_values[mask] = table.low[genes_indices[mask]] + random_indices[mask] * table.step[genes_indices[mask]]
+
+        mask = kinds == GENE_SPACE_UNIFORM
+        new_values[mask] = numpy.random.uniform(low=table.low[genes_indices[mask]],
+                                                high=table.high[genes_indices[mask]])
+
+        mask = kinds == GENE_SPACE_NONE
+        new_values[mask] = numpy.random.uniform(low=range_min[mask],
+                                                high=range_max[mask])
+        if not (gene_values is None or self.mutation_by_replacement):
+            # The random value is added to the gene value.
+            new_values[mask] += gene_values[mask]
+
+        # Round the values before changing their data type to avoid precision loss for some data types like numpy.float32.
+        if not (gene_type[1] is None):
+            new_values = numpy.round(new_values, gene_type[1])
+
+        return numpy.asarray(new_values, dtype=gene_type[0])
+
+    def discrete_gene_space(self, gene_idx):
+        """
+        Returns the values of a gene with a discrete space (a list of values or a dict with the 'step' key) using the 'gene_space_table' attribute.
+        The values are unique, sorted, rounded, and have the gene data type (saved as float64). A None value in a global gene space is saved as NaN after all other values.
+        It accepts:
+            -gene_idx: The index of the gene.
+        It returns a 1D array of the values or None if the space of the gene is not discrete.
+        """
+
+        table = self.gene_space_table
+        if table is None:
+            return None
+        elif table.kinds[gene_idx] == GENE_SPACE_VALUES:
+            return table.values[table.offsets[gene_idx]:table.offsets[gene_idx] + table.lengths[gene_idx]]
+        elif table.kinds[gene_idx] == GENE_SPACE_STEP:
+            dtype = self.get_gene_dtype(gene_index=gene_idx)
+            space = table.low[gene_idx] + numpy.arange(table.lengths[gene_idx]) * table.step[gene_idx]
+            if not (dtype[1] is None):
+                space = numpy.round(space, dtype[1])
+            return numpy.unique(numpy.asarray(numpy.asarray(space, dtype=dtype[0]), dtype=float))
+        else:
+            return None
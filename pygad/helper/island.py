@@ -0,0 +1,91 @@
+"""
+The pygad.helper.island module has the functions that run inside the processes of the pygad.IslandGA class.
+Each process runs a full pygad.GA instance (an island). Every few generations, the island sends its best solutions (migrants) to the main process through a pipe and receives the migrants of other islands.
+Only the gene rows and their fitness values are sent through the pipes. The pygad.GA instances are never pickled.
+"""
+
+import traceback
+import cloudpickle
+import numpy
+
+def migrate(ga_instance, connection, num_migrants):
+    """
+    Sends the best solutions of an island to the main process and replaces the worst solutions of the island with the received migrants.
+
+    Parameters:
+        ga_instance (pygad.GA): The GA instance of the island.
+        connection (multiprocessing.connection.Connection): The pipe connecting the island to the main process.
+        num_migrants (int): The number of solutions sent to (and at most received from) the other islands.
+    """
+
+    if ga_instance.last_generation_fitness.dtype.kind in ["i", "u"]:
+        # The fitness of the migrants may not be integer.
+        ga_instance.last_generation_fitness = ga_instance.last_generation_fitness.astype(float)
+
+    # The indices of the solutions sorted from the best to the worst. It works with both single- and multi-objective optimization problems.
+    fitness_sorted = ga_instance.sort_solutions_nsga2(fitness=ga_instance.last_generation_fitness,
+                                                      find_best_solution=True)
+    migrants_indices = fitness_sorted[:num_migrants]
+    connection.send(("migrants",
+                     ga_instance.population[migrants_indices].copy(),
+                     numpy.array(ga_instance.last_generation_fitness[migrants_indices])))
+
+    _, migrants, migrants_fitness = connection.recv()
+    if len(migrants) == 0:
+        return
+
+    if len(migrants) > num_migrants:
+        # The island received migrants from multiple islands. Only the best ones are kept.
+        best_indices = ga_instance.sort_solutions_nsga2(fitness=migrants_fitness,
+                                                        find_best_solution=True)[:num_migrants]
+        migrants = migrants[best_indices]
+        migrants_fitness = migrants_fitness[best_indices]
+
+    # The migrants replace the worst solutions of the island.
+    replaced_indices = fitness_sorted[len(fitness_sorted) - len(migrants):]
+    ga_instance.population[replaced_indices] = migrants
+    ga_instance.last_generation_fitness[replaced_indices] = migrants_fitness
+
+def run_island(island_idx, ga_kwargs_bytes, connection, migration_interval, num_migrants):
+    """
+    Runs a single island inside a process. When the island completes, its results are sent to the main process.
+
+    Parameters:
+        island_idx (int): The index of the island. It is assigned to the 'island_idx' attribute of the GA instance.
+        ga_kwargs_bytes (bytes): The cloudpickled parameters of the pygad.GA class constructor.
+        connection (multiprocessing.connection.Connection): The pipe connecting the island to the main process.
+        migration_interval (int): The number of generations between migrations.
+        num_migrants (int): The number of solutions migrating from the island.
+    """
+
+    # pygad is imported here to avoid a circular import as the pygad module imports the helper package.
+    import pygad
+
+    try:
+        ga_kwargs = cloudpickle.loads(ga_kwargs_bytes)
+        user_on_generation = ga_kwargs.get("on_generation")
+
+        def on_generation(ga_instance):
+            if not (user_on_generation is None):
+                r = user_on_generation(ga_instance)
+                if type(r) is str and r.lower() == "stop":
+                    return r
+            # No migration after the last generation.
+            if ga_instance.generations_completed % migration_interval == 0 and ga_instance.generations_completed < ga_instance.num_generations:
+                migrate(ga_instance, connection, num_migrants)
+
+        ga_kwargs["on_generation"] = on_generation
+        ga_instance = pygad.GA(**ga_kwargs)
+        ga_instance.island_idx = island_idx
+        ga_instance.run()
+        ga_instance.close()
+
+        connection.send(("done",
+                         ga_instance.population,
+                         ga_instance.last_generation_fitness,
+                         numpy.array(ga_instance.best_solutions_fitness),
+                         ga_instance.generations_completed))
+    except Exception:
+        connection.send(("error", traceback.format_exc()))
+    finally:
+        connection.close()
@@ -201,6 +201,27 @@ class Helper:
             dtype = self.gene_type[gene_index]
         return dtype
 
+    def get_permutation_values(self):
+
+        """
+        Returns the values permuted by each solution when gene_encoding='permutation'. They are the sorted values of the 'gene_space' parameter or the gene indices if 'gene_space' is None.
+        The values are sorted to map a gene value to its rank using numpy.searchsorted().
+
+        It returns a 1D NumPy array of the values with the gene data type.
+        """
+
+        if self.gene_space is None:
+            permutation_values = numpy.arange(self.num_genes)
+        else:
+            permutation_values = numpy.sort(numpy.array(list(self.gene_space)))
+            if len(permutation_values) != self.num_genes:
+                self.valid_parameters = False
+                raise ValueError(f"When gene_encoding='permutation', the number of values in the 'gene_space' parameter ({len(permutation_values)}) must be equal to the number of genes ({self.num_genes}).")
+
+        if not (self.gene_type[1] is None):
+            permutation_values = numpy.round(permutation_values, self.gene_type[1])
+        return numpy.asarray(permutation_values, dtype=self.gene_type[0])
+
     def get_random_mutation_range(self, gene_index):
 
         """
@@ -0,0 +1,479 @@
+"""
+The pygad.helper.parallel module has helper methods to calculate the fitness using parallel processing.
+For process-based parallel processing, the processes do not receive the pygad.GA instance. Instead, they receive a slim read-only context that is sent only once when the processes start.
+"""
+
+import concurrent.futures
+import pickle
+import cloudpickle
+import weakref
+import numpy
+from multiprocessing import shared_memory
+
+# Names of the pygad.GA attributes that are not sent to the processes. They either change in each generation, may hold too much data, or cannot be pickled.
+EXCLUDED_WORKER_ATTRIBUTES = ["population",
+                              "initial_population",
+                              "solutions",
+                              "solutions_fitness",
+                              "best_solutions",
+                              "best_solutions_fitness",
+                              "last_generation_fitness",
+                              "last_generation_parents",
+                              "last_generation_parents_indices",
+                              "last_generation_offspring_crossover",
+                              "last_generation_offspring_mutation",
+                              "last_generation_elitism",
+                              "last_generation_elitism_indices",
+                              "previous_generation_fitness",
+                              "last_generation_offspring_known_fitness",
+                              "pareto_fronts",
+                              "nsga2_ranking_cache",
+                              "hypervolumes",
+                              "fitness_cache",
+                              "pareto_archive",
+                              "logger",
+                              "executor",
+                              "user_executor",
+                              "ipc_stats",
+                              "shared_memory_blocks",
+                              "shared_memory_finalizers",
+                              "perf_stats",
+                              "perf_stats_buffer",
+                              "perf_generation"]
+
+# The context of the current worker process. It is set only once by the init_worker() function when the process starts.
+worker_context = None
+
+# The shared memory blocks attached by the current worker process. The key is the role of the block (either "population" or "fitness").
+worker_shared_memory_blocks = {}
+
+class WorkerContext:
+
+    """
+    A slim read-only copy of the pygad.GA instance. It is passed to the fitness function (as its first argument) inside the processes.
+    """
+
+    def __init__(self, attributes):
+        self.__dict__.update(attributes)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"The attribute '{name}' cannot be set because the context passed to the fitness function inside the processes is read-only.")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"The attribute '{name}' cannot be deleted because the context passed to the fitness function inside the processes is read-only.")
+
+def init_worker(context_bytes):
+    """
+    Called only once when a worker process starts to unpickle the worker context.
+
+    Parameters:
+        context_bytes (bytes): The pickled WorkerContext.
+    """
+
+    global worker_context
+    worker_context = pickle.loads(context_bytes)
+
+def calculate_fitness(task_bytes, context_bytes=None):
+    """
+    Calculates the fitness of the solution(s) in a single task inside a worker process.
+
+    Parameters:
+        task_bytes (bytes): The pickled tuple (solution(s), index/indices).
+        context_bytes (bytes, optional): The pickled WorkerContext. It is only passed if the worker process was not initialized using the init_worker() function (e.g. an executor passed by the user).
+
+    Returns:
+        bytes: The pickled fitness value(s).
+    """
+
+    if context_bytes is None:
+        context = worker_context
+    else:
+        context = pickle.loads(context_bytes)
+    solution, solution_idx = pickle.loads(task_bytes)
+    fitness = context.fitness_func(context, solution, solution_idx)
+    return pickle.dumps(fitness, protocol=pickle.HIGHEST_PROTOCOL)
+
+def attach_shared_memory(role, name):
+    """
+    Attaches the current worker process to a shared memory block created by the main process. The block is attached only once and reused by the next tasks.
+    If the main process replaced the block of the same role (e.g. to make it larger), then the old block is closed.
+
+    Parameters:
+        role (str): The role of the block which is either "population" or "fitness".
+        name (str): The name of the shared memory block.
+
+    Returns:
+        SharedMemory: The attached shared memory block.
+    """
+
+    block = worker_shared_memory_blocks.get(role)
+    if block is None or block.name != name:
+        if not (block is None):
+            try:
+                block.close()
+            except BufferError:
+                # The fitness function still references the old block. It is released when the process exits.
+                pass
+        try:
+            # Starting from Python 3.13, the block can be attached without being tracked. Only the main process is responsible for unlinking it.
+            block = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            block = shared_memory.SharedMemory(name=name)
+        worker_shared_memory_blocks[role] = block
+    return block
+
+def release_shared_memory(block):
+    """
+    Closes and unlinks a shared memory block created by the main process. It is called either by the close() method or by the finalizer registered when the block is created (e.g. the pygad.GA instance is garbage collected or the interpreter exits without calling close()).
+
+    Parameters:
+        block (SharedMemory): The shared memory block.
+    """
+
+    block.close()
+    try:
+        block.unlink()
+    except FileNotFoundError:
+        # The block is already unlinked.
+        pass
+
+def is_numeric(value):
+    return isinstance(value, (int, float, numpy.integer, numpy.floating)) and not isinstance(value, (bool, numpy.bool_))
+
+def is_int64(value):
+    # Integer values are written into the shared fitness array as int64 to keep their data type. Larger integers are returned by pickling.
+    return isinstance(value, (int, numpy.integer)) and not isinstance(value, (bool, numpy.bool_)) and numpy.iinfo(numpy.int64).min <= value <= numpy.iinfo(numpy.int64).max
+
+def calculate_fitness_shared_memory(task_bytes, context_bytes=None):
+    """
+    Calculates the fitness of the solution(s) in a single task inside a worker process where the solutions are read from a shared memory block.
+    The task only has the names of the shared memory blocks and the range of rows to read.
+    The fitness values are written into the shared fitness array whenever possible. Otherwise, they are returned.
+
+    Parameters:
+        task_bytes (bytes): The pickled tuple (population_name, population_shape, population_dtype, fitness_name, fitness_shape, first_row, last_row, index/indices, batch).
+        context_bytes (bytes, optional): The pickled WorkerContext. It is only passed if the worker process was not initialized using the init_worker() function.
+
+    Returns:
+        bytes: The pickled tuple ("shared", sizes, integers) if the fitness values are written into the shared fitness array where sizes holds 0 for a single-objective fitness and the number of objectives for a multi-objective fitness and integers holds True for the fitness values written as int64. Otherwise, the pickled tuple ("value", fitness).
+    """
+
+    if context_bytes is None:
+        context = worker_context
+    else:
+        context = pickle.loads(context_bytes)
+    population_name, population_shape, population_dtype, fitness_name, fitness_shape, first_row, last_row, solution_idx, batch = pickle.loads(task_bytes)
+
+    # A view of the rows in the shared memory block. No copy is made.
+    population = numpy.ndarray(population_shape, dtype=population_dtype, buffer=attach_shared_memory("population", population_name).buf)
+    if batch:
+        fitness = context.fitness_func(context, population[first_row:last_row], solution_idx)
+        if type(fitness) not in [list, tuple, numpy.ndarray] or len(fitness) != (last_row - first_row):
+            # Return it as is to be validated by the main process.
+            return pickle.dumps(("value", fitness), protocol=pickle.HIGHEST_PROTOCOL)
+        fitness_values = fitness
+    else:
+        fitness = context.fitness_func(context, population[first_row], solution_idx)
+        fitness_values = [fitness]
+    del population
+
+    # Make sure all the fitness values fit into the shared fitness array.
+    # The integer fitness values are written as int64 so that the main process receives them with an integer data type as if they were pickled.
+    sizes = []
+    integers = []
+    for value in fitness_values:
+        if is_numeric(value):
+            items = [value]
+            sizes.append(0)
+        elif type(value) in [list, tuple, numpy.ndarray] and len(value) <= fitness_shape[1] and all([is_numeric(item) for item in value]):
+            items = value
+            sizes.append(len(value))
+        else:
+            return pickle.dumps(("value", fitness), protocol=pickle.HIGHEST_PROTOCOL)
+        if any([isinstance(item, (int, numpy.integer)) and not is_int64(item) for item in items]):
+            # The integer does not fit into int64.
+            return pickle.dumps(("value", fitness), protocol=pickle.HIGHEST_PROTOCOL)
+        integers.append(len(items) > 0 and all([is_int64(item) for item in items]))
+    if fitness_shape[1] == 0:
+        return pickle.dumps(("value", fitness), protocol=pickle.HIGHEST_PROTOCOL)
+
+    fitness_array = numpy.ndarray(fitness_shape, dtype=numpy.float64, buffer=attach_shared_memory("fitness", fitness_name).buf)
+    # An int64 view of the same buffer.
+    fitness_array_int = fitness_array.view(numpy.int64)
+    for row, (value, size, integer) in enumerate(zip(fitness_values, sizes, integers), start=first_row):
+        if size == 0:
+            (fitness_array_int if integer else fitness_array)[row, 0] = value
+        else:
+            (fitness_array_int if integer else fitness_array)[row, :size] = value
+    del fitness_array, fitness_array_int
+
+    return pickle.dumps(("shared", sizes, integers), protocol=pickle.HIGHEST_PROTOCOL)
+
+class Parallel:
+
+    def get_worker_context(self):
+        """
+        Creates the slim context sent to the worker processes instead of the pygad.GA instance.
+        If the 'worker_attributes' parameter is None, then the context has all the attributes except for those that change in each generation, may hold too much data, or are callables (other than the fitness function).
+        Otherwise, the context only has the attributes listed in the 'worker_attributes' parameter in addition to the fitness function.
+
+        Returns:
+            WorkerContext: The worker context.
+        """
+
+        if self.worker_attributes is None:
+            attributes = {}
+            for name, value in self.__dict__.items():
+                if name in EXCLUDED_WORKER_ATTRIBUTES:
+                    continue
+                elif callable(value) and name != "fitness_func":
+                    continue
+                attributes[name] = value
+        else:
+            attributes = {name: getattr(self, name) for name in self.worker_attributes}
+            attributes["fitness_func"] = self.fitness_func
+
+        return WorkerContext(attributes)
+
+    def get_executor(self):
+        """
+        Returns the executor used for parallel processing according to the 'parallel_processing' parameter.
+        The executor is created at the first call and reused across all generations and calls to the run() method until the close() method is called.
+        If the user passed an executor to the 'parallel_processing' parameter, then it is returned.
+        For process-based parallel processing, the worker context is pickled and sent to each process only once when it starts.
+        """
+
+        if self.executor is None:
+            if self.parallel_processing is None:
+                raise ValueError("No executor is used because parallel processing is not enabled. Set the 'parallel_processing' parameter to enable it.")
+
+            # Decide which class to use based on whether the user selected "process" or "thread"
+            if self.parallel_processing[0] == "process":
+                # cloudpickle is used so that the fitness function does not have to be defined at the top level of a module.
+                context_bytes = cloudpickle.dumps(self.get_worker_context())
+                self.ipc_stats["context_bytes"] = len(context_bytes)
+                self.executor = concurrent.futures.ProcessPoolExecutor(max_workers=self.parallel_processing[1],
+                                                                       initializer=init_worker,
+                                                                       initargs=(context_bytes,))
+            else:
+                self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.parallel_processing[1])
+
+        return self.executor
+
+    def close(self):
+        """
+        Shuts down the executor created by PyGAD for parallel processing. It is created again if the run() method is called later.
+        An executor passed by the user to the 'parallel_processing' parameter is not shut down as it is owned by the user.
+        """
+
+        if not (self.executor is None) and not (self.executor is self.user_executor):
+            self.executor.shutdown(wait=True)
+        self.executor = self.user_executor
+
+        # Release the shared memory blocks. Calling the finalizer releases the block only once.
+        for finalizer in self.shared_memory_finalizers.values():
+            finalizer()
+        self.shared_memory_blocks = {}
+        self.shared_memory_finalizers = {}
+
+    def get_shared_memory_array(self, role, shape, dtype):
+        """
+        Returns a NumPy array backed by a shared memory block to share data with the worker processes without pickling it.
+        The block of each role is created only once and replaced only if a larger block is needed.
+        A finalizer is registered for each block when it is created. So, the block is released even if the close() method is never called (e.g. the instance is garbage collected or the interpreter exits).
+
+        Parameters:
+            role (str): The role of the block which is either "population" or "fitness".
+            shape (tuple): The shape of the array.
+            dtype: The data type of the array.
+
+        Returns:
+            tuple: The array and the name of its shared memory block.
+        """
+
+        num_bytes = max(1, int(numpy.prod(shape)) * numpy.dtype(dtype).itemsize)
+        block = self.shared_memory_blocks.get(role)
+        if block is None or block.size < num_bytes:
+            if not (block is None):
+                self.shared_memory_finalizers[role]()
+            block = shared_memory.SharedMemory(create=True, size=num_bytes)
+            self.shared_memory_blocks[role] = block
+            # The finalizer must not reference the instance. Otherwise, the instance is never garbage collected.
+            self.shared_memory_finalizers[role] = weakref.finalize(self, release_shared_memory, block)
+        return numpy.ndarray(shape, dtype=dtype, buffer=block.buf), block.name
+
+    def map_fitness(self, solutions, indices, population=None, rows_indices=None):
+        """
+        Calls the fitness function for each task using the executor. A task is either a single solution and its index or a batch of solutions and their indices.
+        For process-based parallel processing, a task only sends the solution(s) and index/indices. The number of bytes sent and received is saved into the 'ipc_stats' attribute.
+
+        Parameters:
+            solutions (list): The solution (or batch of solutions) of each task. It may be None if the shared memory is used.
+            indices (list): The index (or indices) of the solution(s) of each task.
+            population (numpy.ndarray, optional): The population holding the solutions. If the shared memory is used, the solutions are copied from it directly into the shared memory block.
+            rows_indices (list, optional): The indices of the rows of the population to evaluate in the order of the tasks. The rows of each task are consecutive. It is used with the 'population' parameter.
+
+        Returns:
+            list: The output of the fitness function for each task.
+        """
+
+        executor = self.get_executor()
+
+        if self.parallel_processing[0] == "thread":
+            return list(executor.map(self.fitness_func, [self]*len(solutions), solutions, indices))
+
+        if executor is self.user_executor:
+            # The processes of the executor passed by the user were not initialized with the worker context. So, it is sent with each task.
+            context_bytes = cloudpickle.dumps(self.get_worker_context())
+            self.ipc_stats["context_bytes"] = len(context_bytes)
+        else:
+            context_bytes = None
+
+        if self.shared_memory:
+            fitness = self.map_fitness_shared_memory(executor, population, rows_indices, indices, context_bytes)
+            return fitness
+
+        tasks_bytes = [pickle.dumps((solution, solution_idx), protocol=pickle.HIGHEST_PROTOCOL) for solution, solution_idx in zip(solutions, indices)]
+
+        fitness = []
+        for fitness_bytes in executor.map(calculate_fitness, tasks_bytes, [context_bytes]*len(tasks_bytes)):
+            self.ipc_stats["bytes_received"] += len(fitness_bytes)
+            fitness.append(pickle.loads(fitness_bytes))
+
+        self.ipc_stats["num_tasks"] += len(tasks_bytes)
+        self.ipc_stats["bytes_sent"] += sum([len(task_bytes) for task_bytes in tasks_bytes])
+        if not (context_bytes is None):
+            self.ipc_stats["bytes_sent"] += len(context_bytes) * len(tasks_bytes)
+
+        return fitness
+
+    def submit_fitness(self, solution, solution_idx):
+        """
+        Submits a single task to the executor to calculate the fitness of a solution without waiting for it. It is used by the steady-state mode where a new task is submitted as soon as a task completes.
+        For process-based parallel processing, the task only sends the solution and its index. Note that the shared memory transport is not used for single tasks.
+
+        Parameters:
+            solution: The solution to calculate its fitness.
+            solution_idx: The index of the solution.
+
+        Returns:
+            concurrent.futures.Future: The future of the task. Its fitness is returned by the fitness_from_future() method.
+        """
+
+        executor = self.get_executor()
+
+        if self.parallel_processing[0] == "thread":
+            return executor.submit(self.fitness_func, self, solution, solution_idx)
+
+        if executor is self.user_executor:
+            context_bytes = cloudpickle.dumps(self.get_worker_context())
+            self.ipc_stats["context_bytes"] = len(context_bytes)
+            self.ipc_stats["bytes_sent"] += len(context_bytes)
+        else:
+            context_bytes = None
+
+        task_bytes = pickle.dumps((solution, solution_idx), protocol=pickle.HIGHEST_PROTOCOL)
+        self.ipc_stats["num_tasks"] += 1
+        self.ipc_stats["bytes_sent"] += len(task_bytes)
+        return executor.submit(calculate_fitness, task_bytes, context_bytes)
+
+    def fitness_from_future(self, future):
+        """
+        Returns the fitness calculated by a task submitted using the submit_fitness() method.
+
+        Parameters:
+            future (concurrent.futures.Future): A completed future returned by the submit_fitness() method.
+
+        Returns:
+            The output of the fitness function.
+        """
+
+        if self.parallel_processing[0] == "thread":
+            return future.result()
+
+        fitness_bytes = future.result()
+        self.ipc_stats["bytes_received"] += len(fitness_bytes)
+        return pickle.loads(fitness_bytes)
+
+    def map_fitness_shared_memory(self, executor, population, rows_indices, indices, context_bytes):
+        """
+        Calls the fitness function for each task using the processes where the solutions and fitness values are transferred using shared memory.
+        The solutions of all tasks are copied from the population into a shared memory block at once. Each task only carries the range of its rows and the index/indices of the solution(s).
+        The fitness values are written by the processes into a shared fitness array.
+
+        Parameters:
+            executor: The process-based executor.
+            population (numpy.ndarray): The population holding the solutions.
+            rows_indices (list): The indices of the rows of the population to evaluate in the order of the tasks.
+            indices (list): The index (or indices) of the solution(s) of each task.
+            context_bytes (bytes): The pickled worker context if it must be sent with each task. Otherwise, None.
+
+        Returns:
+            list: The output of the fitness function for each task.
+        """
+
+        if len(indices) == 0:
+            return []
+
+        population = numpy.asarray(population)
+        rows_indices = numpy.asarray(rows_indices, dtype=int)
+        total_rows = len(rows_indices)
+        dtype = population.dtype
+
+        # The rows of each task are consecutive. Each task has 1 row or a batch of 'fitness_batch_size' rows (the last batch may be smaller).
+        batch = not (self.fitness_batch_size in [1, None])
+        task_size = self.fitness_batch_size if batch else 1
+        tasks_first_rows = numpy.arange(len(indices)) * task_size
+        tasks_rows = list(zip(tasks_first_rows.tolist(), numpy.minimum(tasks_first_rows + task_size, total_rows).tolist()))
+
+        # Copy the solutions from the population into the shared memory block at once without an intermediate copy.
+        population_shape = (total_rows, self.num_genes)
+        shared_population, population_name = self.get_shared_memory_array(role="population",
+                                                                           shape=population_shape,
+                                                                           dtype=dtype)
+        numpy.take(population, rows_indices, axis=0, out=shared_population)
+        del shared_population
+
+        # The fitness array has a column for each objective. Its width is 0 until the number of objectives is known.
+        fitness_shape = (total_rows, self.shared_memory_num_objectives)
+        fitness_array, fitness_name = self.get_shared_memory_array(role="fitness",
+                                                                   shape=fitness_shape,
+                                                                   dtype=numpy.float64)
+        # The integer fitness values are written by the processes into an int64 view of the same buffer.
+        fitness_array_int = fitness_array.view(numpy.int64)
+
+        tasks_bytes = [pickle.dumps((population_name, population_shape, dtype.str, fitness_name, fitness_shape, first_row, last_row, solution_idx, batch), protocol=pickle.HIGHEST_PROTOCOL) for (first_row, last_row), solution_idx in zip(tasks_rows, indices)]
+
+        fitness = []
+        for (first_row, last_row), fitness_bytes in zip(tasks_rows, executor.map(calculate_fitness_shared_memory, tasks_bytes, [context_bytes]*len(tasks_bytes))):
+            self.ipc_stats["bytes_received"] += len(fitness_bytes)
+            kind, *output = pickle.loads(fitness_bytes)
+            if kind == "value":
+                output = output[0]
+                # The fitness values did not fit into the shared fitness array. Use a wider array for the next calls.
+                for value in (output if batch and type(output) in [list, tuple, numpy.ndarray] else [output]):
+                    if type(value) in [list, tuple, numpy.ndarray]:
+                        self.shared_memory_num_objectives = max(self.shared_memory_num_objectives, len(value))
+                    else:
+                        self.shared_memory_num_objectives = max(self.shared_memory_num_objectives, 1)
+                fitness.append(output)
+            else:
+                sizes, integers = output
+                task_fitness = []
+                for row, size, integer in zip(range(first_row, last_row), sizes, integers):
+                    if size == 0:
+                        task_fitness.append((fitness_array_int if integer else fitness_array)[row, 0].copy())
+                    else:
+                        task_fitness.append((fitness_array_int if integer else fitness_array)[row, :size].copy())
+                if batch:
+                    fitness.append(task_fitness)
+                else:
+                    fitness.append(task_fitness[0])
+        del fitness_array, fitness_array_int
+
+        self.ipc_stats["num_tasks"] += len(tasks_bytes)
+        self.ipc_stats["bytes_sent"] += sum([len(task_bytes) for task_bytes in tasks_bytes])
+        if not (context_bytes is None):
+            self.ipc_stats["bytes_sent"] += len(context_bytes) * len(tasks_bytes)
+
+        return fitness
@@ -0,0 +1,216 @@
+"""
+The pygad.helper.pareto_archive module has an archive of the non-dominated solutions found across all generations of a multi-objective problem.
+It is updated by the run_best_solution() method after the fitness of each generation is calculated.
+The dominance checks and the crowding distance are inherited from the NSGA2 class. So, the memory used by the dominance checks is bounded by the same 'dominance_max_elements' class attribute.
+"""
+
+import numpy
+from pygad.utils.nsga2 import NSGA2
+
+class ParetoArchive(NSGA2):
+
+    # The supported methods to select the solutions to be removed when the archive exceeds its maximum size.
+    supported_truncations = ["crowding", "hypervolume"]
+
+    def __init__(self, max_size=None, truncation="crowding"):
+        """
+        Creates an empty archive of non-dominated solutions.
+
+        Parameters:
+            max_size (int, optional): The maximum number of solutions in the archive. If None, the archive grows without limit. Otherwise, the solutions are removed using the truncation method once the archive exceeds this size.
+            truncation (str, optional): The method used to select the solution to be removed when the archive is full. If "crowding", the solution with the smallest crowding distance is removed. If "hypervolume", the solution with the smallest contribution to the hypervolume is removed (2 objectives only, the crowding distance is used otherwise). The solutions at the ends of the front are never removed.
+        """
+
+        self.max_size = max_size
+        self.truncation = truncation
+
+        # The non-dominated solutions. A 2D array with a row per solution.
+        self.solutions = None
+        # The fitness of the non-dominated solutions. A 2D array of floats with a row per solution and a column per objective.
+        # For 2 objectives, the solutions are sorted by the first objective in descending order (i.e. the second objective is in ascending order).
+        self.fitness = None
+
+        # The number of solutions inserted into the archive.
+        self.num_inserted = 0
+        # The number of solutions removed from the archive because it exceeded its maximum size.
+        self.num_truncated = 0
+
+    def add(self, solutions, fitness):
+        """
+        Inserts the non-dominated solutions out of the passed solutions into the archive. The archived solutions dominated by the new solutions are removed.
+        A solution whose fitness equals the fitness of an archived solution is not inserted.
+
+        Parameters:
+            solutions (array-like): A 2D array of the solutions with a row per solution.
+            fitness (array-like): The fitness of the solutions. A 2D array with a row per solution and a column per objective. A 1D array is treated as a single objective.
+
+        Returns:
+            int: The number of inserted solutions.
+        """
+
+        solutions = numpy.asarray(solutions)
+        fitness = numpy.asarray(fitness, dtype=float)
+        if fitness.ndim == 1:
+            fitness = fitness.reshape(-1, 1)
+        if solutions.ndim != 2 or fitness.ndim != 2 or solutions.shape[0] != fitness.shape[0]:
+            raise ValueError(f"The solutions must be a 2D array and the fitness must have a row per solution but solutions of shape {solutions.shape} and fitness of shape {fitness.shape} found.")
+        if solutions.shape[0] == 0:
+            return 0
+
+        if self.fitness is None:
+            num_archived = 0
+            all_fitness = fitness
+        elif self.fitness.shape[1] != fitness.shape[1]:
+            raise ValueError(f"The archive holds solutions with {self.fitness.shape[1]} objective(s) but the fitness of the new solutions has {fitness.shape[1]} objective(s).")
+        else:
+            num_archived = self.fitness.shape[0]
+            all_fitness = numpy.concatenate((self.fitness, fitness))
+
+        # The indices of the solutions kept in the archive.
+        if fitness.shape[1] == 2:
+            kept = self.non_dominated_2d(all_fitness)
+        else:
+            kept = numpy.flatnonzero(self.non_dominated_nd(all_fitness, num_archived))
+
+        num_inserted = numpy.count_nonzero(kept >= num_archived)
+        if num_inserted == 0 and len(kept) == num_archived:
+            # The archive did not change.
+            return 0
+
+        if num_archived == 0:
+            all_solutions = solutions
+        else:
+            all_solutions = numpy.concatenate((self.solutions, solutions))
+        self.solutions = all_solutions[kept]
+        self.fitness = all_fitness[kept]
+        self.num_inserted += int(num_inserted)
+
+        if not (self.max_size is None):
+            self.truncate(self.max_size)
+
+        return int(num_inserted)
+
+    @staticmethod
+    def non_dominated_2d(fitness):
+        """
+        Finds the non-dominated solutions of a 2-objective problem by sorting the solutions by the first objective in descending order.
+        A solution is non-dominated if its second objective is larger than the second objective of all the solutions before it. Out of the solutions with equal fitness, the first one is kept.
+
+        Parameters:
+            fitness (numpy.ndarray): A 2D array of the fitness with 2 columns.
+
+        Returns:
+            numpy.ndarray: The indices of the non-dominated solutions sorted by the first objective in descending order.
+        """
+
+        order = numpy.lexsort((numpy.arange(fitness.shape[0]), -fitness[:, 1], -fitness[:, 0]))
+        second_objective = fitness[order, 1]
+        best_before = numpy.maximum.accumulate(numpy.concatenate(([-numpy.inf], second_objective[:-1])))
+        return order[second_objective > best_before]
+
+    def non_dominated_nd(self, fitness, num_archived):
+        """
+        Finds the non-dominated solutions for any number of objectives given that the first solutions are the archived solutions which do not dominate each other.
+        The new solutions are compared against the archived solutions and against each other using the dominated_counts() method of the NSGA2 class. Out of the solutions with equal fitness, the archived (or the first) one is kept.
+
+        Parameters:
+            fitness (numpy.ndarray): A 2D array of the fitness of the archived solutions followed by the new solutions.
+            num_archived (int): The number of archived solutions.
+
+        Returns:
+            numpy.ndarray: A 1D boolean array with True for the non-dominated solutions.
+        """
+
+        archived = fitness[:num_archived]
+        # Keep only the first solution out of the solutions with equal fitness. The archived solutions come first so a new solution equal to an archived one is dropped.
+        _, unique_indices = numpy.unique(fitness, axis=0, return_index=True)
+        unique_indices = numpy.sort(unique_indices)
+        new_indices = unique_indices[unique_indices >= num_archived]
+        new_indices = new_indices[self.dominated_counts(fitness=fitness[new_indices],
+                                                        dominating_fitness=archived) == 0]
+        new_indices = new_indices[self.dominated_counts(fitness=fitness[new_indices],
+                                                        dominating_fitness=fitness[new_indices]) == 0]
+
+        kept = numpy.zeros(fitness.shape[0], dtype=bool)
+        kept[:num_archived] = self.dominated_counts(fitness=archived,
+                                                    dominating_fitness=fitness[new_indices]) == 0
+        kept[new_indices] = True
+        return kept
+
+    def crowding_distances(self):
+        """
+        Calculates the crowding distance of the archived solutions using the crowding_distance() method of the NSGA2 class. The solutions at the ends of the front have an infinite distance.
+
+        Returns:
+            numpy.ndarray: A 1D array of the crowding distance of each archived solution.
+        """
+
+        num_solutions = self.fitness.shape[0]
+        if num_solutions <= 2:
+            return numpy.full(num_solutions, numpy.inf)
+
+        _, crowding_dist_sum, _, _ = self.crowding_distance(pareto_front=numpy.arange(num_solutions),
+                                                            fitness=self.fitness)
+        distances = numpy.empty(num_solutions)
+        distances[crowding_dist_sum[:, 0].astype(int)] = crowding_dist_sum[:, 1]
+        return distances
+
+    @staticmethod
+    def hypervolume_contributions_2d(fitness):
+        """
+        Calculates the area dominated only by each solution of a 2-objective front sorted by the first objective in descending order. The solutions at the ends of the front have an infinite contribution.
+
+        Parameters:
+            fitness (numpy.ndarray): A 2D array of the fitness of the non-dominated solutions sorted by the first objective in descending order.
+
+        Returns:
+            numpy.ndarray: A 1D array of the contribution of each solution.
+        """
+
+        contributions = numpy.full(fitness.shape[0], numpy.inf)
+        contributions[1:-1] = (fitness[1:-1, 0] - fitness[2:, 0]) * (fitness[1:-1, 1] - fitness[:-2, 1])
+        return contributions
+
+    def truncation_scores(self):
+        """
+        Calculates the score of each archived solution according to the 'truncation' attribute. The solution with the smallest score is removed first.
+
+        Returns:
+            numpy.ndarray: A 1D array of the score of each archived solution.
+        """
+
+        if self.truncation == "hypervolume" and self.fitness.shape[1] == 2:
+            return self.hypervolume_contributions_2d(self.fitness)
+        else:
+            return self.crowding_distances()
+
+    def truncate(self, max_size):
+        """
+        Removes the solutions with the smallest score until the archive has at most max_size solutions.
+        The solutions are removed in rounds and the scores are recalculated after each round. Each round removes half of the excess solutions (at least 1) so that the last solutions are removed one by one.
+
+        Parameters:
+            max_size (int): The maximum number of solutions to keep.
+        """
+
+        while len(self) > max_size:
+            num_removed = max(1, (len(self) - max_size) // 2)
+            removed_indices = numpy.argsort(self.truncation_scores(), kind="stable")[:num_removed]
+            self.solutions = numpy.delete(self.solutions, removed_indices, axis=0)
+            self.fitness = numpy.delete(self.fitness, removed_indices, axis=0)
+            self.num_truncated += num_removed
+
+    def clear(self):
+        """
+        Removes all the solutions from the archive and resets the counters.
+        """
+
+        self.solutions = None
+        self.fitness = None
+        self.num_inserted = 0
+        self.num_truncated = 0
+
+    def __len__(self):
+        if self.fitness is None:
+            return 0
+        return self.fitness.shape[0]
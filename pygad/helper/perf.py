@@ -0,0 +1,135 @@
+"""
+The pygad.helper.perf module has helper methods to measure the time spent in each phase of each generation.
+The statistics are only collected when the 'collect_perf_stats' parameter is True. Otherwise, each method returns right away.
+"""
+
+import time
+import numpy
+
+# The phases of a generation. The time of each phase is saved into a field named '<phase>_ns' in nanoseconds.
+# The time of a phase excludes the time of the duplicate genes repair and the callbacks called inside it.
+PERF_PHASES = ["selection",
+               "crossover",
+               "mutation",
+               "fitness",
+               "callbacks",
+               "duplicates",
+               "other"]
+
+# The data type of the structured array saved into the 'perf_stats' attribute. It has a row for each generation.
+PERF_STATS_DTYPE = numpy.dtype([("generation", numpy.int64)] +
+                               [(f"{phase}_ns", numpy.int64) for phase in PERF_PHASES] +
+                               [("total_ns", numpy.int64),
+                                ("num_evaluations", numpy.int64),
+                                ("num_fitness_calls", numpy.int64),
+                                ("cache_hits", numpy.int64),
+                                ("evaluations_per_second", numpy.float64)])
+
+class Perf:
+
+    def perf_reset(self):
+        """
+        Starts measuring a new generation. It resets the time of each phase and the counters.
+        """
+
+        if not self.collect_perf_stats:
+            return
+
+        self.perf_generation = dict.fromkeys(PERF_PHASES, 0)
+        self.perf_generation["num_evaluations"] = 0
+        self.perf_generation["num_fitness_calls"] = 0
+        self.perf_generation["cache_hits"] = 0 if self.fitness_cache is None else self.fitness_cache.hits
+        self.perf_generation_start_ns = time.perf_counter_ns()
+        self.perf_lap_start_ns = self.perf_generation_start_ns
+        self.perf_nested_ns = 0
+
+    def perf_lap(self, phase):
+        """
+        Adds the time passed since the last call to this method (or the perf_reset() method) to the given phase.
+        The time measured by the perf_nested() method in between is excluded.
+
+        phase: The name of the phase in the PERF_PHASES list.
+        """
+
+        if not self.collect_perf_stats:
+            return
+
+        now_ns = time.perf_counter_ns()
+        self.perf_generation[phase] += now_ns - self.perf_lap_start_ns - self.perf_nested_ns
+        self.perf_lap_start_ns = now_ns
+        self.perf_nested_ns = 0
+
+    def perf_nested(self, phase, start_ns):
+        """
+        Adds the time passed since start_ns to the given phase. It is used to measure a phase that runs inside another phase (e.g. the duplicate genes repair inside the mutation). The time is excluded from the outer phase.
+
+        phase: The name of the phase in the PERF_PHASES list.
+        start_ns: The value returned by time.perf_counter_ns() when the phase started.
+        """
+
+        if self.perf_generation is None:
+            # The perf_reset() method was not called yet (e.g. while building the initial population).
+            return
+
+        elapsed_ns = time.perf_counter_ns() - start_ns
+        self.perf_generation[phase] += elapsed_ns
+        self.perf_nested_ns += elapsed_ns
+
+    def perf_count_evaluations(self, num_evaluations):
+        """
+        Counts the solutions evaluated by the cal_pop_fitness() method and the number of calls to the fitness function according to the 'fitness_batch_size' parameter.
+
+        num_evaluations: The number of solutions evaluated.
+        """
+
+        if not self.collect_perf_stats:
+            return
+
+        if num_evaluations == 0:
+            num_fitness_calls = 0
+        elif self.fitness_batch_size == "population":
+            num_fitness_calls = 1
+        elif self.fitness_batch_size in [1, None]:
+            num_fitness_calls = num_evaluations
+        else:
+            num_fitness_calls = int(numpy.ceil(num_evaluations / self.fitness_batch_size))
+        self.perf_generation["num_evaluations"] += num_evaluations
+        self.perf_generation["num_fitness_calls"] += num_fitness_calls
+
+    def perf_generation_end(self):
+        """
+        Saves the statistics of the current generation as a new row in the 'perf_stats' attribute, calls the on_perf() callback if defined, and starts measuring the next generation.
+        The time passed since the last call to the perf_lap() method is added to the 'other' phase.
+        """
+
+        if not self.collect_perf_stats:
+            return
+
+        self.perf_lap("other")
+
+        num_rows = len(self.perf_stats)
+        if num_rows == len(self.perf_stats_buffer):
+            # Double the size of the buffer to append the rows in amortized constant time.
+            perf_stats_buffer = numpy.zeros(max(2 * num_rows, self.num_generations + 1), dtype=PERF_STATS_DTYPE)
+            perf_stats_buffer[:num_rows] = self.perf_stats_buffer[:num_rows]
+            self.perf_stats_buffer = perf_stats_buffer
+
+        record = self.perf_stats_buffer[num_rows]
+        record["generation"] = self.generations_completed
+        for phase in PERF_PHASES:
+            record[f"{phase}_ns"] = self.perf_generation[phase]
+        record["total_ns"] = self.perf_lap_start_ns - self.perf_generation_start_ns
+        record["num_evaluations"] = self.perf_generation["num_evaluations"]
+        record["num_fitness_calls"] = self.perf_generation["num_fitness_calls"]
+        if not (self.fitness_cache is None):
+            # The hits are reset if the cache is cleared.
+            record["cache_hits"] = max(0, self.fitness_cache.hits - self.perf_generation["cache_hits"])
+        if self.perf_generation["fitness"] > 0:
+            record["evaluations_per_second"] = self.perf_generation["num_evaluations"] * 1e9 / self.perf_generation["fitness"]
+        self.perf_stats = self.perf_stats_buffer[:num_rows + 1]
+
+        if not (self.on_perf is None):
+            self.on_perf(self, record)
+
+        # The time spent inside the on_perf() callback is not measured.
+        self.perf_reset()
@@ -5,6 +5,7 @@ The pygad.helper.unique module has helper methods to solve duplicate genes and m
 import numpy
 import warnings
 import random
+import time
 import pygad
 
 class Unique:
@@ -34,6 +35,9 @@ class Unique:
                 int: The number of duplicates that could not be resolved.
         """
 
+        if self.collect_perf_stats:
+            start_ns = time.perf_counter_ns()
+
         new_solution = solution.copy()
 
         _, unique_gene_indices = numpy.unique(solution, return_index=True)
@@ -79,6 +83,9 @@ class Unique:
         not_unique_indices = set(range(len(solution))) - set(unique_gene_indices)
         # self.logger.info("not_unique_indices INSIDE", not_unique_indices)
 
+        if self.collect_perf_stats:
+            self.perf_nested("duplicates", start_ns)
+
         return new_solution, not_unique_indices, num_unsolved_duplicates
 
     def solve_duplicate_genes_by_space(self, 
@@ -105,6 +112,9 @@ class Unique:
                 int: The number of duplicates that could not be resolved.
         """
 
+        if self.collect_perf_stats:
+            start_ns = time.perf_counter_ns()
+
         new_solution = solution.copy()
 
         _, unique_gene_indices = numpy.unique(solution, return_index=True)
@@ -121,19 +131,339 @@ class Unique:
                                                                                                    mutation_by_replacement=mutation_by_replacement,
                                                                                                    build_initial_pop=build_initial_pop)
         else:
+            if self.collect_perf_stats:
+                self.perf_nested("duplicates", start_ns)
             return new_solution, not_unique_indices, len(not_unique_indices)
 
-        # DEEP-DUPLICATE-REMOVAL-NEEDED
-        # Search by this phrase to find where deep duplicates removal should be applied.
-        # If there exist duplicate genes, then changing either of the 2 duplicating genes (with indices 2 and 3) will not solve the problem.
-        # This problem can be solved by randomly changing one of the non-duplicating genes that may make a room for a unique value in one the 2 duplicating genes.
-        # For example, if gene_space=[[3, 0, 1], [4, 1, 2], [0, 2], [3, 2, 0]] and the solution is [3 2 0 0], then the values of the last 2 genes duplicate.
-        # There are no possible changes in the last 2 genes to solve the problem. But it could be solved by changing the second gene from 2 to 4.
-        # As a result, any of the last 2 genes can take the value 2 and solve the duplicates.
+        if num_unsolved_duplicates > 0:
+            # Changing either of the 2 duplicating genes may not solve the problem.
+            # For example, if gene_space=[[3, 0, 1], [4, 1, 2], [0, 2], [3, 2, 0]] and the solution is [3 2 0 0], then the values of the last 2 genes duplicate.
+            # It is solved by changing the second gene from 2 to 4 to make room for the value 2 in one of the last 2 genes. Such chains of changes are found by matching the genes to the values in their spaces.
+            new_solution, num_unsolved_duplicates = self.solve_duplicates_by_matching(solution=new_solution,
+                                                                                      build_initial_pop=build_initial_pop)
+            _, unique_gene_indices = numpy.unique(new_solution, return_index=True)
+            not_unique_indices = set(range(len(solution))) - set(unique_gene_indices)
+
+            self.warn_unsolved_duplicates(num_unsolved_duplicates=num_unsolved_duplicates,
+                                          build_initial_pop=build_initial_pop)
+
+        if self.collect_perf_stats:
+            self.perf_nested("duplicates", start_ns)
 
         return new_solution, not_unique_indices, num_unsolved_duplicates
 
-    def unique_int_gene_from_range(self, 
+    def duplicate_genes_mask(self, population, fixed_genes=None):
+
+        """
+        Detects the duplicate genes in all solutions at once. The genes of each solution are sorted and a gene is a duplicate if it equals the gene before it in the sorted order.
+        The sort is stable so that the first gene (by index) holding a value is not marked as a duplicate, the same as the genes kept by the numpy.unique() function in the solve_duplicate_genes_randomly() and solve_duplicate_genes_by_space() methods.
+
+        Args:
+            population (numpy.ndarray): A 2D array where each row is a solution.
+            fixed_genes (numpy.ndarray, optional): A boolean array with the same shape as the population. Among the genes sharing a value, a fixed gene (True) is not marked as a duplicate before the other genes. It is used to change the genes that can take another value.
+
+        Returns:
+            numpy.ndarray: A boolean array with the same shape as the population. The duplicate genes are True.
+        """
+
+        population = numpy.asarray(population, dtype=float)
+        if fixed_genes is None:
+            sorted_indices = numpy.argsort(population, axis=1, kind="stable")
+        else:
+            # Sort by the value then put the fixed genes first among the genes sharing the same value.
+            sorted_indices = numpy.lexsort((~fixed_genes, population), axis=1)
+        sorted_population = numpy.take_along_axis(population, sorted_indices, axis=1)
+
+        sorted_duplicates = numpy.zeros(population.shape, dtype=bool)
+        sorted_duplicates[:, 1:] = sorted_population[:, 1:] == sorted_population[:, :-1]
+
+        duplicates_mask = numpy.zeros(population.shape, dtype=bool)
+        numpy.put_along_axis(duplicates_mask, sorted_indices, sorted_duplicates, axis=1)
+        return duplicates_mask
+
+    def solve_duplicate_genes_batch(self,
+                                    population,
+                                    build_initial_pop=False):
+
+        """
+        Resolves the duplicate genes in all solutions of a population at once. It is the vectorized version of the solve_duplicate_genes_randomly() and solve_duplicate_genes_by_space() methods.
+        It works in rounds (up to the 'sample_size' attribute). In each round, the duplicate genes are detected using the duplicate_genes_mask() method and new values are selected for all of them using the select_unique_genes_values() method.
+        The genes with a constraint in the 'gene_constraint' attribute and the genes whose space has no unused values keep their values, so the other genes sharing the same values are changed instead.
+        The solutions that still have duplicates after the rounds are solved one by one using the solve_duplicate_genes_randomly() or solve_duplicate_genes_by_space() method. This is skipped if all the remaining duplicate genes have discrete spaces without unused values.
+
+        Args:
+            population (numpy.ndarray): A 2D array where each row is a solution. It is changed in place.
+            build_initial_pop (bool, optional): Indicates if initial population should be built. If True, the values are selected from the initial population range by replacement. Otherwise, the values are selected for mutation.
+
+        Returns:
+            tuple:
+                numpy.ndarray: The population after resolving the duplicates.
+                int: The number of duplicates that could not be resolved.
+        """
+
+        if self.collect_perf_stats:
+            start_ns = time.perf_counter_ns()
+
+        constrained_genes = numpy.zeros(population.shape[1], dtype=bool)
+        if self.gene_constraint:
+            constrained_genes[:] = [not (constraint is None) for constraint in self.gene_constraint]
+
+        # The genes whose discrete space has no value that is unused by their solutions.
+        exhausted_genes = numpy.zeros(population.shape, dtype=bool)
+        # The genes for which no unused random value was generated.
+        failed_genes = numpy.zeros(population.shape, dtype=bool)
+
+        # The indices of the solutions that may have duplicates.
+        solutions_indices = numpy.arange(population.shape[0])
+        for _ in range(self.sample_size):
+            # The genes that cannot be changed keep their values. So, the other genes sharing the same values are changed.
+            fixed_genes = constrained_genes | exhausted_genes[solutions_indices] | failed_genes[solutions_indices]
+            duplicates_mask = self.duplicate_genes_mask(population[solutions_indices],
+                                                        fixed_genes=fixed_genes)
+            with_duplicates = numpy.any(duplicates_mask, axis=1)
+            solutions_indices = solutions_indices[with_duplicates]
+            duplicates_mask = duplicates_mask[with_duplicates] & ~fixed_genes[with_duplicates]
+            if not numpy.any(duplicates_mask):
+                break
+
+            self.select_unique_genes_values(population=population,
+                                            solutions_indices=solutions_indices,
+                                            duplicates_mask=duplicates_mask,
+                                            exhausted_genes=exhausted_genes,
+                                            failed_genes=failed_genes,
+                                            build_initial_pop=build_initial_pop)
+
+        # The duplicate genes with exhausted spaces cannot be solved by selecting another value from their spaces.
+        duplicates_mask = self.duplicate_genes_mask(population[solutions_indices],
+                                                    fixed_genes=exhausted_genes[solutions_indices])
+        if self.gene_space_nested or not self.gene_type_single:
+            # The genes have different spaces. Solving the duplicates may need a chain of changes in other genes.
+            # This is done exactly by matching the genes to the values in their spaces.
+            for solution_idx in solutions_indices[numpy.any(duplicates_mask & exhausted_genes[solutions_indices], axis=1)]:
+                population[solution_idx], _ = self.solve_duplicates_by_matching(solution=population[solution_idx],
+                                                                                build_initial_pop=build_initial_pop)
+            duplicates_mask = self.duplicate_genes_mask(population[solutions_indices],
+                                                        fixed_genes=exhausted_genes[solutions_indices])
+
+        fallback_solutions = numpy.any(duplicates_mask & ~exhausted_genes[solutions_indices], axis=1)
+        num_unsolved_duplicates = int(numpy.count_nonzero(duplicates_mask[~fallback_solutions]))
+        self.warn_unsolved_duplicates(num_unsolved_duplicates=num_unsolved_duplicates,
+                                      build_initial_pop=build_initial_pop)
+
+        if self.collect_perf_stats:
+            # The solve_duplicate_genes_randomly() and solve_duplicate_genes_by_space() methods measure their own time.
+            self.perf_nested("duplicates", start_ns)
+
+        # Solve the remaining duplicates (e.g. the genes with a constraint) one solution at a time.
+        for solution_idx in solutions_indices[fallback_solutions]:
+            if self.gene_space is None:
+                if build_initial_pop:
+                    min_val, max_val = self.init_range_low, self.init_range_high
+                else:
+                    min_val, max_val = self.random_mutation_min_val, self.random_mutation_max_val
+                population[solution_idx], _, num_unsolved = self.solve_duplicate_genes_randomly(solution=population[solution_idx],
+                                                                                                min_val=min_val,
+                                                                                                max_val=max_val,
+                                                                                                mutation_by_replacement=build_initial_pop or self.mutation_by_replacement,
+                                                                                                gene_type=self.gene_type,
+                                                                                                sample_size=self.sample_size)
+            else:
+                population[solution_idx], _, num_unsolved = self.solve_duplicate_genes_by_space(solution=population[solution_idx].copy(),
+                                                                                                gene_type=self.gene_type,
+                                                                                                mutation_by_replacement=build_initial_pop or self.mutation_by_replacement,
+                                                                                                sample_size=self.sample_size,
+                                                                                                build_initial_pop=build_initial_pop)
+            num_unsolved_duplicates += num_unsolved
+
+        return population, num_unsolved_duplicates
+
+    def select_unique_genes_values(self,
+                                   population,
+                                   solutions_indices,
+                                   duplicates_mask,
+                                   exhausted_genes,
+                                   failed_genes,
+                                   build_initial_pop=False):
+
+        """
+        Selects new values for the duplicate genes of some solutions at once. It is called by the solve_duplicate_genes_batch() method in each round.
+        For a gene whose space is discrete (a list of values or a dict with the 'step' key in the 'gene_space' parameter), a value is selected randomly out of the values unused by its solution. If there are no such values, the gene is marked as exhausted.
+        For the other genes, a random value is generated using either the gene_space_values() or the mutation_random_values() method. The value is only accepted if it is unused by its solution. Otherwise, the next round tries again.
+        If multiple duplicate genes in the same solution select the same value, the next round detects and solves them.
+
+        Args:
+            population (numpy.ndarray): A 2D array where each row is a solution. It is changed in place.
+            solutions_indices (numpy.ndarray): The indices of the solutions with duplicates in the population.
+            duplicates_mask (numpy.ndarray): A boolean array of shape (len(solutions_indices), num_genes). The genes to change are True.
+            exhausted_genes (numpy.ndarray): A boolean array with the same shape as the population. It is changed in place to mark the genes whose discrete space has no unused values.
+            failed_genes (numpy.ndarray): A boolean array with the same shape as the population. It is changed in place to mark the genes for which no unused random value was generated.
+            build_initial_pop (bool, optional): Indicates if initial population should be built.
+        """
+
+        solutions = numpy.asarray(population[solutions_indices], dtype=float)
+        table = self.gene_space_table
+
+        if build_initial_pop:
+            range_min, range_max = self.init_range_low, self.init_range_high
+        else:
+            range_min, range_max = self.random_mutation_min_val, self.random_mutation_max_val
+        range_min = numpy.broadcast_to(numpy.asarray(range_min, dtype=float), (self.num_genes,))
+        range_max = numpy.broadcast_to(numpy.asarray(range_max, dtype=float), (self.num_genes,))
+
+        if self.gene_type_single == True:
+            groups = [(duplicates_mask, self.gene_type)]
+        else:
+            # Each gene has its own data type. The genes are solved column by column.
+            groups = []
+            for gene_idx in range(self.num_genes):
+                gene_mask = numpy.zeros(duplicates_mask.shape, dtype=bool)
+                gene_mask[:, gene_idx] = duplicates_mask[:, gene_idx]
+                if numpy.any(gene_mask):
+                    groups.append((gene_mask, self.gene_type[gene_idx]))
+
+        for group_mask, gene_type in groups:
+            rows, genes_indices = numpy.nonzero(group_mask)
+            new_values = numpy.empty(len(rows), dtype=float)
+            selected = numpy.zeros(len(rows), dtype=bool)
+
+            if table is None:
+                discrete = numpy.zeros(len(rows), dtype=bool)
+            else:
+                discrete = numpy.isin(table.kinds[genes_indices], [pygad.helper.gene_space.GENE_SPACE_VALUES,
+                                                                   pygad.helper.gene_space.GENE_SPACE_STEP])
+
+            # The genes with a discrete space: Select a value out of the unused values.
+            if self.gene_space_nested:
+                # Each gene has its own space.
+                space_groups = [numpy.flatnonzero(discrete & (genes_indices == gene_idx)) for gene_idx in numpy.unique(genes_indices[discrete])]
+            elif numpy.any(discrete):
+                # All the genes share the same space.
+                space_groups = [numpy.flatnonzero(discrete)]
+            else:
+                space_groups = []
+
+            for group in space_groups:
+                space = self.discrete_gene_space(gene_idx=genes_indices[group[0]])
+                # The None values in a global gene space are saved as NaN at the end. They are always unused.
+                num_numbers = len(space) - numpy.count_nonzero(numpy.isnan(space))
+
+                # The sorted indices of the values used by each solution in the space. The values out of the space take the index len(space).
+                group_rows, group_inverse = numpy.unique(rows[group], return_inverse=True)
+                group_solutions = solutions[group_rows]
+                used_indices = numpy.minimum(numpy.searchsorted(space[:num_numbers], group_solutions), max(num_numbers - 1, 0))
+                if num_numbers > 0:
+                    used_indices[space[used_indices] != group_solutions] = len(space)
+                else:
+                    used_indices[:, :] = len(space)
+                used_indices = numpy.sort(used_indices, axis=1)
+                used_indices[:, 1:][used_indices[:, 1:] == used_indices[:, :-1]] = len(space)
+                used_indices = numpy.sort(used_indices, axis=1)
+                num_used = numpy.count_nonzero(used_indices < len(space), axis=1)
+
+                num_unused = (len(space) - num_used)[group_inverse]
+                exhausted = num_unused == 0
+                exhausted_genes[solutions_indices[rows[group[exhausted]]], genes_indices[group[exhausted]]] = True
+
+                # The random index among the unused values is converted into an index in the space by skipping the used indices before it.
+                # As the used indices are sorted and unique, (used_indices - arange) is non-decreasing and counts the unused values before each used index.
+                # The number of used indices to skip is found by searching all solutions at once after offsetting each solution by (len(space) + 1).
+                unused_before = used_indices - numpy.arange(used_indices.shape[1])
+                unused_before[used_indices == len(space)] = len(space)
+                unused_before += numpy.arange(len(group_rows))[:, numpy.newaxis] * (len(space) + 1)
+                random_indices = numpy.floor(numpy.random.random(size=len(group)) * num_unused).astype(int)
+                num_used_before = numpy.searchsorted(numpy.ravel(unused_before),
+                                                     random_indices + group_inverse * (len(space) + 1),
+                                                     side="right") - group_inverse * used_indices.shape[1]
+                space_indices = numpy.minimum(random_indices + num_used_before, len(space) - 1)
+
+                group_values = space[space_indices]
+                # A None value in the global gene space is replaced by a random value.
+                none_values = numpy.isnan(group_values)
+                group_values[none_values] = numpy.random.uniform(low=range_min[genes_indices[group[none_values]]],
+                                                                 high=range_max[genes_indices[group[none_values]]])
+                new_values[group] = group_values
+                selected[group] = ~exhausted
+
+            # The other genes: Generate 'sample_size' random values for each gene and select the first value unused by its solution.
+            random_genes = numpy.flatnonzero(~discrete)
+            if len(random_genes) > 0:
+                random_genes_indices = numpy.repeat(genes_indices[random_genes], self.sample_size)
+                if build_initial_pop:
+                    gene_values = None
+                else:
+                    gene_values = numpy.repeat(solutions[rows[random_genes], genes_indices[random_genes]], self.sample_size)
+
+                if table is None:
+                    if gene_values is None:
+                        gene_values = numpy.zeros(len(random_genes_indices))
+                    random_values = self.mutation_random_values(gene_values=gene_values,
+                                                                genes_indices=random_genes_indices,
+                                                                gene_type=gene_type,
+                                                                range_min=range_min,
+                                                                range_max=range_max,
+                                                                mutation_by_replacement=build_initial_pop or self.mutation_by_replacement)
+                else:
+                    random_values = self.gene_space_values(genes_indices=random_genes_indices,
+                                                           gene_type=gene_type,
+                                                           gene_values=gene_values)
+                # Compare the values after rounding and changing their data type.
+                random_values = numpy.asarray(random_values, dtype=float).reshape(len(random_genes), self.sample_size)
+
+                unused = ~self.values_in_solutions(solutions=solutions[rows[random_genes]],
+                                                   values=random_values)
+                found = numpy.any(unused, axis=1)
+                new_values[random_genes] = random_values[numpy.arange(len(random_genes)), numpy.argmax(unused, axis=1)]
+                selected[random_genes] = found
+                # No unused value was generated. The gene is left to the solve_duplicate_genes_randomly() and solve_duplicate_genes_by_space() methods.
+                failed_genes[solutions_indices[rows[random_genes[~found]]], genes_indices[random_genes[~found]]] = True
+
+            # Round the values before changing their data type to avoid precision loss for some data types like numpy.float32.
+            if not (gene_type[1] is None):
+                new_values = numpy.round(new_values, gene_type[1])
+            new_values = numpy.asarray(new_values, dtype=gene_type[0])
+
+            if self.gene_type_single == True:
+                population[solutions_indices[rows[selected]], genes_indices[selected]] = new_values[selected]
+            else:
+                # Assign a list to keep the data type of each value in the object array.
+                population[solutions_indices[rows[selected]], genes_indices[selected]] = list(new_values[selected])
+
+    def values_in_solutions(self, solutions, values):
+
+        """
+        Checks whether some values exist in their solutions for many solutions at once.
+        The genes of all solutions and the values are sorted together by the solution index and then by the value. A value exists in its solution if the last gene before it in the sorted order belongs to the same solution and has the same value.
+
+        Args:
+            solutions (numpy.ndarray): A 2D array where each row is a solution.
+            values (numpy.ndarray): A 2D array with a row of values for each solution.
+
+        Returns:
+            numpy.ndarray: A boolean array with the same shape as the values. The values that exist in their solutions are True.
+        """
+
+        num_solutions, num_genes = solutions.shape
+        num_values = values.shape[1]
+
+        rows = numpy.concatenate((numpy.repeat(numpy.arange(num_solutions), num_genes),
+                                  numpy.repeat(numpy.arange(num_solutions), num_values)))
+        items = numpy.concatenate((numpy.ravel(solutions), numpy.ravel(values)))
+        # The genes come before the values equal to them.
+        is_value = numpy.concatenate((numpy.zeros(solutions.size, dtype=bool),
+                                      numpy.ones(values.size, dtype=bool)))
+        order = numpy.lexsort((is_value, items, rows))
+
+        # The position (in the sorted order) of the last gene at or before each item.
+        last_gene = numpy.where(is_value[order], -1, numpy.arange(len(order)))
+        last_gene = numpy.maximum.accumulate(last_gene)
+        last_gene_item = order[numpy.maximum(last_gene, 0)]
+        exists = (last_gene >= 0) & (rows[last_gene_item] == rows[order]) & (items[last_gene_item] == items[order])
+
+        values_exist = numpy.empty(len(order), dtype=bool)
+        values_exist[order] = exists
+        return values_exist[solutions.size:].reshape(values.shape)
+
+    def unique_int_gene_from_range(self,
                                    solution, 
                                    gene_index, 
                                    min_val, 
@@ -319,8 +649,8 @@ class Unique:
                                                  build_initial_pop=build_initial_pop)
 
             if temp_val in solution:
+                # The duplicate is reported by the solve_duplicate_genes_by_space() method if it cannot be solved by matching.
                 num_unsolved_duplicates = num_unsolved_duplicates + 1
-                if not self.suppress_warnings: warnings.warn(f"Failed to find a unique value for gene with index {duplicate_index} whose value is {solution[duplicate_index]} at generation {self.generations_completed+1}. Consider adding more values in the gene space or use a wider range for initial population or random mutation.")
             else:
                 solution[duplicate_index] = temp_val
     
@@ -390,33 +720,6 @@ class Unique:
 
         return selected_value
 
-    def find_two_duplicates(self, 
-                            solution,
-                            gene_space_unpacked):
-        """
-        Identifies the first occurrence of a duplicate gene in the solution.
-
-        Args:
-            solution: The solution containing genes with duplicate values.
-            gene_space_unpacked: A list of values from the gene space to choose the values that resolve duplicates.
-
-        Returns:
-            int: The index of the first gene with a duplicate value.
-            Any: The value of the duplicate gene.
-        """
-
-        for gene in set(solution):
-            gene_indices = numpy.where(numpy.array(solution) == gene)[0]
-            if len(gene_indices) == 1:
-                continue
-            for gene_idx in gene_indices:
-                number_alternate_values = len(set(gene_space_unpacked[gene_idx]))
-                if number_alternate_values > 1:
-                    return gene_idx, gene
-        # This means there is no way to solve the duplicates between the genes.
-        # Because the space of the duplicates genes only has a single value and there is no alternatives.
-        return None, gene
-
     def unpack_gene_space(self, 
                           range_min,
                           range_max,
@@ -542,68 +845,317 @@ class Unique:
 
         return gene_space_unpacked
 
-    def solve_duplicates_deeply(self,
-                                solution):
+    def max_genes_matching(self,
+                           allowed_values,
+                           num_values,
+                           genes_values=None):
         """
-        Sometimes it is impossible to solve the duplicate genes by simply selecting another value for either genes.
-        This function solve the duplicates between 2 genes by searching for a third gene that can make assist in the solution.
+        Finds a maximum matching between the genes and the values using the Hopcroft-Karp algorithm. Each gene is matched to one of its allowed values and each value is matched to at most one gene.
+        The matching starts from the current values of the genes so that most genes keep their values. Then it is extended by augmenting paths that change the values of some genes to make room for the unmatched genes.
+        It runs in O(E * sqrt(V)) time where E is the number of (gene, value) pairs and V is the number of genes and values.
 
         Args:
-            solution (list): The current solution containing genes, potentially with duplicates.
+            allowed_values (list): A list with a list of the allowed value indices for each gene. A gene with an empty list is not matched.
+            num_values (int): The number of values. The value indices are from 0 to num_values-1.
+            genes_values (list, optional): The index of the current value of each gene or -1 if the current value is not allowed.
 
         Returns:
-            list or None: The updated solution with duplicates resolved, or `None` if the duplicates cannot be resolved.
+            list: The index of the value matched to each gene or -1 if the gene is not matched.
         """
 
-        # gene_space_unpacked = self.unpack_gene_space()
-        # Create a copy of the gene_space_unpacked attribute because it will be changed later.
-        gene_space_unpacked = self.gene_space_unpacked.copy()
-
-        duplicate_index, duplicate_value = self.find_two_duplicates(solution, 
-                                                                    gene_space_unpacked)
-    
-        if duplicate_index is None:
-            # Impossible to solve the duplicates for the genes with value duplicate_value.
-            return None
-    
-    
-        # Without copy(), the gene will be removed from the gene_space.
-        # Convert the space to list because tuples do not have copy()
-        gene_other_values = list(gene_space_unpacked[duplicate_index]).copy()
-
-        # This removes all the occurrences of this value.
-        gene_other_values = [v for v in gene_other_values if v != duplicate_value]
-
-        # Two conditions to solve the duplicates of the value D:
-            # 1. From gene_other_values, select a value V such that it is available in the gene space of another gene X.
-            # 2. Find an alternate value for the gene X that will not cause any duplicates.
-            #    2.1 If the gene X does not have alternatives, then go back to step 1 to find another gene.
-            #    2.2 Set the gene X to the value D.
-            #    2.3 Set the target gene to the value V.
-        # Set the space of the duplicate gene to empty list []. Do not remove it to not alter the indices of the gene spaces.
-        gene_space_unpacked[duplicate_index] = []
-
-        for other_value in gene_other_values:
-            for space_idx, space in enumerate(gene_space_unpacked):
-                if other_value in space:
-                    if other_value in solution and list(solution).index(other_value) != space_idx:
-                        continue
+        num_genes = len(allowed_values)
+        gene_match = [-1] * num_genes
+        value_match = [-1] * num_values
+
+        if not (genes_values is None):
+            # Keep the current values. If more than 1 gene has the same value, the first gene keeps it.
+            for gene_idx, value_idx in enumerate(genes_values):
+                if value_idx >= 0 and value_match[value_idx] == -1:
+                    gene_match[gene_idx] = value_idx
+                    value_match[value_idx] = gene_idx
+
+        infinity = num_genes + 1
+        while True:
+            # Breadth-first search from the unmatched genes to build the layers of the shortest augmenting paths.
+            distance = [infinity] * num_genes
+            queue = [gene_idx for gene_idx in range(num_genes) if gene_match[gene_idx] == -1 and len(allowed_values[gene_idx]) > 0]
+            for gene_idx in queue:
+                distance[gene_idx] = 0
+            found_path = False
+            for gene_idx in queue:
+                for value_idx in allowed_values[gene_idx]:
+                    other_gene_idx = value_match[value_idx]
+                    if other_gene_idx == -1:
+                        found_path = True
+                    elif distance[other_gene_idx] == infinity:
+                        distance[other_gene_idx] = distance[gene_idx] + 1
+                        queue.append(other_gene_idx)
+            if not found_path:
+                break
+
+            # Depth-first search along the layers to find vertex-disjoint augmenting paths. An iterative search is used to avoid the recursion limit.
+            next_value = [0] * num_genes
+            for root_gene_idx in range(num_genes):
+                if gene_match[root_gene_idx] != -1 or distance[root_gene_idx] != 0:
+                    continue
+                path_genes = [root_gene_idx]
+                path_values = []
+                while path_genes:
+                    gene_idx = path_genes[-1]
+                    if next_value[gene_idx] < len(allowed_values[gene_idx]):
+                        value_idx = allowed_values[gene_idx][next_value[gene_idx]]
+                        next_value[gene_idx] += 1
+                        other_gene_idx = value_match[value_idx]
+                        if other_gene_idx == -1:
+                            # Augment the matching along the path.
+                            path_values.append(value_idx)
+                            for path_gene_idx, path_value_idx in zip(path_genes, path_values):
+                                gene_match[path_gene_idx] = path_value_idx
+                                value_match[path_value_idx] = path_gene_idx
+                            break
+                        elif distance[other_gene_idx] == distance[gene_idx] + 1:
+                            path_genes.append(other_gene_idx)
+                            path_values.append(value_idx)
                     else:
-                        # Find an alternate value for the third gene.
-                        # Copy the space so that the original space is not changed after removing the value.
-                        space_other_values = space.copy()
-                        # This removes all the occurrences of this value. It is not enough to use the remove() function because it only removes the first occurrence.
-                        space_other_values = [v for v in space_other_values if v != other_value]
-
-                        for val in space_other_values:
-                            if val in solution:
-                                # If the value exists in another gene of the solution, then we cannot use this value as it will cause another duplicate.
-                                # End the current iteration and go check another value.
-                                continue
-                            else:
-                                solution[space_idx] = val
-                                solution[duplicate_index] = other_value
-                                return solution
-
-        # Reaching here means we cannot solve the duplicate genes.
-        return None
+                        # No augmenting path passes through this gene in the current phase.
+                        distance[gene_idx] = infinity
+                        path_genes.pop()
+                        if path_values:
+                            path_values.pop()
+
+        return gene_match
+
+    def matching_spaces(self):
+        """
+        Returns the discrete space of each gene that is matched by the max_genes_matching() method.
+        Only the genes with a discrete space (a list of values or a dict with the 'step' key in the 'gene_space' parameter) and without a constraint are matched.
+        A gene whose global gene space has None can always take a new random value. So, it is not matched too.
+
+        Returns:
+            list: The discrete space of each gene or None if the gene is not matched.
+        """
+
+        constrained_genes = numpy.zeros(self.num_genes, dtype=bool)
+        if self.gene_constraint:
+            constrained_genes[:] = [not (constraint is None) for constraint in self.gene_constraint]
+
+        spaces = []
+        for gene_idx in range(self.num_genes):
+            space = self.discrete_gene_space(gene_idx=gene_idx)
+            if constrained_genes[gene_idx] or (space is None) or numpy.any(numpy.isnan(space)):
+                spaces.append(None)
+            else:
+                spaces.append(space)
+        return spaces
+
+    def is_duplicate_gene(self, solution, gene_idx):
+        """
+        Checks whether the value of a gene is used by another gene in the same solution.
+
+        Args:
+            solution (list): The solution holding the values of the genes.
+            gene_idx (int): The index of the gene.
+
+        Returns:
+            bool: True if the gene value is used by another gene. False otherwise.
+        """
+
+        other_values = numpy.asarray(numpy.delete(solution, gene_idx), dtype=float)
+        return float(solution[gene_idx]) in other_values
+
+    def unbounded_gene_space(self, gene_idx):
+        """
+        Checks whether a gene accepts any value. This is when the gene space is None or holds a None value.
+
+        Args:
+            gene_idx (int): The index of the gene.
+
+        Returns:
+            bool: True if the gene accepts any value. False otherwise.
+        """
+
+        if self.gene_space is None:
+            return True
+        elif self.gene_space_nested:
+            if self.gene_space[gene_idx] is None:
+                return True
+        space = self.discrete_gene_space(gene_idx=gene_idx)
+        return not (space is None) and bool(numpy.any(numpy.isnan(space)))
+
+    def matching_graph(self, solution=None, free_genes_fixed=True):
+        """
+        Builds the bipartite graph between the genes and their values to be used by the max_genes_matching() method.
+        Only the genes returned by the matching_spaces() method are matched. The other genes keep their values. So, their values are not allowed for the matched genes.
+        The genes that are not matched and have no constraint (e.g. a gene with a continuous space or a None space) can take new values. If free_genes_fixed=False, their values are allowed for the matched genes and they are expected to take new values after the matching.
+
+        Args:
+            solution (list, optional): The solution holding the current values of the genes. If None, the graph is built to check whether unique values can be assigned to the genes.
+            free_genes_fixed (bool, optional): Whether the values of the genes that are not matched and have no constraint are not allowed for the matched genes.
+
+        Returns:
+            tuple:
+                numpy.ndarray: The sorted values. The index of a value in this array is its index in the graph.
+                list: A list with a list of the allowed value indices for each gene. It is empty for the genes that are not matched.
+                list: The index of the current value of each gene or -1 if the current value is not allowed. It is None if the solution is None.
+        """
+
+        constrained_genes = numpy.zeros(self.num_genes, dtype=bool)
+        if self.gene_constraint:
+            constrained_genes[:] = [not (constraint is None) for constraint in self.gene_constraint]
+
+        spaces = self.matching_spaces()
+
+        discrete_spaces = [space for space in spaces if not (space is None)]
+        if len(discrete_spaces) == 0:
+            values = numpy.zeros(0, dtype=float)
+        else:
+            values = numpy.unique(numpy.concatenate(discrete_spaces))
+
+        allowed = numpy.ones(len(values), dtype=bool)
+        if not (solution is None):
+            solution = numpy.asarray(solution, dtype=float)
+            # The values of the genes that are not matched are not allowed for the other genes.
+            fixed_genes = numpy.array([space is None for space in spaces], dtype=bool)
+            if not free_genes_fixed:
+                # Only the genes with a constraint keep their values.
+                fixed_genes &= constrained_genes
+            fixed_values = solution[fixed_genes]
+            allowed[numpy.isin(values, fixed_values)] = False
+
+        allowed_values = []
+        for space in spaces:
+            if space is None:
+                allowed_values.append([])
+            else:
+                space_indices = numpy.searchsorted(values, space)
+                allowed_values.append(space_indices[allowed[space_indices]].tolist())
+
+        if solution is None:
+            genes_values = None
+        else:
+            positions = numpy.minimum(numpy.searchsorted(values, solution), max(len(values) - 1, 0))
+            genes_values = []
+            for gene_idx, position in enumerate(positions):
+                if len(values) > 0 and values[position] == solution[gene_idx] and position in allowed_values[gene_idx]:
+                    genes_values.append(int(position))
+                else:
+                    genes_values.append(-1)
+
+        return values, allowed_values, genes_values
+
+    def check_unique_genes_feasibility(self):
+        """
+        Checks whether unique values can be assigned to all genes according to the 'gene_space' attribute when duplicate genes are not allowed (allow_duplicate_genes=False). It is called once by the constructor.
+        The check finds a maximum matching between the genes with a discrete space and their values. If not all the genes are matched, a warning is given once and the duplicates that cannot be solved are not reported again at each generation.
+
+        Returns:
+            bool: True if unique values can be assigned to all genes (or duplicate genes are allowed). Otherwise, False.
+        """
+
+        if self.allow_duplicate_genes or self.gene_space is None:
+            return True
+
+        if not self.gene_space_nested and self.gene_type_single:
+            # All the genes share the same space.
+            space = self.discrete_gene_space(gene_idx=0)
+            if (space is None) or numpy.any(numpy.isnan(space)):
+                return True
+            num_genes_matched = min(len(space), self.num_genes)
+            num_genes_discrete = self.num_genes
+        else:
+            values, allowed_values, _ = self.matching_graph()
+            gene_match = self.max_genes_matching(allowed_values=allowed_values,
+                                                 num_values=len(values))
+            num_genes_matched = sum([value_idx >= 0 for value_idx in gene_match])
+            num_genes_discrete = sum([len(gene_values) > 0 for gene_values in allowed_values])
+
+        if num_genes_matched < num_genes_discrete:
+            if not self.suppress_warnings:
+                warnings.warn(f"The 'allow_duplicate_genes' parameter is False but unique values can be assigned to at most {num_genes_matched} out of the {num_genes_discrete} genes with discrete spaces in the 'gene_space' parameter. The remaining duplicates cannot be solved.")
+            return False
+        return True
+
+    def warn_unsolved_duplicates(self, num_unsolved_duplicates, build_initial_pop=False):
+        """
+        Warns that some duplicate genes could not be solved. It is used by the solve_duplicate_genes_by_space() and solve_duplicate_genes_batch() methods so that both report the same message.
+        No warning is given if unique values cannot be assigned to all genes because this was reported once by the constructor using the check_unique_genes_feasibility() method.
+
+        Args:
+            num_unsolved_duplicates (int): The number of duplicate genes that could not be solved.
+            build_initial_pop (bool, optional): Whether the duplicates are solved while creating the initial population. Defaults to False.
+        """
+
+        if num_unsolved_duplicates > 0 and self.unique_genes_feasible:
+            if not self.suppress_warnings:
+                if build_initial_pop:
+                    stage = "while creating the initial population"
+                else:
+                    stage = f"at generation {self.generations_completed+1}"
+                warnings.warn(f"Failed to find unique values for {num_unsolved_duplicates} duplicate gene(s) {stage}. Consider adding more values in the gene space or use a wider range for initial population or random mutation.")
+
+    def solve_duplicates_by_matching(self, solution, build_initial_pop=False):
+        """
+        Solves the duplicate genes in a solution exactly by finding a maximum matching between the genes and the values in their spaces using the max_genes_matching() method.
+        It solves the duplicates that need a chain of changes in other genes. For example, if gene_space=[[3, 0, 1], [4, 1, 2], [0, 2], [3, 2, 0]] and the solution is [3 2 0 0], then changing the second gene from 2 to 4 makes room for the last gene to take the value 2.
+        The genes keep their values as long as possible. Only the genes with a discrete space and without a constraint are changed.
+
+        Args:
+            solution (list): A solution containing genes, potentially with duplicate values.
+            build_initial_pop (bool, optional): Indicates if initial population should be built. The genes that can take new values select them from the initial population range instead of the mutation range.
+
+        Returns:
+            tuple:
+                list: The solution after solving the duplicates.
+                int: The number of duplicates that could not be resolved.
+        """
+
+        new_solution = solution.copy()
+        values, allowed_values, genes_values = self.matching_graph(solution=solution)
+        gene_match = self.max_genes_matching(allowed_values=allowed_values,
+                                             num_values=len(values),
+                                             genes_values=genes_values)
+
+        spaces = self.matching_spaces()
+        free_genes = []
+        if any([value_idx == -1 and not (space is None) for value_idx, space in zip(gene_match, spaces)]):
+            # Some genes with discrete spaces are not matched. The values they need may be held by genes that can take new values (e.g. a gene with a continuous or a None space).
+            # So, the matching is repeated where the values of such genes are allowed and these genes take new values after the matching.
+            free_genes = [gene_idx for gene_idx, space in enumerate(spaces) if space is None and not (self.gene_constraint and self.gene_constraint[gene_idx])]
+            if len(free_genes) > 0:
+                values, allowed_values, genes_values = self.matching_graph(solution=solution,
+                                                                           free_genes_fixed=False)
+                gene_match = self.max_genes_matching(allowed_values=allowed_values,
+                                                     num_values=len(values),
+                                                     genes_values=genes_values)
+
+        for gene_idx, value_idx in enumerate(gene_match):
+            if value_idx >= 0 and value_idx != genes_values[gene_idx]:
+                dtype = self.get_gene_dtype(gene_index=gene_idx)
+                new_solution[gene_idx] = dtype[0](values[value_idx])
+
+        # The genes that can take new values are given values unused by the other genes.
+        for gene_idx in free_genes:
+            if not self.is_duplicate_gene(solution=new_solution, gene_idx=gene_idx):
+                continue
+            new_solution[gene_idx] = self.unique_gene_by_space(solution=new_solution,
+                                                               gene_idx=gene_idx,
+                                                               gene_type=self.gene_type,
+                                                               mutation_by_replacement=True,
+                                                               sample_size=self.sample_size,
+                                                               build_initial_pop=build_initial_pop)
+            if self.is_duplicate_gene(solution=new_solution, gene_idx=gene_idx) and self.unbounded_gene_space(gene_idx=gene_idx):
+                # The mutation range may be too narrow to hold a unique value (e.g. an integer gene within [-1, 1)).
+                # A gene with a None space accepts any value. So, the range is extended by the number of genes which guarantees a unique value.
+                if build_initial_pop:
+                    range_min, range_max = self.get_initial_population_range(gene_index=gene_idx)
+                else:
+                    range_min, range_max = self.get_random_mutation_range(gene_idx)
+                dtype = self.get_gene_dtype(gene_index=gene_idx)
+                candidates = numpy.arange(numpy.floor(range_min), numpy.ceil(range_max) + self.num_genes)
+                candidates = [dtype[0](value) for value in candidates]
+                new_solution[gene_idx] = self.select_unique_value(gene_values=candidates,
+                                                                  solution=new_solution,
+                                                                  gene_index=gene_idx)
+
+        num_unsolved_duplicates = len(new_solution) - len(numpy.unique(numpy.asarray(new_solution, dtype=float)))
+        return new_solution, num_unsolved_duplicates
@@ -3,6 +3,9 @@ import random
 import cloudpickle
 import warnings
 import concurrent.futures
+import multiprocessing
+import time
+import asyncio
 import inspect
 import logging
 from pygad import utils
@@ -14,8 +17,12 @@ class GA(utils.parent_selection.ParentSelection,
          utils.crossover.Crossover,
          utils.mutation.Mutation,
          utils.nsga2.NSGA2,
+         utils.hypervolume.Hypervolume,
          helper.unique.Unique,
          helper.misc.Helper,
+         helper.parallel.Parallel,
+         helper.perf.Perf,
+         helper.gene_space.GeneSpace,
          visualize.plot.Plot):
 
     supported_int_types = [int, numpy.int8, numpy.int16, numpy.int32, numpy.int64,
@@ -24,6 +31,9 @@ class GA(utils.parent_selection.ParentSelection,
     supported_float_types = [float, numpy.float16, numpy.float32, numpy.float64,
                              object]
     supported_int_float_types = supported_int_types + supported_float_types
+    # The crossover and mutation types that keep the solutions valid permutations when gene_encoding='permutation'.
+    supported_permutation_crossover_types = ["ox", "pmx", "cycle", "edge"]
+    supported_permutation_mutation_types = ["swap", "inversion", "scramble"]
 
     def __init__(self,
                  num_generations,
@@ -53,6 +63,7 @@ class GA(utils.parent_selection.ParentSelection,
                  gene_constraint=None,
                  sample_size=100,
                  allow_duplicate_genes=True,
+                 gene_encoding=None,
                  on_start=None,
                  on_fitness=None,
                  on_parents=None,
@@ -60,11 +71,18 @@ class GA(utils.parent_selection.ParentSelection,
                  on_mutation=None,
                  on_generation=None,
                  on_stop=None,
+                 on_perf=None,
                  save_best_solutions=False,
                  save_solutions=False,
+                 fitness_cache_size=None,
+                 pareto_archive_size=None,
+                 pareto_archive_truncation="crowding",
                  suppress_warnings=False,
                  stop_criteria=None,
                  parallel_processing=None,
+                 worker_attributes=None,
+                 shared_memory=False,
+                 collect_perf_stats=False,
                  random_seed=None,
                  logger=None):
         """
@@ -74,7 +92,7 @@ class GA(utils.parent_selection.ParentSelection,
         num_parents_mating: Number of solutions to be selected as parents in the mating pool.
 
         fitness_func: Accepts a function/method and returns the fitness value of the solution. In PyGAD 2.20.0, a third parameter is passed referring to the 'pygad.GA' instance. If method, then it must accept 4 parameters where the fourth one refers to the method's object.
-        fitness_batch_size: Added in PyGAD 2.19.0. Supports calculating the fitness in batches. If the value is 1 or None, then the fitness function is called for each individual solution. If given another value X where X is neither 1 nor None (e.g. X=3), then the fitness function is called once for each X (3) solutions.
+        fitness_batch_size: Added in PyGAD 2.19.0. Supports calculating the fitness in batches. If the value is 1 or None, then the fitness function is called for each individual solution. If given another value X where X is neither 1 nor None (e.g. X=3), then the fitness function is called once for each X (3) solutions. Added in PyGAD 3.6.0: If the value is "population", then the fitness function is called only once per generation for all solutions whose fitness is not already known. It receives a 2D array of solutions and a 1D array of their indices and returns a 1D array (single-objective) or a 2D array (multi-objective) with a row per solution.
 
         initial_population: A user-defined initial population. It is useful when the user wants to start the generations with a custom initial population. It defaults to None which means no initial population is specified by the user. In this case, PyGAD creates an initial population using the 'sol_per_pop' and 'num_genes' parameters. An exception is raised if the 'initial_population' is None while any of the 2 parameters ('sol_per_pop' or 'num_genes') is also None.
         sol_per_pop: Number of solutions in the population. 
@@ -117,17 +135,25 @@ class GA(utils.parent_selection.ParentSelection,
         on_mutation: Accepts a function/method to be called each time the mutation operation is applied. If functioned, then it must accept 2 parameters: the first one represents the instance of the genetic algorithm and the second one represents the offspring after applying the mutation. If method, then it must accept 3 parameters where the third one refers to the method's object. Added in PyGAD 2.6.0.
         on_generation: Accepts a function/method to be called after each generation. If functioned, then it must accept a single parameter representing the instance of the genetic algorithm. If the function returned "stop", then the run() method stops without completing the other generations. If method, then it must accept 2 parameters where the second one refers to the method's object. Added in PyGAD 2.6.0.
         on_stop: Accepts a function/method to be called only once exactly before the genetic algorithm stops or when it completes all the generations. If functioned, then it must accept 2 parameters: the first one represents the instance of the genetic algorithm and the second one is a list of fitness values of the last population's solutions. If method, then it must accept 3 parameters where the third one refers to the method's object. Added in PyGAD 2.6.0.
+        on_perf: Accepts a function/method to be called after each generation with the performance statistics of the generation. If functioned, then it must accept 2 parameters: the first one represents the instance of the genetic algorithm and the second one is the row of the generation in the 'perf_stats' attribute. If method, then it must accept 3 parameters where the third one refers to the method's object. It is only called when collect_perf_stats=True. Added in PyGAD 3.6.0.
 
         save_best_solutions: Added in PyGAD 2.9.0 and its type is bool. If True, then the best solution in each generation is saved into the 'best_solutions' attribute. Use this parameter with caution as it may cause memory overflow when either the number of generations or the number of genes is large.
         save_solutions: Added in PyGAD 2.15.0 and its type is bool. If True, then all solutions in each generation are saved into the 'solutions' attribute. Use this parameter with caution as it may cause memory overflow when either the number of generations, number of genes, or number of solutions in population is large.
+        fitness_cache_size: Added in PyGAD 3.6.0. It defaults to None. If a positive integer is assigned, then the fitness of every evaluated solution is saved into a cache (the 'fitness_cache' attribute) holding at most this number of solutions where the least recently used solutions are evicted first. The fitness function is not called for a solution that exists in the cache. If None, then the cache only holds the solutions saved using the 'save_solutions' and 'save_best_solutions' parameters (or every evaluated solution if the adaptive mutation is used) without a limit on its size.
+        pareto_archive_size: Added in PyGAD 3.6.0. It defaults to None which means no archive is used. If a positive integer is assigned, then the non-dominated solutions found across all generations are saved into an archive (the 'pareto_archive' attribute) holding at most this number of solutions. It is useful for multi-objective problems as the 'pareto_fronts' attribute only describes the current population. The archive is saved by the save() method.
+        pareto_archive_truncation: Added in PyGAD 3.6.0. The method used to remove solutions from the Pareto archive once it exceeds the size in the 'pareto_archive_size' parameter. If "crowding" (default), the solutions with the smallest crowding distance are removed. If "hypervolume", the solutions with the smallest contribution to the hypervolume are removed.
 
         suppress_warnings: Added in PyGAD 2.10.0 and its type is bool. If True, then no warning messages will be displayed. It defaults to False.
 
         allow_duplicate_genes: Added in PyGAD 2.13.0. If True, then a solution/chromosome may have duplicate gene values. If False, then each gene will have a unique value in its solution.
+        gene_encoding: Added in PyGAD 3.6.0. It defaults to None. If "permutation", then each solution is a permutation of the values in the 'gene_space' parameter (or of the gene indices if 'gene_space' is None). The crossover type must be one of the permutation crossovers ("ox", "pmx", "cycle", or "edge") and the mutation type must be one of "swap", "inversion", or "scramble". The solutions remain valid permutations without repairing duplicate genes.
 
-        stop_criteria: Added in PyGAD 2.15.0. It is assigned to some criteria to stop the evolution if at least one criterion holds.
+        stop_criteria: Added in PyGAD 2.15.0. It is assigned to some criteria to stop the evolution if at least one criterion holds. Added in PyGAD 3.6.0: The "hv_saturate_K_eps" criterion stops the evolution of a multi-objective problem if the best hypervolume of the first pareto front does not improve by more than the fraction eps in K generations (e.g. "hv_saturate_10_0.001"). The eps part is optional and defaults to 0.
 
-        parallel_processing: Added in PyGAD 2.17.0. Defaults to `None` which means no parallel processing is used. If a positive integer is assigned, it specifies the number of threads to be used. If a list or a tuple of exactly 2 elements is assigned, then: 1) The first element can be either "process" or "thread" to specify whether processes or threads are used, respectively. 2) The second element can be: 1) A positive integer to select the maximum number of processes or threads to be used. 2) 0 to indicate that parallel processing is not used. This is identical to setting 'parallel_processing=None'. 3) None to use the default value as calculated by the concurrent.futures module.
+        parallel_processing: Added in PyGAD 2.17.0. Defaults to `None` which means no parallel processing is used. If a positive integer is assigned, it specifies the number of threads to be used. If a list or a tuple of exactly 2 elements is assigned, then: 1) The first element can be either "process" or "thread" to specify whether processes or threads are used, respectively. 2) The second element can be: 1) A positive integer to select the maximum number of processes or threads to be used. 2) 0 to indicate that parallel processing is not used. This is identical to setting 'parallel_processing=None'. 3) None to use the default value as calculated by the concurrent.futures module. Starting from PyGAD 3.6.0, it also accepts an instance of the concurrent.futures.Executor class to be used for parallel processing. PyGAD does not shut down an executor passed by the user. The executor used for parallel processing is created only once and reused across all generations and calls to the run() method. Call the close() method to shut it down.
+        worker_attributes: Added in PyGAD 3.6.0. It is only used with process-based parallel processing. The processes do not receive the pygad.GA instance. Instead, the fitness function receives a slim read-only context sent only once to each process when it starts. If None (default), then the context has all the attributes of the pygad.GA instance except for those that change in each generation (e.g. 'population'), may hold too much data (e.g. 'solutions'), or are callables other than the fitness function. If a list/tuple of attribute names is assigned, then the context only has these attributes in addition to the fitness function.
+        collect_perf_stats: Added in PyGAD 3.6.0. If True, then the run() method measures the time spent in each phase of each generation (parent selection, crossover, mutation, fitness calculation, callbacks, and duplicate genes repair) using time.perf_counter_ns(). It also counts the evaluated solutions, the calls to the fitness function, and the fitness cache hits. The statistics are saved into the 'perf_stats' attribute as a NumPy structured array with a row per generation. It defaults to False.
+        shared_memory: Added in PyGAD 3.6.0. It is only used with process-based parallel processing. If True, then the solutions are not pickled and sent to the processes. Instead, they are copied into a shared memory block (multiprocessing.shared_memory) and each task only carries the range of its rows. The processes read the rows without copying them and write the fitness values into a shared array. It requires all genes to have the same data type. It defaults to False.
 
         random_seed: Added in PyGAD 2.18.0. It defines the random seed to be used by the random function generators (we use random functions in the NumPy and random modules). This helps to reproduce the same results by setting the same random seed.
 
@@ -184,6 +210,19 @@ class GA(utils.parent_selection.ParentSelection,
                 self.valid_parameters = False
                 raise TypeError(f"The expected type of the 'suppress_warnings' parameter is bool but {type(suppress_warnings)} found.")
 
+            # Validate collect_perf_stats. It is validated before building the initial population as the duplicate genes repair is measured.
+            if type(collect_perf_stats) is bool:
+                self.collect_perf_stats = collect_perf_stats
+            else:
+                self.valid_parameters = False
+                raise TypeError(f"The expected type of the 'collect_perf_stats' parameter is bool but {type(collect_perf_stats)} found.")
+            # Added in PyGAD 3.6.0. A NumPy structured array with the performance statistics of each generation. Check the pygad.helper.perf module for its fields.
+            # It is extended with each call to the run() method. The rows are saved into a larger buffer to append them in amortized constant time.
+            self.perf_stats_buffer = numpy.zeros(0, dtype=helper.perf.PERF_STATS_DTYPE)
+            self.perf_stats = self.perf_stats_buffer
+            # The statistics of the generation being measured.
+            self.perf_generation = None
+
             # Validating mutation_by_replacement
             if not (type(mutation_by_replacement) is bool):
                 self.valid_parameters = False
@@ -398,6 +437,32 @@ class GA(utils.parent_selection.ParentSelection,
                 self.valid_parameters = False
                 raise ValueError(f"The value passed to the 'gene_type' parameter must be either a single integer, floating-point, list, tuple, or numpy.ndarray but ({gene_type}) of type {type(gene_type)} found.")
 
+            # Validate gene_encoding
+            if gene_encoding is None:
+                pass
+            elif not (type(gene_encoding) is str):
+                self.valid_parameters = False
+                raise TypeError(f"The expected type of the 'gene_encoding' parameter is str but {type(gene_encoding)} found.")
+            elif gene_encoding == "permutation":
+                if not self.gene_type_single:
+                    self.valid_parameters = False
+                    raise ValueError(f"When gene_encoding='permutation', all genes must have the same data type but the 'gene_type' parameter is {gene_type}.")
+                if not (gene_space is None):
+                    if self.gene_space_nested or not (type(gene_space) in [list, tuple, range, numpy.ndarray]) or (None in list(gene_space)):
+                        self.valid_parameters = False
+                        raise ValueError("When gene_encoding='permutation', the 'gene_space' parameter must be a single list/tuple/range/numpy.ndarray of numbers holding the values to permute.")
+                    if len(set(gene_space)) != len(gene_space):
+                        self.valid_parameters = False
+                        raise ValueError("When gene_encoding='permutation', the values in the 'gene_space' parameter must be unique.")
+                if not (gene_constraint is None):
+                    self.valid_parameters = False
+                    raise ValueError("The 'gene_constraint' parameter is not supported when gene_encoding='permutation'.")
+            else:
+                self.valid_parameters = False
+                raise ValueError(f"The value of the 'gene_encoding' parameter must be either None or 'permutation' but ({gene_encoding}) found.")
+
+            self.gene_encoding = gene_encoding
+
             # Call the unpack_gene_space() method in the pygad.helper.unique.Unique class.
             self.gene_space_unpacked = self.unpack_gene_space(range_min=self.init_range_low,
                                                               range_max=self.init_range_high)
@@ -428,6 +493,10 @@ class GA(utils.parent_selection.ParentSelection,
 
                     # Number of solutions in the population.
                     self.sol_per_pop = sol_per_pop
+                    # Compile the gene space into lookup tables used to build the initial population and apply the mutation.
+                    self.gene_space_table = self.compile_gene_space()
+                    if self.gene_encoding == "permutation":
+                        self.permutation_values = self.get_permutation_values()
                     self.initialize_population(allow_duplicate_genes=allow_duplicate_genes,
                                                gene_type=self.gene_type,
                                                gene_constraint=gene_constraint)
@@ -453,23 +522,6 @@ class GA(utils.parent_selection.ParentSelection,
                 # Change the data type and round all genes within the initial population.
                 self.initial_population = self.change_population_dtype_and_round(initial_population)
 
-                # Check if duplicates are allowed. If not, then solve any existing duplicates in the passed initial population.
-                if self.allow_duplicate_genes == False:
-                    for initial_solution_idx, initial_solution in enumerate(self.initial_population):
-                        if self.gene_space is None:
-                            self.initial_population[initial_solution_idx], _, _ = self.solve_duplicate_genes_randomly(solution=initial_solution,
-                                                                                                                      min_val=self.init_range_low,
-                                                                                                                      max_val=self.init_range_high,
-                                                                                                                      mutation_by_replacement=True,
-                                                                                                                      gene_type=self.gene_type,
-                                                                                                                      sample_size=self.sample_size)
-                        else:
-                            self.initial_population[initial_solution_idx], _, _ = self.solve_duplicate_genes_by_space(solution=initial_solution,
-                                                                                                                      gene_type=self.gene_type,
-                                                                                                                      sample_size=self.sample_size,
-                                                                                                                      mutation_by_replacement=True,
-                                                                                                                      build_initial_pop=True)
-
                 # A NumPy array holding the initial population.
                 self.population = self.initial_population.copy()
                 # Number of genes in the solution.
@@ -489,6 +541,16 @@ class GA(utils.parent_selection.ParentSelection,
                     self.valid_parameters = False
                     raise ValueError(f"When the parameter 'gene_space' is nested, then its length must be equal to the value passed to the 'num_genes' parameter. Instead, length of gene_space ({len(gene_space)}) != num_genes ({self.num_genes})")
 
+            if not (initial_population is None):
+                # Compile the gene space into lookup tables used to apply the mutation.
+                # Without an initial population, the tables are compiled before creating the population.
+                self.gene_space_table = self.compile_gene_space()
+                if self.gene_encoding == "permutation":
+                    self.permutation_values = self.get_permutation_values()
+                    if not numpy.all(numpy.sort(numpy.asarray(self.population, dtype=self.permutation_values.dtype), axis=1) == self.permutation_values):
+                        self.valid_parameters = False
+                        raise ValueError("When gene_encoding='permutation', each solution in the 'initial_population' parameter must be a permutation of the values in the 'gene_space' parameter (or of the gene indices if 'gene_space' is None).")
+
             # Validate random_mutation_min_val and random_mutation_max_val
             if type(random_mutation_min_val) in GA.supported_int_float_types:
                 if type(random_mutation_max_val) in GA.supported_int_float_types:
@@ -567,6 +629,17 @@ class GA(utils.parent_selection.ParentSelection,
 
             self.gene_constraint = gene_constraint
 
+            if not (initial_population is None):
+                # Check once whether unique values can be assigned to all genes. Without an initial population, it is checked while creating the population.
+                self.unique_genes_feasible = self.check_unique_genes_feasibility()
+
+            # Check if duplicates are allowed. If not, then solve any existing duplicates in the passed initial population.
+            # The duplicates are solved after the gene space is compiled and the gene_constraint parameter is validated.
+            if not (initial_population is None) and self.allow_duplicate_genes == False:
+                self.initial_population, _ = self.solve_duplicate_genes_batch(population=self.initial_population,
+                                                                              build_initial_pop=True)
+                self.population = self.initial_population.copy()
+
             # Validating the number of parents to be selected for mating (num_parents_mating)
             if num_parents_mating <= 0:
                 self.valid_parameters = False
@@ -612,9 +685,25 @@ class GA(utils.parent_selection.ParentSelection,
                     self.crossover = self.uniform_crossover
                 elif crossover_type == "scattered":
                     self.crossover = self.scattered_crossover
+                elif crossover_type == "ox":
+                    self.crossover = self.ox_crossover
+                elif crossover_type == "pmx":
+                    self.crossover = self.pmx_crossover
+                elif crossover_type == "cycle":
+                    self.crossover = self.cycle_crossover
+                elif crossover_type == "edge":
+                    self.crossover = self.edge_crossover
                 else:
                     self.valid_parameters = False
-                    raise TypeError(f"Undefined crossover type. \nThe assigned value to the crossover_type ({crossover_type}) parameter does not refer to one of the supported crossover types which are: \n-single_point (for single point crossover)\n-two_points (for two points crossover)\n-uniform (for uniform crossover)\n-scattered (for scattered crossover).\n")
+                    raise TypeError(f"Undefined crossover type. \nThe assigned value to the crossover_type ({crossover_type}) parameter does not refer to one of the supported crossover types which are: \n-single_point (for single point crossover)\n-two_points (for two points crossover)\n-uniform (for uniform crossover)\n-scattered (for scattered crossover)\n-ox (for order crossover of permutations)\n-pmx (for partially mapped crossover of permutations)\n-cycle (for cycle crossover of permutations)\n-edge (for edge recombination crossover of permutations).\n")
+
+                # The permutation crossovers keep the solutions valid permutations only when gene_encoding='permutation'. The other crossovers break the permutations.
+                if (crossover_type in GA.supported_permutation_crossover_types) != (self.gene_encoding == "permutation"):
+                    self.valid_parameters = False
+                    if self.gene_encoding == "permutation":
+                        raise ValueError(f"When gene_encoding='permutation', the 'crossover_type' parameter must be one of {GA.supported_permutation_crossover_types}, a callable, or None but ({crossover_type}) found.")
+                    else:
+                        raise ValueError(f"The crossover type ({crossover_type}) is only supported when gene_encoding='permutation'.")
 
             self.crossover_type = crossover_type
 
@@ -671,6 +760,10 @@ class GA(utils.parent_selection.ParentSelection,
                     self.valid_parameters = False
                     raise TypeError(f"Undefined mutation type. \nThe assigned string value to the 'mutation_type' parameter ({mutation_type}) does not refer to one of the supported mutation types which are: \n-random (for random mutation)\n-swap (for swap mutation)\n-inversion (for inversion mutation)\n-scramble (for scramble mutation)\n-adaptive (for adaptive mutation).\n")
 
+                if self.gene_encoding == "permutation" and not (mutation_type in GA.supported_permutation_mutation_types):
+                    self.valid_parameters = False
+                    raise ValueError(f"When gene_encoding='permutation', the 'mutation_type' parameter must be one of {GA.supported_permutation_mutation_types}, a callable, or None but ({mutation_type}) found.")
+
             self.mutation_type = mutation_type
 
             # Calculate the value of mutation_probability
@@ -965,9 +1058,13 @@ class GA(utils.parent_selection.ParentSelection,
 
             if fitness_batch_size is None:
                 pass
+            elif type(fitness_batch_size) is str:
+                if fitness_batch_size != "population":
+                    self.valid_parameters = False
+                    raise ValueError(f"The only string value accepted by the fitness_batch_size parameter is 'population' but the value ({fitness_batch_size}) found.")
             elif not (type(fitness_batch_size) in GA.supported_int_types):
                 self.valid_parameters = False
-                raise TypeError(f"The value assigned to the fitness_batch_size parameter is expected to be integer but the value ({fitness_batch_size}) of type {type(fitness_batch_size)} found.")
+                raise TypeError(f"The value assigned to the fitness_batch_size parameter is expected to be integer or the string 'population' but the value ({fitness_batch_size}) of type {type(fitness_batch_size)} found.")
             elif fitness_batch_size <= 0 or fitness_batch_size > self.sol_per_pop:
                 self.valid_parameters = False
                 raise ValueError(f"The value assigned to the fitness_batch_size parameter must be:\n1) Greater than 0.\n2) Less than or equal to sol_per_pop ({self.sol_per_pop}).\nBut the value ({fitness_batch_size}) found.")
@@ -1142,6 +1239,30 @@ class GA(utils.parent_selection.ParentSelection,
             else:
                 self.on_stop = None
 
+            # Check if the on_perf exists.
+            if not (on_perf is None):
+                # Check if the on_perf is a method.
+                if inspect.ismethod(on_perf):
+                    # Check if the on_perf method accepts 3 parameters.
+                    if on_perf.__code__.co_argcount == 3:
+                        self.on_perf = on_perf
+                    else:
+                        self.valid_parameters = False
+                        raise ValueError(f"The method assigned to the on_perf parameter must accept 3 parameters:\n1) Expected to be the 'self' object.\n2) The instance of the genetic algorithm.\n3) The performance statistics of the generation.\nThe passed method named '{on_perf.__code__.co_name}' accepts {on_perf.__code__.co_argcount} parameter(s).")
+                # Check if the on_perf is a function.
+                elif callable(on_perf):
+                    # Check if the on_perf function accepts 2 parameters.
+                    if on_perf.__code__.co_argcount == 2:
+                        self.on_perf = on_perf
+                    else:
+                        self.valid_parameters = False
+                        raise ValueError(f"The function assigned to the on_perf parameter must accept 2 parameters representing the instance of the genetic algorithm and the performance statistics of the generation.\nThe passed function named '{on_perf.__code__.co_name}' accepts {on_perf.__code__.co_argcount} parameter(s).")
+                else:
+                    self.valid_parameters = False
+                    raise TypeError(f"The value assigned to the 'on_perf' parameter is expected to be of type function but {type(on_perf)} found.")
+            else:
+                self.on_perf = None
+
             # Validate save_best_solutions
             if type(save_best_solutions) is bool:
                 if save_best_solutions == True:
@@ -1160,12 +1281,41 @@ class GA(utils.parent_selection.ParentSelection,
                 self.valid_parameters = False
                 raise TypeError(f"The value passed to the 'save_solutions' parameter must be of type bool but {type(save_solutions)} found.")
 
+            # Validate fitness_cache_size
+            if fitness_cache_size is None:
+                pass
+            elif type(fitness_cache_size) in GA.supported_int_types:
+                if fitness_cache_size <= 0:
+                    self.valid_parameters = False
+                    raise ValueError(f"The value assigned to the 'fitness_cache_size' parameter must be a positive integer but the value ({fitness_cache_size}) found.")
+            else:
+                self.valid_parameters = False
+                raise TypeError(f"The value assigned to the 'fitness_cache_size' parameter must be either None or a positive integer but the value ({fitness_cache_size}) of type {type(fitness_cache_size)} found.")
+
+            # Validate pareto_archive_size
+            if pareto_archive_size is None:
+                pass
+            elif type(pareto_archive_size) in GA.supported_int_types:
+                if pareto_archive_size <= 0:
+                    self.valid_parameters = False
+                    raise ValueError(f"The value assigned to the 'pareto_archive_size' parameter must be a positive integer but the value ({pareto_archive_size}) found.")
+            else:
+                self.valid_parameters = False
+                raise TypeError(f"The value assigned to the 'pareto_archive_size' parameter must be either None or a positive integer but the value ({pareto_archive_size}) of type {type(pareto_archive_size)} found.")
+
+            # Validate pareto_archive_truncation
+            if not (pareto_archive_truncation in helper.pareto_archive.ParetoArchive.supported_truncations):
+                self.valid_parameters = False
+                raise ValueError(f"The value assigned to the 'pareto_archive_truncation' parameter must be one of {helper.pareto_archive.ParetoArchive.supported_truncations} but the value ({pareto_archive_truncation}) found.")
+
             def validate_multi_stop_criteria(self, stop_word, number):
                 if stop_word == 'reach':
                     pass
+                elif stop_word == 'hv_saturate' and len(number) == 2:
+                    pass
                 else:
                     self.valid_parameters = False
-                    raise ValueError(f"Passing multiple numbers following the keyword in the 'stop_criteria' parameter is expected only with the 'reach' keyword but the keyword ({stop_word}) found.")
+                    raise ValueError(f"Passing multiple numbers following the keyword in the 'stop_criteria' parameter is expected only with the 'reach' keyword (or 2 numbers with the 'hv_saturate' keyword) but the keyword ({stop_word}) found with {len(number)} numbers.")
 
                 for idx, num in enumerate(number):
                     if num.replace(".", "").replace("-", "").isnumeric():
@@ -1176,14 +1326,18 @@ class GA(utils.parent_selection.ParentSelection,
                 return number
 
             self.stop_criteria = []
-            self.supported_stop_words = ["reach", "saturate"]
+            self.supported_stop_words = ["reach", "saturate", "hv_saturate"]
             if stop_criteria is None:
                 # None: Stop after passing through all generations.
                 self.stop_criteria = None
             elif type(stop_criteria) is str:
                 # reach_{target_fitness}: Stop if the target fitness value is reached.
                 # saturate_{num_generations}: Stop if the fitness value does not change (saturates) for the given number of generations.
+                # hv_saturate_{num_generations}_{epsilon}: Stop if the hypervolume of the first pareto front does not improve by more than epsilon (relative) for the given number of generations.
                 criterion = stop_criteria.split("_")
+                # The 'hv_saturate' stop word has an underscore.
+                if criterion[0:2] == ["hv", "saturate"]:
+                    criterion = ["hv_saturate"] + criterion[2:]
                 stop_word = criterion[0]
                 # criterion[1] might be a single or multiple numbers.
                 number = criterion[1:]
@@ -1216,6 +1370,9 @@ class GA(utils.parent_selection.ParentSelection,
                 for idx, val in enumerate(stop_criteria):
                     if type(val) is str:
                         criterion = val.split("_")
+                        # The 'hv_saturate' stop word has an underscore.
+                        if criterion[0:2] == ["hv", "saturate"]:
+                            criterion = ["hv_saturate"] + criterion[2:]
                         stop_word = criterion[0]
                         number = criterion[1:]
                         if len(criterion) == 2:
@@ -1247,8 +1404,31 @@ class GA(utils.parent_selection.ParentSelection,
                 self.valid_parameters = False
                 raise TypeError(f"The expected value of the 'stop_criteria' is a single string or a list/tuple/numpy.ndarray of strings but the value ({stop_criteria}) of type {type(stop_criteria)} found.")
 
+            # Validate worker_attributes
+            if worker_attributes is None:
+                pass
+            elif type(worker_attributes) in [list, tuple]:
+                for attribute in worker_attributes:
+                    if type(attribute) is str:
+                        pass
+                    else:
+                        self.valid_parameters = False
+                        raise TypeError(f"The elements of the 'worker_attributes' parameter must be strings holding attribute names but the value ({attribute}) of type {type(attribute)} found.")
+            else:
+                self.valid_parameters = False
+                raise TypeError(f"The value assigned to the 'worker_attributes' parameter must be either None or a list/tuple of attribute names but the value ({worker_attributes}) of type {type(worker_attributes)} found.")
+            self.worker_attributes = worker_attributes
+
+            # The executor passed by the user to the 'parallel_processing' parameter. PyGAD never shuts it down.
+            self.user_executor = None
             if parallel_processing is None:
                 self.parallel_processing = None
+            elif isinstance(parallel_processing, concurrent.futures.Executor):
+                self.user_executor = parallel_processing
+                if isinstance(parallel_processing, concurrent.futures.ProcessPoolExecutor):
+                    self.parallel_processing = ["process", None]
+                else:
+                    self.parallel_processing = ["thread", None]
             elif type(parallel_processing) in GA.supported_int_types:
                 if parallel_processing > 0:
                     self.parallel_processing = ["thread", parallel_processing]
@@ -1280,7 +1460,25 @@ class GA(utils.parent_selection.ParentSelection,
                     raise ValueError(f"When a list or tuple is assigned to the 'parallel_processing' parameter, then it must have 2 elements but ({len(parallel_processing)}) found.")
             else:
                 self.valid_parameters = False
-                raise ValueError(f"Unexpected value ({parallel_processing}) of type ({type(parallel_processing)}) assigned to the 'parallel_processing' parameter. The accepted values for this parameter are:\n1) None: (Default) It means no parallel processing is used.\n2) A positive integer referring to the number of threads to be used (i.e. threads, not processes, are used.\n3) list/tuple: If a list or a tuple of exactly 2 elements is assigned, then:\n\t*1) The first element can be either 'process' or 'thread' to specify whether processes or threads are used, respectively.\n\t*2) The second element can be:\n\t\t**1) A positive integer to select the maximum number of processes or threads to be used.\n\t\t**2) 0 to indicate that parallel processing is not used. This is identical to setting 'parallel_processing=None'.\n\t\t**3) None to use the default value as calculated by the concurrent.futures module.")
+                raise ValueError(f"Unexpected value ({parallel_processing}) of type ({type(parallel_processing)}) assigned to the 'parallel_processing' parameter. The accepted values for this parameter are:\n1) None: (Default) It means no parallel processing is used.\n2) A positive integer referring to the number of threads to be used (i.e. threads, not processes, are used.\n3) list/tuple: If a list or a tuple of exactly 2 elements is assigned, then:\n\t*1) The first element can be either 'process' or 'thread' to specify whether processes or threads are used, respectively.\n\t*2) The second element can be:\n\t\t**1) A positive integer to select the maximum number of processes or threads to be used.\n\t\t**2) 0 to indicate that parallel processing is not used. This is identical to setting 'parallel_processing=None'.\n\t\t**3) None to use the default value as calculated by the concurrent.futures module.\n4) An instance of the concurrent.futures.Executor class.")
+
+            # Validate shared_memory
+            if type(shared_memory) is bool:
+                if shared_memory:
+                    if self.parallel_processing is None or self.parallel_processing[0] != "process":
+                        self.valid_parameters = False
+                        raise ValueError(f"The 'shared_memory' parameter can only be set to True when process-based parallel processing is used (e.g. parallel_processing=['process', 4]) but the value ({self.parallel_processing}) is assigned to the 'parallel_processing' parameter.")
+                    elif not self.gene_type_single:
+                        self.valid_parameters = False
+                        raise ValueError("The 'shared_memory' parameter can only be set to True when all genes have the same data type (i.e. a single data type is assigned to the 'gene_type' parameter).")
+            else:
+                self.valid_parameters = False
+                raise TypeError(f"The value passed to the 'shared_memory' parameter must be of type bool but {type(shared_memory)} found.")
+            self.shared_memory = shared_memory
+
+            if self.fitness_batch_size == "population" and not (self.parallel_processing is None):
+                if not self.suppress_warnings:
+                    warnings.warn("When fitness_batch_size='population', the fitness function is called only once for all the solutions. The parallel_processing parameter has no effect on calculating the fitness.")
 
             # Set the `run_completed` property to False. It is set to `True` only after the `run()` method is complete.
             self.run_completed = False
@@ -1288,6 +1486,17 @@ class GA(utils.parent_selection.ParentSelection,
             # The number of completed generations.
             self.generations_completed = 0
 
+            # Added in PyGAD 3.6.0. The number of offspring evaluated by the run_steady_state() method. In the steady-state mode, the progress is counted in evaluations rather than generations.
+            self.evaluations_completed = 0
+
+            # Added in PyGAD 3.6.0. The state of the ask/tell interface.
+            # The outputs of the reuse_pop_fitness() method for the solutions returned by ask() and waiting for their fitness to be passed to tell().
+            self.ask_tell_pending = None
+            # The index of the generation at which the evolution started by ask() stops. It is None if no evolution is in progress.
+            self.ask_tell_generation_last_idx = None
+            # The fitness of the best solution in the current generation of the evolution started by ask().
+            self.ask_tell_best_solution_fitness = None
+
             # At this point, all necessary parameters validation is done successfully, and we are sure that the parameters are valid.
             # Set to True when all the parameters passed in the GA class constructor are valid.
             self.valid_parameters = True
@@ -1315,6 +1524,25 @@ class GA(utils.parent_selection.ParentSelection,
             # Holds the fitness of the solutions in each generation.
             self.solutions_fitness = []
 
+            self.fitness_cache_size = fitness_cache_size
+            # Added in PyGAD 3.6.0. A cache mapping the previously explored solutions to their fitness values. It is used by the cal_pop_fitness() method to avoid calling the fitness function again for such solutions.
+            # It is None if none of the 'save_solutions', 'save_best_solutions', and 'fitness_cache_size' parameters is used and the mutation is not adaptive.
+            # The adaptive mutation evaluates the offspring before mutating them. So, the fitness of every evaluated solution is saved into the cache to evaluate every distinct solution only once.
+            if save_solutions or save_best_solutions or not (fitness_cache_size is None) or self.mutation_type == "adaptive":
+                self.fitness_cache = helper.fitness_cache.FitnessCache(max_entries=fitness_cache_size)
+            else:
+                self.fitness_cache = None
+
+            self.pareto_archive_size = pareto_archive_size
+            self.pareto_archive_truncation = pareto_archive_truncation
+            # Added in PyGAD 3.6.0. An archive of the non-dominated solutions found across all generations. It is updated by the run_best_solution() method.
+            # It is None if the 'pareto_archive_size' parameter is None.
+            if pareto_archive_size is None:
+                self.pareto_archive = None
+            else:
+                self.pareto_archive = helper.pareto_archive.ParetoArchive(max_size=pareto_archive_size,
+                                                                          truncation=pareto_archive_truncation)
+
             # A list holding the fitness values of all solutions in the last generation.
             self.last_generation_fitness = None
             # A list holding the parents of the last generation.
@@ -1327,12 +1555,35 @@ class GA(utils.parent_selection.ParentSelection,
             # They are used inside the cal_pop_fitness() method to fetch the fitness of the parents in one generation before the latest generation.
             # This is to avoid re-calculating the fitness for such parents again.
             self.previous_generation_fitness = None
+            # Added in PyGAD 3.6.0. A dict mapping the keys of the offspring evaluated by the adaptive mutation (before being mutated) to their fitness. It is used by the reuse_pop_fitness() method so that the offspring not changed by the mutation are not evaluated again.
+            self.last_generation_offspring_known_fitness = {}
             # Added in PyGAD 2.18.0. A NumPy array holding the elitism of the current generation according to the value passed in the 'keep_elitism' parameter. It works only if the 'keep_elitism' parameter has a non-zero value.
             self.last_generation_elitism = None
             # Added in PyGAD 2.19.0. A NumPy array holding the indices of the elitism of the current generation. It works only if the 'keep_elitism' parameter has a non-zero value.
             self.last_generation_elitism_indices = None
             # Supported in PyGAD 3.2.0. It holds the pareto fronts when solving a multi-objective problem.
             self.pareto_fronts = None
+            # Added in PyGAD 3.6.0. The ranking of the solutions (pareto fronts and crowding distances) of the last sorted fitness when solving a multi-objective problem.
+            # It is built by the nsga2_ranking() method and reused by the parent selection, the elitism, and the best_solution() method until the fitness changes.
+            self.nsga2_ranking_cache = None
+            # Added in PyGAD 3.6.0. The hypervolume of the first pareto front in each generation. It is calculated only if the 'hv_saturate' stop criterion is used.
+            self.hypervolumes = []
+            # Added in PyGAD 3.6.0. The reference point used to calculate the hypervolume. If None, it is created from the fitness of the first generation in which the hypervolume is calculated.
+            self.hypervolume_reference_point = None
+            # Added in PyGAD 3.6.0. The number of bytes sent to/received from the processes in process-based parallel processing.
+            # 'context_bytes' is the size of the worker context sent once to each process. 'num_tasks' is the number of tasks submitted. 'bytes_sent' and 'bytes_received' are the total sizes of the tasks and their results.
+            self.ipc_stats = {"context_bytes": 0,
+                              "num_tasks": 0,
+                              "bytes_sent": 0,
+                              "bytes_received": 0}
+            # Added in PyGAD 3.6.0. The executor used for parallel processing. It is created by the get_executor() method and reused across generations until the close() method is called.
+            self.executor = self.user_executor
+            # Added in PyGAD 3.6.0. The shared memory blocks used to transfer the solutions and fitness values to/from the processes when shared_memory=True. The key is the role of the block ("population" or "fitness").
+            self.shared_memory_blocks = {}
+            # Added in PyGAD 3.6.0. The finalizers that release the shared memory blocks. They are registered once a block is created so that the blocks are released even if the close() method is not called.
+            self.shared_memory_finalizers = {}
+            # The number of columns in the shared fitness array. It is 0 until the fitness function returns its first value.
+            self.shared_memory_num_objectives = 0
         except Exception as e:
             self.logger.exception(e)
             # sys.exit(-1)
@@ -1383,7 +1634,10 @@ class GA(utils.parent_selection.ParentSelection,
         self.population = numpy.empty(shape=self.pop_size, dtype=object)
 
         # 1) Create the initial population either randomly or using the gene space.
-        if self.gene_space is None:
+        if self.gene_encoding == "permutation":
+            # Each solution is a random permutation of the values. Sorting random keys gives a uniformly random permutation for each solution.
+            self.population[:, :] = self.permutation_values[numpy.argsort(numpy.random.random(size=self.pop_size), axis=1)]
+        elif self.gene_space is None:
             # Create the initial population randomly.
 
             # Set gene_value=None to consider generating values for the initial population instead of generating values for mutation.
@@ -1400,14 +1654,18 @@ class GA(utils.parent_selection.ParentSelection,
                                                                                            step=1)
 
         else:
-            # Generate the initial population using the gene_space.
-            for sol_idx in range(self.sol_per_pop):
+            # Generate the initial population using the compiled gene space. All the genes of all solutions are selected at once.
+            if self.gene_type_single == True:
+                genes_indices = numpy.tile(numpy.arange(self.num_genes), self.sol_per_pop)
+                self.population[:, :] = self.gene_space_values(genes_indices=genes_indices,
+                                                               gene_type=self.gene_type).reshape(self.pop_size)
+            else:
+                # Each gene has its own data type. The genes are selected column by column.
                 for gene_idx in range(self.num_genes):
-                    self.population[sol_idx, gene_idx] = self.generate_gene_value_from_space(gene_idx=gene_idx,
-                                                                                             mutation_by_replacement=True,
-                                                                                             gene_value=None,
-                                                                                             solution=self.population[sol_idx],
-                                                                                             sample_size=1)
+                    gene_values = self.gene_space_values(genes_indices=numpy.full(self.sol_per_pop, gene_idx),
+                                                         gene_type=self.gene_type[gene_idx])
+                    # Assign a list to keep the data type of each value in the object array.
+                    self.population[:, gene_idx] = list(gene_values)
 
         # 2) Change the data type and round all genes within the initial population.
         self.population = self.change_population_dtype_and_round(self.population)
@@ -1465,21 +1723,12 @@ class GA(utils.parent_selection.ParentSelection,
                             raise Exception(f"It is expected to receive a list/numpy.ndarray from the gene_constraint callable that is either empty or has a single value equal, but received a list/numpy.ndarray of length {len(filtered_values)}.")
 
         # 4) Solve duplicate genes.
-        if allow_duplicate_genes == False:
-            for solution_idx in range(self.population.shape[0]):
-                if self.gene_space is None:
-                    self.population[solution_idx], _, _ = self.solve_duplicate_genes_randomly(solution=self.population[solution_idx],
-                                                                                              min_val=self.init_range_low,
-                                                                                              max_val=self.init_range_high,
-                                                                                              gene_type=gene_type,
-                                                                                              mutation_by_replacement=True,
-                                                                                              sample_size=self.sample_size)
-                else:
-                    self.population[solution_idx], _, _ = self.solve_duplicate_genes_by_space(solution=self.population[solution_idx].copy(),
-                                                                                              gene_type=self.gene_type,
-                                                                                              mutation_by_replacement=True,
-                                                                                              sample_size=self.sample_size,
-                                                                                              build_initial_pop=True)
+        # Check once whether unique values can be assigned to all genes. If not, a single warning is given instead of a warning at each generation.
+        self.unique_genes_feasible = self.check_unique_genes_feasibility()
+        # The permutations have no duplicate genes.
+        if allow_duplicate_genes == False and self.gene_encoding != "permutation":
+            self.population, _ = self.solve_duplicate_genes_batch(population=self.population,
+                                                                  build_initial_pop=True)
 
         # Change the data type and round all genes within the initial population.
         self.population = self.change_population_dtype_and_round(self.population)
@@ -1487,9 +1736,12 @@ class GA(utils.parent_selection.ParentSelection,
         # Keeping the initial population in the initial_population attribute.
         self.initial_population = self.population.copy()
 
-    def cal_pop_fitness(self):
+    def cal_pop_fitness(self, population=None, known_fitness=None):
         """
         Calculating the fitness values of batches of solutions in the current population. 
+        It accepts:
+            -population: Added in PyGAD 3.6.0. The solutions to calculate their fitness. If None, then the current population (the 'population' attribute) is used. Otherwise, the solutions are not part of the population yet (e.g. the offspring in the adaptive mutation) and None is passed to the fitness function as their index.
+            -known_fitness: Added in PyGAD 3.6.0. An optional dict mapping the keys returned by the FitnessCache.keys() method to the known fitness values. It is passed to the reuse_pop_fitness() method.
         It returns:
             -fitness: An array of the calculated fitness values.
         """
@@ -1497,89 +1749,45 @@ class GA(utils.parent_selection.ParentSelection,
             if self.valid_parameters == False:
                 raise Exception("ERROR calling the cal_pop_fitness() method: \nPlease check the parameters passed while creating an instance of the GA class.\n")
 
-            # 'last_generation_parents_as_list' is the list version of 'self.last_generation_parents'
-            # It is used to return the parent index using the 'in' membership operator of Python lists. This is much faster than using 'numpy.where()'.
-            if self.last_generation_parents is not None:
-                last_generation_parents_as_list = self.last_generation_parents.tolist()
-            else:
-                last_generation_parents_as_list = []
-
-            # 'last_generation_elitism_as_list' is the list version of 'self.last_generation_elitism'
-            # It is used to return the elitism index using the 'in' membership operator of Python lists. This is much faster than using 'numpy.where()'.
-            if self.last_generation_elitism is not None:
-                last_generation_elitism_as_list = self.last_generation_elitism.tolist()
-            else:
-                last_generation_elitism_as_list = []
-
-            pop_fitness = ["undefined"] * len(self.population)
-            if self.parallel_processing is None:
-                # Calculating the fitness value of each solution in the current population.
-                for sol_idx, sol in enumerate(self.population):
-                    # Check if the `save_solutions` parameter is `True` and whether the solution already exists in the `solutions` list. If so, use its fitness rather than calculating it again.
-                    # The functions numpy.any()/numpy.all()/numpy.where()/numpy.equal() are very slow.
-                    # So, list membership operator 'in' is used to check if the solution exists in the 'self.solutions' list.
-                    # Make sure that both the solution and 'self.solutions' are of type 'list' not 'numpy.ndarray'.
-                    # if (self.save_solutions) and (len(self.solutions) > 0) and (numpy.any(numpy.all(self.solutions == numpy.array(sol), axis=1)))
-                    # if (self.save_solutions) and (len(self.solutions) > 0) and (numpy.any(numpy.all(numpy.equal(self.solutions, numpy.array(sol)), axis=1)))
-
-                    # Make sure self.best_solutions is a list of lists before proceeding.
-                    # Because the second condition expects that best_solutions is a list of lists.
-                    if type(self.best_solutions) is numpy.ndarray:
-                        self.best_solutions = self.best_solutions.tolist()
-
-                    if (self.save_solutions) and (len(self.solutions) > 0) and (list(sol) in self.solutions):
-                        solution_idx = self.solutions.index(list(sol))
-                        fitness = self.solutions_fitness[solution_idx]
-                    elif (self.save_best_solutions) and (len(self.best_solutions) > 0) and (list(sol) in self.best_solutions):
-                        solution_idx = self.best_solutions.index(list(sol))
-                        fitness = self.best_solutions_fitness[solution_idx]
-                    elif (self.keep_elitism > 0) and (self.last_generation_elitism is not None) and (len(self.last_generation_elitism) > 0) and (list(sol) in last_generation_elitism_as_list):
-                        # Return the index of the elitism from the elitism array 'self.last_generation_elitism'.
-                        # This is not its index within the population. It is just its index in the 'self.last_generation_elitism' array.
-                        elitism_idx = last_generation_elitism_as_list.index(list(sol))
-                        # Use the returned elitism index to return its index in the last population.
-                        elitism_idx = self.last_generation_elitism_indices[elitism_idx]
-                        # Use the elitism's index to return its pre-calculated fitness value.
-                        fitness = self.previous_generation_fitness[elitism_idx]
-                    # If the solutions are not saved (i.e. `save_solutions=False`), check if this solution is a parent from the previous generation and its fitness value is already calculated. If so, use the fitness value instead of calling the fitness function.
-                    # We cannot use the `numpy.where()` function directly because it does not support the `axis` parameter. This is why the `numpy.all()` function is used to match the solutions on axis=1.
-                    # elif (self.last_generation_parents is not None) and len(numpy.where(numpy.all(self.last_generation_parents == sol, axis=1))[0] > 0):
-                    elif ((self.keep_parents == -1) or (self.keep_parents > 0)) and (self.last_generation_parents is not None) and (len(self.last_generation_parents) > 0) and (list(sol) in last_generation_parents_as_list):
-                        # Index of the parent in the 'self.last_generation_parents' array.
-                        # This is not its index within the population. It is just its index in the 'self.last_generation_parents' array.
-                        # parent_idx = numpy.where(numpy.all(self.last_generation_parents == sol, axis=1))[0][0]
-                        parent_idx = last_generation_parents_as_list.index(list(sol))
-                        # Use the returned parent index to return its index in the last population.
-                        parent_idx = self.last_generation_parents_indices[parent_idx]
-                        # Use the parent's index to return its pre-calculated fitness value.
-                        fitness = self.previous_generation_fitness[parent_idx]
-                    else:
-                        # Check if batch processing is used. If not, then calculate this missing fitness value.
-                        if self.fitness_batch_size in [1, None]:
-                            fitness = self.fitness_func(self, sol, sol_idx)
-                            if type(fitness) in GA.supported_int_float_types:
-                                # The fitness function returns a single numeric value.
-                                # This is a single-objective optimization problem.
-                                pass
-                            elif type(fitness) in [list, tuple, numpy.ndarray]:
-                                # The fitness function returns a list/tuple/numpy.ndarray.
-                                # This is a multi-objective optimization problem.
-                                pass
-                            else:
-                                raise ValueError(f"The fitness function should return a number or an iterable (list, tuple, or numpy.ndarray) but the value {fitness} of type {type(fitness)} found.")
+            if inspect.iscoroutinefunction(self.fitness_func):
+                raise TypeError("The fitness function is a coroutine function (async def). Use the run_async() method instead of the run() method to calculate the fitness.")
+
+            # The fitness of the solutions that are either in the fitness cache or were part of the previous generation is reused.
+            pop_fitness, solutions_indices, repeated_solutions_indices, population_keys = self.reuse_pop_fitness(population=population,
+                                                                                                                 known_fitness=known_fitness)
+
+            # The solutions outside the population do not have an index to pass to the fitness function.
+            pass_indices = population is None
+            if population is None:
+                population = self.population
+
+            if self.fitness_batch_size == "population":
+                # Vectorized fitness calculation: The fitness function is called only once for all the solutions to calculate their fitness.
+                if len(solutions_indices) > 0:
+                    pop_fitness = self.cal_pop_fitness_vectorized(pop_fitness=pop_fitness,
+                                                                  solutions_indices=solutions_indices,
+                                                                  population=population,
+                                                                  pass_indices=pass_indices)
+            elif self.parallel_processing is None:
+                # Check if batch processing is used. If not, then calculate the fitness value for individual solutions.
+                if self.fitness_batch_size in [1, None]:
+                    for sol_idx in solutions_indices:
+                        fitness = self.fitness_func(self, population[sol_idx], sol_idx if pass_indices else None)
+                        if type(fitness) in GA.supported_int_float_types:
+                            # The fitness function returns a single numeric value.
+                            # This is a single-objective optimization problem.
+                            pass
+                        elif type(fitness) in [list, tuple, numpy.ndarray]:
+                            # The fitness function returns a list/tuple/numpy.ndarray.
+                            # This is a multi-objective optimization problem.
+                            pass
                         else:
-                            # Reaching this point means that batch processing is in effect to calculate the fitness values.
-                            # Do not continue the loop as no fitness is calculated. The fitness will be calculated later in batch mode.
-                            continue
-
-                    # This is only executed if the fitness value was already calculated.
-                    pop_fitness[sol_idx] = fitness
+                            raise ValueError(f"The fitness function should return a number or an iterable (list, tuple, or numpy.ndarray) but the value {fitness} of type {type(fitness)} found.")
 
-                if self.fitness_batch_size not in [1, None]:
+                        pop_fitness[sol_idx] = fitness
+                else:
                     # Reaching this block means that batch fitness calculation is used.
 
-                    # Indices of the solutions to calculate their fitness.
-                    solutions_indices = [idx for idx, fit in enumerate(pop_fitness) if type(fit) is str and fit == "undefined"]
                     # Number of batches.
                     num_batches = int(numpy.ceil(len(solutions_indices) / self.fitness_batch_size))
                     # For each batch, get its indices and call the fitness function.
@@ -1587,10 +1795,10 @@ class GA(utils.parent_selection.ParentSelection,
                         batch_first_index = batch_idx * self.fitness_batch_size
                         batch_last_index = (batch_idx + 1) * self.fitness_batch_size
                         batch_indices = solutions_indices[batch_first_index:batch_last_index]
-                        batch_solutions = self.population[batch_indices, :]
+                        batch_solutions = population[batch_indices, :]
 
                         batch_fitness = self.fitness_func(
-                            self, batch_solutions, batch_indices)
+                            self, batch_solutions, batch_indices if pass_indices else None)
                         if type(batch_fitness) not in [list, tuple, numpy.ndarray]:
                             raise TypeError(f"Expected to receive a list, tuple, or numpy.ndarray from the fitness function but the value ({batch_fitness}) of type {type(batch_fitness)}.")
                         elif len(numpy.array(batch_fitness)) != len(batch_indices):
@@ -1608,66 +1816,62 @@ class GA(utils.parent_selection.ParentSelection,
                             else:
                                 raise ValueError(f"The fitness function should return a number or an iterable (list, tuple, or numpy.ndarray) but the value {fitness} of type {type(fitness)} found.")
             else:
-                # Calculating the fitness value of each solution in the current population.
-                for sol_idx, sol in enumerate(self.population):
-                    # Check if the `save_solutions` parameter is `True` and whether the solution already exists in the `solutions` list. If so, use its fitness rather than calculating it again.
-                    # The functions numpy.any()/numpy.all()/numpy.where()/numpy.equal() are very slow.
-                    # So, list membership operator 'in' is used to check if the solution exists in the 'self.solutions' list.
-                    # Make sure that both the solution and 'self.solutions' are of type 'list' not 'numpy.ndarray'.
-                    if (self.save_solutions) and (len(self.solutions) > 0) and (list(sol) in self.solutions):
-                        solution_idx = self.solutions.index(list(sol))
-                        fitness = self.solutions_fitness[solution_idx]
-                        pop_fitness[sol_idx] = fitness
-                    elif (self.keep_elitism > 0) and (self.last_generation_elitism is not None) and (len(self.last_generation_elitism) > 0) and (list(sol) in last_generation_elitism_as_list):
-                        # Return the index of the elitism from the elitism array 'self.last_generation_elitism'.
-                        # This is not its index within the population. It is just its index in the 'self.last_generation_elitism' array.
-                        elitism_idx = last_generation_elitism_as_list.index(
-                            list(sol))
-                        # Use the returned elitism index to return its index in the last population.
-                        elitism_idx = self.last_generation_elitism_indices[elitism_idx]
-                        # Use the elitism's index to return its pre-calculated fitness value.
-                        fitness = self.previous_generation_fitness[elitism_idx]
+                solutions_to_submit_indices = solutions_indices
+                if self.shared_memory:
+                    # The solutions are copied from the population directly into the shared memory block by the map_fitness() method. No copy is made per solution.
+                    solutions_to_submit = None
+                else:
+                    solutions_to_submit = [population[sol_idx].copy() for sol_idx in solutions_to_submit_indices]
+
+                # Check if batch processing is used. If not, then calculate the fitness value for individual solutions.
+                if self.fitness_batch_size in [1, None]:
+                    for index, fitness in zip(solutions_to_submit_indices, self.map_fitness(solutions_to_submit,
+                                                                                            solutions_to_submit_indices if pass_indices else [None]*len(solutions_to_submit_indices),
+                                                                                            population=population,
+                                                                                            rows_indices=solutions_to_submit_indices)):
+                        if type(fitness) in GA.supported_int_float_types:
+                            # The fitness function returns a single numeric value.
+                            # This is a single-objective optimization problem.
+                            pop_fitness[index] = fitness
+                        elif type(fitness) in [list, tuple, numpy.ndarray]:
+                            # The fitness function returns a list/tuple/numpy.ndarray.
+                            # This is a multi-objective optimization problem.
+                            pop_fitness[index] = fitness
+                        else:
+                            raise ValueError(f"The fitness function should return a number or an iterable (list, tuple, or numpy.ndarray) but the value {fitness} of type {type(fitness)} found.")
+                else:
+                    # Reaching this block means that batch processing is used. The fitness values are calculated in batches.
 
-                        pop_fitness[sol_idx] = fitness
-                    # If the solutions are not saved (i.e. `save_solutions=False`), check if this solution is a parent from the previous generation and its fitness value is already calculated. If so, use the fitness value instead of calling the fitness function.
-                    # We cannot use the `numpy.where()` function directly because it does not support the `axis` parameter. This is why the `numpy.all()` function is used to match the solutions on axis=1.
-                    # elif (self.last_generation_parents is not None) and len(numpy.where(numpy.all(self.last_generation_parents == sol, axis=1))[0] > 0):
-                    elif ((self.keep_parents == -1) or (self.keep_parents > 0)) and (self.last_generation_parents is not None) and (len(self.last_generation_parents) > 0) and (list(sol) in last_generation_parents_as_list):
-                        # Index of the parent in the 'self.last_generation_parents' array.
-                        # This is not its index within the population. It is just its index in the 'self.last_generation_parents' array.
-                        # parent_idx = numpy.where(numpy.all(self.last_generation_parents == sol, axis=1))[0][0]
-                        parent_idx = last_generation_parents_as_list.index(
-                            list(sol))
-                        # Use the returned parent index to return its index in the last population.
-                        parent_idx = self.last_generation_parents_indices[parent_idx]
-                        # Use the parent's index to return its pre-calculated fitness value.
-                        fitness = self.previous_generation_fitness[parent_idx]
+                    # Number of batches.
+                    num_batches = int(numpy.ceil(len(solutions_to_submit_indices) / self.fitness_batch_size))
+                    # Each element of the `batches_solutions` list represents the solutions in one batch.
+                    batches_solutions = []
+                    # Each element of the `batches_indices` list represents the solutions' indices in one batch.
+                    batches_indices = []
+                    # For each batch, get its indices and call the fitness function.
+                    for batch_idx in range(num_batches):
+                        batch_first_index = batch_idx * self.fitness_batch_size
+                        batch_last_index = (batch_idx + 1) * self.fitness_batch_size
+                        batch_indices = solutions_to_submit_indices[batch_first_index:batch_last_index]
+                        if self.shared_memory:
+                            # The batches are copied from the population directly into the shared memory block by the map_fitness() method.
+                            batch_solutions = None
+                        else:
+                            batch_solutions = population[batch_indices, :]
 
-                        pop_fitness[sol_idx] = fitness
+                        batches_solutions.append(batch_solutions)
+                        batches_indices.append(batch_indices)
 
-                # Decide which class to use based on whether the user selected "process" or "thread"
-                if self.parallel_processing[0] == "process":
-                    ExecutorClass = concurrent.futures.ProcessPoolExecutor
-                else:
-                    ExecutorClass = concurrent.futures.ThreadPoolExecutor
-
-                # We can use a with statement to ensure threads are cleaned up promptly (https://docs.python.org/3/library/concurrent.futures.html#threadpoolexecutor-example)
-                with ExecutorClass(max_workers=self.parallel_processing[1]) as executor:
-                    solutions_to_submit_indices = []
-                    solutions_to_submit = []
-                    for sol_idx, sol in enumerate(self.population):
-                        # The "undefined" value means that the fitness of this solution must be calculated.
-                        if type(pop_fitness[sol_idx]) is str:
-                            if pop_fitness[sol_idx] == "undefined":
-                                solutions_to_submit.append(sol.copy())
-                                solutions_to_submit_indices.append(sol_idx)
-                        elif type(pop_fitness[sol_idx]) in [list, tuple, numpy.ndarray]:
-                            # This is a multi-objective problem. The fitness is already calculated. Nothing to do.
-                            pass
+                    for batch_indices, batch_fitness in zip(batches_indices, self.map_fitness(batches_solutions,
+                                                                                              batches_indices if pass_indices else [None]*len(batches_indices),
+                                                                                              population=population,
+                                                                                              rows_indices=solutions_to_submit_indices)):
+                        if type(batch_fitness) not in [list, tuple, numpy.ndarray]:
+                            raise TypeError(f"Expected to receive a list, tuple, or numpy.ndarray from the fitness function but the value ({batch_fitness}) of type {type(batch_fitness)}.")
+                        elif len(numpy.array(batch_fitness)) != len(batch_indices):
+                            raise ValueError(f"There is a mismatch between the number of solutions passed to the fitness function ({len(batch_indices)}) and the number of fitness values returned ({len(batch_fitness)}). They must match.")
 
-                    # Check if batch processing is used. If not, then calculate the fitness value for individual solutions.
-                    if self.fitness_batch_size in [1, None]:
-                        for index, fitness in zip(solutions_to_submit_indices, executor.map(self.fitness_func, [self]*len(solutions_to_submit_indices), solutions_to_submit, solutions_to_submit_indices)):
+                        for index, fitness in zip(batch_indices, batch_fitness):
                             if type(fitness) in GA.supported_int_float_types:
                                 # The fitness function returns a single numeric value.
                                 # This is a single-objective optimization problem.
@@ -1677,51 +1881,136 @@ class GA(utils.parent_selection.ParentSelection,
                                 # This is a multi-objective optimization problem.
                                 pop_fitness[index] = fitness
                             else:
-                                raise ValueError(f"The fitness function should return a number or an iterable (list, tuple, or numpy.ndarray) but the value {fitness} of type {type(fitness)} found.")
-                    else:
-                        # Reaching this block means that batch processing is used. The fitness values are calculated in batches.
-
-                        # Number of batches.
-                        num_batches = int(numpy.ceil(len(solutions_to_submit_indices) / self.fitness_batch_size))
-                        # Each element of the `batches_solutions` list represents the solutions in one batch.
-                        batches_solutions = []
-                        # Each element of the `batches_indices` list represents the solutions' indices in one batch.
-                        batches_indices = []
-                        # For each batch, get its indices and call the fitness function.
-                        for batch_idx in range(num_batches):
-                            batch_first_index = batch_idx * self.fitness_batch_size
-                            batch_last_index = (batch_idx + 1) * self.fitness_batch_size
-                            batch_indices = solutions_to_submit_indices[batch_first_index:batch_last_index]
-                            batch_solutions = self.population[batch_indices, :]
-
-                            batches_solutions.append(batch_solutions)
-                            batches_indices.append(batch_indices)
-
-                        for batch_indices, batch_fitness in zip(batches_indices, executor.map(self.fitness_func, [self]*len(solutions_to_submit_indices), batches_solutions, batches_indices)):
-                            if type(batch_fitness) not in [list, tuple, numpy.ndarray]:
-                                raise TypeError(f"Expected to receive a list, tuple, or numpy.ndarray from the fitness function but the value ({batch_fitness}) of type {type(batch_fitness)}.")
-                            elif len(numpy.array(batch_fitness)) != len(batch_indices):
-                                raise ValueError(f"There is a mismatch between the number of solutions passed to the fitness function ({len(batch_indices)}) and the number of fitness values returned ({len(batch_fitness)}). They must match.")
-
-                            for index, fitness in zip(batch_indices, batch_fitness):
-                                if type(fitness) in GA.supported_int_float_types:
-                                    # The fitness function returns a single numeric value.
-                                    # This is a single-objective optimization problem.
-                                    pop_fitness[index] = fitness
-                                elif type(fitness) in [list, tuple, numpy.ndarray]:
-                                    # The fitness function returns a list/tuple/numpy.ndarray.
-                                    # This is a multi-objective optimization problem.
-                                    pop_fitness[index] = fitness
-                                else:
-                                    raise ValueError(f"The fitness function should return a number or an iterable (list, tuple, or numpy.ndarray) but the value ({fitness}) of type {type(fitness)} found.")
+                                raise ValueError(f"The fitness function should return a number or an iterable (list, tuple, or numpy.ndarray) but the value ({fitness}) of type {type(fitness)} found.")
 
-            pop_fitness = numpy.array(pop_fitness)
+            pop_fitness = self.complete_pop_fitness(pop_fitness=pop_fitness,
+                                                    solutions_indices=solutions_indices,
+                                                    repeated_solutions_indices=repeated_solutions_indices,
+                                                    population_keys=population_keys)
+
+            self.perf_count_evaluations(len(solutions_indices))
         except Exception as ex:
             self.logger.exception(ex)
             # sys.exit(-1)
             raise ex
         return pop_fitness
 
+    def reuse_pop_fitness(self, population=None, known_fitness=None):
+        """
+        Finds the solutions in the current population whose fitness is already known so that the fitness function is not called for them.
+        The fitness is reused from the fitness cache and from the elitism and parents of the previous generation. The fitness of the offspring calculated by the adaptive mutation before being mutated is also reused for the offspring that were not changed by the mutation.
+        It accepts:
+            -population: Added in PyGAD 3.6.0. The solutions to find their known fitness. If None, then the current population (the 'population' attribute) is used.
+            -known_fitness: Added in PyGAD 3.6.0. A dict mapping the keys returned by the FitnessCache.keys() method to the known fitness values. If None, then the fitness of the elitism and parents of the previous generation and the offspring evaluated by the adaptive mutation is used.
+        It returns:
+            -pop_fitness: A list of the population fitness where the unknown fitness values are set to "undefined".
+            -solutions_indices: The indices of the solutions to calculate their fitness.
+            -repeated_solutions_indices: A dict mapping the index of a solution repeated within the population to the index of its first occurrence. Its fitness is copied after the first occurrence is evaluated.
+            -population_keys: The keys of the solutions in the fitness cache or None if they are not needed.
+        """
+
+        if population is None:
+            population = self.population
+
+        if known_fitness is None:
+            # The fitness values of the elitism and parents of the previous generation are already calculated.
+            # They are saved into a dict where the key is the canonical byte encoding of the solution. This returns the fitness of a solution in O(1) instead of searching a list.
+            last_generation_known_fitness = {}
+            if (self.keep_elitism > 0) and (self.last_generation_elitism is not None) and (len(self.last_generation_elitism) > 0):
+                for elitism_key, elitism_idx in zip(helper.fitness_cache.FitnessCache.keys(self.last_generation_elitism), self.last_generation_elitism_indices):
+                    # Use the elitism's index in the last population to return its pre-calculated fitness value.
+                    last_generation_known_fitness.setdefault(elitism_key, self.previous_generation_fitness[elitism_idx])
+            if ((self.keep_parents == -1) or (self.keep_parents > 0)) and (self.last_generation_parents is not None) and (len(self.last_generation_parents) > 0):
+                for parent_key, parent_idx in zip(helper.fitness_cache.FitnessCache.keys(self.last_generation_parents), self.last_generation_parents_indices):
+                    # Use the parent's index in the last population to return its pre-calculated fitness value.
+                    last_generation_known_fitness.setdefault(parent_key, self.previous_generation_fitness[parent_idx])
+            # The offspring evaluated by the adaptive mutation before being mutated. The offspring not changed by the mutation are not evaluated again.
+            # The dict is used only once as it belongs to the offspring of the last generation.
+            for offspring_key, offspring_fitness in self.last_generation_offspring_known_fitness.items():
+                last_generation_known_fitness.setdefault(offspring_key, offspring_fitness)
+            self.last_generation_offspring_known_fitness = {}
+        else:
+            last_generation_known_fitness = known_fitness
+
+        pop_fitness = ["undefined"] * len(population)
+        # The keys of the solutions in the fitness cache. They are only calculated if there is a chance to reuse the fitness.
+        population_keys = None
+        if not (self.fitness_cache is None) or len(last_generation_known_fitness) > 0:
+            population_keys = helper.fitness_cache.FitnessCache.keys(population)
+            # Reuse the fitness of the solutions that are either in the fitness cache or were part of the previous generation.
+            for sol_idx, key in enumerate(population_keys):
+                fitness = None
+                if not (self.fitness_cache is None):
+                    fitness = self.fitness_cache.lookup(key)
+                if fitness is None and len(last_generation_known_fitness) > 0:
+                    fitness = last_generation_known_fitness.get(key)
+                if not (fitness is None):
+                    pop_fitness[sol_idx] = fitness
+
+        # Indices of the solutions to calculate their fitness.
+        solutions_indices = [idx for idx, fit in enumerate(pop_fitness) if type(fit) is str and fit == "undefined"]
+
+        # When every evaluated solution is saved into the cache, a solution that is repeated within the population is evaluated only once.
+        # This dict maps the index of a repeated solution to the index of its first occurrence.
+        repeated_solutions_indices = {}
+        if not (self.fitness_cache is None) and (self.save_solutions or not (self.fitness_cache_size is None) or self.mutation_type == "adaptive"):
+            first_occurrence_indices = {}
+            for sol_idx in solutions_indices:
+                first_idx = first_occurrence_indices.setdefault(population_keys[sol_idx], sol_idx)
+                if first_idx != sol_idx:
+                    repeated_solutions_indices[sol_idx] = first_idx
+            solutions_indices = [sol_idx for sol_idx in solutions_indices if not (sol_idx in repeated_solutions_indices)]
+
+        return pop_fitness, solutions_indices, repeated_solutions_indices, population_keys
+
+    def complete_pop_fitness(self, pop_fitness, solutions_indices, repeated_solutions_indices, population_keys):
+        """
+        Completes the population fitness after calculating the fitness of the solutions returned by the reuse_pop_fitness() method.
+        It saves the newly calculated fitness values into the fitness cache and copies the fitness of the repeated solutions.
+        It accepts the 4 outputs of the reuse_pop_fitness() method after filling the fitness of the solutions at the solutions_indices.
+        It returns a NumPy array of the population fitness.
+        """
+
+        # Save the fitness of the newly evaluated solutions into the cache.
+        # If only 'save_best_solutions' is used, then the cache is only updated with the best solutions inside the run() method.
+        if not (self.fitness_cache is None) and (self.save_solutions or not (self.fitness_cache_size is None) or self.mutation_type == "adaptive"):
+            for sol_idx in solutions_indices:
+                self.fitness_cache.store(population_keys[sol_idx], pop_fitness[sol_idx])
+            for sol_idx, first_idx in repeated_solutions_indices.items():
+                pop_fitness[sol_idx] = pop_fitness[first_idx]
+
+        return numpy.array(pop_fitness)
+
+    def cal_pop_fitness_vectorized(self, pop_fitness, solutions_indices, population=None, pass_indices=True):
+        """
+        Calculates the fitness of some solutions in the current population by calling the fitness function only once. It is used when fitness_batch_size="population".
+        The fitness function receives a 2D array of the solutions and a 1D array of their indices. It must return a 1D array (single-objective) or a 2D array (multi-objective) with a row for each solution.
+        It accepts:
+            -pop_fitness: A list of the population fitness where the fitness of the solutions to calculate is not yet known.
+            -solutions_indices: The indices of the solutions to calculate their fitness.
+            -population: Added in PyGAD 3.6.0. The solutions. If None, then the current population (the 'population' attribute) is used.
+            -pass_indices: Added in PyGAD 3.6.0. If False, then None is passed to the fitness function instead of the indices of the solutions.
+        It returns a NumPy array of the population fitness.
+        """
+
+        if population is None:
+            population = self.population
+
+        solutions_indices = numpy.asarray(solutions_indices, dtype=int)
+        batch_fitness = numpy.asarray(self.fitness_func(self, population[solutions_indices], solutions_indices if pass_indices else None))
+        if (batch_fitness.ndim not in [1, 2]) or (batch_fitness.shape[0] != solutions_indices.shape[0]) or (batch_fitness.dtype.kind not in ["i", "u", "f"]):
+            raise ValueError(f"When fitness_batch_size='population', the fitness function must return a numeric 1D array (single-objective) or 2D array (multi-objective) with a row for each of the {solutions_indices.shape[0]} solutions passed but an array of shape {batch_fitness.shape} and data type {batch_fitness.dtype} found.")
+
+        # Scatter the calculated fitness values and the known fitness values into a preallocated array.
+        pop_fitness_array = numpy.empty((len(pop_fitness),) + batch_fitness.shape[1:], dtype=numpy.float64)
+        pop_fitness_array[solutions_indices] = batch_fitness
+        if solutions_indices.shape[0] < len(pop_fitness):
+            for sol_idx, fitness in enumerate(pop_fitness):
+                if not (type(fitness) is str):
+                    pop_fitness_array[sol_idx] = fitness
+
+        return pop_fitness_array
+
     def run(self):
         """
         Runs the genetic algorithm. This is the main method in which the genetic algorithm is evolved through a number of generations.
@@ -1730,26 +2019,7 @@ class GA(utils.parent_selection.ParentSelection,
             if self.valid_parameters == False:
                 raise Exception("Error calling the run() method: \nThe run() method cannot be executed with invalid parameters. Please check the parameters passed while creating an instance of the GA class.\n")
 
-            # Starting from PyGAD 2.18.0, the 4 properties (best_solutions, best_solutions_fitness, solutions, and solutions_fitness) are no longer reset with each call to the run() method. Instead, they are extended.
-            # For example, if there are 50 generations and the user set save_best_solutions=True, then the length of the 2 properties best_solutions and best_solutions_fitness will be 50 after the first call to the run() method, then 100 after the second call, 150 after the third, and so on.
-
-            # self.best_solutions: Holds the best solution in each generation.
-            if type(self.best_solutions) is numpy.ndarray:
-                self.best_solutions = self.best_solutions.tolist()
-            # self.best_solutions_fitness: A list holding the fitness value of the best solution for each generation.
-            if type(self.best_solutions_fitness) is numpy.ndarray:
-                self.best_solutions_fitness = list(self.best_solutions_fitness)
-            # self.solutions: Holds the solutions in each generation.
-            if type(self.solutions) is numpy.ndarray:
-                self.solutions = self.solutions.tolist()
-            # self.solutions_fitness: Holds the fitness of the solutions in each generation.
-            if type(self.solutions_fitness) is numpy.ndarray:
-                self.solutions_fitness = list(self.solutions_fitness)
-
-            if not (self.on_start is None):
-                self.on_start(self)
-
-            stop_run = False
+            self.run_start()
 
             # To continue from where we stopped, the first generation index should start from the value of the 'self.generations_completed' parameter.
             if self.generations_completed != 0 and type(self.generations_completed) in GA.supported_int_types:
@@ -1763,43 +2033,40 @@ class GA(utils.parent_selection.ParentSelection,
 
             # Measuring the fitness of each chromosome in the population. Save the fitness in the last_generation_fitness attribute.
             self.last_generation_fitness = self.cal_pop_fitness()
+            self.perf_lap("fitness")
 
             # Know whether the problem is SOO or MOO.
-            if type(self.last_generation_fitness[0]) in GA.supported_int_float_types:
-                # Single-objective problem.
-                # If the problem is SOO, the parent selection type cannot be nsga2 or tournament_nsga2.
-                if self.parent_selection_type in ['nsga2', 'tournament_nsga2']:
-                    raise TypeError(f"Incorrect parent selection type. The fitness function returned a single numeric fitness value which means the problem is single-objective. But the parent selection type {self.parent_selection_type} is used which only works for multi-objective optimization problems.")
-            elif type(self.last_generation_fitness[0]) in [list, tuple, numpy.ndarray]:
-                # Multi-objective problem.
-                pass                
+            self.run_check_fitness_type()
 
-            best_solution, best_solution_fitness, best_match_idx = self.best_solution(pop_fitness=self.last_generation_fitness)
+            best_solution_fitness = self.run_best_solution()
 
-            # Appending the best solution in the initial population to the best_solutions list.
-            if self.save_best_solutions:
-                self.best_solutions.append(list(best_solution))
+            # Save the performance statistics of the initial population.
+            self.perf_generation_end()
 
             for generation in range(generation_first_idx, generation_last_idx):
 
                 self.run_loop_head(best_solution_fitness)
+                self.perf_lap("callbacks")
 
                 # Call the 'run_select_parents()' method to select the parents.
                 # It edits these 2 instance attributes:
                     # 1) last_generation_parents: A NumPy array of the selected parents.
                     # 2) last_generation_parents_indices: A 1D NumPy array of the indices of the selected parents.
                 self.run_select_parents()
+                self.perf_lap("selection")
 
                 # Call the 'run_crossover()' method to select the offspring.
                 # It edits these 2 instance attributes:
                     # 1) last_generation_offspring_crossover: A NumPy array of the selected offspring.
                     # 2) last_generation_elitism: A NumPy array of the current generation elitism. Applicable only if the 'keep_elitism' parameter > 0.
                 self.run_crossover()
+                self.perf_lap("crossover")
 
                 # Call the 'run_mutation()' method to mutate the selected offspring.
                 # It edits this instance attribute:
                     # 1) last_generation_offspring_mutation: A NumPy array of the mutated offspring.
                 self.run_mutation()
+                self.perf_lap("mutation")
 
                 # Call the 'run_update_population()' method to update the population after both crossover and mutation operations complete.
                 # It edits this instance attribute:
@@ -1812,126 +2079,738 @@ class GA(utils.parent_selection.ParentSelection,
                 self.previous_generation_fitness = self.last_generation_fitness.copy()
                 # Measuring the fitness of each chromosome in the population. Save the fitness in the last_generation_fitness attribute.
                 self.last_generation_fitness = self.cal_pop_fitness()
-
-                best_solution, best_solution_fitness, best_match_idx = self.best_solution(
-                    pop_fitness=self.last_generation_fitness)
+                self.perf_lap("fitness")
 
                 # Appending the best solution in the current generation to the best_solutions list.
-                if self.save_best_solutions:
-                    self.best_solutions.append(list(best_solution))
+                best_solution_fitness = self.run_best_solution()
+                self.perf_lap("other")
 
                 # Note: Any code that has loop-dependant statements (e.g. continue, break, etc.) must be kept inside the loop of the 'run()' method. It can be moved to another method to clean the run() method.
                 # If the on_generation attribute is not None, then cal the callback function after the generation.
-                if not (self.on_generation is None):
-                    r = self.on_generation(self)
-                    if type(r) is str and r.lower() == "stop":
-                        # Before aborting the loop, save the fitness value of the best solution.
-                        # _, best_solution_fitness, _ = self.best_solution()
-                        self.best_solutions_fitness.append(best_solution_fitness)
-                        break
+                stop_run = self.run_on_generation(best_solution_fitness)
+                self.perf_lap("callbacks")
 
-                if not self.stop_criteria is None:
-                    for criterion in self.stop_criteria:
-                        if criterion[0] == "reach":
-                            # Single-objective problem.
-                            if type(self.last_generation_fitness[0]) in GA.supported_int_float_types:
-                                if max(self.last_generation_fitness) >= criterion[1]:
-                                    stop_run = True
-                                    break
-                            # Multi-objective problem.
-                            elif type(self.last_generation_fitness[0]) in [list, tuple, numpy.ndarray]:
-                                # Validate the value passed to the criterion.
-                                if len(criterion[1:]) == 1:
-                                    # There is a single value used across all the objectives.
-                                    pass
-                                elif len(criterion[1:]) > 1:
-                                    # There are multiple values. The number of values must be equal to the number of objectives.
-                                    if len(criterion[1:]) == len(self.last_generation_fitness[0]):
-                                        pass
-                                    else:
-                                        self.valid_parameters = False
-                                        raise ValueError(f"When the the 'reach' keyword is used with the 'stop_criteria' parameter for solving a multi-objective problem, then the number of numeric values following the keyword can be:\n1) A single numeric value to be used across all the objective functions.\n2) A number of numeric values equal to the number of objective functions.\nBut the value {criterion} found with {len(criterion)-1} numeric values which is not equal to the number of objective functions {len(self.last_generation_fitness[0])}.")
+                if not stop_run:
+                    stop_run = self.run_stop_criteria()
 
-                                stop_run = True
-                                for obj_idx in range(len(self.last_generation_fitness[0])):
-                                    # Use the objective index to return the proper value for the criterion.
+                self.perf_generation_end()
+                if stop_run:
+                    break
 
-                                    if len(criterion[1:]) == len(self.last_generation_fitness[0]):
-                                        reach_fitness_value = criterion[obj_idx + 1]
-                                    elif len(criterion[1:]) == 1:
-                                        reach_fitness_value = criterion[1]
-                                    else:
-                                        # Unexpected to be reached, but it is safer to handle it.
-                                        self.valid_parameters = False
-                                        raise ValueError(f"The number of values does not equal the number of objectives.")
+            self.run_end()
 
-                                    if max(self.last_generation_fitness[:, obj_idx]) >= reach_fitness_value:
-                                        pass
-                                    else:
-                                        stop_run = False
-                                        break
-                        elif criterion[0] == "saturate":
-                            criterion[1] = int(criterion[1])
-                            if self.generations_completed >= criterion[1]:
-                                # Single-objective problem.
-                                if type(self.last_generation_fitness[0]) in GA.supported_int_float_types:
-                                    if (self.best_solutions_fitness[self.generations_completed - criterion[1]] - self.best_solutions_fitness[self.generations_completed - 1]) == 0:
-                                        stop_run = True
-                                        break
-                                # Multi-objective problem.
-                                elif type(self.last_generation_fitness[0]) in [list, tuple, numpy.ndarray]:
-                                    stop_run = True
-                                    for obj_idx in range(len(self.last_generation_fitness[0])):
-                                        if (self.best_solutions_fitness[self.generations_completed - criterion[1]][obj_idx] - self.best_solutions_fitness[self.generations_completed - 1][obj_idx]) == 0:
-                                            pass
-                                        else:
-                                            stop_run = False
-                                            break
+            # Converting the 'solutions' list into a NumPy array.
+            # self.solutions = numpy.array(self.solutions)
+        except Exception as ex:
+            self.logger.exception(ex)
+            # sys.exit(-1)
+            raise ex
 
-                if stop_run:
-                    break
+    def ask(self):
+        """
+        Returns the solutions whose fitness is to be calculated outside of PyGAD. Together with the tell() method, it is an alternative to the run() method when the fitness is not calculated by calling the fitness function (e.g. the solutions are submitted to a job queue or evaluated in a single vectorized/remote call).
+        The first call returns the solutions of the current population. After the fitness is passed to the tell() method, the next call creates the next generation using parent selection, crossover, and mutation and returns its solutions.
+        The solutions whose fitness is already known (e.g. elitism, kept parents, or solutions in the fitness cache) are not returned.
+        If the ask() method is called again before calling tell(), then the same solutions are returned.
 
-            # Save the fitness of the last generation.
-            if self.save_solutions:
-                # self.solutions.extend(self.population.copy())
-                population_as_list = self.population.copy()
-                population_as_list = [list(item) for item in population_as_list]
-                self.solutions.extend(population_as_list)
+        Returns
+        -------
+        solutions : A 2D NumPy array of the solutions to calculate their fitness.
+        """
+
+        try:
+            if self.valid_parameters == False:
+                raise Exception("Error calling the ask() method: \nThe ask() method cannot be executed with invalid parameters. Please check the parameters passed while creating an instance of the GA class.\n")
 
-                self.solutions_fitness.extend(self.last_generation_fitness)
+            if self.ask_tell_pending is None:
+                if self.ask_tell_generation_last_idx is None:
+                    # Start a new evolution. Similar to the run() method, it continues from the last completed generation.
+                    self.run_start()
+                    self.ask_tell_generation_last_idx = self.num_generations + self.generations_completed
+                else:
+                    # Create the next generation the same way as the run() method.
+                    self.run_loop_head(self.ask_tell_best_solution_fitness)
+                    self.run_select_parents()
+                    self.run_crossover()
+                    self.run_mutation()
+                    self.run_update_population()
 
-            # Call the run_select_parents() method to update these 2 attributes according to the 'last_generation_fitness' attribute:
-                # 1) last_generation_parents 2) last_generation_parents_indices
-            # Set 'call_on_parents=False' to avoid calling the callable 'on_parents' because this step is not part of the cycle.
-            self.run_select_parents(call_on_parents=False)
+                    self.generations_completed = self.generations_completed + 1
+                    self.previous_generation_fitness = self.last_generation_fitness.copy()
 
-            # Save the fitness value of the best solution.
-            _, best_solution_fitness, _ = self.best_solution(
-                pop_fitness=self.last_generation_fitness)
-            self.best_solutions_fitness.append(best_solution_fitness)
+                self.ask_tell_pending = self.reuse_pop_fitness()
 
-            self.best_solution_generation = numpy.where(numpy.array(
-                self.best_solutions_fitness) == numpy.max(numpy.array(self.best_solutions_fitness)))[0][0]
-            # After the run() method completes, the run_completed flag is changed from False to True.
-            # Set to True only after the run() method completes gracefully.
-            self.run_completed = True
+            solutions_indices = self.ask_tell_pending[1]
+            return self.population[solutions_indices].copy()
+        except Exception as ex:
+            self.logger.exception(ex)
+            raise ex
 
-            if not (self.on_stop is None):
-                self.on_stop(self, self.last_generation_fitness)
+    def tell(self, fitness):
+        """
+        Accepts the fitness of the solutions returned by the last call to the ask() method and completes the current generation.
+        It applies the same steps as the run() method after calculating the fitness: saving the best solution, calling on_generation(), and checking the stop criteria.
+        When the evolution stops, the same steps done at the end of the run() method are applied (e.g. calling on_stop()).
 
-            # Converting the 'best_solutions' list into a NumPy array.
-            self.best_solutions = numpy.array(self.best_solutions)
+        Parameters
+        ----------
+        fitness : A list/tuple/numpy.ndarray with the fitness of each solution returned by ask(), in the same order. Each fitness is a number (single-objective) or a list/tuple/numpy.ndarray (multi-objective).
 
-            # Update previous_generation_fitness because it is used to get the fitness of the parents.
-            self.previous_generation_fitness = self.last_generation_fitness.copy()
+        Returns
+        -------
+        bool: True if the evolution stopped because the number of generations is reached, on_generation() returned "stop", or a stop criterion is satisfied. Otherwise, False.
+        """
 
-            # Converting the 'solutions' list into a NumPy array.
-            # self.solutions = numpy.array(self.solutions)
+        try:
+            if self.ask_tell_pending is None:
+                raise RuntimeError("The tell() method must be called after the ask() method to pass the fitness of the solutions returned by ask().")
+
+            pop_fitness, solutions_indices, repeated_solutions_indices, population_keys = self.ask_tell_pending
+
+            if type(fitness) not in [list, tuple, numpy.ndarray]:
+                raise TypeError(f"The fitness passed to the tell() method is expected to be a list, tuple, or numpy.ndarray but the value ({fitness}) of type {type(fitness)} found.")
+            elif len(fitness) != len(solutions_indices):
+                raise ValueError(f"There is a mismatch between the number of solutions returned by ask() ({len(solutions_indices)}) and the number of fitness values passed to tell() ({len(fitness)}). They must match.")
+
+            for sol_idx, sol_fitness in zip(solutions_indices, fitness):
+                if type(sol_fitness) in self.supported_int_float_types:
+                    # This is a single-objective optimization problem.
+                    pop_fitness[sol_idx] = sol_fitness
+                elif type(sol_fitness) in [list, tuple, numpy.ndarray]:
+                    # This is a multi-objective optimization problem.
+                    pop_fitness[sol_idx] = sol_fitness
+                else:
+                    raise ValueError(f"Each fitness passed to the tell() method should be a number or an iterable (list, tuple, or numpy.ndarray) but the value ({sol_fitness}) of type {type(sol_fitness)} found.")
+
+            self.ask_tell_pending = None
+            self.last_generation_fitness = self.complete_pop_fitness(pop_fitness=pop_fitness,
+                                                                     solutions_indices=solutions_indices,
+                                                                     repeated_solutions_indices=repeated_solutions_indices,
+                                                                     population_keys=population_keys)
+
+            if self.ask_tell_best_solution_fitness is None:
+                # This is the first generation of the evolution.
+                self.run_check_fitness_type()
+                self.ask_tell_best_solution_fitness = self.run_best_solution()
+                stop_run = False
+            else:
+                self.ask_tell_best_solution_fitness = self.run_best_solution()
+                stop_run = self.run_on_generation(self.ask_tell_best_solution_fitness) or self.run_stop_criteria()
+
+            if stop_run or self.generations_completed >= self.ask_tell_generation_last_idx:
+                self.run_end()
+                self.ask_tell_generation_last_idx = None
+                self.ask_tell_best_solution_fitness = None
+                return True
+            return False
+        except Exception as ex:
+            self.logger.exception(ex)
+            raise ex
+
+    async def run_async(self, max_concurrency=None, timeout=None, timeout_fitness=None):
+        """
+        A coroutine that runs the genetic algorithm using a fitness function defined with async def. It is suitable for I/O-bound fitness functions (e.g. calling a service over the network) as hundreds of evaluations can be in flight at the same time without using threads or processes.
+        In each generation, the fitness of all the solutions whose fitness is not already known is calculated concurrently using asyncio. The fitness is reused from the fitness cache, elitism, and parents exactly like the run() method as it is built on top of the ask() and tell() methods.
+        No new evaluations are started once the evolution stops (e.g. on_generation() returns "stop"). If an evaluation fails or the run_async() coroutine is cancelled, then the evaluations still in flight are cancelled.
+
+        Parameters
+        ----------
+        max_concurrency : int, optional
+            The maximum number of evaluations in flight at the same time. If None (default), then all the evaluations of a generation are started at once.
+        timeout : int or float, optional
+            The maximum number of seconds to wait for a single evaluation (i.e. a single call to the fitness function). If None (default), then there is no timeout.
+        timeout_fitness : optional
+            The fitness assigned to the solutions whose evaluation timed out. If None (default), then asyncio.TimeoutError is raised.
+
+        Returns
+        -------
+        None.
+        """
+
+        try:
+            if self.valid_parameters == False:
+                raise Exception("Error calling the run_async() method: \nThe run_async() method cannot be executed with invalid parameters. Please check the parameters passed while creating an instance of the GA class.\n")
+
+            if not inspect.iscoroutinefunction(self.fitness_func):
+                raise TypeError("The run_async() method expects the fitness function to be a coroutine function (i.e. defined using async def). Use the run() method for regular fitness functions.")
+            elif self.mutation_type == "adaptive":
+                raise ValueError("The adaptive mutation calls the fitness function synchronously. It cannot be used with the run_async() method.")
+
+            if max_concurrency is None:
+                semaphore = None
+            elif type(max_concurrency) in GA.supported_int_types and max_concurrency > 0:
+                semaphore = asyncio.Semaphore(max_concurrency)
+            else:
+                raise ValueError(f"The value passed to the max_concurrency parameter of the run_async() method must be None or a positive integer but the value ({max_concurrency}) of type {type(max_concurrency)} found.")
+
+            if not (timeout is None) and not (type(timeout) in GA.supported_int_float_types and timeout > 0):
+                raise ValueError(f"The value passed to the timeout parameter of the run_async() method must be None or a positive number but the value ({timeout}) of type {type(timeout)} found.")
+
+            stop_run = False
+            while not stop_run:
+                solutions = self.ask()
+                fitness = await self.cal_fitness_async(solutions=solutions,
+                                                       solutions_indices=self.ask_tell_pending[1],
+                                                       semaphore=semaphore,
+                                                       timeout=timeout,
+                                                       timeout_fitness=timeout_fitness)
+                stop_run = self.tell(fitness)
         except Exception as ex:
             self.logger.exception(ex)
-            # sys.exit(-1)
             raise ex
 
+    async def cal_fitness_async(self, solutions, solutions_indices, semaphore=None, timeout=None, timeout_fitness=None):
+        """
+        A coroutine that calculates the fitness of some solutions concurrently by awaiting the fitness function (defined using async def). It is used by the run_async() method.
+        The fitness function is called for each solution or for each batch of solutions according to the fitness_batch_size parameter.
+        It accepts:
+            -solutions: The solutions to calculate their fitness.
+            -solutions_indices: The indices of the solutions in the population.
+            -semaphore: An asyncio.Semaphore to limit the number of evaluations in flight or None for no limit.
+            -timeout: The maximum number of seconds to wait for a single call to the fitness function or None for no timeout.
+            -timeout_fitness: The fitness assigned to the solutions whose evaluation timed out. If None, then asyncio.TimeoutError is raised.
+        It returns a list of the fitness of the solutions.
+        """
+
+        async def evaluate(batch_solutions, batch_indices, batch_size):
+            if semaphore is None:
+                return await evaluate_with_timeout(batch_solutions, batch_indices, batch_size)
+            async with semaphore:
+                return await evaluate_with_timeout(batch_solutions, batch_indices, batch_size)
+
+        async def evaluate_with_timeout(batch_solutions, batch_indices, batch_size):
+            if timeout is None:
+                return await self.fitness_func(self, batch_solutions, batch_indices)
+            try:
+                return await asyncio.wait_for(self.fitness_func(self, batch_solutions, batch_indices), timeout)
+            except asyncio.TimeoutError:
+                if timeout_fitness is None:
+                    raise
+                if batch_size is None:
+                    return timeout_fitness
+                return [timeout_fitness] * batch_size
+
+        if self.fitness_batch_size in [1, None]:
+            tasks = [asyncio.ensure_future(evaluate(solution, sol_idx, None)) for solution, sol_idx in zip(solutions, solutions_indices)]
+        else:
+            if self.fitness_batch_size == "population":
+                batch_size = max(len(solutions), 1)
+            else:
+                batch_size = self.fitness_batch_size
+            tasks = []
+            for batch_first_index in range(0, len(solutions), batch_size):
+                batch_last_index = batch_first_index + batch_size
+                tasks.append(asyncio.ensure_future(evaluate(solutions[batch_first_index:batch_last_index],
+                                                            solutions_indices[batch_first_index:batch_last_index],
+                                                            len(solutions[batch_first_index:batch_last_index]))))
+
+        try:
+            outputs = await asyncio.gather(*tasks)
+        except BaseException:
+            # Cancel the evaluations still in flight if an evaluation fails or the coroutine is cancelled.
+            for task in tasks:
+                task.cancel()
+            raise
+
+        if self.fitness_batch_size in [1, None]:
+            return outputs
+
+        fitness = []
+        for batch_first_index, batch_fitness in zip(range(0, len(solutions), batch_size), outputs):
+            num_batch_solutions = len(solutions[batch_first_index:batch_first_index + batch_size])
+            if type(batch_fitness) not in [list, tuple, numpy.ndarray]:
+                raise TypeError(f"Expected to receive a list, tuple, or numpy.ndarray from the fitness function but the value ({batch_fitness}) of type {type(batch_fitness)}.")
+            elif len(batch_fitness) != num_batch_solutions:
+                raise ValueError(f"There is a mismatch between the number of solutions passed to the fitness function ({num_batch_solutions}) and the number of fitness values returned ({len(batch_fitness)}). They must match.")
+            fitness.extend(batch_fitness)
+        return fitness
+
+    def run_steady_state(self, num_evaluations=None, replacement="worst"):
+        """
+        Runs the genetic algorithm in the steady-state (asynchronous) mode. Unlike the run() method, there are no generational barriers: whenever the fitness of an offspring is calculated, the offspring is inserted into the population right away and a new offspring is bred from the current population and submitted.
+        With parallel processing, the workers are kept busy instead of waiting for the slowest evaluation of each generation. Without parallel processing, the offspring are evaluated one by one.
+        The offspring are bred using the same parent selection, crossover, and mutation operators used by the run() method.
+        The progress is counted in evaluations using the evaluations_completed attribute. For the callbacks and stop criteria, each num_offspring evaluations are considered a generation: the generations_completed attribute is incremented, on_generation() is called, and the stop criteria are checked.
+
+        Parameters
+        ----------
+        num_evaluations : int, optional
+            The number of offspring to evaluate. If None (default), then it is num_generations*num_offspring which is the same number of evaluations made by the run() method.
+        replacement : str, optional
+            How to select the solution replaced by a new offspring:
+                1) "worst" (default): The worst solution in the population is replaced if the offspring is not worse than it.
+                2) "tournament": The worst out of K_tournament solutions selected randomly is replaced. The best keep_elitism solutions are never replaced.
+
+        Returns
+        -------
+        None.
+        """
+
+        # Maps the future of each evaluation in progress to its offspring.
+        pending_offspring = {}
+        try:
+            if self.valid_parameters == False:
+                raise Exception("Error calling the run_steady_state() method: \nThe run_steady_state() method cannot be executed with invalid parameters. Please check the parameters passed while creating an instance of the GA class.\n")
+
+            if inspect.iscoroutinefunction(self.fitness_func):
+                raise TypeError("The fitness function is a coroutine function (async def). It cannot be used with the run_steady_state() method.")
+            elif self.mutation_type == "adaptive":
+                raise ValueError("The adaptive mutation calculates the fitness of all the offspring of a generation at once. It cannot be used with the run_steady_state() method.")
+
+            if not (replacement in ["worst", "tournament"]):
+                raise ValueError(f"The value passed to the replacement parameter of the run_steady_state() method must be either 'worst' or 'tournament' but the value ({replacement}) found.")
+
+            if num_evaluations is None:
+                num_evaluations = self.num_generations * self.num_offspring
+            elif not (type(num_evaluations) in GA.supported_int_types and num_evaluations > 0):
+                raise ValueError(f"The value passed to the num_evaluations parameter of the run_steady_state() method must be None or a positive integer but the value ({num_evaluations}) of type {type(num_evaluations)} found.")
+
+            self.run_start()
+
+            # The fitness of the initial population is calculated the same way as the run() method.
+            self.last_generation_fitness = self.cal_pop_fitness()
+            if self.last_generation_fitness.dtype.kind in ["i", "u"]:
+                # The fitness of the offspring is inserted into this array. Integer fitness would truncate float values.
+                self.last_generation_fitness = self.last_generation_fitness.astype(float)
+            self.run_check_fitness_type()
+            best_solution_fitness = self.run_best_solution()
+
+            if self.parallel_processing is None:
+                num_workers = 1
+            else:
+                executor = self.get_executor()
+                num_workers = self.parallel_processing[1]
+                if num_workers is None:
+                    num_workers = getattr(executor, "_max_workers", None) or 1
+
+            # The number of generations equivalent to the evaluations.
+            num_evaluations_per_generation = max(self.num_offspring, 1)
+
+            last_evaluation = self.evaluations_completed + num_evaluations
+            num_submitted = self.evaluations_completed
+            stop_run = False
+
+            self.run_loop_head(best_solution_fitness)
+            while not stop_run and self.evaluations_completed < last_evaluation:
+                # Keep all the workers busy.
+                completed = []
+                while len(pending_offspring) < num_workers and num_submitted < last_evaluation:
+                    offspring = self.steady_state_offspring()
+                    num_submitted += 1
+
+                    fitness = None
+                    if not (self.fitness_cache is None):
+                        fitness = self.fitness_cache.get(offspring)
+
+                    if not (fitness is None):
+                        completed.append((offspring, fitness))
+                    elif self.parallel_processing is None:
+                        completed.append((offspring, self.steady_state_fitness(self.fitness_func(self, self.steady_state_solutions(offspring), None))))
+                        break
+                    else:
+                        pending_offspring[self.submit_fitness(self.steady_state_solutions(offspring), None)] = offspring
+
+                if len(completed) == 0:
+                    done, _ = concurrent.futures.wait(pending_offspring, return_when=concurrent.futures.FIRST_COMPLETED)
+                    for future in done:
+                        completed.append((pending_offspring.pop(future), self.steady_state_fitness(self.fitness_from_future(future))))
+
+                for offspring, fitness in completed:
+                    self.steady_state_insert(offspring, fitness, replacement)
+                    self.evaluations_completed += 1
+
+                    if self.evaluations_completed % num_evaluations_per_generation == 0:
+                        self.generations_completed = self.generations_completed + 1
+                        best_solution_fitness = self.run_best_solution()
+                        stop_run = self.run_on_generation(best_solution_fitness) or self.run_stop_criteria()
+                        if stop_run:
+                            break
+                        if self.evaluations_completed < last_evaluation:
+                            self.run_loop_head(best_solution_fitness)
+
+            # Do not wait for the evaluations still in progress.
+            for future in pending_offspring:
+                future.cancel()
+
+            self.run_end()
+        except Exception as ex:
+            for future in pending_offspring:
+                future.cancel()
+            self.logger.exception(ex)
+            raise ex
+
+    def steady_state_offspring(self):
+        """
+        Breeds a single offspring from the current population for the steady-state mode using the parent selection, crossover, and mutation operators.
+        It returns the offspring as a 1D NumPy array.
+        """
+
+        if callable(self.parent_selection_type):
+            parents, _ = self.select_parents(self.last_generation_fitness, self.num_parents_mating, self)
+        else:
+            parents, _ = self.select_parents(self.last_generation_fitness, num_parents=self.num_parents_mating)
+
+        # The crossover operators mate the first 2 parents to produce a single offspring. Shuffle the parents so that different pairs mate.
+        parents = parents[numpy.random.permutation(parents.shape[0])]
+
+        if self.crossover_type is None:
+            offspring = parents[0:1].copy()
+        elif callable(self.crossover_type):
+            offspring = self.crossover(parents, (1, self.num_genes), self)
+        else:
+            offspring = self.crossover(parents, offspring_size=(1, self.num_genes))
+
+        if self.mutation_type is None:
+            pass
+        elif callable(self.mutation_type):
+            offspring = self.mutation(offspring, self)
+        else:
+            offspring = self.mutation(offspring)
+
+        return offspring[0]
+
+    def steady_state_solutions(self, offspring):
+        """
+        Returns what is passed to the fitness function to calculate the fitness of an offspring in the steady-state mode.
+        If the 'fitness_batch_size' parameter is used (an integer > 1 or "population"), then the fitness function expects a batch of solutions. So, the offspring is passed as a batch of a single solution.
+        It accepts:
+            -offspring: The offspring as a 1D NumPy array.
+        It returns either the offspring or a 2D array with a single row.
+        """
+
+        if self.fitness_batch_size in [1, None]:
+            return offspring
+        else:
+            return offspring[numpy.newaxis]
+
+    def steady_state_fitness(self, fitness):
+        """
+        Returns the fitness of an offspring in the steady-state mode out of the output of the fitness function. If the 'fitness_batch_size' parameter is used, then the output is a batch of a single fitness value and this value is returned.
+        It accepts:
+            -fitness: The output of the fitness function.
+        It returns the fitness of the offspring.
+        """
+
+        if self.fitness_batch_size in [1, None]:
+            return fitness
+
+        if type(fitness) not in [list, tuple, numpy.ndarray]:
+            raise TypeError(f"Expected to receive a list, tuple, or numpy.ndarray from the fitness function but the value ({fitness}) of type {type(fitness)}.")
+        elif len(fitness) != 1:
+            raise ValueError(f"There is a mismatch between the number of solutions passed to the fitness function (1) and the number of fitness values returned ({len(fitness)}). They must match.")
+        return fitness[0]
+
+    def steady_state_insert(self, offspring, fitness, replacement):
+        """
+        Inserts an evaluated offspring into the population in the steady-state mode. The 'population' and 'last_generation_fitness' attributes are edited in place.
+        It accepts:
+            -offspring: The offspring.
+            -fitness: The fitness of the offspring.
+            -replacement: Either "worst" or "tournament". Check the run_steady_state() method.
+        """
+
+        if type(fitness) in GA.supported_int_float_types:
+            # This is a single-objective optimization problem.
+            pass
+        elif type(fitness) in [list, tuple, numpy.ndarray]:
+            # This is a multi-objective optimization problem.
+            fitness = numpy.array(fitness)
+        else:
+            raise ValueError(f"The fitness function should return a number or an iterable (list, tuple, or numpy.ndarray) but the value ({fitness}) of type {type(fitness)} found.")
+
+        if not (self.fitness_cache is None) and (self.save_solutions or not (self.fitness_cache_size is None) or self.mutation_type == "adaptive"):
+            self.fitness_cache.put(offspring, fitness)
+
+        # The offspring is archived even if it does not replace a solution in the population.
+        if not (self.pareto_archive is None):
+            self.pareto_archive.add(offspring[numpy.newaxis], numpy.reshape(fitness, (1, -1)))
+
+        # For a single-objective optimization problem, the worst solutions are found without sorting the population.
+        # For a multi-objective optimization problem, the solutions are sorted from the best to the worst using non-dominated sorting and crowding distance.
+        single_objective = self.last_generation_fitness.ndim == 1
+        if not single_objective:
+            fitness_sorted = self.sort_solutions_nsga2(fitness=self.last_generation_fitness,
+                                                       find_best_solution=True)
+
+        if replacement == "worst":
+            if single_objective:
+                replaced_idx = numpy.argmin(self.last_generation_fitness)
+            else:
+                replaced_idx = fitness_sorted[-1]
+            worst_fitness = self.last_generation_fitness[replaced_idx]
+            if type(fitness) in GA.supported_int_float_types:
+                if fitness < worst_fitness:
+                    return
+            elif numpy.all(worst_fitness >= fitness) and numpy.any(worst_fitness > fitness):
+                # The worst solution dominates the offspring.
+                return
+        elif single_objective:
+            # The best keep_elitism solutions are never replaced.
+            num_protected = min(self.keep_elitism, len(self.last_generation_fitness) - 1)
+            if num_protected > 0:
+                candidates = numpy.argpartition(-self.last_generation_fitness, num_protected - 1)[num_protected:]
+            else:
+                candidates = numpy.arange(len(self.last_generation_fitness))
+            contestants = candidates[numpy.random.choice(len(candidates),
+                                                         size=min(self.K_tournament, len(candidates)),
+                                                         replace=False)]
+            replaced_idx = contestants[numpy.argmin(self.last_generation_fitness[contestants])]
+        else:
+            # The best keep_elitism solutions are never replaced.
+            candidates = fitness_sorted[min(self.keep_elitism, len(fitness_sorted) - 1):]
+            contestants = numpy.random.choice(len(candidates),
+                                              size=min(self.K_tournament, len(candidates)),
+                                              replace=False)
+            # The candidates are sorted from the best to the worst. So, the contestant with the largest position is the worst one.
+            replaced_idx = candidates[max(contestants)]
+
+        self.population[replaced_idx] = offspring
+        self.last_generation_fitness[replaced_idx] = fitness
+
+    def run_start(self):
+        """
+        This method must be only called from inside the run() method. It is not meant for use by the user.
+        Generally, any method with a name starting with 'run_' is meant to be only called by PyGAD from inside the 'run()' method.
+
+        The objective of the 'run_start()' method is to prepare the attributes that are extended while running the generations and call the callable on_start() if defined.
+
+        Returns
+        -------
+        None.
+        """
+
+        # Starting from PyGAD 2.18.0, the 4 properties (best_solutions, best_solutions_fitness, solutions, and solutions_fitness) are no longer reset with each call to the run() method. Instead, they are extended.
+        # For example, if there are 50 generations and the user set save_best_solutions=True, then the length of the 2 properties best_solutions and best_solutions_fitness will be 50 after the first call to the run() method, then 100 after the second call, 150 after the third, and so on.
+
+        # self.best_solutions: Holds the best solution in each generation.
+        if type(self.best_solutions) is numpy.ndarray:
+            self.best_solutions = self.best_solutions.tolist()
+        # self.best_solutions_fitness: A list holding the fitness value of the best solution for each generation.
+        if type(self.best_solutions_fitness) is numpy.ndarray:
+            self.best_solutions_fitness = list(self.best_solutions_fitness)
+        # self.solutions: Holds the solutions in each generation.
+        if type(self.solutions) is numpy.ndarray:
+            self.solutions = self.solutions.tolist()
+        # self.solutions_fitness: Holds the fitness of the solutions in each generation.
+        if type(self.solutions_fitness) is numpy.ndarray:
+            self.solutions_fitness = list(self.solutions_fitness)
+
+        # Start measuring the performance statistics of the first generation.
+        self.perf_reset()
+
+        # Create the executor once before the generations loop. It is reused by all generations.
+        if not (self.parallel_processing is None):
+            self.get_executor()
+        self.perf_lap("other")
+
+        if not (self.on_start is None):
+            self.on_start(self)
+        self.perf_lap("callbacks")
+
+    def run_check_fitness_type(self):
+        """
+        This method must be only called from inside the run() method. It is not meant for use by the user.
+        Generally, any method with a name starting with 'run_' is meant to be only called by PyGAD from inside the 'run()' method.
+
+        The objective of the 'run_check_fitness_type()' method is to know whether the problem is single-objective or multi-objective according to the 'last_generation_fitness' attribute and validate the parent selection type accordingly.
+
+        Returns
+        -------
+        None.
+        """
+
+        if type(self.last_generation_fitness[0]) in GA.supported_int_float_types:
+            # Single-objective problem.
+            # If the problem is SOO, the parent selection type cannot be nsga2 or tournament_nsga2.
+            if self.parent_selection_type in ['nsga2', 'tournament_nsga2']:
+                raise TypeError(f"Incorrect parent selection type. The fitness function returned a single numeric fitness value which means the problem is single-objective. But the parent selection type {self.parent_selection_type} is used which only works for multi-objective optimization problems.")
+        elif type(self.last_generation_fitness[0]) in [list, tuple, numpy.ndarray]:
+            # Multi-objective problem.
+            pass
+
+    def run_best_solution(self):
+        """
+        This method must be only called from inside the run() method. It is not meant for use by the user.
+        Generally, any method with a name starting with 'run_' is meant to be only called by PyGAD from inside the 'run()' method.
+
+        The objective of the 'run_best_solution()' method is to find the best solution in the current generation and append it to the 'best_solutions' attribute if save_best_solutions=True.
+        If the Pareto archive is used, then the solutions of the current generation are inserted into it.
+
+        Returns
+        -------
+        best_solution_fitness : The fitness of the best solution in the current generation.
+        """
+
+        best_solution, best_solution_fitness, best_match_idx = self.best_solution(pop_fitness=self.last_generation_fitness)
+
+        # Appending the best solution in the current generation to the best_solutions list.
+        if self.save_best_solutions:
+            self.best_solutions.append(list(best_solution))
+            self.fitness_cache.put(best_solution, self.last_generation_fitness[best_match_idx])
+
+        if not (self.pareto_archive is None):
+            self.pareto_archive.add(self.population, self.last_generation_fitness)
+
+        return best_solution_fitness
+
+    def run_on_generation(self, best_solution_fitness):
+        """
+        This method must be only called from inside the run() method. It is not meant for use by the user.
+        Generally, any method with a name starting with 'run_' is meant to be only called by PyGAD from inside the 'run()' method.
+
+        The objective of the 'run_on_generation()' method is to call the callable on_generation() if defined.
+
+        Parameters
+        ----------
+        best_solution_fitness : The fitness of the best solution in the current generation.
+
+        Returns
+        -------
+        bool: True if on_generation() returned "stop" to stop the evolution. Otherwise, False.
+        """
+
+        if not (self.on_generation is None):
+            r = self.on_generation(self)
+            if type(r) is str and r.lower() == "stop":
+                # Before aborting the loop, save the fitness value of the best solution.
+                # _, best_solution_fitness, _ = self.best_solution()
+                self.best_solutions_fitness.append(best_solution_fitness)
+                return True
+        return False
+
+    def run_stop_criteria(self):
+        """
+        This method must be only called from inside the run() method. It is not meant for use by the user.
+        Generally, any method with a name starting with 'run_' is meant to be only called by PyGAD from inside the 'run()' method.
+
+        The objective of the 'run_stop_criteria()' method is to check whether any of the criteria passed to the 'stop_criteria' parameter is satisfied.
+
+        Returns
+        -------
+        bool: True if the evolution should stop. Otherwise, False.
+        """
+
+        stop_run = False
+        if not self.stop_criteria is None:
+            # The hypervolume is calculated once per generation even if the 'hv_saturate' keyword is used multiple times.
+            if "hv_saturate" in [criterion[0] for criterion in self.stop_criteria]:
+                self.hypervolumes.append(self.pareto_front_hypervolume(self.last_generation_fitness))
+
+            for criterion in self.stop_criteria:
+                if criterion[0] == "reach":
+                    # Single-objective problem.
+                    if type(self.last_generation_fitness[0]) in GA.supported_int_float_types:
+                        if max(self.last_generation_fitness) >= criterion[1]:
+                            stop_run = True
+                            break
+                    # Multi-objective problem.
+                    elif type(self.last_generation_fitness[0]) in [list, tuple, numpy.ndarray]:
+                        # Validate the value passed to the criterion.
+                        if len(criterion[1:]) == 1:
+                            # There is a single value used across all the objectives.
+                            pass
+                        elif len(criterion[1:]) > 1:
+                            # There are multiple values. The number of values must be equal to the number of objectives.
+                            if len(criterion[1:]) == len(self.last_generation_fitness[0]):
+                                pass
+                            else:
+                                self.valid_parameters = False
+                                raise ValueError(f"When the the 'reach' keyword is used with the 'stop_criteria' parameter for solving a multi-objective problem, then the number of numeric values following the keyword can be:\n1) A single numeric value to be used across all the objective functions.\n2) A number of numeric values equal to the number of objective functions.\nBut the value {criterion} found with {len(criterion)-1} numeric values which is not equal to the number of objective functions {len(self.last_generation_fitness[0])}.")
+
+                        stop_run = True
+                        for obj_idx in range(len(self.last_generation_fitness[0])):
+                            # Use the objective index to return the proper value for the criterion.
+
+                            if len(criterion[1:]) == len(self.last_generation_fitness[0]):
+                                reach_fitness_value = criterion[obj_idx + 1]
+                            elif len(criterion[1:]) == 1:
+                                reach_fitness_value = criterion[1]
+                            else:
+                                # Unexpected to be reached, but it is safer to handle it.
+                                self.valid_parameters = False
+                                raise ValueError(f"The number of values does not equal the number of objectives.")
+
+                            if max(self.last_generation_fitness[:, obj_idx]) >= reach_fitness_value:
+                                pass
+                            else:
+                                stop_run = False
+                                break
+                elif criterion[0] == "saturate":
+                    criterion[1] = int(criterion[1])
+                    if self.generations_completed >= criterion[1]:
+                        # Single-objective problem.
+                        if type(self.last_generation_fitness[0]) in GA.supported_int_float_types:
+                            if (self.best_solutions_fitness[self.generations_completed - criterion[1]] - self.best_solutions_fitness[self.generations_completed - 1]) == 0:
+                                stop_run = True
+                                break
+                        # Multi-objective problem.
+                        elif type(self.last_generation_fitness[0]) in [list, tuple, numpy.ndarray]:
+                            stop_run = True
+                            for obj_idx in range(len(self.last_generation_fitness[0])):
+                                if (self.best_solutions_fitness[self.generations_completed - criterion[1]][obj_idx] - self.best_solutions_fitness[self.generations_completed - 1][obj_idx]) == 0:
+                                    pass
+                                else:
+                                    stop_run = False
+                                    break
+                elif criterion[0] == "hv_saturate":
+                    num_generations = int(criterion[1])
+                    # The minimum relative improvement of the hypervolume. It defaults to 0 which means the hypervolume does not change.
+                    epsilon = criterion[2] if len(criterion) > 2 else 0
+                    if len(self.hypervolumes) > num_generations:
+                        # The hypervolume of the population may decrease. So, the best hypervolume in the last num_generations generations is compared against the best hypervolume before them.
+                        previous_hypervolume = max(self.hypervolumes[:-num_generations])
+                        if max(self.hypervolumes[-num_generations:]) - previous_hypervolume <= epsilon * abs(previous_hypervolume):
+                            stop_run = True
+                            break
+
+        return stop_run
+
+    def run_end(self):
+        """
+        This method must be only called from inside the run() method. It is not meant for use by the user.
+        Generally, any method with a name starting with 'run_' is meant to be only called by PyGAD from inside the 'run()' method.
+
+        The objective of the 'run_end()' method is to save the outputs of the last generation, mark the run as completed, and call the callable on_stop() if defined.
+
+        Returns
+        -------
+        None.
+        """
+
+        # Save the fitness of the last generation.
+        if self.save_solutions:
+            # self.solutions.extend(self.population.copy())
+            population_as_list = self.population.copy()
+            population_as_list = [list(item) for item in population_as_list]
+            self.solutions.extend(population_as_list)
+
+            self.solutions_fitness.extend(self.last_generation_fitness)
+
+        # Call the run_select_parents() method to update these 2 attributes according to the 'last_generation_fitness' attribute:
+            # 1) last_generation_parents 2) last_generation_parents_indices
+        # Set 'call_on_parents=False' to avoid calling the callable 'on_parents' because this step is not part of the cycle.
+        self.run_select_parents(call_on_parents=False)
+
+        # Save the fitness value of the best solution.
+        _, best_solution_fitness, _ = self.best_solution(
+            pop_fitness=self.last_generation_fitness)
+        self.best_solutions_fitness.append(best_solution_fitness)
+
+        self.best_solution_generation = numpy.where(numpy.array(
+            self.best_solutions_fitness) == numpy.max(numpy.array(self.best_solutions_fitness)))[0][0]
+        # After the run() method completes, the run_completed flag is changed from False to True.
+        # Set to True only after the run() method completes gracefully.
+        self.run_completed = True
+
+        if not (self.on_stop is None):
+            self.on_stop(self, self.last_generation_fitness)
+
+        # Converting the 'best_solutions' list into a NumPy array.
+        self.best_solutions = numpy.array(self.best_solutions)
+
+        # Update previous_generation_fitness because it is used to get the fitness of the parents.
+        self.previous_generation_fitness = self.last_generation_fitness.copy()
+
     def run_loop_head(self, best_solution_fitness):
         if not (self.on_fitness is None):
             on_fitness_output = self.on_fitness(self, 
@@ -2008,8 +2887,12 @@ class GA(utils.parent_selection.ParentSelection,
 
         if call_on_parents:
             if not (self.on_parents is None):
+                if self.collect_perf_stats:
+                    start_ns = time.perf_counter_ns()
                 on_parents_output = self.on_parents(self, 
                                                     self.last_generation_parents)
+                if self.collect_perf_stats:
+                    self.perf_nested("callbacks", start_ns)
     
                 if on_parents_output is None:
                     pass
@@ -2102,8 +2985,12 @@ class GA(utils.parent_selection.ParentSelection,
 
         # PyGAD 2.18.2 // The on_crossover() callback function is called even if crossover_type is None.
         if not (self.on_crossover is None):
+            if self.collect_perf_stats:
+                start_ns = time.perf_counter_ns()
             on_crossover_output = self.on_crossover(self, 
                                                     self.last_generation_offspring_crossover)
+            if self.collect_perf_stats:
+                self.perf_nested("callbacks", start_ns)
             if on_crossover_output is None:
                 pass
             else:
@@ -2151,8 +3038,12 @@ class GA(utils.parent_selection.ParentSelection,
 
         # PyGAD 2.18.2 // The on_mutation() callback function is called even if mutation_type is None.
         if not (self.on_mutation is None):
+            if self.collect_perf_stats:
+                start_ns = time.perf_counter_ns()
             on_mutation_output = self.on_mutation(self, 
                                                   self.last_generation_offspring_mutation)
+            if self.collect_perf_stats:
+                self.perf_nested("callbacks", start_ns)
 
             if on_mutation_output is None:
                 pass
@@ -2254,6 +3145,23 @@ class GA(utils.parent_selection.ParentSelection,
 
         return best_solution, best_solution_fitness, best_match_idx
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __getstate__(self):
+        # The executors cannot be pickled. They are removed while pickling the instance (e.g. by the save() method).
+        state = self.__dict__.copy()
+        state["executor"] = None
+        state["user_executor"] = None
+        state["shared_memory_blocks"] = {}
+        state["shared_memory_finalizers"] = {}
+        # The ranking is rebuilt from the fitness when needed.
+        state["nsga2_ranking_cache"] = None
+        return state
+
     def save(self, filename):
         """
         Saves the genetic algorithm instance:
@@ -2415,6 +3323,10 @@ class GA(utils.parent_selection.ParentSelection,
                 m = f"Parallel Processing: {self.parallel_processing}"
                 self.logger.info(m)
                 summary_output = summary_output + m + "\n"
+                if self.ipc_stats["num_tasks"] > 0:
+                    m = f"IPC per Task: {self.ipc_stats['bytes_sent'] / self.ipc_stats['num_tasks']:.1f} bytes sent, {self.ipc_stats['bytes_received'] / self.ipc_stats['num_tasks']:.1f} bytes received (worker context {self.ipc_stats['context_bytes']} bytes)"
+                    self.logger.info(m)
+                    summary_output = summary_output + m + "\n"
             if not self.random_seed is None:
                 m = f"Random Seed: {self.random_seed}"
                 self.logger.info(m)
@@ -2425,6 +3337,10 @@ class GA(utils.parent_selection.ParentSelection,
             m = f"Save Solutions: {self.save_solutions}"
             self.logger.info(m)
             summary_output = summary_output + m + "\n"
+            if not (self.pareto_archive is None):
+                m = f"Pareto Archive: {len(self.pareto_archive)} of at most {self.pareto_archive_size} solutions ({self.pareto_archive_truncation} truncation)"
+                self.logger.info(m)
+                summary_output = summary_output + m + "\n"
 
         m = line_separator(line_character=line_character)
         self.logger.info(m)
@@ -2494,6 +3410,197 @@ class GA(utils.parent_selection.ParentSelection,
             summary_output = summary_output + m + "\n"
         return summary_output
 
+class IslandGA(utils.nsga2.NSGA2):
+
+    supported_int_float_types = GA.supported_int_float_types
+
+    def __init__(self,
+                 num_islands,
+                 migration_interval=10,
+                 num_migrants=1,
+                 migration_topology="ring",
+                 **kwargs):
+        """
+        The constructor of the IslandGA class runs multiple sub-populations (islands) in separate processes. Each island is a full pygad.GA instance with its own operators.
+        Every 'migration_interval' generations, each island sends its best 'num_migrants' solutions to other islands according to the 'migration_topology' parameter. The received migrants replace the worst solutions of the island.
+        Only the gene rows and their fitness values are sent between the processes through pipes.
+
+        num_islands: The number of islands (processes).
+        migration_interval: The number of generations between migrations. It defaults to 10.
+        num_migrants: The number of best solutions migrating from each island. It defaults to 1.
+        migration_topology: Which islands receive the migrants of an island. It can be "ring" (default) where each island sends its migrants to the next island, "fully_connected" where each island sends its migrants to all the other islands, or "random" where each island sends its migrants to a randomly selected island in each migration. If an island receives more than 'num_migrants' migrants, then only the best ones are kept.
+        kwargs: The parameters passed to the constructor of the pygad.GA class of each island. If 'random_seed' is passed, then the island at index i uses the seed random_seed+i. Otherwise, each island uses its own seed spawned from a numpy.random.SeedSequence so that the islands do not inherit the same random state. The 'on_generation' callback is called inside the islands before the migration. The index of the island is available in the 'island_idx' attribute of its pygad.GA instance.
+        """
+
+        if not (type(num_islands) in GA.supported_int_types and num_islands > 0):
+            raise ValueError(f"The value assigned to the 'num_islands' parameter must be a positive integer but the value ({num_islands}) of type {type(num_islands)} found.")
+        if not (type(migration_interval) in GA.supported_int_types and migration_interval > 0):
+            raise ValueError(f"The value assigned to the 'migration_interval' parameter must be a positive integer but the value ({migration_interval}) of type {type(migration_interval)} found.")
+        if not (type(num_migrants) in GA.supported_int_types and num_migrants >= 0):
+            raise ValueError(f"The value assigned to the 'num_migrants' parameter must be a non-negative integer but the value ({num_migrants}) of type {type(num_migrants)} found.")
+        if not (migration_topology in ["ring", "fully_connected", "random"]):
+            raise ValueError(f"The value assigned to the 'migration_topology' parameter must be 'ring', 'fully_connected', or 'random' but the value ({migration_topology}) found.")
+
+        # Validate the parameters of the islands before starting the processes.
+        ga_instance = GA(**kwargs)
+        if num_migrants >= ga_instance.sol_per_pop:
+            raise ValueError(f"The value assigned to the 'num_migrants' parameter ({num_migrants}) must be less than the number of solutions in the population of each island ({ga_instance.sol_per_pop}).")
+
+        self.num_islands = num_islands
+        self.migration_interval = migration_interval
+        self.num_migrants = num_migrants
+        self.migration_topology = migration_topology
+        self.ga_kwargs = kwargs
+        self.random_seed = kwargs.get("random_seed")
+        # The seed of each island. Without a seed, the processes would inherit the same random state and all islands would evolve identically.
+        if self.random_seed is None:
+            self.islands_random_seeds = [int(seed_sequence.generate_state(1)[0]) for seed_sequence in numpy.random.SeedSequence().spawn(num_islands)]
+        else:
+            self.islands_random_seeds = [self.random_seed + island_idx for island_idx in range(num_islands)]
+
+        # The final population and fitness of each island.
+        self.populations = []
+        self.populations_fitness = []
+        # The fitness of the best solution in each generation of each island.
+        self.islands_best_solutions_fitness = []
+        # The number of generations completed by each island.
+        self.islands_generations_completed = []
+        # The fitness of the best solution across all islands in each generation.
+        self.best_solutions_fitness = []
+        # The number of migrations done.
+        self.num_migrations = 0
+        self.run_completed = False
+
+    def island_kwargs(self, island_idx):
+        """
+        Returns the cloudpickled parameters of the pygad.GA class constructor for the island at the given index.
+        """
+
+        kwargs = dict(self.ga_kwargs)
+        kwargs["random_seed"] = self.islands_random_seeds[island_idx]
+        return cloudpickle.dumps(kwargs)
+
+    def route_migrants(self, migrants, random_generator):
+        """
+        Decides which islands receive the migrants according to the 'migration_topology' parameter.
+        It accepts:
+            -migrants: A dict mapping the index of each island sending migrants to a tuple of its migrants and their fitness.
+            -random_generator: A numpy.random.Generator used by the random topology.
+        It returns a dict mapping the index of each island to a tuple of its received migrants and their fitness.
+        """
+
+        senders = sorted(migrants.keys())
+        received = {island_idx: [] for island_idx in senders}
+        if len(senders) > 1:
+            for pos, island_idx in enumerate(senders):
+                if self.migration_topology == "ring":
+                    targets = [senders[(pos + 1) % len(senders)]]
+                elif self.migration_topology == "fully_connected":
+                    targets = [target for target in senders if target != island_idx]
+                else:
+                    others = [target for target in senders if target != island_idx]
+                    targets = [others[random_generator.integers(len(others))]]
+                for target in targets:
+                    received[target].append(migrants[island_idx])
+
+        routed = {}
+        for island_idx in senders:
+            if len(received[island_idx]) == 0:
+                rows, fitness = migrants[island_idx]
+                routed[island_idx] = (rows[:0], fitness[:0])
+            else:
+                routed[island_idx] = (numpy.concatenate([rows for rows, _ in received[island_idx]]),
+                                      numpy.concatenate([fitness for _, fitness in received[island_idx]]))
+        return routed
+
+    def run(self):
+        """
+        Runs the islands in separate processes and manages the migration between them. It returns after all islands complete.
+        """
+
+        multiprocessing_context = multiprocessing.get_context()
+        random_generator = numpy.random.default_rng(self.random_seed)
+
+        connections = []
+        processes = []
+        for island_idx in range(self.num_islands):
+            parent_connection, child_connection = multiprocessing_context.Pipe()
+            process = multiprocessing_context.Process(target=helper.island.run_island,
+                                                      args=(island_idx,
+                                                            self.island_kwargs(island_idx),
+                                                            child_connection,
+                                                            self.migration_interval,
+                                                            self.num_migrants),
+                                                      daemon=True)
+            process.start()
+            child_connection.close()
+            connections.append(parent_connection)
+            processes.append(process)
+
+        results = [None] * self.num_islands
+        try:
+            running = list(range(self.num_islands))
+            while len(running) > 0:
+                # Each running island either sends its migrants and waits for the migrants of the other islands or completes.
+                migrants = {}
+                for island_idx in running:
+                    try:
+                        message = connections[island_idx].recv()
+                    except EOFError:
+                        raise RuntimeError(f"The process of the island at index {island_idx} exited unexpectedly.")
+                    if message[0] == "migrants":
+                        migrants[island_idx] = (message[1], message[2])
+                    elif message[0] == "done":
+                        results[island_idx] = message[1:]
+                    else:
+                        raise RuntimeError(f"An error occurred in the island at index {island_idx}:\n{message[1]}")
+
+                if len(migrants) > 0:
+                    for island_idx, (rows, fitness) in self.route_migrants(migrants, random_generator).items():
+                        connections[island_idx].send(("migrants", rows, fitness))
+                    self.num_migrations += 1
+                running = list(migrants.keys())
+        finally:
+            for connection in connections:
+                connection.close()
+            for process in processes:
+                process.join(timeout=None if all([not (result is None) for result in results]) else 0)
+                if process.is_alive():
+                    process.terminate()
+
+        self.populations = [result[0] for result in results]
+        self.populations_fitness = [result[1] for result in results]
+        self.islands_best_solutions_fitness = [list(result[2]) for result in results]
+        self.islands_generations_completed = [result[3] for result in results]
+
+        # Combine the fitness of the best solutions of all islands in each generation.
+        self.best_solutions_fitness = []
+        for generation in range(max([len(best_solutions_fitness) for best_solutions_fitness in self.islands_best_solutions_fitness])):
+            generation_fitness = [best_solutions_fitness[generation] for best_solutions_fitness in self.islands_best_solutions_fitness if generation < len(best_solutions_fitness)]
+            best_idx = self.sort_solutions_nsga2(fitness=numpy.array(generation_fitness),
+                                                 find_best_solution=True)[0]
+            self.best_solutions_fitness.append(generation_fitness[best_idx])
+
+        self.run_completed = True
+
+    def best_solution(self):
+        """
+        Returns information about the best solution across all islands after the run() method completes.
+        The following are returned:
+            -best_solution: Best solution across all islands.
+            -best_solution_fitness: Fitness value of the best solution.
+            -best_island_idx: Index of the island having the best solution.
+        """
+
+        if not self.run_completed:
+            raise RuntimeError("The best_solution() method of the IslandGA class can only be called after the run() method completes.")
+
+        islands_indices = numpy.concatenate([[island_idx] * len(population) for island_idx, population in enumerate(self.populations)])
+        fitness = numpy.concatenate(self.populations_fitness)
+        best_idx = self.sort_solutions_nsga2(fitness=fitness,
+                                             find_best_solution=True)[0]
+        return numpy.concatenate(self.populations)[best_idx], fitness[best_idx], int(islands_indices[best_idx])
+
 def load(filename):
     """
     Reads a saved instance of the genetic algorithm:
@@ -2,5 +2,6 @@ from pygad.utils import parent_selection
 from pygad.utils import crossover
 from pygad.utils import mutation
 from pygad.utils import nsga2
+from pygad.utils import hypervolume
 
 __version__ = "1.3.0"
\ No newline at end of file
@@ -3,7 +3,6 @@ The pygad.utils.crossover module has all the built-in crossover operators.
 """
 
 import numpy
-import random
 
 class Crossover:
 
@@ -24,61 +23,18 @@ class Crossover:
             array-like: An array containing the produced offspring.
         """
 
-        if self.gene_type_single == True:
-            offspring = numpy.empty(offspring_size, dtype=self.gene_type[0])
-        else:
-            offspring = numpy.empty(offspring_size, dtype=object)
-
         # Randomly generate all the K points at which crossover takes place between each two parents. The point does not have to be always at the center of the solutions.
         # This saves time by calling the numpy.random.randint() function only once.
         crossover_points = numpy.random.randint(low=0, 
                                                 high=parents.shape[1], 
                                                 size=offspring_size[0])
 
-        for k in range(offspring_size[0]):
-            # Check if the crossover_probability parameter is used.
-            if not (self.crossover_probability is None):
-                probs = numpy.random.random(size=parents.shape[0])
-                indices = list(set(numpy.where(probs <= self.crossover_probability)[0]))
-
-                # If no parent satisfied the probability, no crossover is applied and a parent is selected as is.
-                if len(indices) == 0:
-                    offspring[k, :] = parents[k % parents.shape[0], :]
-                    continue
-                elif len(indices) == 1:
-                    parent1_idx = indices[0]
-                    parent2_idx = parent1_idx
-                else:
-                    indices = random.sample(indices, 2)
-                    parent1_idx = indices[0]
-                    parent2_idx = indices[1]
-            else:
-                # Index of the first parent to mate.
-                parent1_idx = k % parents.shape[0]
-                # Index of the second parent to mate.
-                parent2_idx = (k+1) % parents.shape[0]
-
-            # The new offspring has its first half of its genes from the first parent.
-            offspring[k, 0:crossover_points[k]] = parents[parent1_idx, 0:crossover_points[k]]
-            # The new offspring has its second half of its genes from the second parent.
-            offspring[k, crossover_points[k]:] = parents[parent2_idx, crossover_points[k]:]
-
-            if self.allow_duplicate_genes == False:
-                if self.gene_space is None:
-                    offspring[k], _, _ = self.solve_duplicate_genes_randomly(solution=offspring[k],
-                                                                             min_val=self.random_mutation_min_val,
-                                                                             max_val=self.random_mutation_max_val,
-                                                                             mutation_by_replacement=self.mutation_by_replacement,
-                                                                             gene_type=self.gene_type,
-                                                                             sample_size=self.sample_size)
-                else:
-                    offspring[k], _, _ = self.solve_duplicate_genes_by_space(solution=offspring[k],
-                                                                             gene_type=self.gene_type,
-                                                                             sample_size=self.sample_size,
-                                                                             mutation_by_replacement=self.mutation_by_replacement,
-                                                                             build_initial_pop=False)
-        
-        return offspring
+        # The new offspring has its first part of its genes (before the crossover point) from the first parent and the remaining genes from the second parent.
+        first_parent_mask = numpy.arange(offspring_size[1]) < crossover_points[:, numpy.newaxis]
+
+        return self.crossover_offspring(parents=parents,
+                                        offspring_size=offspring_size,
+                                        first_parent_mask=first_parent_mask)
 
     def two_points_crossover(self, parents, offspring_size):
 
@@ -90,15 +46,10 @@ class Crossover:
         It returns an array the produced offspring.
         """
 
-        if self.gene_type_single == True:
-            offspring = numpy.empty(offspring_size, dtype=self.gene_type[0])
-        else:
-            offspring = numpy.empty(offspring_size, dtype=object)
-
         # Randomly generate all the first K points at which crossover takes place between each two parents. 
         # This saves time by calling the numpy.random.randint() function only once.
         if (parents.shape[1] == 1): # If the chromosome has only a single gene. In this case, this gene is copied from the second parent.
-            crossover_points_1 = numpy.zeros(offspring_size[0])
+            crossover_points_1 = numpy.zeros(offspring_size[0], dtype=int)
         else:
             crossover_points_1 = numpy.random.randint(low=0, 
                                                       high=numpy.ceil(parents.shape[1]/2 + 1), 
@@ -107,51 +58,14 @@ class Crossover:
         # The second point must always be greater than the first point.
         crossover_points_2 = crossover_points_1 + int(parents.shape[1]/2) 
 
-        for k in range(offspring_size[0]):
-
-            if not (self.crossover_probability is None):
-                probs = numpy.random.random(size=parents.shape[0])
-                indices = list(set(numpy.where(probs <= self.crossover_probability)[0]))
-
-                # If no parent satisfied the probability, no crossover is applied and a parent is selected.
-                if len(indices) == 0:
-                    offspring[k, :] = parents[k % parents.shape[0], :]
-                    continue
-                elif len(indices) == 1:
-                    parent1_idx = indices[0]
-                    parent2_idx = parent1_idx
-                else:
-                    indices = random.sample(indices, 2)
-                    parent1_idx = indices[0]
-                    parent2_idx = indices[1]
-            else:
-                # Index of the first parent to mate.
-                parent1_idx = k % parents.shape[0]
-                # Index of the second parent to mate.
-                parent2_idx = (k+1) % parents.shape[0]
-
-            # The genes from the beginning of the chromosome up to the first point are copied from the first parent.
-            offspring[k, 0:crossover_points_1[k]] = parents[parent1_idx, 0:crossover_points_1[k]]
-            # The genes from the second point up to the end of the chromosome are copied from the first parent.
-            offspring[k, crossover_points_2[k]:] = parents[parent1_idx, crossover_points_2[k]:]
-            # The genes between the 2 points are copied from the second parent.
-            offspring[k, crossover_points_1[k]:crossover_points_2[k]] = parents[parent2_idx, crossover_points_1[k]:crossover_points_2[k]]
-
-            if self.allow_duplicate_genes == False:
-                if self.gene_space is None:
-                    offspring[k], _, _ = self.solve_duplicate_genes_randomly(solution=offspring[k],
-                                                                             min_val=self.random_mutation_min_val,
-                                                                             max_val=self.random_mutation_max_val,
-                                                                             mutation_by_replacement=self.mutation_by_replacement,
-                                                                             gene_type=self.gene_type,
-                                                                             sample_size=self.sample_size)
-                else:
-                    offspring[k], _, _ = self.solve_duplicate_genes_by_space(solution=offspring[k],
-                                                                             gene_type=self.gene_type,
-                                                                             sample_size=self.sample_size,
-                                                                             mutation_by_replacement=self.mutation_by_replacement,
-                                                                             build_initial_pop=False)
-        return offspring
+        # The genes before the first point and the genes starting from the second point are copied from the first parent.
+        # The genes between the 2 points are copied from the second parent.
+        genes_indices = numpy.arange(offspring_size[1])
+        first_parent_mask = (genes_indices < crossover_points_1[:, numpy.newaxis]) | (genes_indices >= crossover_points_2[:, numpy.newaxis])
+
+        return self.crossover_offspring(parents=parents,
+                                        offspring_size=offspring_size,
+                                        first_parent_mask=first_parent_mask)
 
     def uniform_crossover(self, parents, offspring_size):
 
@@ -163,11 +77,6 @@ class Crossover:
         It returns an array the produced offspring.
         """
 
-        if self.gene_type_single == True:
-            offspring = numpy.empty(offspring_size, dtype=self.gene_type[0])
-        else:
-            offspring = numpy.empty(offspring_size, dtype=object)
-
         # Randomly generate all the genes sources at which crossover takes place between each two parents. 
         # This saves time by calling the numpy.random.randint() function only once.
         # There is a list of 0 and 1 for each offspring.
@@ -176,52 +85,9 @@ class Crossover:
                                              high=2, 
                                              size=offspring_size)
 
-        for k in range(offspring_size[0]):
-            if not (self.crossover_probability is None):
-                probs = numpy.random.random(size=parents.shape[0])
-                indices = list(set(numpy.where(probs <= self.crossover_probability)[0]))
-
-                # If no parent satisfied the probability, no crossover is applied and a parent is selected.
-                if len(indices) == 0:
-                    offspring[k, :] = parents[k % parents.shape[0], :]
-                    continue
-                elif len(indices) == 1:
-                    parent1_idx = indices[0]
-                    parent2_idx = parent1_idx
-                else:
-                    indices = random.sample(indices, 2)
-                    parent1_idx = indices[0]
-                    parent2_idx = indices[1]
-            else:
-                # Index of the first parent to mate.
-                parent1_idx = k % parents.shape[0]
-                # Index of the second parent to mate.
-                parent2_idx = (k+1) % parents.shape[0]
-
-            for gene_idx in range(offspring_size[1]):
-                if (genes_sources[k, gene_idx] == 0):
-                    # The gene will be copied from the first parent if the current gene index is 0.
-                    offspring[k, gene_idx] = parents[parent1_idx, gene_idx]
-                elif (genes_sources[k, gene_idx] == 1):
-                    # The gene will be copied from the second parent if the current gene index is 1.
-                    offspring[k, gene_idx] = parents[parent2_idx, gene_idx]
-
-            if self.allow_duplicate_genes == False:
-                if self.gene_space is None:
-                    offspring[k], _, _ = self.solve_duplicate_genes_randomly(solution=offspring[k],
-                                                                             min_val=self.random_mutation_min_val,
-                                                                             max_val=self.random_mutation_max_val,
-                                                                             mutation_by_replacement=self.mutation_by_replacement,
-                                                                             gene_type=self.gene_type,
-                                                                             sample_size=self.sample_size)
-                else:
-                    offspring[k], _, _ = self.solve_duplicate_genes_by_space(solution=offspring[k],
-                                                                             gene_type=self.gene_type,
-                                                                             sample_size=self.sample_size,
-                                                                             mutation_by_replacement=self.mutation_by_replacement,
-                                                                             build_initial_pop=False)
-
-        return offspring
+        return self.crossover_offspring(parents=parents,
+                                        offspring_size=offspring_size,
+                                        first_parent_mask=genes_sources == 0)
 
     def scattered_crossover(self, parents, offspring_size):
 
@@ -233,11 +99,6 @@ class Crossover:
         It returns an array the produced offspring.
         """
 
-        if self.gene_type_single == True:
-            offspring = numpy.empty(offspring_size, dtype=self.gene_type[0])
-        else:
-            offspring = numpy.empty(offspring_size, dtype=object)
-
         # Randomly generate all the genes sources at which crossover takes place between each two parents. 
         # This saves time by calling the numpy.random.randint() function only once.
         # There is a list of 0 and 1 for each offspring.
@@ -246,44 +107,336 @@ class Crossover:
                                              high=2, 
                                              size=offspring_size)
 
-        for k in range(offspring_size[0]):
-            if not (self.crossover_probability is None):
-                probs = numpy.random.random(size=parents.shape[0])
-                indices = list(set(numpy.where(probs <= self.crossover_probability)[0]))
-
-                # If no parent satisfied the probability, no crossover is applied and a parent is selected.
-                if len(indices) == 0:
-                    offspring[k, :] = parents[k % parents.shape[0], :]
-                    continue
-                elif len(indices) == 1:
-                    parent1_idx = indices[0]
-                    parent2_idx = parent1_idx
-                else:
-                    indices = random.sample(indices, 2)
-                    parent1_idx = indices[0]
-                    parent2_idx = indices[1]
-            else:
-                # Index of the first parent to mate.
-                parent1_idx = k % parents.shape[0]
-                # Index of the second parent to mate.
-                parent2_idx = (k+1) % parents.shape[0]
-
-            offspring[k, :] = numpy.where(genes_sources[k] == 0, 
-                                          parents[parent1_idx, :], 
-                                          parents[parent2_idx, :])
-
-            if self.allow_duplicate_genes == False:
-                if self.gene_space is None:
-                    offspring[k], _, _ = self.solve_duplicate_genes_randomly(solution=offspring[k],
-                                                                             min_val=self.random_mutation_min_val,
-                                                                             max_val=self.random_mutation_max_val,
-                                                                             mutation_by_replacement=self.mutation_by_replacement,
-                                                                             gene_type=self.gene_type,
-                                                                             sample_size=self.sample_size)
-                else:
-                    offspring[k], _, _ = self.solve_duplicate_genes_by_space(solution=offspring[k],
-                                                                             gene_type=self.gene_type,
-                                                                             sample_size=self.sample_size,
-                                                                             mutation_by_replacement=self.mutation_by_replacement,
+        return self.crossover_offspring(parents=parents,
+                                        offspring_size=offspring_size,
+                                        first_parent_mask=genes_sources == 0)
+
+    def crossover_parents_indices(self, num_parents, num_offspring):
+
+        """
+        Selects the indices of the 2 parents mating to produce each offspring.
+        If the crossover_probability parameter is None, then the offspring at index k is produced by mating the parents at indices k and k+1 (wrapping around the parents).
+        Otherwise, each parent is selected for mating an offspring if its random probability is <= crossover_probability. Then 2 parents are selected randomly out of the selected ones. If only a single parent is selected, then it mates with itself. If no parent is selected, then no crossover is applied and the parent at index k is copied as is.
+        Instead of generating a probability for each parent and offspring, the number of selected parents is drawn from the binomial distribution. As the selected parents are a random subset of the parents, 2 random parents out of the selected ones are just 2 distinct random parents.
+
+        Parameters:
+            num_parents (int): The number of parents.
+            num_offspring (int): The number of offspring to produce.
+
+        Returns:
+            tuple:
+                numpy.ndarray: The indices of the first parents.
+                numpy.ndarray: The indices of the second parents.
+                numpy.ndarray: A boolean array that is True for each offspring produced by crossover and False for each offspring copied from a parent.
+        """
+
+        # Index of the first parent to mate.
+        parents1_indices = numpy.arange(num_offspring) % num_parents
+        if self.crossover_probability is None:
+            # Index of the second parent to mate.
+            parents2_indices = (parents1_indices + 1) % num_parents
+            return parents1_indices, parents2_indices, numpy.ones(num_offspring, dtype=bool)
+
+        # The number of parents satisfying the probability for each offspring.
+        num_selected = numpy.random.binomial(n=num_parents,
+                                             p=self.crossover_probability,
+                                             size=num_offspring)
+        # If no parent satisfied the probability, no crossover is applied and a parent is selected as is.
+        crossed = num_selected > 0
+
+        random_parents1_indices = numpy.random.randint(low=0,
+                                                       high=num_parents,
+                                                       size=num_offspring)
+        # The second parent is selected out of the remaining parents so that it differs from the first parent.
+        random_parents2_indices = numpy.random.randint(low=0,
+                                                       high=max(num_parents - 1, 1),
+                                                       size=num_offspring)
+        random_parents2_indices += random_parents2_indices >= random_parents1_indices
+
+        parents1_indices = numpy.where(crossed, random_parents1_indices, parents1_indices)
+        # If only a single parent satisfied the probability, then it mates with itself.
+        parents2_indices = numpy.where(num_selected > 1, random_parents2_indices, parents1_indices)
+
+        return parents1_indices, parents2_indices, crossed
+
+    def crossover_offspring(self, parents, offspring_size, first_parent_mask):
+
+        """
+        Builds the offspring by copying each gene from either the first or the second mating parent. It is used by all the built-in crossover operators.
+        The parents are selected using the crossover_parents_indices() method. If the allow_duplicate_genes parameter is False, then the duplicate genes in the offspring produced by crossover are solved.
+
+        Parameters:
+            parents (array-like): The parents to mate for producing the offspring.
+            offspring_size (tuple): The size of the offspring to produce.
+            first_parent_mask (numpy.ndarray): A boolean array of shape offspring_size. If True, the gene is copied from the first parent. Otherwise, it is copied from the second parent.
+
+        Returns:
+            array-like: An array containing the produced offspring.
+        """
+
+        if self.gene_type_single == True:
+            offspring = numpy.empty(offspring_size, dtype=self.gene_type[0])
+        else:
+            offspring = numpy.empty(offspring_size, dtype=object)
+
+        parents1_indices, parents2_indices, crossed = self.crossover_parents_indices(num_parents=parents.shape[0],
+                                                                                     num_offspring=offspring_size[0])
+
+        offspring[:, :] = numpy.where(first_parent_mask,
+                                      parents[parents1_indices, :],
+                                      parents[parents2_indices, :])
+
+        if self.allow_duplicate_genes == False:
+            # Only the offspring produced by crossover may have new duplicates. The others are copies of their parents.
+            crossed_indices = numpy.flatnonzero(crossed)
+            offspring[crossed_indices], _ = self.solve_duplicate_genes_batch(population=offspring[crossed_indices],
                                                                              build_initial_pop=False)
+
+        return offspring
+
+    def permutation_crossover_parents(self, parents, offspring_size):
+
+        """
+        Selects the 2 mating parents of each offspring for the permutation crossovers and converts their genes into ranks.
+        The rank of a gene is the index of its value in the 'permutation_values' attribute. So, each parent becomes a permutation of the integers from 0 to num_genes-1.
+
+        Parameters:
+            parents (array-like): The parents to mate for producing the offspring.
+            offspring_size (tuple): The size of the offspring to produce.
+
+        Returns:
+            tuple:
+                numpy.ndarray: The ranks of the first parent of each offspring.
+                numpy.ndarray: The ranks of the second parent of each offspring.
+                numpy.ndarray: A boolean array that is True for each offspring produced by crossover and False for each offspring copied from a parent.
+        """
+
+        parents1_indices, parents2_indices, crossed = self.crossover_parents_indices(num_parents=parents.shape[0],
+                                                                                     num_offspring=offspring_size[0])
+
+        parents_ranks = numpy.searchsorted(self.permutation_values,
+                                           numpy.asarray(parents, dtype=self.permutation_values.dtype))
+
+        return parents_ranks[parents1_indices], parents_ranks[parents2_indices], crossed
+
+    def permutation_offspring(self, offspring_ranks, parents1_ranks, crossed):
+
+        """
+        Converts the ranks of the offspring produced by a permutation crossover back to the gene values.
+        The offspring not produced by crossover are copied from their first parent.
+
+        Parameters:
+            offspring_ranks (numpy.ndarray): The ranks of the offspring.
+            parents1_ranks (numpy.ndarray): The ranks of the first parent of each offspring.
+            crossed (numpy.ndarray): A boolean array that is True for each offspring produced by crossover.
+
+        Returns:
+            numpy.ndarray: An array containing the produced offspring.
+        """
+
+        offspring_ranks = numpy.where(crossed[:, numpy.newaxis], offspring_ranks, parents1_ranks)
+
+        offspring = numpy.empty(offspring_ranks.shape, dtype=self.gene_type[0])
+        offspring[:, :] = self.permutation_values[offspring_ranks]
         return offspring
+
+    def permutation_segments(self, offspring_size):
+
+        """
+        Selects 2 random cut points for each offspring. It is used by the order and partially mapped crossovers.
+
+        Parameters:
+            offspring_size (tuple): The size of the offspring to produce.
+
+        Returns:
+            tuple:
+                numpy.ndarray: A column vector with the start (inclusive) of the segment of each offspring.
+                numpy.ndarray: A column vector with the end (exclusive) of the segment of each offspring.
+                numpy.ndarray: A boolean array of shape offspring_size that is True for the genes inside the segment.
+        """
+
+        points = numpy.sort(numpy.random.randint(low=0,
+                                                 high=offspring_size[1] + 1,
+                                                 size=(offspring_size[0], 2)),
+                            axis=1)
+        segments_starts = points[:, :1]
+        segments_ends = points[:, 1:]
+        genes_indices = numpy.arange(offspring_size[1])
+        in_segment = (genes_indices >= segments_starts) & (genes_indices < segments_ends)
+        return segments_starts, segments_ends, in_segment
+
+    def ox_crossover(self, parents, offspring_size):
+
+        """
+        Applies the order crossover (OX) between pairs of parents. It is only used when gene_encoding='permutation'.
+        The offspring copies a random segment from the first parent. The remaining genes are filled, starting after the segment and wrapping around, with the genes of the second parent that are not in the segment in the order they appear in the second parent (also starting after the segment).
+        All offspring are produced at once.
+
+        Parameters:
+            parents (array-like): The parents to mate for producing the offspring.
+            offspring_size (tuple): The size of the offspring to produce.
+
+        Returns:
+            array-like: An array containing the produced offspring.
+        """
+
+        parents1_ranks, parents2_ranks, crossed = self.permutation_crossover_parents(parents, offspring_size)
+        segments_starts, segments_ends, in_segment = self.permutation_segments(offspring_size)
+        rows = numpy.arange(offspring_size[0])[:, numpy.newaxis]
+
+        # True for each rank copied from the segment of the first parent.
+        used = numpy.zeros(offspring_size, dtype=bool)
+        used[rows, parents1_ranks] = in_segment
+
+        # The gene indices starting after the segment and wrapping around.
+        rotated_indices = (segments_ends + numpy.arange(offspring_size[1])) % offspring_size[1]
+        parents2_rotated = parents2_ranks[rows, rotated_indices]
+
+        # Each offspring has the same number of positions outside its segment and unused ranks. So, the 2 lists are aligned row by row.
+        offspring_indices, positions = numpy.nonzero(~in_segment[rows, rotated_indices])
+        fill_positions = rotated_indices[offspring_indices, positions]
+        fill_ranks = parents2_rotated[~used[rows, parents2_rotated]]
+
+        offspring_ranks = parents1_ranks.copy()
+        offspring_ranks[offspring_indices, fill_positions] = fill_ranks
+
+        return self.permutation_offspring(offspring_ranks, parents1_ranks, crossed)
+
+    def pmx_crossover(self, parents, offspring_size):
+
+        """
+        Applies the partially mapped crossover (PMX) between pairs of parents. It is only used when gene_encoding='permutation'.
+        The offspring copies a random segment from the first parent and the remaining genes from the second parent. A gene of the second parent that already exists in the segment is replaced by following the mapping between the 2 parents inside the segment until reaching a gene outside the segment.
+        All offspring are produced at once. The mapping is followed for all genes at the same time and the number of iterations is at most the segment length.
+
+        Parameters:
+            parents (array-like): The parents to mate for producing the offspring.
+            offspring_size (tuple): The size of the offspring to produce.
+
+        Returns:
+            array-like: An array containing the produced offspring.
+        """
+
+        parents1_ranks, parents2_ranks, crossed = self.permutation_crossover_parents(parents, offspring_size)
+        segments_starts, segments_ends, in_segment = self.permutation_segments(offspring_size)
+        rows = numpy.arange(offspring_size[0])[:, numpy.newaxis]
+
+        # The position of each rank in the first parent.
+        parents1_positions = numpy.empty(offspring_size, dtype=int)
+        parents1_positions[rows, parents1_ranks] = numpy.arange(offspring_size[1])
+
+        offspring_ranks = numpy.where(in_segment, parents1_ranks, parents2_ranks)
+
+        offspring_indices, genes_indices = numpy.nonzero(~in_segment)
+        ranks = parents2_ranks[offspring_indices, genes_indices]
+        positions = parents1_positions[offspring_indices, ranks]
+        pending = numpy.flatnonzero(in_segment[offspring_indices, positions])
+        while len(pending) > 0:
+            # Map the rank to the rank of the second parent at the position of the rank in the first parent.
+            ranks[pending] = parents2_ranks[offspring_indices[pending], positions[pending]]
+            positions[pending] = parents1_positions[offspring_indices[pending], ranks[pending]]
+            pending = pending[in_segment[offspring_indices[pending], positions[pending]]]
+        offspring_ranks[offspring_indices, genes_indices] = ranks
+
+        return self.permutation_offspring(offspring_ranks, parents1_ranks, crossed)
+
+    def cycle_crossover(self, parents, offspring_size):
+
+        """
+        Applies the cycle crossover (CX) between pairs of parents. It is only used when gene_encoding='permutation'.
+        The positions of the genes are split into cycles where each cycle has the same genes in both parents. The offspring copies the genes of the first, third, fifth, ... cycles from the first parent and the genes of the other cycles from the second parent. The cycles are ordered by their first position.
+        All offspring are produced at once. Each position is labeled by the smallest position in its cycle using pointer doubling which takes log2(num_genes) iterations.
+
+        Parameters:
+            parents (array-like): The parents to mate for producing the offspring.
+            offspring_size (tuple): The size of the offspring to produce.
+
+        Returns:
+            array-like: An array containing the produced offspring.
+        """
+
+        parents1_ranks, parents2_ranks, crossed = self.permutation_crossover_parents(parents, offspring_size)
+        rows = numpy.arange(offspring_size[0])[:, numpy.newaxis]
+        genes_indices = numpy.arange(offspring_size[1])
+
+        # The position of each rank in the first parent.
+        parents1_positions = numpy.empty(offspring_size, dtype=int)
+        parents1_positions[rows, parents1_ranks] = genes_indices
+
+        # The next position in the cycle is the position in the first parent of the gene of the second parent.
+        next_positions = parents1_positions[rows, parents2_ranks]
+        cycles_starts = numpy.tile(genes_indices, (offspring_size[0], 1))
+        for _ in range(max(int(numpy.ceil(numpy.log2(offspring_size[1]))), 1)):
+            cycles_starts = numpy.minimum(cycles_starts, cycles_starts[rows, next_positions])
+            next_positions = next_positions[rows, next_positions]
+
+        # The order of each cycle is the number of cycles starting before it.
+        cycles_orders = numpy.cumsum(cycles_starts == genes_indices, axis=1) - 1
+        from_first_parent = cycles_orders[rows, cycles_starts] % 2 == 0
+
+        offspring_ranks = numpy.where(from_first_parent, parents1_ranks, parents2_ranks)
+
+        return self.permutation_offspring(offspring_ranks, parents1_ranks, crossed)
+
+    def edge_crossover(self, parents, offspring_size):
+
+        """
+        Applies the edge recombination crossover (ERX) between pairs of parents. It is only used when gene_encoding='permutation'.
+        Each gene has a list of its neighbors (the genes before and after it) in both parents. The offspring starts with the first gene of the first parent. Then the next gene is the unvisited neighbor of the current gene with the fewest unvisited neighbors (ties are broken randomly). If the current gene has no unvisited neighbors, then the next gene is a random unvisited gene.
+        The genes of each offspring are selected one after the other. Each step selects the next gene for all offspring at once.
+
+        Parameters:
+            parents (array-like): The parents to mate for producing the offspring.
+            offspring_size (tuple): The size of the offspring to produce.
+
+        Returns:
+            array-like: An array containing the produced offspring.
+        """
+
+        parents1_ranks, parents2_ranks, crossed = self.permutation_crossover_parents(parents, offspring_size)
+        num_offspring, num_genes = offspring_size
+        rows = numpy.arange(num_offspring)[:, numpy.newaxis]
+        offspring_indices = numpy.arange(num_offspring)
+
+        # The 4 neighbors of each rank: before and after it in the first and the second parents. A duplicate neighbor is replaced by -1.
+        neighbors = numpy.empty((num_offspring, num_genes, 4), dtype=int)
+        for parent_idx, parent_ranks in enumerate([parents1_ranks, parents2_ranks]):
+            neighbors[rows, parent_ranks, 2 * parent_idx] = numpy.roll(parent_ranks, 1, axis=1)
+            neighbors[rows, parent_ranks, 2 * parent_idx + 1] = numpy.roll(parent_ranks, -1, axis=1)
+        for neighbor_idx in range(1, 4):
+            duplicate = numpy.any(neighbors[:, :, :neighbor_idx] == neighbors[:, :, neighbor_idx:neighbor_idx + 1], axis=2)
+            neighbors[:, :, neighbor_idx][duplicate] = -1
+        # The number of unvisited neighbors of each rank.
+        num_neighbors = numpy.sum(neighbors >= 0, axis=2)
+
+        visited = numpy.zeros(offspring_size, dtype=bool)
+        offspring_ranks = numpy.empty(offspring_size, dtype=int)
+        current_ranks = parents1_ranks[:, 0]
+        for gene_idx in range(num_genes):
+            offspring_ranks[:, gene_idx] = current_ranks
+            visited[offspring_indices, current_ranks] = True
+            if gene_idx == num_genes - 1:
+                break
+
+            current_neighbors = neighbors[offspring_indices, current_ranks]
+            valid = current_neighbors >= 0
+            # The current rank is no longer an unvisited neighbor of its neighbors.
+            valid_offspring, valid_neighbors = numpy.nonzero(valid)
+            num_neighbors[valid_offspring, current_neighbors[valid_offspring, valid_neighbors]] -= 1
+
+            current_neighbors = numpy.where(valid, current_neighbors, 0)
+            candidates = valid & ~visited[rows, current_neighbors]
+            # The random fraction breaks the ties without changing the order of different numbers of neighbors.
+            keys = numpy.where(candidates,
+                               num_neighbors[rows, current_neighbors] + numpy.random.random(size=current_neighbors.shape),
+                               numpy.inf)
+            next_ranks = current_neighbors[offspring_indices, numpy.argmin(keys, axis=1)]
+
+            # Select a random unvisited rank for the offspring without unvisited neighbors.
+            stuck = numpy.flatnonzero(~numpy.any(candidates, axis=1))
+            if len(stuck) > 0:
+                keys = numpy.where(visited[stuck], -1, numpy.random.random(size=(len(stuck), num_genes)))
+                next_ranks[stuck] = numpy.argmax(keys, axis=1)
+            current_ranks = next_ranks
+
+        return self.permutation_offspring(offspring_ranks, parents1_ranks, crossed)
@@ -0,0 +1,215 @@
+import numpy
+import bisect
+
+class Hypervolume:
+
+    def __init__(self):
+        pass
+
+    # The number of random points used to estimate the hypervolume for more than 3 objectives.
+    hypervolume_num_samples = 100000
+
+    # The seed of the random points used to estimate the hypervolume. The same points are used in all generations so that the estimates of different fronts are comparable.
+    # A separate random generator is used to keep the random numbers of the genetic algorithm unchanged.
+    hypervolume_random_seed = 0
+
+    def hypervolume(self, fitness, reference_point):
+        """
+        Calculate the hypervolume of a set of solutions. It is the volume of the objective space dominated by the solutions and bounded by the reference point.
+        All objectives are maximized. The solutions that are not better than the reference point in all objectives are ignored.
+        The hypervolume is calculated exactly for up to 3 objectives using a sweep. For more objectives, it is estimated using Monte Carlo sampling.
+
+        Parameters
+        ----------
+        fitness : numpy.ndarray
+            A 2D array of the fitness values of the solutions with a row per solution and a column per objective. A 1D array is treated as a single objective.
+        reference_point : numpy.ndarray
+            A 1D array with a value per objective. It must be worse than the solutions in all objectives.
+
+        Returns
+        -------
+        hypervolume : float
+            The hypervolume of the solutions.
+        """
+
+        fitness = numpy.asarray(fitness, dtype=float)
+        if fitness.ndim == 1:
+            fitness = fitness.reshape(-1, 1)
+        reference_point = numpy.broadcast_to(numpy.asarray(reference_point, dtype=float), (fitness.shape[1],))
+
+        # Shift the solutions so that the reference point is at the origin.
+        points = fitness[numpy.all(fitness > reference_point, axis=1)] - reference_point
+        if points.shape[0] == 0:
+            return 0.0
+
+        num_objectives = points.shape[1]
+        if num_objectives == 1:
+            return float(numpy.max(points))
+        elif num_objectives == 2:
+            return self.hypervolume_2d(points)
+        elif num_objectives == 3:
+            return self.hypervolume_3d(points)
+        else:
+            return self.hypervolume_monte_carlo(points)
+
+    def hypervolume_2d(self, points):
+        """
+        Calculate the exact hypervolume (area) of 2-objective points relative to the origin.
+        The points are sorted by the first objective in descending order. Each point adds the rectangle between its first objective and the next one with a height equal to the best second objective so far.
+
+        Parameters
+        ----------
+        points : numpy.ndarray
+            A 2D array of positive points with 2 columns.
+
+        Returns
+        -------
+        hypervolume : float
+            The area dominated by the points.
+        """
+
+        points = points[numpy.argsort(-points[:, 0], kind="stable")]
+        widths = points[:, 0] - numpy.append(points[1:, 0], 0)
+        heights = numpy.maximum.accumulate(points[:, 1])
+        return float(numpy.sum(widths * heights))
+
+    def hypervolume_3d(self, points):
+        """
+        Calculate the exact hypervolume of 3-objective points relative to the origin.
+        The points are swept by the third objective in descending order. The area dominated by the swept points in the first 2 objectives is updated incrementally by inserting each point into a staircase kept sorted by the first objective.
+        Each point takes O(log N) time to be located in the staircase in addition to the time to remove the points it dominates. Every point is removed at most once.
+
+        Parameters
+        ----------
+        points : numpy.ndarray
+            A 2D array of positive points with 3 columns.
+
+        Returns
+        -------
+        hypervolume : float
+            The volume dominated by the points.
+        """
+
+        points = points[numpy.argsort(-points[:, 2], kind="stable")]
+        heights = points[:, 2] - numpy.append(points[1:, 2], 0)
+
+        # The staircase of the non-dominated points in the first 2 objectives. The first objective is in ascending order and the second objective is in descending order.
+        staircase_x = []
+        # The negative of the second objective to have it in ascending order for the binary search.
+        staircase_neg_y = []
+        area = 0.0
+        volume = 0.0
+        for (x, y, _), height in zip(points.tolist(), heights.tolist()):
+            right_idx = bisect.bisect_left(staircase_x, x)
+            # The point is inserted only if no point in the staircase has both objectives greater than or equal to it.
+            if right_idx == len(staircase_x) or -staircase_neg_y[right_idx] < y:
+                # The points dominated by the new point are contiguous in the staircase.
+                end_idx = bisect.bisect_right(staircase_x, x)
+                start_idx = min(bisect.bisect_left(staircase_neg_y, -y), end_idx)
+
+                # The part of the rectangle of the new point that is already dominated by the staircase.
+                # It is a smaller staircase made of the left neighbour, the dominated points, and the right neighbour clipped to the rectangle.
+                steps = []
+                if start_idx > 0:
+                    steps.append((staircase_x[start_idx - 1], y))
+                steps.extend(zip(staircase_x[start_idx:end_idx], [-neg_y for neg_y in staircase_neg_y[start_idx:end_idx]]))
+                if end_idx < len(staircase_x):
+                    steps.append((x, -staircase_neg_y[end_idx]))
+                covered_area = 0.0
+                previous_x = 0.0
+                for step_x, step_y in steps:
+                    covered_area += (step_x - previous_x) * step_y
+                    previous_x = step_x
+
+                area += x * y - covered_area
+                staircase_x[start_idx:end_idx] = [x]
+                staircase_neg_y[start_idx:end_idx] = [-y]
+
+            # The slab between the third objective of the current point and the next point.
+            volume += area * height
+
+        return volume
+
+    def hypervolume_monte_carlo(self, points):
+        """
+        Estimate the hypervolume of points with any number of objectives relative to the origin using Monte Carlo sampling.
+        Random samples are drawn uniformly in the box between the origin and the maximum of each objective. The hypervolume is the volume of the box multiplied by the fraction of the samples dominated by at least one point.
+        The number of samples and their seed are set by the 'hypervolume_num_samples' and 'hypervolume_random_seed' attributes.
+
+        Parameters
+        ----------
+        points : numpy.ndarray
+            A 2D array of positive points with a row per point.
+
+        Returns
+        -------
+        hypervolume : float
+            The estimated hypervolume of the points.
+        """
+
+        upper_bound = numpy.max(points, axis=0)
+        box_volume = float(numpy.prod(upper_bound))
+        random_generator = numpy.random.default_rng(self.hypervolume_random_seed)
+
+        num_dominated = 0
+        # The samples are compared against the points in blocks to bound the memory.
+        block_size = max(1, self.dominance_max_elements // points.shape[0])
+        for block_start in range(0, self.hypervolume_num_samples, block_size):
+            num_block_samples = min(block_size, self.hypervolume_num_samples - block_start)
+            samples = random_generator.random((num_block_samples, points.shape[1])) * upper_bound
+            dominated = numpy.ones((num_block_samples, points.shape[0]), dtype=bool)
+            for objective_idx in range(points.shape[1]):
+                dominated &= points[:, objective_idx] >= samples[:, objective_idx, numpy.newaxis]
+            num_dominated += numpy.count_nonzero(numpy.any(dominated, axis=1))
+
+        return box_volume * num_dominated / self.hypervolume_num_samples
+
+    def hypervolume_reference_point_from(self, fitness):
+        """
+        Create a reference point that is worse than all the passed solutions. For each objective, it is the minimum fitness minus 10% of the range of the fitness (or minus 1 if all the solutions have the same fitness).
+
+        Parameters
+        ----------
+        fitness : numpy.ndarray
+            A 2D array of the fitness values of the solutions with a row per solution and a column per objective.
+
+        Returns
+        -------
+        reference_point : numpy.ndarray
+            A 1D array with a value per objective.
+        """
+
+        fitness = numpy.asarray(fitness, dtype=float)
+        if fitness.ndim == 1:
+            fitness = fitness.reshape(-1, 1)
+        fitness_min = numpy.min(fitness, axis=0)
+        margin = 0.1 * (numpy.max(fitness, axis=0) - fitness_min)
+        margin[margin == 0] = 1.0
+        return fitness_min - margin
+
+    def pareto_front_hypervolume(self, fitness):
+        """
+        Calculate the hypervolume of the first pareto front of the passed fitness. The first front is found using the cached ranking returned by the nsga2_ranking() method.
+        The reference point is saved in the 'hypervolume_reference_point' attribute. If it is None, it is created from the passed fitness using the hypervolume_reference_point_from() method and kept fixed in the next calls so that the hypervolumes of different generations are comparable.
+
+        Parameters
+        ----------
+        fitness : numpy.ndarray
+            The fitness values of the solutions.
+
+        Returns
+        -------
+        hypervolume : float
+            The hypervolume of the first pareto front.
+        """
+
+        fitness = numpy.asarray(fitness, dtype=float)
+        if fitness.ndim == 1:
+            fitness = fitness.reshape(-1, 1)
+
+        if self.hypervolume_reference_point is None:
+            self.hypervolume_reference_point = self.hypervolume_reference_point_from(fitness)
+
+        first_front = self.nsga2_ranking(fitness).pareto_fronts[0]
+        return self.hypervolume(fitness[first_front],
+                                reference_point=self.hypervolume_reference_point)
@@ -3,10 +3,8 @@ The pygad.utils.mutation module has all the built-in mutation operators.
 """
 
 import numpy
-import random
 
 import pygad
-import concurrent.futures
 
 import warnings
 
@@ -56,36 +54,8 @@ class Mutation:
         It returns an array of the mutated offspring using the mutation space.
         """
 
-        # For each offspring, a value from the gene space is selected randomly and assigned to the selected mutated gene.
-        for offspring_idx in range(offspring.shape[0]):
-            mutation_indices = numpy.array(random.sample(range(0, self.num_genes), self.mutation_num_genes))
-            for gene_idx in mutation_indices:
-
-                value_from_space = self.mutation_process_gene_value(solution=offspring[offspring_idx],
-                                                                    gene_idx=gene_idx,
-                                                                    sample_size=self.sample_size)
-
-                # Before assigning the selected value from the space to the gene, change its data type and round it.
-                if self.gene_type_single == True:
-                    if not self.gene_type[1] is None:
-                        offspring[offspring_idx, gene_idx] = numpy.round(self.gene_type[0](value_from_space),
-                                                                         self.gene_type[1])
-                    else:
-                        offspring[offspring_idx, gene_idx] = self.gene_type[0](value_from_space)
-                else:
-                    if not self.gene_type[gene_idx][1] is None:
-                        offspring[offspring_idx, gene_idx] = numpy.round(self.gene_type[gene_idx][0](value_from_space),
-                                                                         self.gene_type[gene_idx][1])
-                    else:
-                        offspring[offspring_idx, gene_idx] = self.gene_type[gene_idx][0](value_from_space)
-
-                if self.allow_duplicate_genes == False:
-                    offspring[offspring_idx], _, _ = self.solve_duplicate_genes_by_space(solution=offspring[offspring_idx],
-                                                                                         gene_type=self.gene_type,
-                                                                                         sample_size=self.sample_size,
-                                                                                         mutation_by_replacement=self.mutation_by_replacement,
-                                                                                         build_initial_pop=False)
-        return offspring
+        return self.mutation_by_mask(offspring=offspring,
+                                     mutation_mask=self.mutation_num_genes_mask(offspring.shape))
 
     def mutation_probs_by_space(self, offspring):
 
@@ -96,37 +66,10 @@ class Mutation:
         It returns an array of the mutated offspring using the mutation space.
         """
 
-        # For each offspring, a value from the gene space is selected randomly and assigned to the selected mutated gene.
-        for offspring_idx in range(offspring.shape[0]):
-            probs = numpy.random.random(size=offspring.shape[1])
-            for gene_idx in range(offspring.shape[1]):
-
-                if probs[gene_idx] <= self.mutation_probability:
-                    value_from_space = self.mutation_process_gene_value(solution=offspring[offspring_idx],
-                                                                        gene_idx=gene_idx,
-                                                                        sample_size=self.sample_size)
-
-                    # Assigning the selected value from the space to the gene.
-                    if self.gene_type_single == True:
-                        if not self.gene_type[1] is None:
-                            offspring[offspring_idx, gene_idx] = numpy.round(self.gene_type[0](value_from_space),
-                                                                             self.gene_type[1])
-                        else:
-                            offspring[offspring_idx, gene_idx] = self.gene_type[0](value_from_space)
-                    else:
-                        if not self.gene_type[gene_idx][1] is None:
-                            offspring[offspring_idx, gene_idx] = numpy.round(self.gene_type[gene_idx][0](value_from_space),
-                                                                             self.gene_type[gene_idx][1])
-                        else:
-                            offspring[offspring_idx, gene_idx] = self.gene_type[gene_idx][0](value_from_space)
-
-                    if self.allow_duplicate_genes == False:
-                        offspring[offspring_idx], _, _ = self.solve_duplicate_genes_by_space(solution=offspring[offspring_idx],
-                                                                                             gene_type=self.gene_type,
-                                                                                             sample_size=self.sample_size,
-                                                                                             mutation_by_replacement=self.mutation_by_replacement,
-                                                                                             build_initial_pop=False)
-        return offspring
+        # The mutation probabilities of all genes in all offspring.
+        mutation_mask = numpy.random.random(size=offspring.shape) <= self.mutation_probability
+        return self.mutation_by_mask(offspring=offspring,
+                                     mutation_mask=mutation_mask)
 
     def mutation_process_gene_value(self,
                                     solution,
@@ -186,136 +129,244 @@ class Mutation:
         It returns an array of the mutated offspring.
         """
 
-        # Random mutation changes one or more genes in each offspring randomly.
-        for offspring_idx in range(offspring.shape[0]):
-            # Return the indices of the genes to mutate.
-            mutation_indices = numpy.array(random.sample(range(0, self.num_genes), 
-                                                         self.mutation_num_genes))
-            for gene_idx in mutation_indices:
+        return self.mutation_by_mask(offspring=offspring,
+                                     mutation_mask=self.mutation_num_genes_mask(offspring.shape))
 
-                range_min, range_max = self.get_random_mutation_range(gene_idx)
+    def mutation_probs_randomly(self, offspring):
 
-                # Generate a random value for mutation that meet the gene constraint if exists.
-                random_value = self.mutation_process_gene_value(range_min=range_min,
-                                                                range_max=range_max,
-                                                                solution=offspring[offspring_idx],
-                                                                gene_idx=gene_idx,
-                                                                sample_size=self.sample_size)
+        """
+        Applies the random mutation using the mutation probability. For each gene, if its probability is <= that mutation probability, then it will be mutated randomly.
+        It accepts:
+            -offspring: The offspring to mutate.
+        It returns an array of the mutated offspring.
+        """
 
-                offspring[offspring_idx, gene_idx] = random_value
+        # The mutation probabilities of all genes in all offspring.
+        mutation_mask = numpy.random.random(size=offspring.shape) <= self.mutation_probability
+        return self.mutation_by_mask(offspring=offspring,
+                                     mutation_mask=mutation_mask)
 
-                if self.allow_duplicate_genes == False:
-                    offspring[offspring_idx], _, _ = self.solve_duplicate_genes_randomly(solution=offspring[offspring_idx],
-                                                                                         min_val=range_min,
-                                                                                         max_val=range_max,
-                                                                                         mutation_by_replacement=self.mutation_by_replacement,
-                                                                                         gene_type=self.gene_type,
-                                                                                         sample_size=self.sample_size)
+    def mutation_num_genes_mask(self, shape):
 
-        return offspring
+        """
+        Selects the genes to mutate in all offspring at once according to the 'mutation_num_genes' parameter. For each offspring, the genes with the smallest 'mutation_num_genes' random keys are selected.
+        It accepts:
+            -shape: The shape of the offspring.
+        It returns a boolean array of the given shape where the genes to mutate are True.
+        """
 
-    def mutation_probs_randomly(self, offspring):
+        mutation_mask = numpy.zeros(shape, dtype=bool)
+        if self.mutation_num_genes >= shape[1]:
+            mutation_mask[:, :] = True
+        elif self.mutation_num_genes > 0:
+            mutation_indices = numpy.argpartition(numpy.random.random(size=shape),
+                                                  self.mutation_num_genes,
+                                                  axis=1)[:, :self.mutation_num_genes]
+            mutation_mask[numpy.arange(shape[0])[:, numpy.newaxis], mutation_indices] = True
+        return mutation_mask
+
+    def mutation_by_mask(self, offspring, mutation_mask):
 
         """
-        Applies the random mutation using the mutation probability. For each gene, if its probability is <= that mutation probability, then it will be mutated randomly.
+        Applies the random mutation to the genes selected by a mask.
+        The new values of all the selected genes without a constraint are generated at once, either randomly using the mutation_random_values() method or from the gene space using the gene_space_values() method. The genes with a constraint in the gene_constraint parameter are mutated one by one using the mutation_process_gene_value() method.
+        If duplicate genes are not allowed (allow_duplicate_genes=False), the duplicates in all offspring are solved once after the mutation using the solve_duplicate_genes_batch() method.
         It accepts:
             -offspring: The offspring to mutate.
+            -mutation_mask: A boolean array with the same shape as the offspring. The genes to mutate are True.
         It returns an array of the mutated offspring.
         """
 
-        # Random mutation changes one or more genes in each offspring randomly.
-        for offspring_idx in range(offspring.shape[0]):
-            # The mutation probabilities for the current offspring.
-            probs = numpy.random.random(size=offspring.shape[1])
-            for gene_idx in range(offspring.shape[1]):
+        constrained_genes = numpy.zeros(offspring.shape[1], dtype=bool)
+        if self.gene_constraint:
+            constrained_genes[:] = [not (constraint is None) for constraint in self.gene_constraint]
+
+        if self.gene_space is None:
+            mutation_values = self.mutation_random_values
+        else:
+            mutation_values = self.gene_space_values
 
+        if self.gene_type_single == True:
+            offspring_indices, genes_indices = numpy.nonzero(mutation_mask & ~constrained_genes)
+            offspring[offspring_indices, genes_indices] = mutation_values(gene_values=offspring[offspring_indices, genes_indices],
+                                                                          genes_indices=genes_indices,
+                                                                          gene_type=self.gene_type)
+        else:
+            # Each gene has its own data type. The genes are mutated column by column.
+            for gene_idx in numpy.flatnonzero(~constrained_genes):
+                offspring_indices = numpy.flatnonzero(mutation_mask[:, gene_idx])
+                if len(offspring_indices) > 0:
+                    new_values = mutation_values(gene_values=offspring[offspring_indices, gene_idx],
+                                                 genes_indices=numpy.full(len(offspring_indices), gene_idx),
+                                                 gene_type=self.gene_type[gene_idx])
+                    # Assign a list to keep the data type of each value in the object array.
+                    offspring[offspring_indices, gene_idx] = list(new_values)
+
+        # The genes with a constraint.
+        for offspring_idx, gene_idx in zip(*numpy.nonzero(mutation_mask & constrained_genes)):
+            if self.gene_space is None:
                 range_min, range_max = self.get_random_mutation_range(gene_idx)
+            else:
+                # The values are selected from the gene space.
+                range_min, range_max = None, None
+
+            # Generate a random value for mutation that meet the gene constraint.
+            offspring[offspring_idx, gene_idx] = self.mutation_process_gene_value(range_min=range_min,
+                                                                                  range_max=range_max,
+                                                                                  solution=offspring[offspring_idx],
+                                                                                  gene_idx=gene_idx,
+                                                                                  sample_size=self.sample_size)
+
+        if self.allow_duplicate_genes == False:
+            offspring, _ = self.solve_duplicate_genes_batch(population=offspring,
+                                                            build_initial_pop=False)
 
-                # A gene is mutated only if its mutation probability is less than or equal to the threshold.
-                if probs[gene_idx] <= self.mutation_probability:
-
-                    # Generate a random value fpr mutation that meet the gene constraint if exists.
-                    random_value = self.mutation_process_gene_value(range_min=range_min,
-                                                                    range_max=range_max,
-                                                                    solution=offspring[offspring_idx],
-                                                                    gene_idx=gene_idx,
-                                                                    sample_size=self.sample_size)
-
-                    offspring[offspring_idx, gene_idx] = random_value
-
-                    if self.allow_duplicate_genes == False:
-                        offspring[offspring_idx], _, _ = self.solve_duplicate_genes_randomly(solution=offspring[offspring_idx],
-                                                                                             min_val=range_min,
-                                                                                             max_val=range_max,
-                                                                                             mutation_by_replacement=self.mutation_by_replacement,
-                                                                                             gene_type=self.gene_type,
-                                                                                             sample_size=self.sample_size)
         return offspring
 
+    def mutation_random_values(self,
+                               gene_values,
+                               genes_indices,
+                               gene_type,
+                               range_min=None,
+                               range_max=None,
+                               mutation_by_replacement=None):
+
+        """
+        Generates the mutated values of some genes sharing the same data type at once. It is the vectorized version of the generate_gene_value_randomly() method for a single value.
+        The random values are selected from the range set by the 'random_mutation_min_val' and 'random_mutation_max_val' parameters. For integer genes, the random value is an integer in the range.
+        According to the 'mutation_by_replacement' parameter, the random values either replace the gene values or are added to them. Then the new values are rounded and their data type is changed.
+        It accepts:
+            -gene_values: A 1D array of the values of the genes before mutation.
+            -genes_indices: A 1D array of the indices of the genes in their solutions. It is used to get the mutation range of each gene.
+            -gene_type: The data type of the genes and its precision as a list of 2 elements.
+            -range_min (optional): The minimum value of the range (a number or a value per gene). If None, the 'random_mutation_min_val' attribute is used.
+            -range_max (optional): The maximum value of the range (a number or a value per gene). If None, the 'random_mutation_max_val' attribute is used.
+            -mutation_by_replacement (optional): Whether the random values replace the gene values. If None, the 'mutation_by_replacement' attribute is used.
+        It returns a 1D array of the mutated values.
+        """
+
+        if range_min is None:
+            range_min = self.random_mutation_min_val
+        if range_max is None:
+            range_max = self.random_mutation_max_val
+        if mutation_by_replacement is None:
+            mutation_by_replacement = self.mutation_by_replacement
+
+        range_min = numpy.asarray(range_min, dtype=float)
+        range_max = numpy.asarray(range_max, dtype=float)
+        if range_min.ndim > 0:
+            # Each gene has its own mutation range.
+            range_min = range_min[genes_indices]
+            range_max = range_max[genes_indices]
+
+        if gene_type[0] in pygad.GA.supported_int_types:
+            # Select an integer out of the values in numpy.arange(range_min, range_max).
+            num_values = numpy.maximum(numpy.ceil(range_max - range_min), 1)
+            random_values = numpy.asarray(range_min + numpy.floor(numpy.random.random(size=len(genes_indices)) * num_values),
+                                          dtype=gene_type[0])
+        else:
+            random_values = numpy.random.uniform(low=range_min,
+                                                 high=range_max,
+                                                 size=len(genes_indices))
+
+        if mutation_by_replacement:
+            # The random value replaces the current gene value.
+            new_values = random_values
+        else:
+            # The random value is added to the gene value.
+            new_values = numpy.asarray(gene_values, dtype=gene_type[0]) + random_values
+
+        # Round the values before changing their data type to avoid precision loss for some data types like numpy.float32.
+        if not (gene_type[1] is None):
+            new_values = numpy.round(numpy.asarray(new_values, dtype=float), gene_type[1])
+
+        return numpy.asarray(new_values, dtype=gene_type[0])
+
     def swap_mutation(self, offspring):
 
         """
         Applies the swap mutation which interchanges the values of 2 randomly selected genes.
+        The genes of all offspring are swapped at once.
         It accepts:
             -offspring: The offspring to mutate.
         It returns an array of the mutated offspring.
         """
 
-        for idx in range(offspring.shape[0]):
-            mutation_gene1 = numpy.random.randint(low=0, high=offspring.shape[1]/2, size=1)[0]
-            mutation_gene2 = mutation_gene1 + int(offspring.shape[1]/2)
+        offspring_indices = numpy.arange(offspring.shape[0])
+        mutation_genes1 = numpy.random.randint(low=0, high=offspring.shape[1]/2, size=offspring.shape[0])
+        mutation_genes2 = mutation_genes1 + int(offspring.shape[1]/2)
 
-            temp = offspring[idx, mutation_gene1]
-            offspring[idx, mutation_gene1] = offspring[idx, mutation_gene2]
-            offspring[idx, mutation_gene2] = temp
+        # Fancy indexing returns copies. So, the right-hand side is not changed by the assignment.
+        offspring[offspring_indices, mutation_genes1], offspring[offspring_indices, mutation_genes2] = offspring[offspring_indices, mutation_genes2], offspring[offspring_indices, mutation_genes1]
         return offspring
 
     def inversion_mutation(self, offspring):
 
         """
         Applies the inversion mutation which selects a subset of genes and inverts them (in order).
+        The genes of all offspring are inverted at once by reading each offspring through a matrix of gene indices.
         It accepts:
             -offspring: The offspring to mutate.
         It returns an array of the mutated offspring.
         """
 
-        for idx in range(offspring.shape[0]):
-            mutation_gene1 = numpy.random.randint(low=0, high=numpy.ceil(offspring.shape[1]/2 + 1), size=1)[0]
-            mutation_gene2 = mutation_gene1 + int(offspring.shape[1]/2)
+        mutation_genes1, mutation_genes2 = self.mutation_segments(offspring.shape)
+
+        genes_indices = numpy.tile(numpy.arange(offspring.shape[1]), (offspring.shape[0], 1))
+        in_segment = (genes_indices >= mutation_genes1) & (genes_indices < mutation_genes2)
+        # Inside the segment, the gene at index i takes the value of the gene at index (mutation_gene1 + mutation_gene2 - 1 - i).
+        genes_indices = numpy.where(in_segment,
+                                    mutation_genes1 + mutation_genes2 - 1 - genes_indices,
+                                    genes_indices)
 
-            genes_to_scramble = numpy.flip(offspring[idx, mutation_gene1:mutation_gene2])
-            offspring[idx, mutation_gene1:mutation_gene2] = genes_to_scramble
+        offspring[:, :] = offspring[numpy.arange(offspring.shape[0])[:, numpy.newaxis], genes_indices]
         return offspring
 
     def scramble_mutation(self, offspring):
 
         """
         Applies the scramble mutation which selects a subset of genes and shuffles their order randomly.
+        The genes of all offspring are shuffled at once. Each gene gets a sort key equal to its index. Inside the segment, the key is replaced by a random value within the segment bounds. Sorting the keys shuffles the segment and keeps the other genes in place.
         It accepts:
             -offspring: The offspring to mutate.
         It returns an array of the mutated offspring.
         """
 
-        for idx in range(offspring.shape[0]):
-            mutation_gene1 = numpy.random.randint(low=0, high=numpy.ceil(offspring.shape[1]/2 + 1), size=1)[0]
-            mutation_gene2 = mutation_gene1 + int(offspring.shape[1]/2)
-            genes_range = numpy.arange(start=mutation_gene1, stop=mutation_gene2)
-            numpy.random.shuffle(genes_range)
-            
-            genes_to_scramble = numpy.flip(offspring[idx, genes_range])
-            offspring[idx, genes_range] = genes_to_scramble
+        mutation_genes1, mutation_genes2 = self.mutation_segments(offspring.shape)
+
+        genes_indices = numpy.tile(numpy.arange(offspring.shape[1]), (offspring.shape[0], 1))
+        in_segment = (genes_indices >= mutation_genes1) & (genes_indices < mutation_genes2)
+        random_keys = mutation_genes1 + numpy.random.random(size=offspring.shape) * (mutation_genes2 - mutation_genes1)
+        genes_indices = numpy.argsort(numpy.where(in_segment, random_keys, genes_indices), axis=1)
+
+        offspring[:, :] = offspring[numpy.arange(offspring.shape[0])[:, numpy.newaxis], genes_indices]
         return offspring
 
+    def mutation_segments(self, shape):
+
+        """
+        Selects a segment of genes to mutate in each offspring. It is used by the inversion and scramble mutations.
+        The segment has int(num_genes/2) genes and starts at a random gene.
+        It accepts:
+            -shape: The shape of the offspring.
+        It returns 2 column vectors with the start (inclusive) and end (exclusive) indices of the segment of each offspring.
+        """
+
+        mutation_genes1 = numpy.random.randint(low=0, high=numpy.ceil(shape[1]/2 + 1), size=(shape[0], 1))
+        mutation_genes2 = mutation_genes1 + int(shape[1]/2)
+        return mutation_genes1, mutation_genes2
+
     def adaptive_mutation_population_fitness(self, offspring):
 
         """
         A helper method to calculate the average fitness of the solutions before applying the adaptive mutation.
+        The solutions are the kept parents/elitism followed by the offspring which is the same order of the next population. Their fitness is calculated using the cal_pop_fitness() method. So, the fitness of a solution that exists in the current population or in the fitness cache is reused and every distinct offspring is evaluated only once.
+        The fitness of the offspring is saved into the 'last_generation_offspring_known_fitness' attribute so that the offspring not changed by the mutation are not evaluated again in the next generation.
         It accepts:
             -offspring: The offspring to mutate.
-        It returns the average fitness to be used in adaptive mutation.
-        """        
+        It returns the average fitness to be used in adaptive mutation and the fitness of the offspring.
+        """
 
-        fitness = self.last_generation_fitness.copy()
         temp_population = numpy.zeros_like(self.population)
 
         if (self.keep_elitism == 0):
@@ -333,129 +384,69 @@ class Mutation:
 
         temp_population[len(parents_to_keep):, :] = offspring
 
-        fitness[:self.last_generation_parents.shape[0]] = self.last_generation_fitness[self.last_generation_parents_indices]
+        # The kept parents/elitism are part of the current population. Their fitness (and the fitness of any offspring equal to a solution in the current population) is already known.
+        known_fitness = dict(zip(pygad.helper.fitness_cache.FitnessCache.keys(self.population), self.last_generation_fitness))
 
-        first_idx = len(parents_to_keep)
-        last_idx = fitness.shape[0]
-        if len(fitness.shape) > 1:
-            # TODO This is a multi-objective optimization problem.
-            # fitness[first_idx:last_idx] = [0]*(last_idx - first_idx)
-            fitness[first_idx:last_idx] = numpy.zeros(shape=(last_idx - first_idx, fitness.shape[1]))
-            # raise ValueError('Edit adaptive mutation to work with multi-objective optimization problems.')
-        else:
-            # This is a single-objective optimization problem.
-            fitness[first_idx:last_idx] = [0]*(last_idx - first_idx)
-
-        # # No parallel processing.
-        if self.parallel_processing is None:
-            if self.fitness_batch_size in [1, None]:
-                # Calculate the fitness for each individual solution.
-                for idx in range(first_idx, last_idx):
-                    # We cannot return the index of the solution within the population.
-                    # Because the new solution (offspring) does not yet exist in the population.
-                    # The user should handle this situation if the solution index is used anywhere.
-                    fitness[idx] = self.fitness_func(self, 
-                                                      temp_population[idx], 
-                                                      None)
-            else:
-                # Calculate the fitness for batch of solutions.
-    
-                # Number of batches.
-                num_batches = int(numpy.ceil((last_idx - first_idx) / self.fitness_batch_size))
-    
-                for batch_idx in range(num_batches):
-                    # The index of the first solution in the current batch.
-                    batch_first_index = first_idx + batch_idx * self.fitness_batch_size
-                    # The index of the last solution in the current batch.
-                    if batch_idx == (num_batches - 1):
-                        batch_last_index = last_idx
-                    else:
-                        batch_last_index = first_idx + (batch_idx + 1) * self.fitness_batch_size
-    
-                    # Calculate the fitness values for the batch.
-                    # We cannot return the index/indices of the solution(s) within the population.
-                    # Because the new solution(s) (offspring) do(es) not yet exist in the population.
-                    # The user should handle this situation if the solution index is used anywhere.
-                    fitness_temp = self.fitness_func(self, 
-                                                     temp_population[batch_first_index:batch_last_index], 
-                                                     None) 
-                    # Insert the fitness of each solution at the proper index.
-                    for idx in range(batch_first_index, batch_last_index):
-                        fitness[idx] = fitness_temp[idx - batch_first_index]
+        # The offspring do not exist in the population yet. So, the fitness function receives None as their index.
+        fitness = self.cal_pop_fitness(population=temp_population,
+                                       known_fitness=known_fitness)
 
+        offspring_fitness = fitness[len(parents_to_keep):]
+        self.last_generation_offspring_known_fitness = dict(zip(pygad.helper.fitness_cache.FitnessCache.keys(offspring), offspring_fitness))
+
+        # For a multi-objective problem, the average of each objective is calculated across all solutions.
+        average_fitness = numpy.mean(fitness, axis=0)
+
+        return average_fitness, offspring_fitness
+
+    def adaptive_mutation_low_quality(self, average_fitness, offspring_fitness):
+
+        """
+        Finds the low-quality offspring which use the first value of the adaptive mutation parameter ('mutation_num_genes' or 'mutation_probability'). The high-quality offspring use the second value.
+        For a single-objective problem, an offspring is low-quality if its fitness is less than the average fitness. For a multi-objective problem, an offspring is low-quality if its fitness is less than the average fitness in at least half of the objectives.
+        It accepts:
+            -average_fitness: The average fitness returned by the adaptive_mutation_population_fitness() method.
+            -offspring_fitness: The fitness of the offspring returned by the adaptive_mutation_population_fitness() method.
+        It returns a 1D boolean array with True for the low-quality offspring.
+        """
+
+        # Compare the fitness of each offspring to the average fitness of each objective function.
+        fitness_comparison = offspring_fitness < average_fitness
+        if fitness_comparison.ndim > 1:
+            # Multi-objective optimization problem.
+            # True is considered 1 and False is 0.
+            return numpy.sum(fitness_comparison, axis=1) >= fitness_comparison.shape[1]/2
         else:
-            # Parallel processing
-            # Decide which class to use based on whether the user selected "process" or "thread"
-            # TODO Add ExecutorClass as an instance attribute in the pygad.GA instances. Then retrieve this instance here instead of creating a new one.
-            if self.parallel_processing[0] == "process":
-                ExecutorClass = concurrent.futures.ProcessPoolExecutor
-            else:
-                ExecutorClass = concurrent.futures.ThreadPoolExecutor
-    
-            # We can use a with statement to ensure threads are cleaned up promptly (https://docs.python.org/3/library/concurrent.futures.html#threadpoolexecutor-example)
-            with ExecutorClass(max_workers=self.parallel_processing[1]) as executor:
-                # Indices of the solutions to calculate its fitness.
-                solutions_to_submit_indices = list(range(first_idx, last_idx))
-                # The solutions to calculate its fitness.
-                solutions_to_submit = [temp_population[sol_idx].copy() for sol_idx in solutions_to_submit_indices]
-                if self.fitness_batch_size in [1, None]:
-                    # Use parallel processing to calculate the fitness of the solutions.
-                    for index, sol_fitness in zip(solutions_to_submit_indices, executor.map(self.fitness_func, [self]*len(solutions_to_submit_indices), solutions_to_submit, solutions_to_submit_indices)):
-                        if type(sol_fitness) in self.supported_int_float_types:
-                            # The fitness function returns a single numeric value.
-                            # This is a single-objective optimization problem.
-                            fitness[index] = sol_fitness
-                        elif type(sol_fitness) in [list, tuple, numpy.ndarray]:
-                            # The fitness function returns a list/tuple/numpy.ndarray.
-                            # This is a multi-objective optimization problem.
-                            fitness[index] = sol_fitness
-                        else:
-                            raise ValueError(f"The fitness function should return a number or an iterable (list, tuple, or numpy.ndarray) but the value {sol_fitness} of type {type(sol_fitness)} found.")
-                else:
-                    # Reaching this point means that batch processing is in effect to calculate the fitness values.
-                    # Number of batches.
-                    num_batches = int(numpy.ceil(len(solutions_to_submit_indices) / self.fitness_batch_size))
-                    # Each element of the `batches_solutions` list represents the solutions in one batch.
-                    batches_solutions = []
-                    # Each element of the `batches_indices` list represents the solutions' indices in one batch.
-                    batches_indices = []
-                    # For each batch, get its indices and call the fitness function.
-                    for batch_idx in range(num_batches):
-                        batch_first_index = batch_idx * self.fitness_batch_size
-                        batch_last_index = (batch_idx + 1) * self.fitness_batch_size
-                        batch_indices = solutions_to_submit_indices[batch_first_index:batch_last_index]
-                        batch_solutions = self.population[batch_indices, :]
-    
-                        batches_solutions.append(batch_solutions)
-                        batches_indices.append(batch_indices)
-
-                    for batch_indices, batch_fitness in zip(batches_indices, executor.map(self.fitness_func, [self]*len(solutions_to_submit_indices), batches_solutions, batches_indices)):
-                        if type(batch_fitness) not in [list, tuple, numpy.ndarray]:
-                            raise TypeError(f"Expected to receive a list, tuple, or numpy.ndarray from the fitness function but the value ({batch_fitness}) of type {type(batch_fitness)}.")
-                        elif len(numpy.array(batch_fitness)) != len(batch_indices):
-                            raise ValueError(f"There is a mismatch between the number of solutions passed to the fitness function ({len(batch_indices)}) and the number of fitness values returned ({len(batch_fitness)}). They must match.")
-
-                        for index, sol_fitness in zip(batch_indices, batch_fitness):
-                            if type(sol_fitness) in self.supported_int_float_types:
-                                # The fitness function returns a single numeric value.
-                                # This is a single-objective optimization problem.
-                                fitness[index] = sol_fitness
-                            elif type(sol_fitness) in [list, tuple, numpy.ndarray]:
-                                # The fitness function returns a list/tuple/numpy.ndarray.
-                                # This is a multi-objective optimization problem.
-                                fitness[index] = sol_fitness
-                            else:
-                                raise ValueError(f"The fitness function should return a number or an iterable (list, tuple, or numpy.ndarray) but the value ({sol_fitness}) of type {type(sol_fitness)} found.")
-
-        if len(fitness.shape) > 1:
-            # TODO This is a multi-objective optimization problem.
-            # Calculate the average of each objective's fitness across all solutions in the population.
-            average_fitness = numpy.mean(fitness, axis=0)
-        else:
-            # This is a single-objective optimization problem.
-            average_fitness = numpy.mean(fitness)
+            # Single-objective optimization problem.
+            return fitness_comparison
+
+    def adaptive_mutation_num_genes_mask(self, shape, low_quality):
+
+        """
+        Selects the genes to mutate in all offspring at once according to the 2 values of the 'mutation_num_genes' parameter. For each offspring, the genes with the smallest random keys are selected.
+        It accepts:
+            -shape: The shape of the offspring.
+            -low_quality: A 1D boolean array returned by the adaptive_mutation_low_quality() method.
+        It returns a boolean array of the given shape where the genes to mutate are True.
+        """
+
+        num_genes = numpy.where(low_quality, self.mutation_num_genes[0], self.mutation_num_genes[1])
+        # The rank of each gene's random key within its offspring.
+        genes_ranks = numpy.argsort(numpy.argsort(numpy.random.random(size=shape), axis=1), axis=1)
+        return genes_ranks < num_genes[:, numpy.newaxis]
+
+    def adaptive_mutation_probs_mask(self, shape, low_quality):
 
-        return average_fitness, fitness[len(parents_to_keep):]
+        """
+        Selects the genes to mutate in all offspring at once according to the 2 values of the 'mutation_probability' parameter. A gene is selected if its random probability is <= the mutation probability of its offspring.
+        It accepts:
+            -shape: The shape of the offspring.
+            -low_quality: A 1D boolean array returned by the adaptive_mutation_low_quality() method.
+        It returns a boolean array of the given shape where the genes to mutate are True.
+        """
+
+        mutation_probability = numpy.where(low_quality, self.mutation_probability[0], self.mutation_probability[1])
+        return numpy.random.random(size=shape) <= mutation_probability[:, numpy.newaxis]
 
     def adaptive_mutation(self, offspring):
 
@@ -499,67 +490,15 @@ class Mutation:
             -offspring: The offspring to mutate.
         It returns an array of the mutated offspring.
         """
-        
-        # For each offspring, a value from the gene space is selected randomly and assigned to the selected gene for mutation.
 
         average_fitness, offspring_fitness = self.adaptive_mutation_population_fitness(offspring)
 
         # Adaptive mutation changes one or more genes in each offspring randomly.
         # The number of genes to mutate depends on the solution's fitness value.
-        for offspring_idx in range(offspring.shape[0]):
-            ## TODO Make edits to work with multi-objective optimization.
-            # Compare the fitness of each offspring to the average fitness of each objective function.
-            fitness_comparison = offspring_fitness[offspring_idx] < average_fitness
-
-            # Check if the problem is single or multi-objective optimization.
-            if type(fitness_comparison) in [bool, numpy.bool_]:
-                # Single-objective optimization problem.
-                if offspring_fitness[offspring_idx] < average_fitness:
-                    adaptive_mutation_num_genes = self.mutation_num_genes[0]
-                else:
-                    adaptive_mutation_num_genes = self.mutation_num_genes[1]
-            else:
-                # Multi-objective optimization problem.
-
-                # Get the sum of the pool array (result of comparison).
-                # True is considered 1 and False is 0.
-                fitness_comparison_sum = sum(fitness_comparison)
-                # Check if more than or equal to 50% of the objectives have fitness greater than the average.
-                # If True, then use the first percentage. 
-                # If False, use the second percentage.
-                if fitness_comparison_sum >= len(fitness_comparison)/2:
-                    adaptive_mutation_num_genes = self.mutation_num_genes[0]
-                else:
-                    adaptive_mutation_num_genes = self.mutation_num_genes[1]
-
-            mutation_indices = numpy.array(random.sample(range(0, self.num_genes), adaptive_mutation_num_genes))
-            for gene_idx in mutation_indices:
-
-                value_from_space = self.mutation_process_gene_value(solution=offspring[offspring_idx],
-                                                                    gene_idx=gene_idx,
-                                                                    sample_size=self.sample_size)
-
-                # Assigning the selected value from the space to the gene.
-                if self.gene_type_single == True:
-                    if not self.gene_type[1] is None:
-                        offspring[offspring_idx, gene_idx] = numpy.round(self.gene_type[0](value_from_space),
-                                                                         self.gene_type[1])
-                    else:
-                        offspring[offspring_idx, gene_idx] = self.gene_type[0](value_from_space)
-                else:
-                    if not self.gene_type[gene_idx][1] is None:
-                        offspring[offspring_idx, gene_idx] = numpy.round(self.gene_type[gene_idx][0](value_from_space),
-                                                                         self.gene_type[gene_idx][1])
-                    else:
-                        offspring[offspring_idx, gene_idx] = self.gene_type[gene_idx][0](value_from_space)
-
-                if self.allow_duplicate_genes == False:
-                    offspring[offspring_idx], _, _ = self.solve_duplicate_genes_by_space(solution=offspring[offspring_idx],
-                                                                                         gene_type=self.gene_type,
-                                                                                         sample_size=self.sample_size,
-                                                                                         mutation_by_replacement=self.mutation_by_replacement,
-                                                                                         build_initial_pop=False)
-        return offspring
+        # The genes to mutate in all offspring are selected at once.
+        low_quality = self.adaptive_mutation_low_quality(average_fitness, offspring_fitness)
+        return self.mutation_by_mask(offspring=offspring,
+                                     mutation_mask=self.adaptive_mutation_num_genes_mask(offspring.shape, low_quality))
 
     def adaptive_mutation_randomly(self, offspring):
 
@@ -574,56 +513,12 @@ class Mutation:
 
         average_fitness, offspring_fitness = self.adaptive_mutation_population_fitness(offspring)
 
-        # Adaptive random mutation changes one or more genes in each offspring randomly.
+        # Adaptive mutation changes one or more genes in each offspring randomly.
         # The number of genes to mutate depends on the solution's fitness value.
-        for offspring_idx in range(offspring.shape[0]):
-            ## TODO Make edits to work with multi-objective optimization.
-            # Compare the fitness of each offspring to the average fitness of each objective function.
-            fitness_comparison = offspring_fitness[offspring_idx] < average_fitness
-
-            # Check if the problem is single or multi-objective optimization.
-            if type(fitness_comparison) in [bool, numpy.bool_]:
-                # Single-objective optimization problem.
-                if fitness_comparison:
-                    adaptive_mutation_num_genes = self.mutation_num_genes[0]
-                else:
-                    adaptive_mutation_num_genes = self.mutation_num_genes[1]
-            else:
-                # Multi-objective optimization problem.
-
-                # Get the sum of the pool array (result of comparison).
-                # True is considered 1 and False is 0.
-                fitness_comparison_sum = sum(fitness_comparison)
-                # Check if more than or equal to 50% of the objectives have fitness greater than the average.
-                # If True, then use the first percentage. 
-                # If False, use the second percentage.
-                if fitness_comparison_sum >= len(fitness_comparison)/2:
-                    adaptive_mutation_num_genes = self.mutation_num_genes[0]
-                else:
-                    adaptive_mutation_num_genes = self.mutation_num_genes[1]
-
-            mutation_indices = numpy.array(random.sample(range(0, self.num_genes), adaptive_mutation_num_genes))
-            for gene_idx in mutation_indices:
-
-                range_min, range_max = self.get_random_mutation_range(gene_idx)
-
-                # Generate a random value fpr mutation that meet the gene constraint if exists.
-                random_value = self.mutation_process_gene_value(range_min=range_min,
-                                                                range_max=range_max,
-                                                                solution=offspring[offspring_idx],
-                                                                gene_idx=gene_idx,
-                                                                sample_size=self.sample_size)
-
-                offspring[offspring_idx, gene_idx] = random_value
-
-                if self.allow_duplicate_genes == False:
-                    offspring[offspring_idx], _, _ = self.solve_duplicate_genes_randomly(solution=offspring[offspring_idx],
-                                                                                         min_val=range_min,
-                                                                                         max_val=range_max,
-                                                                                         mutation_by_replacement=self.mutation_by_replacement,
-                                                                                         gene_type=self.gene_type,
-                                                                                         sample_size=self.sample_size)
-        return offspring
+        # The genes to mutate in all offspring are selected at once.
+        low_quality = self.adaptive_mutation_low_quality(average_fitness, offspring_fitness)
+        return self.mutation_by_mask(offspring=offspring,
+                                     mutation_mask=self.adaptive_mutation_num_genes_mask(offspring.shape, low_quality))
 
     def adaptive_mutation_probs_by_space(self, offspring):
 
@@ -636,68 +531,14 @@ class Mutation:
         It returns an array of the mutated offspring.
         """
 
-        # For each offspring, a value from the gene space is selected randomly and assigned to the selected gene for mutation.
-
         average_fitness, offspring_fitness = self.adaptive_mutation_population_fitness(offspring)
 
         # Adaptive random mutation changes one or more genes in each offspring randomly.
         # The probability of mutating a gene depends on the solution's fitness value.
-        for offspring_idx in range(offspring.shape[0]):
-            ## TODO Make edits to work with multi-objective optimization.
-            # Compare the fitness of each offspring to the average fitness of each objective function.
-            fitness_comparison = offspring_fitness[offspring_idx] < average_fitness
-
-            # Check if the problem is single or multi-objective optimization.
-            if type(fitness_comparison) in [bool, numpy.bool_]:
-                # Single-objective optimization problem.
-                if offspring_fitness[offspring_idx] < average_fitness:
-                    adaptive_mutation_probability = self.mutation_probability[0]
-                else:
-                    adaptive_mutation_probability = self.mutation_probability[1]
-            else:
-                # Multi-objective optimization problem.
-
-                # Get the sum of the pool array (result of comparison).
-                # True is considered 1 and False is 0.
-                fitness_comparison_sum = sum(fitness_comparison)
-                # Check if more than or equal to 50% of the objectives have fitness greater than the average.
-                # If True, then use the first percentage. 
-                # If False, use the second percentage.
-                if fitness_comparison_sum >= len(fitness_comparison)/2:
-                    adaptive_mutation_probability = self.mutation_probability[0]
-                else:
-                    adaptive_mutation_probability = self.mutation_probability[1]
-
-            probs = numpy.random.random(size=offspring.shape[1])
-            for gene_idx in range(offspring.shape[1]):
-
-                if probs[gene_idx] <= adaptive_mutation_probability:
-
-                    value_from_space = self.mutation_process_gene_value(solution=offspring[offspring_idx],
-                                                                        gene_idx=gene_idx,
-                                                                        sample_size=self.sample_size)
-
-                    # Assigning the selected value from the space to the gene.
-                    if self.gene_type_single == True:
-                        if not self.gene_type[1] is None:
-                            offspring[offspring_idx, gene_idx] = numpy.round(self.gene_type[0](value_from_space),
-                                                                             self.gene_type[1])
-                        else:
-                            offspring[offspring_idx, gene_idx] = self.gene_type[0](value_from_space)
-                    else:
-                        if not self.gene_type[gene_idx][1] is None:
-                            offspring[offspring_idx, gene_idx] = numpy.round(self.gene_type[gene_idx][0](value_from_space),
-                                                                             self.gene_type[gene_idx][1])
-                        else:
-                            offspring[offspring_idx, gene_idx] = self.gene_type[gene_idx][0](value_from_space)
-
-                    if self.allow_duplicate_genes == False:
-                        offspring[offspring_idx], _, _ = self.solve_duplicate_genes_by_space(solution=offspring[offspring_idx],
-                                                                                             gene_type=self.gene_type,
-                                                                                             sample_size=self.sample_size,
-                                                                                             mutation_by_replacement=self.mutation_by_replacement,
-                                                                                             build_initial_pop=False)
-        return offspring
+        # The genes to mutate in all offspring are selected at once.
+        low_quality = self.adaptive_mutation_low_quality(average_fitness, offspring_fitness)
+        return self.mutation_by_mask(offspring=offspring,
+                                     mutation_mask=self.adaptive_mutation_probs_mask(offspring.shape, low_quality))
 
     def adaptive_mutation_probs_randomly(self, offspring):
 
@@ -714,52 +555,7 @@ class Mutation:
 
         # Adaptive random mutation changes one or more genes in each offspring randomly.
         # The probability of mutating a gene depends on the solution's fitness value.
-        for offspring_idx in range(offspring.shape[0]):
-            ## TODO Make edits to work with multi-objective optimization.
-            # Compare the fitness of each offspring to the average fitness of each objective function.
-            fitness_comparison = offspring_fitness[offspring_idx] < average_fitness
-
-            # Check if the problem is single or multi-objective optimization.
-            if type(fitness_comparison) in [bool, numpy.bool_]:
-                # Single-objective optimization problem.
-                if offspring_fitness[offspring_idx] < average_fitness:
-                    adaptive_mutation_probability = self.mutation_probability[0]
-                else:
-                    adaptive_mutation_probability = self.mutation_probability[1]
-            else:
-                # Multi-objective optimization problem.
-
-                # Get the sum of the pool array (result of comparison).
-                # True is considered 1 and False is 0.
-                fitness_comparison_sum = sum(fitness_comparison)
-                # Check if more than or equal to 50% of the objectives have fitness greater than the average.
-                # If True, then use the first percentage. 
-                # If False, use the second percentage.
-                if fitness_comparison_sum >= len(fitness_comparison)/2:
-                    adaptive_mutation_probability = self.mutation_probability[0]
-                else:
-                    adaptive_mutation_probability = self.mutation_probability[1]
-
-            probs = numpy.random.random(size=offspring.shape[1])
-            for gene_idx in range(offspring.shape[1]):
-
-                range_min, range_max = self.get_random_mutation_range(gene_idx)
-
-                if probs[gene_idx] <= adaptive_mutation_probability:
-                    # Generate a random value fpr mutation that meet the gene constraint if exists.
-                    random_value = self.mutation_process_gene_value(range_min=range_min,
-                                                                    range_max=range_max,
-                                                                    solution=offspring[offspring_idx],
-                                                                    gene_idx=gene_idx,
-                                                                    sample_size=self.sample_size)
-
-                    offspring[offspring_idx, gene_idx] = random_value
-
-                    if self.allow_duplicate_genes == False:
-                        offspring[offspring_idx], _, _ = self.solve_duplicate_genes_randomly(solution=offspring[offspring_idx],
-                                                                                             min_val=range_min,
-                                                                                             max_val=range_max,
-                                                                                             mutation_by_replacement=self.mutation_by_replacement,
-                                                                                             gene_type=self.gene_type,
-                                                                                             sample_size=self.sample_size)
-        return offspring
+        # The genes to mutate in all offspring are selected at once.
+        low_quality = self.adaptive_mutation_low_quality(average_fitness, offspring_fitness)
+        return self.mutation_by_mask(offspring=offspring,
+                                     mutation_mask=self.adaptive_mutation_probs_mask(offspring.shape, low_quality))
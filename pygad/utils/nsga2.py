@@ -1,11 +1,28 @@
 import numpy
+import bisect
+import collections
 import pygad
 
+# The ranking of the solutions of a multi-objective problem. It is built once per fitness by the nsga2_ranking() method and shared by the parent selection, the elitism, and the best_solution() method.
+#   fitness: A copy of the fitness used to build the ranking. The ranking is rebuilt if the fitness changes.
+#   pareto_fronts: A list of 1D integer arrays. Each array has the indices of the solutions in a pareto front in ascending order.
+#   solutions_fronts_indices: The index of the pareto front of each solution.
+#   crowding_distances: The sum of the crowding distances of each solution across all objectives within its pareto front. It is infinity for the fronts with less than 3 solutions.
+#   fronts_sorted: A list of 1D integer arrays. Each array has the indices of the solutions in a pareto front sorted by the crowding distance in descending order.
+#   solutions_sorted: A list of the indices of all the solutions sorted from the best to the worst.
+#   pareto_fronts_pairs: The pareto fronts as returned by the non_dominated_sorting() method. Each row in a front has the index of a solution and an array of its fitness values.
+NSGA2Ranking = collections.namedtuple("NSGA2Ranking",
+                                      ["fitness", "pareto_fronts", "solutions_fronts_indices", "crowding_distances", "fronts_sorted", "solutions_sorted", "pareto_fronts_pairs"])
+
 class NSGA2:
 
     def __init__(self):
         pass
 
+    # The maximum number of elements in the temporary arrays used to compare the solutions by the dominance matrix and the blocked non-dominated sorting.
+    # It bounds the memory used by the non-dominated sorting (about 32 MB for a boolean array).
+    dominance_max_elements = 2**25
+
     def get_non_dominated_set(self, curr_solutions):
         """
         Get the set of non-dominated solutions from the current set of solutions.
@@ -13,7 +30,7 @@ class NSGA2:
         Parameters
         ----------
         curr_solutions : TYPE
-            The set of solutions to find its non-dominated set.
+            The set of solutions to find its non-dominated set. Each solution has 2 elements: its index and an array of its fitness values.
     
         Returns
         -------
@@ -23,53 +40,309 @@ class NSGA2:
             A set of the non-dominated set.
     
         """
-        # List of the members of the current dominated pareto front/set.
-        dominated_set = []
+
+        if len(curr_solutions) == 0:
+            return [], []
+
+        fitness = numpy.array([solution[1] for solution in curr_solutions], dtype=float)
+        # A solution is dominated if any other solution dominates it.
+        is_dominated = self.dominated_counts(fitness=fitness,
+                                             dominating_fitness=fitness) > 0
+
         # List of the non-members of the current dominated pareto front/set.
+        dominated_set = [solution for solution, dominated in zip(curr_solutions, is_dominated) if dominated]
+        # List of the members of the current non-dominated pareto front/set.
         # The non-dominated set is the pareto front set.
-        non_dominated_set = []
-        for idx1, sol1 in enumerate(curr_solutions):
-            # Flag indicates whether the solution is a member of the current dominated set.
-            is_not_dominated = True
-            for idx2, sol2 in enumerate(curr_solutions):
-                if idx1 == idx2:
-                    continue
-
-                # Zipping the 2 solutions so the corresponding genes are in the same list.
-                # The returned array is of size (N, 2) where N is the number of genes.
-                two_solutions = numpy.array(list(zip(sol1[1], sol2[1])))
-
-                # Use < for minimization problems and > for maximization problems.
-                # Checking if any solution dominates the current solution by applying the 2 conditions.
-                # gr_eq (greater than or equal): All elements must be True.
-                # gr (greater than): Only 1 element must be True.
-                gr_eq = two_solutions[:, 1] >= two_solutions[:, 0]
-                gr = two_solutions[:, 1] > two_solutions[:, 0]
-
-                # If the 2 conditions hold, then a solution (sol2) dominates the current solution (sol1).
-                # The current solution (sol1) is not considered a member of the non-dominated set.
-                if gr_eq.all() and gr.any():
-                    # Set the is_not_dominated flag to False because another solution dominates the current solution (sol1)
-                    is_not_dominated = False
-                    # DO NOT insert the current solution in the current non-dominated set.
-                    # Instead, insert it into the dominated set.
-                    dominated_set.append(sol1)
-                    break
-                else:
-                    # Reaching here means the solution does not dominate the current solution.
-                    pass
-    
-            # If the flag is True, then no solution dominates the current solution.
-            # Insert the current solution (sol1) into the non-dominated set.
-            if is_not_dominated:
-                non_dominated_set.append(sol1)
-    
+        non_dominated_set = [solution for solution, dominated in zip(curr_solutions, is_dominated) if not dominated]
+
         # Return the dominated and non-dominated sets.
         return dominated_set, non_dominated_set
 
+    def dominance_matrix(self, fitness):
+        """
+        Build the dominance matrix of the solutions using broadcasting. All objectives are maximized.
+        It uses N*N elements where N is the number of solutions.
+
+        Parameters
+        ----------
+        fitness : numpy.ndarray
+            A 2D array of the fitness values of the solutions with a row per solution and a column per objective.
+
+        Returns
+        -------
+        dominated_by : numpy.ndarray
+            A 2D boolean array where the element at row i and column j is True if the solution j dominates the solution i.
+        """
+
+        fitness = numpy.asarray(fitness, dtype=float)
+        return self.dominates(fitness=fitness,
+                              dominating_fitness=fitness)
+
+    def dominates(self, fitness, dominating_fitness):
+        """
+        Compare 2 sets of solutions using broadcasting. All objectives are maximized.
+        The objectives are compared one at a time to avoid creating a 3D array.
+
+        Parameters
+        ----------
+        fitness : numpy.ndarray
+            A 2D array of the fitness values of the first set of solutions.
+        dominating_fitness : numpy.ndarray
+            A 2D array of the fitness values of the second set of solutions.
+
+        Returns
+        -------
+        dominated_by : numpy.ndarray
+            A 2D boolean array where the element at row i and column j is True if the solution j in the second set dominates the solution i in the first set.
+        """
+
+        # A solution dominates another solution if it is not worse in all objectives and better in at least 1 objective.
+        greater_equal = numpy.ones((fitness.shape[0], dominating_fitness.shape[0]), dtype=bool)
+        greater = numpy.zeros((fitness.shape[0], dominating_fitness.shape[0]), dtype=bool)
+        for obj_idx in range(fitness.shape[1]):
+            greater_equal &= dominating_fitness[numpy.newaxis, :, obj_idx] >= fitness[:, numpy.newaxis, obj_idx]
+            greater |= dominating_fitness[numpy.newaxis, :, obj_idx] > fitness[:, numpy.newaxis, obj_idx]
+        return greater_equal & greater
+
+    def dominated_counts(self, fitness, dominating_fitness):
+        """
+        Count how many solutions dominate each solution. The solutions are compared in blocks to bound the memory to the 'dominance_max_elements' class attribute.
+
+        Parameters
+        ----------
+        fitness : numpy.ndarray
+            A 2D array of the fitness values of the solutions to count the solutions dominating them.
+        dominating_fitness : numpy.ndarray
+            A 2D array of the fitness values of the solutions that may dominate them.
+
+        Returns
+        -------
+        counts : numpy.ndarray
+            The number of solutions in 'dominating_fitness' dominating each solution in 'fitness'.
+        """
+
+        fitness = numpy.asarray(fitness, dtype=float)
+        dominating_fitness = numpy.asarray(dominating_fitness, dtype=float)
+        counts = numpy.zeros(fitness.shape[0], dtype=int)
+        if fitness.shape[0] == 0 or dominating_fitness.shape[0] == 0:
+            return counts
+
+        block_size = max(1, self.dominance_max_elements // dominating_fitness.shape[0])
+        for block_start in range(0, fitness.shape[0], block_size):
+            dominated_by = self.dominates(fitness=fitness[block_start:block_start + block_size],
+                                          dominating_fitness=dominating_fitness)
+            counts[block_start:block_start + block_size] = numpy.count_nonzero(dominated_by, axis=1)
+        return counts
+
+    def non_dominated_ranks_matrix(self, fitness):
+        """
+        Find the pareto front of each solution by peeling the fronts using the dominance matrix. It suits a moderate number of solutions.
+
+        Parameters
+        ----------
+        fitness : numpy.ndarray
+            A 2D array of the fitness values of the solutions.
+
+        Returns
+        -------
+        solutions_fronts_indices : numpy.ndarray
+            The index of the pareto front of each solution.
+        """
+
+        dominated_by = self.dominance_matrix(fitness)
+        counts = numpy.count_nonzero(dominated_by, axis=1)
+        solutions_fronts_indices = numpy.full(dominated_by.shape[0], -1, dtype=int)
+        remaining = numpy.arange(dominated_by.shape[0])
+        front_index = 0
+        while remaining.size > 0:
+            in_front = counts[remaining] == 0
+            front = remaining[in_front]
+            solutions_fronts_indices[front] = front_index
+            remaining = remaining[~in_front]
+            # The solutions of the current front no longer count as dominating the remaining solutions.
+            counts -= numpy.count_nonzero(dominated_by[:, front], axis=1)
+            front_index += 1
+        return solutions_fronts_indices
+
+    def non_dominated_ranks_blocked(self, fitness):
+        """
+        Find the pareto front of each solution by peeling the fronts without building the full dominance matrix. The solutions are compared in blocks so that the memory is bounded for a large number of solutions.
+        Each pair of solutions is compared at most twice: Once to count the dominating solutions and once when the front of the dominating solution is removed.
+
+        Parameters
+        ----------
+        fitness : numpy.ndarray
+            A 2D array of the fitness values of the solutions.
+
+        Returns
+        -------
+        solutions_fronts_indices : numpy.ndarray
+            The index of the pareto front of each solution.
+        """
+
+        fitness = numpy.asarray(fitness, dtype=float)
+        counts = self.dominated_counts(fitness=fitness,
+                                       dominating_fitness=fitness)
+        solutions_fronts_indices = numpy.full(fitness.shape[0], -1, dtype=int)
+        remaining = numpy.arange(fitness.shape[0])
+        front_index = 0
+        while remaining.size > 0:
+            in_front = counts[remaining] == 0
+            front = remaining[in_front]
+            solutions_fronts_indices[front] = front_index
+            remaining = remaining[~in_front]
+            # The solutions of the current front no longer count as dominating the remaining solutions.
+            counts[remaining] -= self.dominated_counts(fitness=fitness[remaining],
+                                                       dominating_fitness=fitness[front])
+            front_index += 1
+        return solutions_fronts_indices
+
+    def non_dominated_ranks_2d(self, fitness):
+        """
+        Find the pareto front of each solution when there are exactly 2 objectives in O(N log N).
+        The solutions are sorted by the first objective then the second objective in descending order. A solution can only be dominated by the solutions before it.
+        Within a front, the second objective increases. So, a front dominates a solution if the last solution added to the front dominates it. The fronts are searched using a binary search because the last solutions of the fronts are sorted.
+
+        Parameters
+        ----------
+        fitness : numpy.ndarray
+            A 2D array of the fitness values of the solutions with 2 columns.
+
+        Returns
+        -------
+        solutions_fronts_indices : numpy.ndarray
+            The index of the pareto front of each solution.
+        """
+
+        fitness = numpy.asarray(fitness, dtype=float)
+        solutions_fronts_indices = numpy.full(fitness.shape[0], -1, dtype=int)
+        # The last key passed to numpy.lexsort() is the primary key.
+        sorted_indices = numpy.lexsort((-fitness[:, 1], -fitness[:, 0]))
+
+        # For each front, the negated (second objective, first objective) of the last solution added to it. This list is in ascending order.
+        fronts_keys = []
+        for sol_idx, first_obj, second_obj in zip(sorted_indices.tolist(),
+                                                  fitness[sorted_indices, 0].tolist(),
+                                                  fitness[sorted_indices, 1].tolist()):
+            # The last solution of a front dominates the current solution if its key is greater. Equal solutions do not dominate each other.
+            key = (-second_obj, -first_obj)
+            front_index = bisect.bisect_left(fronts_keys, key)
+            if front_index == len(fronts_keys):
+                fronts_keys.append(key)
+            else:
+                fronts_keys[front_index] = key
+            solutions_fronts_indices[sol_idx] = front_index
+        return solutions_fronts_indices
+
+    def non_dominated_ranks_ens(self, fitness):
+        """
+        Find the pareto front of each solution using the Efficient Non-dominated Sort with binary search (ENS-BS). It suits a large number of solutions with more than 2 objectives.
+        The solutions are sorted lexicographically in descending order so that a solution can only be dominated by the solutions before it. Each solution is then assigned to the first front that does not dominate it using a binary search over the fronts.
+
+        Parameters
+        ----------
+        fitness : numpy.ndarray
+            A 2D array of the fitness values of the solutions.
+
+        Returns
+        -------
+        solutions_fronts_indices : numpy.ndarray
+            The index of the pareto front of each solution.
+        """
+
+        fitness = numpy.asarray(fitness, dtype=float)
+        num_solutions, num_objectives = fitness.shape
+        solutions_fronts_indices = numpy.full(num_solutions, -1, dtype=int)
+        # The last key passed to numpy.lexsort() is the primary key.
+        sorted_indices = numpy.lexsort(tuple(-fitness[:, obj_idx] for obj_idx in reversed(range(num_objectives))))
+
+        # The fitness of the solutions in each front. The arrays grow by doubling their size.
+        fronts_fitness = []
+        fronts_sizes = []
+        for sol_idx in sorted_indices.tolist():
+            solution_fitness = fitness[sol_idx]
+            low, high = 0, len(fronts_fitness)
+            while low < high:
+                middle = (low + high) // 2
+                front_fitness = fronts_fitness[middle][:fronts_sizes[middle]]
+                dominated = numpy.any(numpy.all(front_fitness >= solution_fitness, axis=1) & numpy.any(front_fitness > solution_fitness, axis=1))
+                if dominated:
+                    low = middle + 1
+                else:
+                    high = middle
+
+            if low == len(fronts_fitness):
+                fronts_fitness.append(numpy.empty((16, num_objectives), dtype=float))
+                fronts_sizes.append(0)
+            elif fronts_sizes[low] == fronts_fitness[low].shape[0]:
+                fronts_fitness[low] = numpy.concatenate((fronts_fitness[low], numpy.empty_like(fronts_fitness[low])))
+            fronts_fitness[low][fronts_sizes[low]] = solution_fitness
+            fronts_sizes[low] += 1
+            solutions_fronts_indices[sol_idx] = low
+        return solutions_fronts_indices
+
+    def non_dominated_fronts(self, fitness, algorithm="auto"):
+        """
+        Apply non-dominated sorting over the fitness and return the pareto fronts as arrays of the solutions indices.
+        The algorithm is selected automatically based on the number of solutions and objectives:
+            1) 2 objectives: The O(N log N) sweep in the non_dominated_ranks_2d() method.
+            2) The dominance matrix fits into the 'dominance_max_elements' class attribute: The vectorized dominance matrix in the non_dominated_ranks_matrix() method.
+            3) Otherwise: The Efficient Non-dominated Sort in the non_dominated_ranks_ens() method.
+        The blocked sorting in the non_dominated_ranks_blocked() method can be selected using algorithm="blocked".
+
+        Parameters
+        ----------
+        fitness : numpy.ndarray
+            A 2D array of the fitness values of the solutions with a row per solution and a column per objective.
+        algorithm : str, optional
+            One of "auto", "matrix", "blocked", "2d", and "ens". The default is "auto".
+
+        Returns
+        -------
+        pareto_fronts : list
+            A list of 1D integer arrays. Each array has the indices of the solutions in a pareto front in ascending order. The first front is the best.
+        solutions_fronts_indices : numpy.ndarray
+            The index of the pareto front of each solution.
+        """
+
+        fitness = numpy.asarray(fitness, dtype=float)
+        num_solutions, num_objectives = fitness.shape
+
+        if algorithm == "auto":
+            if num_objectives == 2:
+                algorithm = "2d"
+            elif num_solutions * num_solutions <= self.dominance_max_elements:
+                algorithm = "matrix"
+            else:
+                algorithm = "ens"
+
+        if algorithm == "matrix":
+            solutions_fronts_indices = self.non_dominated_ranks_matrix(fitness)
+        elif algorithm == "blocked":
+            solutions_fronts_indices = self.non_dominated_ranks_blocked(fitness)
+        elif algorithm == "2d":
+            if num_objectives != 2:
+                raise ValueError(f"The '2d' non-dominated sorting algorithm only works with 2 objectives but ({num_objectives}) objectives found.")
+            solutions_fronts_indices = self.non_dominated_ranks_2d(fitness)
+        elif algorithm == "ens":
+            solutions_fronts_indices = self.non_dominated_ranks_ens(fitness)
+        else:
+            raise ValueError(f"The value of the 'algorithm' parameter must be one of these values ['auto', 'matrix', 'blocked', '2d', 'ens'] but ({algorithm}) found.")
+
+        # The solutions in each front keep their order in the population.
+        sorted_indices = numpy.argsort(solutions_fronts_indices, kind="stable")
+        fronts_starts = numpy.searchsorted(solutions_fronts_indices[sorted_indices],
+                                           numpy.arange(1, solutions_fronts_indices.max(initial=-1) + 1))
+        pareto_fronts = numpy.split(sorted_indices, fronts_starts)
+        if num_solutions == 0:
+            pareto_fronts = []
+
+        return pareto_fronts, solutions_fronts_indices
+
     def non_dominated_sorting(self, fitness):
         """
         Apply non-dominant sorting over the fitness to create the pareto fronts based on non-dominated sorting of the solutions.
+        The fronts are found by the non_dominated_fronts() method.
     
         Parameters
         ----------
@@ -79,7 +352,9 @@ class NSGA2:
         Returns
         -------
         pareto_fronts : TYPE
-            An array of the pareto fronts.
+            An array of the pareto fronts. Each front is an array where each row has the index of a solution and an array of its fitness values.
+        solutions_fronts_indices : TYPE
+            The index of the pareto front of each solution.
 
         """
 
@@ -91,48 +366,80 @@ class NSGA2:
         else:
             raise TypeError(f'Non-dominated sorting is only applied when optimizing multi-objective problems. \n\nTo use multi-objective optimization, consider returning an iterable of any of these data types:\n1)list\n2)tuple\n3)numpy.ndarray\n\nBut the data type {type(fitness[0])} found.')
 
-        # A list of all non-dominated sets.
-        pareto_fronts = []
-    
-        # The remaining set to be explored for non-dominance.
-        # Initially it is set to the entire population.
-        # The solutions of each non-dominated set are removed after each iteration.
-        remaining_set = fitness.copy()
-    
-        # Zipping the solution index with the solution's fitness.
-        # This helps to easily identify the index of each solution.
-        # Each element has:
-            # 1) The index of the solution.
-            # 2) An array of the fitness values of this solution across all objectives.
-        remaining_set = list(zip(range(0, fitness.shape[0]), remaining_set))
-    
-        # A list mapping the index of each pareto front to the set of solutions in this front.
-        solutions_fronts_indices = [-1]*len(remaining_set)
-        solutions_fronts_indices = numpy.array(solutions_fronts_indices)
-    
-        # Index of the current pareto front.
-        front_index = -1
-        while len(remaining_set) > 0:
-            front_index += 1
+        # The fronts are reused if the same fitness was already sorted.
+        ranking = self.nsga2_ranking(fitness)
 
-            # Get the current non-dominated set of solutions.
-            remaining_set, pareto_front = self.get_non_dominated_set(curr_solutions=remaining_set)
-            pareto_front = numpy.array(pareto_front, dtype=object)
-            pareto_fronts.append(pareto_front)
-    
-            solutions_indices = pareto_front[:, 0].astype(int)
-            solutions_fronts_indices[solutions_indices] = front_index
+        return list(ranking.pareto_fronts_pairs), ranking.solutions_fronts_indices.copy()
 
-        return pareto_fronts, solutions_fronts_indices
+    def nsga2_ranking(self, fitness):
+        """
+        Rank the solutions of a multi-objective problem using non-dominated sorting and crowding distance.
+        The ranking is cached in the 'nsga2_ranking_cache' attribute. It is reused as long as the same fitness values are passed so that the solutions are sorted once per generation even if the parent selection, the elitism, and the best_solution() method need the ranking.
+        The cache is invalidated when the fitness values change (e.g. by the on_fitness() callback or the steady-state mode).
+
+        Parameters
+        ----------
+        fitness : numpy.ndarray
+            A 2D array of the fitness values of the solutions with a row per solution and a column per objective.
+
+        Returns
+        -------
+        ranking : NSGA2Ranking
+            The ranking of the solutions.
+        """
+
+        fitness = numpy.asarray(fitness)
+        # The instances loaded from files saved by older versions do not have the cache.
+        ranking = getattr(self, "nsga2_ranking_cache", None)
+        if not (ranking is None) and ranking.fitness.shape == fitness.shape and numpy.array_equal(ranking.fitness, fitness):
+            return ranking
+
+        pareto_fronts, solutions_fronts_indices = self.non_dominated_fronts(fitness)
+
+        crowding_distances = numpy.full(fitness.shape[0], float('inf'))
+        fronts_sorted = []
+        pareto_fronts_pairs = []
+        for pareto_front in pareto_fronts:
+            # Sort the solutions in the front using crowded distance.
+            _, crowding_dist_sum, _, crowding_dist_pop_sorted_indices = self.crowding_distance(pareto_front=pareto_front,
+                                                                                               fitness=fitness)
+            if len(pareto_front) > 2:
+                crowding_distances[pareto_front[crowding_dist_sum[:, 0].astype(int)]] = crowding_dist_sum[:, 1]
+            fronts_sorted.append(crowding_dist_pop_sorted_indices)
+
+            # Each row in a front has:
+                # 1) The index of the solution.
+                # 2) An array of the fitness values of this solution across all objectives.
+            pareto_front_pairs = numpy.empty((len(pareto_front), 2), dtype=object)
+            for row_idx, sol_idx in enumerate(pareto_front.tolist()):
+                pareto_front_pairs[row_idx, 0] = sol_idx
+                pareto_front_pairs[row_idx, 1] = fitness[sol_idx]
+            pareto_fronts_pairs.append(pareto_front_pairs)
+
+        if len(fronts_sorted) > 0:
+            solutions_sorted = numpy.concatenate(fronts_sorted).tolist()
+        else:
+            solutions_sorted = []
+
+        ranking = NSGA2Ranking(fitness=fitness.copy(),
+                               pareto_fronts=pareto_fronts,
+                               solutions_fronts_indices=solutions_fronts_indices,
+                               crowding_distances=crowding_distances,
+                               fronts_sorted=fronts_sorted,
+                               solutions_sorted=solutions_sorted,
+                               pareto_fronts_pairs=pareto_fronts_pairs)
+        self.nsga2_ranking_cache = ranking
+        return ranking
 
     def crowding_distance(self, pareto_front, fitness):
         """
         Calculate the crowding distance for all solutions in the current pareto front.
+        The solutions are sorted once per objective using numpy.argsort() and the distances are calculated using the differences between the shifted sorted values.
     
         Parameters
         ----------
         pareto_front : TYPE
-            The set of solutions in the current pareto front.
+            The set of solutions in the current pareto front. It is either an array where each row has the index of a solution and an array of its fitness values (as returned by the non_dominated_sorting() method) or a 1D integer array of the solutions indices (as returned by the non_dominated_fronts() method).
         fitness : TYPE
             The fitness of the current population.
     
@@ -141,90 +448,84 @@ class NSGA2:
         obj_crowding_dist_list : TYPE
             A nested list of the values for all objectives alongside their crowding distance.
         crowding_dist_sum : TYPE
-            A list of the sum of crowding distances across all objectives for each solution.
+            A 2D array of the sum of crowding distances across all objectives for each solution. Each row has the index of the solution in the front and its distance. The rows are sorted by the distance.
         crowding_dist_front_sorted_indices : TYPE
             The indices of the solutions (relative to the current front) sorted by the crowding distance.
         crowding_dist_pop_sorted_indices : TYPE
             The indices of the solutions (relative to the population) sorted by the crowding distance.
         """
     
-        # Each solution in the pareto front has 2 elements:
-            # 1) The index of the solution in the population.
-            # 2) A list of the fitness values for all objectives of the solution.
-        # Before proceeding, remove the indices from each solution in the pareto front.
-        pareto_front_no_indices = numpy.array([pareto_front[:, 1][idx] for idx in range(pareto_front.shape[0])])
+        fitness = numpy.asarray(fitness)
+        pareto_front = numpy.asarray(pareto_front)
+        if pareto_front.ndim == 1:
+            # The pareto front has only the indices of its solutions.
+            front_pop_indices = pareto_front.astype(int)
+            pareto_front_no_indices = fitness[front_pop_indices]
+        else:
+            # Each solution in the pareto front has 2 elements:
+                # 1) The index of the solution in the population.
+                # 2) A list of the fitness values for all objectives of the solution.
+            # Before proceeding, remove the indices from each solution in the pareto front.
+            pareto_front_no_indices = numpy.array([pareto_front[:, 1][idx] for idx in range(pareto_front.shape[0])])
+            front_pop_indices = pareto_front[:, 0].astype(int)
     
         # If there is only 1 solution, then return empty arrays for the crowding distance.
         if pareto_front_no_indices.shape[0] == 1:
             # There is only 1 index.
-            return numpy.array([]), numpy.array([]), numpy.array([0]), pareto_front[:, 0].astype(int)
-    
-        # An empty list holding info about the objectives of each solution. The info includes the objective value and crowding distance.
-        obj_crowding_dist_list = []
-        # Loop through the objectives to calculate the crowding distance of each solution across all objectives.
-        for obj_idx in range(pareto_front_no_indices.shape[1]):
-            obj = pareto_front_no_indices[:, obj_idx]
-            # This variable has a nested list where each child list zip the following together:
-                # 1) The index of the objective value.
-                # 2) The objective value.
-                # 3) Initialize the crowding distance by zero.
-            obj = list(zip(range(len(obj)), obj, [0]*len(obj)))
-            obj = [list(element) for element in obj]
-            # This variable is the sorted version where sorting is done by the objective value (second element).
-            # Note that the first element is still the original objective index before sorting.
-            obj_sorted = sorted(obj, key=lambda x: x[1])
-        
-            # Get the minimum and maximum values for the current objective.
-            obj_min_val = min(fitness[:, obj_idx])
-            obj_max_val = max(fitness[:, obj_idx])
-            denominator = obj_max_val - obj_min_val
-            # To avoid division by zero, set the denominator to a tiny value.
-            if denominator == 0:
-                denominator = 0.0000001
-    
-            # Set the crowding distance to the first and last solutions (after being sorted) to infinity.
-            inf_val = float('inf')
-            # crowding_distance[0] = inf_val
-            obj_sorted[0][2] = inf_val
-            # crowding_distance[-1] = inf_val
-            obj_sorted[-1][2] = inf_val
-    
-            # If there are only 2 solutions in the current pareto front, then do not proceed.
-            # The crowding distance for such 2 solutions is infinity.
-            if len(obj_sorted) <= 2:
-                obj_crowding_dist_list.append(obj_sorted)
-                break
-    
-            for idx in range(1, len(obj_sorted)-1):
-                # Calculate the crowding distance.
-                crowding_dist = obj_sorted[idx+1][1] - obj_sorted[idx-1][1]
-                crowding_dist = crowding_dist / denominator
-                # Insert the crowding distance back into the list to override the initial zero.
-                obj_sorted[idx][2] = crowding_dist
-        
-            # Sort the objective by the original index at index 0 of each child list.
-            obj_sorted = sorted(obj_sorted, key=lambda x: x[0])
-            obj_crowding_dist_list.append(obj_sorted)
-    
-        obj_crowding_dist_list = numpy.array(obj_crowding_dist_list)
-        crowding_dist = numpy.array([obj_crowding_dist_list[idx, :, 2] for idx in range(len(obj_crowding_dist_list))])
+            return numpy.array([]), numpy.array([]), numpy.array([0]), front_pop_indices
+
+        num_solutions, num_objectives = pareto_front_no_indices.shape
+        front_indices = numpy.arange(num_solutions)
+
+        # If there are only 2 solutions in the current pareto front, then their crowding distance is infinity.
+        # Only the first objective is used and the solutions are kept in its sorted order.
+        if num_solutions <= 2:
+            sorted_indices = numpy.argsort(pareto_front_no_indices[:, 0], kind="stable")
+            obj_crowding_dist_list = numpy.zeros((1, num_solutions, 3), dtype=float)
+            obj_crowding_dist_list[0, :, 0] = sorted_indices
+            obj_crowding_dist_list[0, :, 1] = pareto_front_no_indices[sorted_indices, 0]
+            obj_crowding_dist_list[0, :, 2] = float('inf')
+            crowding_dist_sum = numpy.column_stack((sorted_indices, numpy.full(num_solutions, float('inf'))))
+            return obj_crowding_dist_list, crowding_dist_sum, sorted_indices, front_pop_indices[sorted_indices]
+
+        # Get the minimum and maximum values for each objective.
+        denominator = numpy.asarray(numpy.max(fitness, axis=0) - numpy.min(fitness, axis=0), dtype=float)
+        # To avoid division by zero, set the denominator to a tiny value.
+        denominator[denominator == 0] = 0.0000001
+
+        # Sort the solutions by each objective. Each column has the front indices sorted by an objective.
+        sorted_indices = numpy.argsort(pareto_front_no_indices, axis=0, kind="stable")
+        sorted_values = numpy.take_along_axis(pareto_front_no_indices, sorted_indices, axis=0)
+
+        # Set the crowding distance to the first and last solutions (after being sorted) to infinity.
+        sorted_crowding_dist = numpy.full((num_solutions, num_objectives), float('inf'))
+        # The crowding distance of the other solutions is the distance between their 2 neighbours.
+        sorted_crowding_dist[1:-1, :] = (sorted_values[2:, :] - sorted_values[:-2, :]) / denominator
+
+        # Return the crowding distance to the original order of the solutions in the front.
+        crowding_dist = numpy.empty((num_objectives, num_solutions), dtype=float)
+        numpy.put_along_axis(crowding_dist.T, sorted_indices, sorted_crowding_dist, axis=0)
+
+        # An array holding info about the objectives of each solution. The info includes the index of the solution in the front, the objective value, and the crowding distance.
+        obj_crowding_dist_list = numpy.empty((num_objectives, num_solutions, 3), dtype=float)
+        obj_crowding_dist_list[:, :, 0] = front_indices
+        obj_crowding_dist_list[:, :, 1] = pareto_front_no_indices.T
+        obj_crowding_dist_list[:, :, 2] = crowding_dist
+
         crowding_dist_sum = numpy.sum(crowding_dist, axis=0)
-    
+
+        # The sorted solutions' indices by the crowding distance in descending order. The stable sort keeps the order of the solutions with equal distances.
+        crowding_dist_front_sorted_indices = numpy.argsort(-crowding_dist_sum, kind="stable")
+
         # An array of the sum of crowding distances across all objectives. 
         # Each row has 2 elements:
             # 1) The index of the solution.
             # 2) The sum of all crowding distances for all objective of the solution.
-        crowding_dist_sum = numpy.array(list(zip(obj_crowding_dist_list[0, :, 0], crowding_dist_sum)))
-        crowding_dist_sum = sorted(crowding_dist_sum, key=lambda x: x[1], reverse=True)
-    
-        # The sorted solutions' indices by the crowding distance.
-        crowding_dist_front_sorted_indices = numpy.array(crowding_dist_sum)[:, 0]
-        crowding_dist_front_sorted_indices = crowding_dist_front_sorted_indices.astype(int)
+        crowding_dist_sum = numpy.column_stack((crowding_dist_front_sorted_indices, crowding_dist_sum[crowding_dist_front_sorted_indices])).astype(float)
+
         # Note that such indices are relative to the front, NOT the population.
         # It is mandatory to map such front indices to population indices before using them to refer to the population.
-        crowding_dist_pop_sorted_indices = pareto_front[:, 0]
-        crowding_dist_pop_sorted_indices = crowding_dist_pop_sorted_indices[crowding_dist_front_sorted_indices]
-        crowding_dist_pop_sorted_indices = crowding_dist_pop_sorted_indices.astype(int)
+        crowding_dist_pop_sorted_indices = front_pop_indices[crowding_dist_front_sorted_indices]
     
         return obj_crowding_dist_list, crowding_dist_sum, crowding_dist_front_sorted_indices, crowding_dist_pop_sorted_indices
 
@@ -252,28 +553,23 @@ class NSGA2:
         """
         if type(fitness[0]) in [list, tuple, numpy.ndarray]:
             # Multi-objective optimization problem.
-            solutions_sorted = []
-            # Split the solutions into pareto fronts using non-dominated sorting.
-            pareto_fronts, solutions_fronts_indices = self.non_dominated_sorting(fitness)
+            # Split the solutions into pareto fronts using non-dominated sorting and sort the solutions in each front using crowded distance.
+            # The ranking is cached and shared with the parent selection and the best_solution() method.
+            ranking = self.nsga2_ranking(fitness)
             if find_best_solution:
                 # Do not edit the pareto_fronts instance attribute when just getting the best solution.
                 pass
             else:
                 # The method is called within the regular GA lifecycle.
                 # We have to edit the pareto_fronts to be assigned the latest pareto front.
-                self.pareto_fronts = pareto_fronts.copy()
-            for pareto_front in pareto_fronts:
-                # Sort the solutions in the front using crowded distance.
-                _, _, _, crowding_dist_pop_sorted_indices = self.crowding_distance(pareto_front=pareto_front.copy(),
-                                                                                   fitness=fitness)
-                crowding_dist_pop_sorted_indices = list(crowding_dist_pop_sorted_indices)
-                # Append the sorted solutions into the list.
-                solutions_sorted.extend(crowding_dist_pop_sorted_indices)
+                self.pareto_fronts = list(ranking.pareto_fronts_pairs)
+            solutions_sorted = list(ranking.solutions_sorted)
         elif type(fitness[0]) in pygad.GA.supported_int_float_types:
             # Single-objective optimization problem.
-            solutions_sorted = sorted(range(len(fitness)), key=lambda k: fitness[k])
+            # A stable sort keeps the order of the solutions with equal fitness values.
+            solutions_sorted = numpy.argsort(numpy.asarray(fitness), kind="stable")
             # Reverse the sorted solutions so that the best solution comes first.
-            solutions_sorted.reverse()
+            solutions_sorted = solutions_sorted[::-1].tolist()
         else:
             raise TypeError(f'Each element in the fitness array must be of a number of an iterable (list, tuple, numpy.ndarray). But the type {type(fitness[0])} found')
 
@@ -29,15 +29,9 @@ class ParentSelection:
         fitness_sorted = self.sort_solutions_nsga2(fitness=fitness)
 
         # Selecting the best individuals in the current generation as parents for producing the offspring of the next generation.
-        if self.gene_type_single == True:
-            parents = numpy.empty((num_parents, self.population.shape[1]), dtype=self.gene_type[0])
-        else:
-            parents = numpy.empty((num_parents, self.population.shape[1]), dtype=object)
-
-        for parent_num in range(num_parents):
-            parents[parent_num, :] = self.population[fitness_sorted[parent_num], :].copy()
+        parents_indices = numpy.array(fitness_sorted[:num_parents])
 
-        return parents, numpy.array(fitness_sorted[:num_parents])
+        return self.selected_parents(parents_indices), parents_indices
 
     def rank_selection(self, fitness, num_parents):
 
@@ -61,23 +55,14 @@ class ParentSelection:
 
         probs = rank / numpy.sum(rank)
 
-        probs_start, probs_end, parents = self.wheel_cumulative_probs(probs=probs.copy(), 
-                                                                      num_parents=num_parents)
+        # Spin the wheel once for each parent. The index returned by the wheel is the rank of the solution but not its index in the population.
+        rand_probs = numpy.random.rand(num_parents)
+        ranks_indices = self.wheel_selection_indices(probs=probs,
+                                                     pointers=rand_probs)
+        # Return the correct indices of the solutions.
+        parents_indices = numpy.asarray(fitness_sorted)[ranks_indices]
 
-        parents_indices = []
-
-        for parent_num in range(num_parents):
-            rand_prob = numpy.random.rand()
-            for idx in range(probs.shape[0]):
-                if (rand_prob >= probs_start[idx] and rand_prob < probs_end[idx]):
-                    # The variable idx has the rank of solution but not its index in the population.
-                    # Return the correct index of the solution.
-                    mapped_idx = fitness_sorted[idx]
-                    parents[parent_num, :] = self.population[mapped_idx, :].copy()
-                    parents_indices.append(mapped_idx)
-                    break
-
-        return parents, numpy.array(parents_indices)
+        return self.selected_parents(parents_indices), parents_indices
 
     def random_selection(self, fitness, num_parents):
     
@@ -91,17 +76,9 @@ class ParentSelection:
             -The indices of the selected solutions.
         """
 
-        if self.gene_type_single == True:
-            parents = numpy.empty((num_parents, self.population.shape[1]), dtype=self.gene_type[0])
-        else:
-            parents = numpy.empty((num_parents, self.population.shape[1]), dtype=object)
-
         rand_indices = numpy.random.randint(low=0.0, high=fitness.shape[0], size=num_parents)
 
-        for parent_num in range(num_parents):
-            parents[parent_num, :] = self.population[rand_indices[parent_num], :].copy()
-
-        return parents, rand_indices
+        return self.selected_parents(rand_indices), rand_indices
 
     def tournament_selection(self, fitness, num_parents):
 
@@ -119,28 +96,18 @@ class ParentSelection:
         # This function works with both single- and multi-objective optimization problems.
         fitness_sorted = self.sort_solutions_nsga2(fitness=fitness)
 
-        if self.gene_type_single == True:
-            parents = numpy.empty((num_parents, self.population.shape[1]), dtype=self.gene_type[0])
-        else:
-            parents = numpy.empty((num_parents, self.population.shape[1]), dtype=object)
-
-        parents_indices = []
-
-        for parent_num in range(num_parents):
-            # Generate random indices for the candidate solutions.
-            rand_indices = numpy.random.randint(low=0, high=len(fitness), size=self.K_tournament)
+        # Find the rank of each solution once. The lower the rank, the better the solution.
+        solutions_ranks = numpy.empty(len(fitness_sorted), dtype=int)
+        solutions_ranks[fitness_sorted] = numpy.arange(len(fitness_sorted))
 
-            # Find the rank of the candidate solutions. The lower the rank, the better the solution.
-            rand_indices_rank = [fitness_sorted.index(rand_idx) for rand_idx in rand_indices]
-            # Select the solution with the lowest rank as a parent.
-            selected_parent_idx = rand_indices_rank.index(min(rand_indices_rank))
+        # Generate random indices for the candidate solutions of all tournaments. Each row is a tournament.
+        rand_indices = numpy.random.randint(low=0, high=len(fitness), size=(num_parents, self.K_tournament))
 
-            # Append the index of the selected parent.
-            parents_indices.append(rand_indices[selected_parent_idx])
-            # Insert the selected parent.
-            parents[parent_num, :] = self.population[rand_indices[selected_parent_idx], :].copy()
+        # Select the solution with the lowest rank in each tournament as a parent.
+        selected_parents_indices = numpy.argmin(solutions_ranks[rand_indices], axis=1)
+        parents_indices = rand_indices[numpy.arange(num_parents), selected_parents_indices]
 
-        return parents, numpy.array(parents_indices)
+        return self.selected_parents(parents_indices), parents_indices
 
     def roulette_wheel_selection(self, fitness, num_parents):
     
@@ -177,20 +144,12 @@ class ParentSelection:
 
         probs = fitness / fitness_sum
 
-        probs_start, probs_end, parents = self.wheel_cumulative_probs(probs=probs.copy(), 
-                                                                      num_parents=num_parents)
+        # Spin the wheel once for each parent.
+        rand_probs = numpy.random.rand(num_parents)
+        parents_indices = self.wheel_selection_indices(probs=probs,
+                                                       pointers=rand_probs)
 
-        parents_indices = []
-
-        for parent_num in range(num_parents):
-            rand_prob = numpy.random.rand()
-            for idx in range(probs.shape[0]):
-                if (rand_prob >= probs_start[idx] and rand_prob < probs_end[idx]):
-                    parents[parent_num, :] = self.population[idx, :].copy()
-                    parents_indices.append(idx)
-                    break
-
-        return parents, numpy.array(parents_indices)
+        return self.selected_parents(parents_indices), parents_indices
 
     def wheel_cumulative_probs(self, probs, num_parents):
         """
@@ -198,26 +157,22 @@ class ParentSelection:
             1) roulette_wheel_selection
             2) rank_selection
         It accepts a single 1D array representing the probabilities of selecting each solution.
+        The solutions are placed on the wheel in ascending order of their probabilities. The solutions with equal probabilities keep their order in the population.
         It returns 2 1D arrays:
             1) probs_start has the start of each range.
             2) probs_start has the end of each range.
         It also returns an empty array for the parents.
         """
 
+        probs = numpy.asarray(probs, dtype=float)
+        # The order of the solutions on the wheel.
+        sorted_indices = numpy.argsort(probs, kind="stable")
+        sorted_probs_end = numpy.cumsum(probs[sorted_indices])
+
         probs_start = numpy.zeros(probs.shape, dtype=float) # An array holding the start values of the ranges of probabilities.
         probs_end = numpy.zeros(probs.shape, dtype=float) # An array holding the end values of the ranges of probabilities.
-
-        curr = 0.0
-
-        # Calculating the probabilities of the solutions to form a roulette wheel.
-        for _ in range(probs.shape[0]):
-            min_probs_idx = numpy.where(probs == numpy.min(probs))[0][0]
-            probs_start[min_probs_idx] = curr
-            curr = curr + probs[min_probs_idx]
-            probs_end[min_probs_idx] = curr
-            # Replace 99999999999 by float('inf')
-            # probs[min_probs_idx] = 99999999999
-            probs[min_probs_idx] = float('inf')
+        probs_start[sorted_indices[1:]] = sorted_probs_end[:-1]
+        probs_end[sorted_indices] = sorted_probs_end
 
         # Selecting the best individuals in the current generation as parents for producing the offspring of the next generation.
         if self.gene_type_single == True:
@@ -227,6 +182,44 @@ class ParentSelection:
 
         return probs_start, probs_end, parents
 
+    def wheel_selection_indices(self, probs, pointers):
+        """
+        Finds the solutions selected by some pointers on a wheel. It is used by these 3 methods:
+            1) roulette_wheel_selection
+            2) rank_selection
+            3) stochastic_universal_selection
+        The wheel is the same as built by the wheel_cumulative_probs() method. The solution of each pointer is found using a binary search over the cumulative probabilities in O(log N) instead of scanning all the solutions.
+        It accepts:
+            -probs: A 1D array representing the probabilities of selecting each solution.
+            -pointers: A 1D array of the pointers in the range [0, 1).
+        It returns a 1D array of the indices of the selected solutions.
+        """
+
+        probs = numpy.asarray(probs, dtype=float)
+        sorted_indices = numpy.argsort(probs, kind="stable")
+        probs_end = numpy.cumsum(probs[sorted_indices])
+
+        # The range of a solution on the wheel is [start, end). So, the first solution whose end is greater than the pointer is selected. The solutions with zero probability are never selected.
+        positions = numpy.searchsorted(probs_end, pointers, side="right")
+        # Due to the floating-point precision, the sum of the probabilities might be slightly less than 1. A pointer after the end of the wheel selects the last solution.
+        positions = numpy.minimum(positions, len(probs) - 1)
+
+        return sorted_indices[positions]
+
+    def selected_parents(self, parents_indices):
+        """
+        Gathers the selected parents from the population at once.
+        It accepts:
+            -parents_indices: A 1D array of the indices of the selected solutions.
+        It returns an array of the selected parents.
+        """
+
+        # Fancy indexing returns a copy of the solutions.
+        if self.gene_type_single == True:
+            return numpy.asarray(self.population[parents_indices, :], dtype=self.gene_type[0])
+        else:
+            return numpy.asarray(self.population[parents_indices, :], dtype=object)
+
     def stochastic_universal_selection(self, fitness, num_parents):
 
         """
@@ -262,41 +255,17 @@ class ParentSelection:
 
         probs = fitness / fitness_sum
 
-        probs_start = numpy.zeros(probs.shape, dtype=float) # An array holding the start values of the ranges of probabilities.
-        probs_end = numpy.zeros(probs.shape, dtype=float) # An array holding the end values of the ranges of probabilities.
-
-        curr = 0.0
-
-        # Calculating the probabilities of the solutions to form a roulette wheel.
-        for _ in range(probs.shape[0]):
-            min_probs_idx = numpy.where(probs == numpy.min(probs))[0][0]
-            probs_start[min_probs_idx] = curr
-            curr = curr + probs[min_probs_idx]
-            probs_end[min_probs_idx] = curr
-            probs[min_probs_idx] = float('inf')
-
         pointers_distance = 1.0 / self.num_parents_mating # Distance between different pointers.
         first_pointer = numpy.random.uniform(low=0.0, 
                                              high=pointers_distance, 
                                              size=1)[0] # Location of the first pointer.
 
-        # Selecting the best individuals in the current generation as parents for producing the offspring of the next generation.
-        if self.gene_type_single == True:
-            parents = numpy.empty((num_parents, self.population.shape[1]), dtype=self.gene_type[0])
-        else:
-            parents = numpy.empty((num_parents, self.population.shape[1]), dtype=object)
-
-        parents_indices = []
-
-        for parent_num in range(num_parents):
-            rand_pointer = first_pointer + parent_num*pointers_distance
-            for idx in range(probs.shape[0]):
-                if (rand_pointer >= probs_start[idx] and rand_pointer < probs_end[idx]):
-                    parents[parent_num, :] = self.population[idx, :].copy()
-                    parents_indices.append(idx)
-                    break
+        # The pointers are evenly spaced on the wheel.
+        pointers = first_pointer + numpy.arange(num_parents) * pointers_distance
+        parents_indices = self.wheel_selection_indices(probs=probs,
+                                                       pointers=pointers)
 
-        return parents, numpy.array(parents_indices)
+        return self.selected_parents(parents_indices), parents_indices
 
     def tournament_selection_nsga2(self,
                                    fitness,
@@ -321,11 +290,6 @@ class ParentSelection:
             -An array of the selected parents.
             -The indices of the selected solutions.
         """
-    
-        if self.gene_type_single == True:
-            parents = numpy.empty((num_parents, self.population.shape[1]), dtype=self.gene_type[0])
-        else:
-            parents = numpy.empty((num_parents, self.population.shape[1]), dtype=object)
 
         # Verify that the problem is multi-objective optimization as the tournament NSGA-II selection is only applied to multi-objective problems.
         if type(fitness[0]) in [list, tuple, numpy.ndarray]:
@@ -338,8 +302,11 @@ class ParentSelection:
 
         # If there is only a single objective, each pareto front is expected to have only 1 solution.
         # TODO Make a test to check for that behaviour and add it to the GitHub actions tests.
-        pareto_fronts, solutions_fronts_indices = self.non_dominated_sorting(fitness)
-        self.pareto_fronts = pareto_fronts.copy()
+        # The pareto fronts and the crowding distances are calculated once and shared by all tournaments.
+        ranking = self.nsga2_ranking(fitness)
+        pareto_fronts = ranking.pareto_fronts
+        solutions_fronts_indices = ranking.solutions_fronts_indices
+        self.pareto_fronts = list(ranking.pareto_fronts_pairs)
 
         # Randomly generate pairs of indices to apply for NSGA-II tournament selection for selecting the parents solutions.
         rand_indices = numpy.random.randint(low=0,
@@ -401,24 +368,14 @@ class ParentSelection:
                 # Fetch the current pareto front.
                 pareto_front = pareto_fronts[selected_pareto_front_index]
 
-                # If there is only 1 solution in the pareto front, just return it without calculating the crowding distance (it is useless).
+                # If there is only 1 solution in the pareto front, just return it without using the crowding distance (it is useless).
                 if pareto_front.shape[0] == 1:
                     selected_parent_index = current_indices[0] # Index 1 can also be used.
                 else:
                     # Reaching here means the selected pareto front has more than 1 solution.
-                    # Calculate the crowding distance of the solutions of the pareto front.
-                    obj_crowding_distance_list, crowding_distance_sum, crowding_dist_front_sorted_indices, crowding_dist_pop_sorted_indices = self.crowding_distance(pareto_front=pareto_front.copy(),
-                                                                                                                                                                     fitness=fitness)
-                    # This list has the sorted population-based indices for the solutions in the current pareto front.
-                    crowding_dist_pop_sorted_indices = list(crowding_dist_pop_sorted_indices)
-
-                    # Return the indices of the solutions from the pareto front based on the crowding distance.
+                    # Fetch the crowding distance of the solutions.
                     # If there is more than one solution, select the solution that has a better crowding distance.
-                    # This solution comes first in the order in the crowding_dist_pop_sorted_indices list.
-                    solutions_indices = [crowding_dist_pop_sorted_indices.index(rand_sol_idx) for rand_sol_idx in current_indices_unique]
-
-                    # Fetch the crowding distance using the indices.
-                    solutions_crowding_distance = [crowding_distance_sum[rand_sol_idx][1] for rand_sol_idx in solutions_indices]
+                    solutions_crowding_distance = list(ranking.crowding_distances[current_indices_unique])
                     max_crowding_distance = max(solutions_crowding_distance)
 
                     if solutions_crowding_distance.count(max_crowding_distance) == 1:
@@ -430,11 +387,10 @@ class ParentSelection:
 
             # Insert the selected parent index.
             parents_indices.append(selected_parent_index)
-            # Insert the selected parent.
-            parents[parent_num, :] = self.population[selected_parent_index, :].copy()
 
         # Make sure the parents indices is returned as a NumPy array.
-        return parents, numpy.array(parents_indices)
+        parents_indices = numpy.array(parents_indices)
+        return self.selected_parents(parents_indices), parents_indices
     
     def nsga2_selection(self,
                         fitness,
@@ -462,69 +418,37 @@ class ParentSelection:
             -The indices of the selected solutions.
         """
 
-        if self.gene_type_single == True:
-            parents = numpy.empty((num_parents, self.population.shape[1]), dtype=self.gene_type[0])
-        else:
-            parents = numpy.empty((num_parents, self.population.shape[1]), dtype=object)
-
         # Verify that the problem is multi-objective optimization as the NSGA-II selection is only applied to multi-objective problems.
         if type(fitness[0]) in [list, tuple, numpy.ndarray]:
             pass
         elif type(fitness[0]) in self.supported_int_float_types:
             raise ValueError('The NSGA-II parent selection operator is only applied when optimizing multi-objective problems.\n\nBut a single-objective optimization problem found as the fitness function returns a single numeric value.\n\nTo use multi-objective optimization, consider returning an iterable of any of these data types:\n1)list\n2)tuple\n3)numpy.ndarray')
 
-        # The indices of the selected parents.
-        parents_indices = []
-
         # If there is only a single objective, each pareto front is expected to have only 1 solution.
         # TODO Make a test to check for that behaviour.
-        pareto_fronts, solutions_fronts_indices = self.non_dominated_sorting(fitness)
-        self.pareto_fronts = pareto_fronts.copy()
+        # The pareto fronts and the crowding distances are shared with the other methods using the same fitness.
+        ranking = self.nsga2_ranking(fitness)
+        self.pareto_fronts = list(ranking.pareto_fronts_pairs)
 
+        # The indices of the selected parents.
+        parents_indices = []
         # The number of remaining parents to be selected.
         num_remaining_parents = num_parents
 
-        # Index of the current parent.
-        current_parent_idx = 0
-        # A loop variable holding the index of the current pareto front.
-        pareto_front_idx = 0
-        while num_remaining_parents != 0 and pareto_front_idx < len(pareto_fronts):
-            # Return the current pareto front.
-            current_pareto_front = pareto_fronts[pareto_front_idx]
+        for pareto_front, front_sorted in zip(ranking.pareto_fronts, ranking.fronts_sorted):
+            if num_remaining_parents == 0:
+                break
             # Check if the entire front fits into the parents array.
             # If so, then insert all the solutions in the current front into the parents array.
-            if num_remaining_parents >= len(current_pareto_front):
-                for sol_idx in range(len(current_pareto_front)):
-                    selected_solution_idx = current_pareto_front[sol_idx, 0]
-                    # Insert the parent into the parents array.
-                    parents[current_parent_idx, :] = self.population[selected_solution_idx, :].copy()
-                    # Insert the index of the selected parent.
-                    parents_indices.append(selected_solution_idx)
-                    # Increase the parent index.
-                    current_parent_idx += 1
-
+            if num_remaining_parents >= len(pareto_front):
+                parents_indices.extend(pareto_front.tolist())
                 # Decrement the number of remaining parents by the length of the pareto front.
-                num_remaining_parents -= len(current_pareto_front)
+                num_remaining_parents -= len(pareto_front)
             else:
                 # If only a subset of the front is needed, then use the crowding distance to sort the solutions and select only the number needed.
-    
-                # Calculate the crowding distance of the solutions of the pareto front.
-                obj_crowding_distance_list, crowding_distance_sum, crowding_dist_front_sorted_indices, crowding_dist_pop_sorted_indices = self.crowding_distance(pareto_front=current_pareto_front.copy(),
-                                                                                                                                                                 fitness=fitness)
-
-                for selected_solution_idx in crowding_dist_pop_sorted_indices[0:num_remaining_parents]:
-                    # Insert the parent into the parents array.
-                    parents[current_parent_idx, :] = self.population[selected_solution_idx, :].copy()
-                    # Insert the index of the selected parent.
-                    parents_indices.append(selected_solution_idx)
-                    # Increase the parent index.
-                    current_parent_idx += 1
-    
-                # Decrement the number of remaining parents by the number of selected parents.
-                num_remaining_parents -= num_remaining_parents
-    
-            # Increase the pareto front index to take parents from the next front.
-            pareto_front_idx += 1
-    
+                parents_indices.extend(front_sorted[0:num_remaining_parents].tolist())
+                num_remaining_parents = 0
+
         # Make sure the parents indices is returned as a NumPy array.
-        return parents, numpy.array(parents_indices)
+        parents_indices = numpy.array(parents_indices)
+        return self.selected_parents(parents_indices), parents_indices
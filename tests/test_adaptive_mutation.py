@@ -1853,6 +1853,93 @@ def test_adaptive_mutation_fitness_batch_size_10_mutation_num_genes_multi_object
                                                    parallel_processing=['process', 4])
 
 
+#### The fitness of each distinct solution is calculated only once.
+evaluated_solutions = []
+
+def fitness_func_sum(ga, solution, idx):
+    evaluated_solutions.append((tuple(solution), idx))
+    return numpy.sum(solution)
+
+def fitness_func_batch_sum(ga, solutions, idxs):
+    for solution_idx, solution in enumerate(solutions):
+        evaluated_solutions.append((tuple(solution), None if idxs is None else idxs[solution_idx]))
+    return numpy.sum(solutions, axis=1)
+
+def create_ga_sum(fitness_batch_size=None,
+                  parallel_processing=None,
+                  mutation_probability=[0.2, 0.1],
+                  save_solutions=True,
+                  on_mutation=None):
+    if fitness_batch_size is None:
+        fitness_func = fitness_func_sum
+    else:
+        fitness_func = fitness_func_batch_sum
+
+    ga_instance = pygad.GA(num_generations=10,
+                           num_parents_mating=5,
+                           fitness_func=fitness_func,
+                           sol_per_pop=10,
+                           num_genes=6,
+                           mutation_type="adaptive",
+                           mutation_probability=mutation_probability,
+                           fitness_batch_size=fitness_batch_size,
+                           parallel_processing=parallel_processing,
+                           save_solutions=save_solutions,
+                           on_mutation=on_mutation,
+                           suppress_warnings=True,
+                           random_seed=1)
+    return ga_instance
+
+def on_mutation_check_offspring_fitness(ga_instance, offspring_mutation):
+    # The fitness calculated by the adaptive mutation belongs to the offspring (not to the solutions in the population).
+    for key, fitness in ga_instance.last_generation_offspring_known_fitness.items():
+        assert numpy.isclose(numpy.sum(numpy.frombuffer(key)), fitness)
+
+def test_adaptive_mutation_single_evaluation():
+    for fitness_batch_size, parallel_processing in [(None, None),
+                                                    (4, None),
+                                                    ("population", None),
+                                                    (None, ["thread", 2]),
+                                                    (3, ["thread", 2])]:
+        evaluated_solutions.clear()
+        ga_instance = create_ga_sum(fitness_batch_size=fitness_batch_size,
+                                    parallel_processing=parallel_processing,
+                                    on_mutation=on_mutation_check_offspring_fitness)
+        ga_instance.run()
+
+        solutions = [solution for solution, _ in evaluated_solutions]
+        assert len(solutions) == len(set(solutions))
+        # The offspring evaluated by the adaptive mutation do not have an index.
+        assert any([idx is None for _, idx in evaluated_solutions])
+
+def test_adaptive_mutation_unchanged_offspring():
+    # No gene is mutated. So, the fitness of the offspring calculated by the adaptive mutation is reused in the next generation without a fitness cache.
+    evaluated_solutions.clear()
+    ga_instance = create_ga_sum(mutation_probability=[0, 0],
+                                save_solutions=False)
+    ga_instance.run()
+    # Only the initial population is evaluated with the indices of the solutions.
+    assert len([idx for _, idx in evaluated_solutions if not (idx is None)]) == ga_instance.sol_per_pop
+    assert ga_instance.last_generation_offspring_known_fitness == {}
+
+def test_adaptive_mutation_vectorized_choice():
+    ga_instance = create_ga_sum()
+    # Single-objective: The offspring with a fitness below the average are low-quality.
+    assert ga_instance.adaptive_mutation_low_quality(2, numpy.array([1, 2, 3])).tolist() == [True, False, False]
+    # Multi-objective: The offspring with a fitness below the average in at least half of the objectives are low-quality.
+    offspring_fitness = numpy.array([[1, 5], [3, 3], [0, 0]])
+    average_fitness = numpy.mean(offspring_fitness, axis=0)
+    assert ga_instance.adaptive_mutation_low_quality(average_fitness, offspring_fitness).tolist() == [True, False, True]
+
+    low_quality = numpy.array([True, False, True, False])
+    ga_instance.mutation_probability = [1, 0]
+    mutation_mask = ga_instance.adaptive_mutation_probs_mask((4, 6), low_quality)
+    assert numpy.array_equal(mutation_mask, numpy.repeat(low_quality[:, numpy.newaxis], 6, axis=1))
+
+    ga_instance.mutation_num_genes = [4, 1]
+    mutation_mask = ga_instance.adaptive_mutation_num_genes_mask((4, 6), low_quality)
+    assert numpy.sum(mutation_mask, axis=1).tolist() == [4, 1, 4, 1]
+
 if __name__ == "__main__":
     #### Single-objective mutation_probability
     print()
@@ -2390,4 +2477,9 @@ if __name__ == "__main__":
     test_adaptive_mutation_fitness_batch_size_10_mutation_probability_parallel_processing_processes()
     print()
 
-
+    test_adaptive_mutation_single_evaluation()
+    print()
+    test_adaptive_mutation_unchanged_offspring()
+    print()
+    test_adaptive_mutation_vectorized_choice()
+    print()
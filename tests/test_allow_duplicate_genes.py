@@ -1,6 +1,7 @@
 import pygad
 import random
 import numpy
+import warnings
 
 num_generations = 1
 
@@ -247,7 +248,7 @@ def test_number_duplicates_nested_gene_space_initial_population():
     assert num_duplicates == 0
 
 
-# def test_number_duplicates_nested_gene_space_nested_gene_type():
+def test_number_duplicates_nested_gene_space_nested_gene_type():
     """
     This example causes duplicate genes that can only be solved by changing the values of a chain of genes.
     Let's explain it using this solution: [0, 2, 3, 4, 5, 6, 6, 7, 8, 9]
@@ -261,30 +262,22 @@ def test_number_duplicates_nested_gene_space_initial_population():
         3) Change the fourth gene from 4 to 3.
         4) Change the fifth gene from 5 to 4.
         5) Change the sixth gene from 6 to 5. This solves the duplicates.
-    But this is NOT SUPPORTED yet.
-    We support changing only a single gene that makes a room to solve the duplicates.
-
-    Let's explain it using this solution: [1, 2, 2, 4, 5, 6, 6, 7, 8, 9]
-    It has 2 genes with the value 2 at indices 1 and 2.
-    This is how the duplicates are solved:
-        1) Change the first gene from 1 to 0.
-        2) Change the second gene from 2 to 1. This solves the duplicates.
-    The result is [0, 1, 2, 4, 5, 6, 6, 7, 8, 9]
+    Such chains are found by matching the genes to the values in their spaces.
     """
-    # num_duplicates = number_duplicate_genes(gene_space=[[0, 1], 
-    #                                                     [1, 2], 
-    #                                                     [2, 3],
-    #                                                     [3, 4],
-    #                                                     [4, 5],
-    #                                                     [5, 6],
-    #                                                     [6, 7],
-    #                                                     [7, 8],
-    #                                                     [8, 9],
-    #                                                     [9, 10]],
-    #                                         gene_type=[int, int, int, int, int, int, int, int, int, int],
-    #                                         num_genes=10)
-
-    # assert num_duplicates == 0
+    num_duplicates = number_duplicate_genes(gene_space=[[0, 1], 
+                                                        [1, 2], 
+                                                        [2, 3],
+                                                        [3, 4],
+                                                        [4, 5],
+                                                        [5, 6],
+                                                        [6, 7],
+                                                        [7, 8],
+                                                        [8, 9],
+                                                        [9, 10]],
+                                            gene_type=[int, int, int, int, int, int, int, int, int, int],
+                                            num_genes=10)
+
+    assert num_duplicates == 0
 
 def test_number_duplicates_nested_gene_space_nested_gene_type_initial_population():
     num_duplicates = number_duplicate_genes(gene_space=[[0, 1], 
@@ -480,7 +473,7 @@ def test_number_duplicates_nested_gene_space_initial_population_multi_objective(
     assert num_duplicates == 0
 
 
-# def test_number_duplicates_nested_gene_space_nested_gene_type_multi_objective():
+def test_number_duplicates_nested_gene_space_nested_gene_type_multi_objective():
     """
     This example causes duplicate genes that can only be solved by changing the values of a chain of genes.
     Let's explain it using this solution: [0, 2, 3, 4, 5, 6, 6, 7, 8, 9]
@@ -494,30 +487,23 @@ def test_number_duplicates_nested_gene_space_initial_population_multi_objective(
         3) Change the fourth gene from 4 to 3.
         4) Change the fifth gene from 5 to 4.
         5) Change the sixth gene from 6 to 5. This solves the duplicates.
-    But this is NOT SUPPORTED yet.
-    We support changing only a single gene that makes a room to solve the duplicates.
-
-    Let's explain it using this solution: [1, 2, 2, 4, 5, 6, 6, 7, 8, 9]
-    It has 2 genes with the value 2 at indices 1 and 2.
-    This is how the duplicates are solved:
-        1) Change the first gene from 1 to 0.
-        2) Change the second gene from 2 to 1. This solves the duplicates.
-    The result is [0, 1, 2, 4, 5, 6, 6, 7, 8, 9]
+    Such chains are found by matching the genes to the values in their spaces.
     """
-    # num_duplicates = number_duplicate_genes(gene_space=[[0, 1], 
-    #                                                     [1, 2], 
-    #                                                     [2, 3],
-    #                                                     [3, 4],
-    #                                                     [4, 5],
-    #                                                     [5, 6],
-    #                                                     [6, 7],
-    #                                                     [7, 8],
-    #                                                     [8, 9],
-    #                                                     [9, 10]],
-    #                                         gene_type=[int, int, int, int, int, int, int, int, int, int],
-    #                                         num_genes=10)
-
-    # assert num_duplicates == 0
+    num_duplicates = number_duplicate_genes(gene_space=[[0, 1], 
+                                                        [1, 2], 
+                                                        [2, 3],
+                                                        [3, 4],
+                                                        [4, 5],
+                                                        [5, 6],
+                                                        [6, 7],
+                                                        [7, 8],
+                                                        [8, 9],
+                                                        [9, 10]],
+                                            gene_type=[int, int, int, int, int, int, int, int, int, int],
+                                            num_genes=10,
+                                            multi_objective=True)
+
+    assert num_duplicates == 0
 
 def test_number_duplicates_nested_gene_space_nested_gene_type_initial_population_multi_objective():
     num_duplicates = number_duplicate_genes(gene_space=[[0, 1], 
@@ -536,6 +522,204 @@ def test_number_duplicates_nested_gene_space_nested_gene_type_initial_population
 
     assert num_duplicates == 0
 
+#### Batch Repair
+def create_ga_batch_repair(gene_space=None,
+                           gene_type=int,
+                           num_genes=10,
+                           mutation_by_replacement=False):
+    def fitness_func(ga, solution, idx):
+        return random.random()
+
+    ga_instance = pygad.GA(num_generations=num_generations,
+                           num_parents_mating=5,
+                           fitness_func=fitness_func,
+                           sol_per_pop=10,
+                           num_genes=num_genes,
+                           gene_space=gene_space,
+                           gene_type=gene_type,
+                           init_range_low=0,
+                           init_range_high=100,
+                           allow_duplicate_genes=False,
+                           mutation_by_replacement=mutation_by_replacement,
+                           random_seed=123,
+                           suppress_warnings=True)
+    return ga_instance
+
+def test_duplicate_genes_mask():
+    ga_instance = create_ga_batch_repair()
+    duplicates_mask = ga_instance.duplicate_genes_mask([[3, 1, 3, 3, 1],
+                                                        [0, 1, 2, 3, 4]])
+    # The first gene holding each value is kept.
+    assert duplicates_mask.tolist() == [[False, False, True, True, True],
+                                        [False, False, False, False, False]]
+
+    # The fixed genes are kept before the other genes sharing their values.
+    duplicates_mask = ga_instance.duplicate_genes_mask([[3, 1, 3, 3, 1]],
+                                                       fixed_genes=numpy.array([[False, False, True, False, False]]))
+    assert duplicates_mask.tolist() == [[True, False, False, True, True]]
+
+def test_solve_duplicate_genes_batch_by_space():
+    ga_instance = create_ga_batch_repair(gene_space=range(6),
+                                         num_genes=4,
+                                         mutation_by_replacement=True)
+    population = numpy.tile([0, 0, 2, 5], (3000, 1))
+    population, num_unsolved = ga_instance.solve_duplicate_genes_batch(population=population)
+    assert num_unsolved == 0
+    assert numpy.all(population[:, [0, 2, 3]] == [0, 2, 5])
+    # The new value is selected out of the unused values.
+    values, counts = numpy.unique(population[:, 1], return_counts=True)
+    assert values.tolist() == [1, 3, 4]
+    assert numpy.all(counts > 900)
+
+    # A gene with a single value keeps it while the other gene sharing the value is changed.
+    ga_instance = create_ga_batch_repair(gene_space=[[1], [1, 2, 3], [4], [5]],
+                                         num_genes=4)
+    population, num_unsolved = ga_instance.solve_duplicate_genes_batch(population=numpy.array([[1, 1, 4, 5]]))
+    assert num_unsolved == 0
+    assert population[0, 0] == 1 and population[0, 1] in [2, 3]
+
+    # No value is left for the last gene.
+    ga_instance = create_ga_batch_repair(gene_space=[0, 1, 2],
+                                         num_genes=4)
+    population, num_unsolved = ga_instance.solve_duplicate_genes_batch(population=numpy.array([[0, 1, 2, 2]]))
+    assert num_unsolved == 1
+
+def test_solve_duplicate_genes_batch_randomly():
+    for gene_type in [int, float, [float, 2]]:
+        ga_instance = create_ga_batch_repair(gene_type=gene_type)
+        population = numpy.zeros((100, 10), dtype=float if gene_type is float else int)
+        population, num_unsolved = ga_instance.solve_duplicate_genes_batch(population=population,
+                                                                           build_initial_pop=True)
+        assert num_unsolved == 0
+        assert all([len(set(solution)) == 10 for solution in population])
+        assert numpy.all((population >= 0) & (population < 100))
+
+def test_solve_duplicate_genes_batch_large_space():
+    num_genes = 1000
+    ga_instance = create_ga_batch_repair(gene_space=range(num_genes),
+                                         num_genes=num_genes)
+    # Each solution is a permutation except for half of its genes duplicating the other half.
+    population = numpy.tile(numpy.arange(num_genes), (20, 1))
+    population[:, num_genes // 2:] = population[:, :num_genes // 2]
+    population, num_unsolved = ga_instance.solve_duplicate_genes_batch(population=population)
+    assert num_unsolved == 0
+    assert numpy.all(numpy.sort(population, axis=1) == numpy.arange(num_genes))
+
+#### Matching
+def test_max_genes_matching():
+    ga_instance = create_ga_batch_repair()
+    # The first gene can take the values 0 and 1, the second gene the value 1, and the third gene the values 1 and 2.
+    allowed_values = [[0, 1], [1], [1, 2]]
+    gene_match = ga_instance.max_genes_matching(allowed_values=allowed_values,
+                                                num_values=3)
+    assert list(gene_match) == [0, 1, 2]
+
+    # The genes keep their current values when possible.
+    gene_match = ga_instance.max_genes_matching(allowed_values=[[0, 1], [0, 1], [1, 2]],
+                                                num_values=3,
+                                                genes_values=[1, 1, 2])
+    assert list(gene_match) == [1, 0, 2]
+
+    # Only 2 genes out of 3 can be matched.
+    gene_match = ga_instance.max_genes_matching(allowed_values=[[0], [0], [1]],
+                                                num_values=2)
+    assert sum([value_idx >= 0 for value_idx in gene_match]) == 2
+
+def test_solve_duplicates_by_matching():
+    gene_space = [[3, 0, 1], [4, 1, 2], [0, 2], [3, 2, 0]]
+    ga_instance = create_ga_batch_repair(gene_space=gene_space,
+                                         num_genes=4)
+    # Changing either of the 2 duplicating genes does not solve the duplicates. The second gene must change to make room for the value 2.
+    solution, num_unsolved = ga_instance.solve_duplicates_by_matching(solution=numpy.array([3, 2, 0, 0]))
+    assert num_unsolved == 0
+    assert len(set(solution)) == 4
+    # The first gene holding each value keeps it.
+    assert solution[0] == 3 and solution[2] == 0
+    for gene_idx in range(4):
+        assert solution[gene_idx] in gene_space[gene_idx]
+
+    population, num_unsolved = ga_instance.solve_duplicate_genes_batch(population=numpy.tile([3, 2, 0, 0], (10, 1)))
+    assert num_unsolved == 0
+    assert all([len(set(solution)) == 4 for solution in population])
+
+    solution, _, num_unsolved = ga_instance.solve_duplicate_genes_by_space(solution=numpy.array([3, 2, 0, 0]),
+                                                                           gene_type=ga_instance.gene_type,
+                                                                           sample_size=10,
+                                                                           mutation_by_replacement=True)
+    assert num_unsolved == 0
+    assert len(set(solution)) == 4
+
+def test_solve_duplicates_by_matching_free_gene():
+    # The third gene has a None space and holds the value 0 needed by one of the first 2 genes.
+    gene_space = [[0, 1], [0, 1], None]
+    ga_instance = create_ga_batch_repair(gene_space=gene_space,
+                                         num_genes=3)
+    assert ga_instance.unique_genes_feasible == True
+
+    solution, num_unsolved = ga_instance.solve_duplicates_by_matching(solution=numpy.array([1, 1, 0]))
+    assert num_unsolved == 0
+    assert len(set(solution)) == 3
+    assert sorted(solution[:2]) == [0, 1]
+
+    population, num_unsolved = ga_instance.solve_duplicate_genes_batch(population=numpy.tile([1, 1, 0], (10, 1)))
+    assert num_unsolved == 0
+    assert all([len(set(solution)) == 3 for solution in population])
+
+    solution, _, num_unsolved = ga_instance.solve_duplicate_genes_by_space(solution=numpy.array([1, 1, 0]),
+                                                                           gene_type=ga_instance.gene_type,
+                                                                           sample_size=10,
+                                                                           mutation_by_replacement=True)
+    assert num_unsolved == 0
+    assert len(set(solution)) == 3
+
+    # No warning about failing to find unique values is given while running.
+    with warnings.catch_warnings(record=True) as caught_warnings:
+        warnings.simplefilter("always")
+        ga_instance = pygad.GA(num_generations=num_generations,
+                               num_parents_mating=2,
+                               fitness_func=lambda ga, solution, idx: 0,
+                               sol_per_pop=8,
+                               num_genes=3,
+                               gene_space=gene_space,
+                               gene_type=int,
+                               mutation_num_genes=1,
+                               allow_duplicate_genes=False,
+                               random_seed=123)
+        ga_instance.run()
+    assert len(caught_warnings) == 0
+    assert all([len(set(solution)) == 3 for solution in ga_instance.population])
+
+def test_unique_genes_feasibility():
+    ga_instance = create_ga_batch_repair(gene_space=[[0, 1], [1, 2], [2, 3], [3, 4]],
+                                         gene_type=[int, int, int, int],
+                                         num_genes=4)
+    assert ga_instance.unique_genes_feasible == True
+
+    # 4 genes cannot take unique values out of 3 values.
+    with warnings.catch_warnings(record=True) as caught_warnings:
+        warnings.simplefilter("always")
+        ga_instance = pygad.GA(num_generations=num_generations,
+                               num_parents_mating=5,
+                               fitness_func=lambda ga, solution, idx: 0,
+                               sol_per_pop=10,
+                               num_genes=4,
+                               gene_space=[0, 1, 2],
+                               gene_type=int,
+                               mutation_num_genes=1,
+                               allow_duplicate_genes=False,
+                               random_seed=123)
+        ga_instance.run()
+    assert ga_instance.unique_genes_feasible == False
+    # The warning is given once by the constructor and not at each generation.
+    messages = [str(warning.message) for warning in caught_warnings]
+    assert len(messages) == 1
+    assert "unique values can be assigned to at most 3 out of the 4 genes" in messages[0]
+
+    # The nested spaces [[0, 1], [0, 1], [0, 1, 2]] allow only 3 unique values although each gene has 2 values.
+    ga_instance = create_ga_batch_repair(gene_space=[[0, 1], [0, 1], [0, 1], [0, 1, 2]],
+                                         num_genes=4)
+    assert ga_instance.unique_genes_feasible == False
+
 if __name__ == "__main__":
     #### Single-objective
     print()
@@ -579,9 +763,8 @@ if __name__ == "__main__":
     test_number_duplicates_nested_gene_space_initial_population()
     print()
 
-    # This example causes duplicates that can only be solved by changing a chain of genes.
-    # test_number_duplicates_nested_gene_space_nested_gene_type()
-    # print()
+    test_number_duplicates_nested_gene_space_nested_gene_type()
+    print()
     test_number_duplicates_nested_gene_space_nested_gene_type_initial_population()
     print()
 
@@ -625,10 +808,26 @@ if __name__ == "__main__":
     test_number_duplicates_nested_gene_space_initial_population_multi_objective()
     print()
 
-    # This example causes duplicates that can only be solved by changing a chain of genes.
-    # test_number_duplicates_nested_gene_space_nested_gene_type_multi_objective()
-    # print()
+    test_number_duplicates_nested_gene_space_nested_gene_type_multi_objective()
+    print()
     test_number_duplicates_nested_gene_space_nested_gene_type_initial_population_multi_objective()
     print()
 
+    test_duplicate_genes_mask()
+    print()
+    test_solve_duplicate_genes_batch_by_space()
+    print()
+    test_solve_duplicate_genes_batch_randomly()
+    print()
+    test_solve_duplicate_genes_batch_large_space()
+    print()
+
+    test_max_genes_matching()
+    print()
+    test_solve_duplicates_by_matching()
+    print()
+    test_solve_duplicates_by_matching_free_gene()
+    print()
+    test_unique_genes_feasibility()
+    print()
 
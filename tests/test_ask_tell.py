@@ -0,0 +1,152 @@
+import pygad
+import numpy
+
+num_generations = 10
+sol_per_pop = 10
+num_parents_mating = 5
+
+def fitness_func(ga_instance, solution, solution_idx):
+    return numpy.sum(solution)
+
+def fitness_func_multi(ga_instance, solution, solution_idx):
+    return [numpy.sum(solution), -numpy.sum(numpy.abs(solution))]
+
+def create_ga(fitness_function=fitness_func,
+              parent_selection_type="sss",
+              keep_elitism=1,
+              keep_parents=-1,
+              mutation_type="random",
+              stop_criteria=None,
+              on_generation=None,
+              fitness_cache_size=None):
+    ga_instance = pygad.GA(num_generations=num_generations,
+                           sol_per_pop=sol_per_pop,
+                           num_genes=4,
+                           num_parents_mating=num_parents_mating,
+                           fitness_func=fitness_function,
+                           parent_selection_type=parent_selection_type,
+                           keep_elitism=keep_elitism,
+                           keep_parents=keep_parents,
+                           mutation_type=mutation_type,
+                           mutation_num_genes=[3, 1] if mutation_type == "adaptive" else None,
+                           stop_criteria=stop_criteria,
+                           on_generation=on_generation,
+                           fitness_cache_size=fitness_cache_size,
+                           save_best_solutions=True,
+                           suppress_warnings=True,
+                           random_seed=1)
+    return ga_instance
+
+def evolve_ask_tell(ga_instance, fitness_function=fitness_func):
+    num_asks = 0
+    while True:
+        solutions = ga_instance.ask()
+        num_asks += 1
+        fitness = [fitness_function(ga_instance, solution, None) for solution in solutions]
+        if ga_instance.tell(fitness):
+            break
+    return num_asks
+
+def compare_with_run(**kwargs):
+    fitness_function = kwargs.get("fitness_function", fitness_func)
+
+    ga_run = create_ga(**kwargs)
+    ga_run.run()
+
+    ga_ask_tell = create_ga(**kwargs)
+    num_asks = evolve_ask_tell(ga_ask_tell, fitness_function)
+
+    assert ga_ask_tell.run_completed
+    assert ga_ask_tell.generations_completed == ga_run.generations_completed
+    assert num_asks == ga_run.generations_completed + 1
+    assert numpy.array_equal(ga_ask_tell.population, ga_run.population)
+    assert numpy.array_equal(ga_ask_tell.last_generation_fitness, ga_run.last_generation_fitness)
+    assert numpy.array_equal(numpy.array(ga_ask_tell.best_solutions_fitness), numpy.array(ga_run.best_solutions_fitness))
+    assert numpy.array_equal(ga_ask_tell.best_solutions, ga_run.best_solutions)
+    return ga_ask_tell
+
+def test_ask_tell_same_as_run():
+    compare_with_run()
+
+def test_ask_tell_keep_parents():
+    compare_with_run(keep_elitism=0,
+                     keep_parents=2)
+
+def test_ask_tell_multi_objective():
+    compare_with_run(fitness_function=fitness_func_multi,
+                     parent_selection_type="nsga2")
+
+def test_ask_tell_adaptive_mutation():
+    compare_with_run(mutation_type="adaptive")
+
+def test_ask_tell_fitness_cache():
+    compare_with_run(fitness_cache_size=50)
+
+def test_ask_tell_stop_criteria():
+    ga_instance = compare_with_run(stop_criteria="reach_5")
+    assert ga_instance.generations_completed < num_generations
+
+def test_ask_tell_on_generation_stop():
+    def on_generation(ga_instance):
+        if ga_instance.generations_completed == 3:
+            return "stop"
+
+    ga_instance = compare_with_run(on_generation=on_generation)
+    assert ga_instance.generations_completed == 3
+
+def test_ask_tell_only_unknown_solutions():
+    ga_instance = create_ga(keep_elitism=2)
+    # All the solutions of the initial population are unknown.
+    assert len(ga_instance.ask()) == sol_per_pop
+    # Calling ask() again before tell() returns the same solutions.
+    solutions = ga_instance.ask()
+    assert len(solutions) == sol_per_pop
+    ga_instance.tell([fitness_func(ga_instance, solution, None) for solution in solutions])
+    # The fitness of the elitism is reused.
+    assert len(ga_instance.ask()) == sol_per_pop - 2
+
+def test_ask_tell_continue():
+    ga_instance = create_ga()
+    evolve_ask_tell(ga_instance)
+    evolve_ask_tell(ga_instance)
+    assert ga_instance.generations_completed == 2 * num_generations
+
+def test_tell_invalid():
+    ga_instance = create_ga()
+    try:
+        ga_instance.tell([1] * sol_per_pop)
+    except RuntimeError:
+        pass
+    else:
+        raise AssertionError("No exception raised when tell() is called before ask().")
+
+    solutions = ga_instance.ask()
+    try:
+        ga_instance.tell([1] * (len(solutions) - 1))
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("No exception raised when the number of fitness values does not match the number of solutions.")
+
+if __name__ == "__main__":
+    print()
+    test_ask_tell_same_as_run()
+    print()
+    test_ask_tell_keep_parents()
+    print()
+    test_ask_tell_multi_objective()
+    print()
+    test_ask_tell_adaptive_mutation()
+    print()
+    test_ask_tell_fitness_cache()
+    print()
+    test_ask_tell_stop_criteria()
+    print()
+    test_ask_tell_on_generation_stop()
+    print()
+    test_ask_tell_only_unknown_solutions()
+    print()
+    test_ask_tell_continue()
+    print()
+    test_tell_invalid()
+    print()
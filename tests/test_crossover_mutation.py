@@ -241,6 +241,118 @@ def test_random_mutation_manual_call4():
     for value in comp_sorted:
         assert value in value_space
 
+def test_crossover_manual_call():
+    result, ga_instance = output_crossover_mutation()
+
+    # Each parent has a distinct value in all its genes to know which parent each gene is copied from.
+    num_parents = 4
+    parents = numpy.repeat(numpy.arange(num_parents), 10).reshape(num_parents, 10)
+    offspring_size = (9, 10)
+    parents1_indices = numpy.arange(offspring_size[0]) % num_parents
+    parents2_indices = (parents1_indices + 1) % num_parents
+    for crossover in [ga_instance.single_point_crossover,
+                      ga_instance.two_points_crossover,
+                      ga_instance.uniform_crossover,
+                      ga_instance.scattered_crossover]:
+        offspring = crossover(parents, offspring_size)
+        assert offspring.shape == offspring_size
+        from_parent1 = offspring == parents1_indices[:, numpy.newaxis]
+        from_parent2 = offspring == parents2_indices[:, numpy.newaxis]
+        assert numpy.all(from_parent1 | from_parent2)
+
+        if crossover == ga_instance.single_point_crossover:
+            # The genes before the crossover point are copied from the first parent.
+            assert numpy.all(numpy.diff(from_parent2.astype(int), axis=1) >= 0)
+        elif crossover == ga_instance.two_points_crossover:
+            # The genes copied from the second parent are consecutive.
+            assert numpy.all(numpy.abs(numpy.diff(from_parent2.astype(int), axis=1)).sum(axis=1) <= 2)
+
+def test_crossover_probability_manual_call():
+    result, ga_instance = output_crossover_mutation()
+
+    num_parents = 4
+    parents = numpy.repeat(numpy.arange(num_parents), 10).reshape(num_parents, 10)
+    offspring_size = (20000, 10)
+    for crossover_probability in [0.0, 0.3, 1.0]:
+        ga_instance.crossover_probability = crossover_probability
+        parents1_indices, parents2_indices, crossed = ga_instance.crossover_parents_indices(num_parents=num_parents,
+                                                                                            num_offspring=offspring_size[0])
+        # An offspring is copied from the parent at index k if no parent satisfies the probability.
+        assert numpy.isclose(numpy.mean(~crossed), (1 - crossover_probability) ** num_parents, atol=0.02)
+        assert numpy.all(parents1_indices[~crossed] == (numpy.arange(offspring_size[0]) % num_parents)[~crossed])
+        # A parent mates with itself only if a single parent satisfies the probability.
+        same_parent = crossed & (parents1_indices == parents2_indices)
+        assert numpy.isclose(numpy.mean(same_parent), num_parents * crossover_probability * (1 - crossover_probability) ** (num_parents - 1), atol=0.02)
+
+        offspring = ga_instance.single_point_crossover(parents, offspring_size)
+        assert numpy.all(numpy.isin(offspring, numpy.arange(num_parents)))
+
+def test_random_mutation_num_genes_manual_call():
+    result, ga_instance = output_crossover_mutation(mutation_type="random",
+                                                    random_mutation_min_val=888,
+                                                    random_mutation_max_val=999)
+    ga_instance.mutation_num_genes = 3
+
+    temp_offspring = numpy.array(initial_population * 100, dtype=float)
+    offspring = ga_instance.mutation_randomly(offspring=temp_offspring.copy())
+
+    # Exactly mutation_num_genes genes are mutated in each offspring.
+    comp = offspring - temp_offspring
+    assert numpy.all(numpy.count_nonzero(comp, axis=1) == ga_instance.mutation_num_genes)
+    assert numpy.all((comp == 0) | ((comp >= 888) & (comp < 999)))
+    # All the genes are selected for mutation.
+    assert numpy.all(numpy.count_nonzero(comp, axis=0) > 0)
+
+def test_random_mutation_probability_manual_call():
+    # Use a different mutation range for each gene.
+    random_mutation_min_val = list(range(0, 100, 10))
+    random_mutation_max_val = list(range(5, 105, 10))
+    result, ga_instance = output_crossover_mutation(gene_type=int,
+                                                    mutation_type="random",
+                                                    random_mutation_min_val=random_mutation_min_val,
+                                                    random_mutation_max_val=random_mutation_max_val,
+                                                    mutation_by_replacement=True)
+    ga_instance.mutation_probability = 0.3
+
+    temp_offspring = numpy.array(initial_population * 100, dtype=int)
+    offspring = ga_instance.mutation_probs_randomly(offspring=temp_offspring.copy())
+
+    assert offspring.dtype == temp_offspring.dtype
+    mutated = offspring != temp_offspring
+    assert numpy.isclose(numpy.mean(mutated), 0.3, atol=0.05)
+    assert numpy.all((offspring[mutated] >= numpy.array(random_mutation_min_val)[numpy.nonzero(mutated)[1]]) &
+                     (offspring[mutated] < numpy.array(random_mutation_max_val)[numpy.nonzero(mutated)[1]]))
+
+def test_permutation_mutations_manual_call():
+    result, ga_instance = output_crossover_mutation(gene_type=int)
+    temp_offspring = numpy.array(initial_population * 100, dtype=int)
+    num_genes = temp_offspring.shape[1]
+    segment_length = num_genes // 2
+
+    offspring = ga_instance.swap_mutation(offspring=temp_offspring.copy())
+    changed = offspring != temp_offspring
+    # Exactly 2 genes are interchanged at a distance of half the number of genes.
+    assert numpy.all(changed.sum(axis=1) == 2)
+    changed_genes = numpy.nonzero(changed)[1].reshape(-1, 2)
+    assert numpy.all(changed_genes[:, 1] - changed_genes[:, 0] == segment_length)
+
+    offspring = ga_instance.inversion_mutation(offspring=temp_offspring.copy())
+    for solution in offspring:
+        # The genes are the indices. So, the start of the inverted segment is the first gene out of place.
+        start = numpy.flatnonzero(solution != numpy.arange(num_genes))[0]
+        assert numpy.array_equal(solution[start:start + segment_length],
+                                 numpy.arange(start, start + segment_length)[::-1])
+
+    offspring = ga_instance.scramble_mutation(offspring=temp_offspring.copy())
+    assert numpy.all(numpy.sort(offspring, axis=1) == temp_offspring)
+    for solution in offspring:
+        moved = numpy.flatnonzero(solution != numpy.arange(num_genes))
+        # Only the genes in a single segment are moved.
+        if len(moved) > 0:
+            assert moved[-1] - moved[0] < segment_length
+    # Each offspring gets its own segment and order.
+    assert len(numpy.unique(offspring, axis=0)) > 1
+
 if __name__ == "__main__":
     #### Single-objective
     print()
@@ -285,3 +397,18 @@ if __name__ == "__main__":
 
     test_random_mutation_manual_call4()
     print()
+
+    test_crossover_manual_call()
+    print()
+
+    test_crossover_probability_manual_call()
+    print()
+
+    test_random_mutation_num_genes_manual_call()
+    print()
+
+    test_random_mutation_probability_manual_call()
+    print()
+
+    test_permutation_mutations_manual_call()
+    print()
@@ -0,0 +1,144 @@
+import pygad
+import numpy
+
+num_generations = 50
+sol_per_pop = 10
+num_parents_mating = 5
+
+# A small discrete gene space makes the same solutions explored many times.
+gene_space = [0, 1, 2]
+
+def fitness_func(ga_instance, solution, solution_idx):
+    return numpy.sum(solution)
+
+def number_calls_fitness_function(fitness_cache_size=None,
+                                  save_solutions=False,
+                                  fitness_batch_size=None,
+                                  parallel_processing=None):
+
+    actual_num_fitness_calls = 0
+    def fitness_func_count(ga_instance, solution, solution_idx):
+        nonlocal actual_num_fitness_calls
+        actual_num_fitness_calls = actual_num_fitness_calls + 1
+        return numpy.sum(solution)
+
+    def fitness_func_batch_count(ga_instance, solutions, solutions_indices):
+        nonlocal actual_num_fitness_calls
+        actual_num_fitness_calls = actual_num_fitness_calls + len(solutions)
+        return numpy.sum(solutions, axis=1)
+
+    if fitness_batch_size is None:
+        fitness_function = fitness_func_count
+    else:
+        fitness_function = fitness_func_batch_count
+
+    ga_instance = pygad.GA(num_generations=num_generations,
+                           sol_per_pop=sol_per_pop,
+                           num_genes=4,
+                           num_parents_mating=num_parents_mating,
+                           fitness_func=fitness_function,
+                           gene_space=gene_space,
+                           gene_type=int,
+                           keep_elitism=0,
+                           keep_parents=0,
+                           fitness_cache_size=fitness_cache_size,
+                           save_solutions=save_solutions,
+                           fitness_batch_size=fitness_batch_size,
+                           parallel_processing=parallel_processing,
+                           suppress_warnings=True,
+                           random_seed=1)
+    ga_instance.run()
+
+    return ga_instance, actual_num_fitness_calls
+
+def test_fitness_cache_disabled():
+    ga_instance, actual = number_calls_fitness_function()
+    assert ga_instance.fitness_cache is None
+    # Every solution is evaluated in every generation.
+    assert actual == sol_per_pop + num_generations * sol_per_pop
+
+def test_fitness_cache_each_solution_evaluated_once():
+    # 3**4=81 possible solutions.
+    ga_instance, actual = number_calls_fitness_function(fitness_cache_size=100)
+    assert actual == len(ga_instance.fitness_cache)
+    assert actual <= 81
+    assert ga_instance.fitness_cache.evictions == 0
+    assert ga_instance.fitness_cache.hits > 0
+
+def test_fitness_cache_save_solutions():
+    ga_instance, actual = number_calls_fitness_function(save_solutions=True)
+    assert ga_instance.fitness_cache.max_entries is None
+    assert actual == len(ga_instance.fitness_cache)
+    assert len(ga_instance.solutions) == sol_per_pop * (num_generations + 1)
+
+def test_fitness_cache_batch():
+    ga_instance, actual = number_calls_fitness_function(fitness_cache_size=100,
+                                                        fitness_batch_size=3)
+    assert actual == len(ga_instance.fitness_cache)
+
+def test_fitness_cache_parallel_thread():
+    ga_instance, actual = number_calls_fitness_function(fitness_cache_size=100,
+                                                        parallel_processing=["thread", 2])
+    assert actual == len(ga_instance.fitness_cache)
+
+def test_fitness_cache_max_entries():
+    ga_instance, actual = number_calls_fitness_function(fitness_cache_size=5)
+    assert len(ga_instance.fitness_cache) == 5
+    assert ga_instance.fitness_cache.evictions == actual - 5
+
+def test_fitness_cache_lru_eviction():
+    cache = pygad.helper.fitness_cache.FitnessCache(max_entries=2)
+    cache.put([1, 2], 3)
+    cache.put([3, 4], 7)
+    # Using the first solution makes the second one the least recently used.
+    assert cache.get([1, 2]) == 3
+    cache.put([5, 6], 11)
+    assert [1, 2] in cache
+    assert not ([3, 4] in cache)
+    assert cache.get([3, 4]) is None
+    assert cache.hits == 1
+    assert cache.misses == 1
+    assert cache.evictions == 1
+
+def test_fitness_cache_key():
+    key = pygad.helper.fitness_cache.FitnessCache.key
+    assert key(numpy.array([1, 2, 3])) == key(numpy.array([1.0, 2.0, 3.0]))
+    assert key(numpy.array([1, 2, 3], dtype=object)) == key([1, 2, 3])
+    assert key([0.0, 1.0]) == key([-0.0, 1.0])
+    assert key([1, 2, 3]) != key([3, 2, 1])
+
+def test_fitness_cache_size_invalid():
+    for fitness_cache_size, error in [(0, ValueError), (-5, ValueError), (2.5, TypeError), ("10", TypeError)]:
+        try:
+            pygad.GA(num_generations=1,
+                     sol_per_pop=sol_per_pop,
+                     num_genes=4,
+                     num_parents_mating=num_parents_mating,
+                     fitness_func=fitness_func,
+                     fitness_cache_size=fitness_cache_size,
+                     suppress_warnings=True)
+        except error:
+            pass
+        else:
+            raise AssertionError(f"No exception raised for fitness_cache_size={fitness_cache_size}.")
+
+if __name__ == "__main__":
+    print()
+    test_fitness_cache_disabled()
+    print()
+    test_fitness_cache_each_solution_evaluated_once()
+    print()
+    test_fitness_cache_save_solutions()
+    print()
+    test_fitness_cache_batch()
+    print()
+    test_fitness_cache_parallel_thread()
+    print()
+    test_fitness_cache_max_entries()
+    print()
+    test_fitness_cache_lru_eviction()
+    print()
+    test_fitness_cache_key()
+    print()
+    test_fitness_cache_size_invalid()
+    print()
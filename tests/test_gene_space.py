@@ -1335,8 +1335,96 @@ def test_nested_gene_space_nested_gene_type_adaptive_mutation_probability_multi_
                                                          parent_selection_type='nsga2')
     assert num_outside == 0
 
-
-
+#### Compiled gene space
+def test_gene_space_table():
+    ga_instance = pygad.GA(num_generations=1,
+                           num_parents_mating=2,
+                           fitness_func=lambda ga, solution, idx: 0,
+                           sol_per_pop=10,
+                           num_genes=5,
+                           gene_space=[[3, 1, 2, 1],
+                                       7,
+                                       {"low": 0, "high": 1, "step": 0.25},
+                                       {"low": 0, "high": 10},
+                                       None],
+                           gene_type=[int, int, float, float, float],
+                           suppress_warnings=True)
+    table = ga_instance.gene_space_table
+    assert list(table.kinds) == [pygad.helper.gene_space.GENE_SPACE_VALUES,
+                                 pygad.helper.gene_space.GENE_SPACE_VALUES,
+                                 pygad.helper.gene_space.GENE_SPACE_STEP,
+                                 pygad.helper.gene_space.GENE_SPACE_UNIFORM,
+                                 pygad.helper.gene_space.GENE_SPACE_NONE]
+    # The values are unique and sorted.
+    assert list(table.values) == [1, 2, 3, 7]
+    assert list(table.offsets[:2]) == [0, 3]
+    assert list(table.lengths[:3]) == [3, 1, 4]
+    assert table.low[3] == 0 and table.high[3] == 10 and table.step[2] == 0.25
+    # The raw values keep the order and the repeated values to select the initial population.
+    assert list(table.raw_values) == [3, 1, 2, 1, 7]
+    assert list(table.raw_offsets[:2]) == [0, 4]
+    assert list(table.raw_lengths[:3]) == [4, 1, 4]
+    # The table is read-only.
+    try:
+        table.values[0] = 5
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("The gene space table is writable.")
+
+def test_gene_space_repeated_values_weighting():
+    # A value repeated in the gene space is selected more often while creating the initial population.
+    for gene_space in [[[0, 0, 0, 1], [0, 0, 0, 1]],
+                       [0, 0, 0, 1]]:
+        ga_instance = pygad.GA(num_generations=1,
+                               num_parents_mating=2,
+                               fitness_func=lambda ga, solution, idx: 0,
+                               sol_per_pop=2000,
+                               num_genes=2,
+                               gene_space=gene_space,
+                               gene_type=int,
+                               suppress_warnings=True,
+                               random_seed=1)
+        ratio = numpy.mean(ga_instance.population == 0)
+        assert 0.7 < ratio < 0.8
+        # The repeated values are removed while mutating the genes.
+        assert list(ga_instance.discrete_gene_space(gene_idx=0)) == [0, 1]
+
+def test_mutation_by_space_excludes_current_value():
+    for mutation_kwargs in [{"mutation_num_genes": 3},
+                            {"mutation_probability": 1.0}]:
+        ga_instance = pygad.GA(num_generations=1,
+                               num_parents_mating=2,
+                               fitness_func=lambda ga, solution, idx: 0,
+                               sol_per_pop=50,
+                               num_genes=3,
+                               gene_space=[[0, 1], [0, 1, 2], [4]],
+                               gene_type=int,
+                               allow_duplicate_genes=True,
+                               suppress_warnings=True,
+                               random_seed=1,
+                               **mutation_kwargs)
+        offspring = ga_instance.population.copy()
+        mutated = ga_instance.random_mutation(offspring.copy())
+        # Every gene is mutated to a different value unless it is the only value in its space.
+        assert numpy.all(mutated[:, 0] == 1 - offspring[:, 0])
+        assert numpy.all(mutated[:, 1] != offspring[:, 1])
+        assert numpy.all(numpy.isin(mutated[:, 1], [0, 1, 2]))
+        assert numpy.all(mutated[:, 2] == 4)
+
+def test_gene_space_global_None():
+    num_outside, ga_instance = number_respect_gene_space(gene_space=[None, 100, 200],
+                                                         gene_type=[float, 2],
+                                                         init_range_low=-4,
+                                                         init_range_high=-3,
+                                                         random_mutation_min_val=-2,
+                                                         random_mutation_max_val=-1,
+                                                         mutation_by_replacement=True)
+    solutions = numpy.array(ga_instance.solutions, dtype=float)
+    in_space = numpy.isin(solutions, [100, 200])
+    # The None value is replaced by a random value from the initial population range or the mutation range.
+    assert numpy.all(in_space | ((solutions >= -4) & (solutions <= -1)))
+    assert numpy.any(~in_space)
 
 if __name__ == "__main__":
     #### Single-objective
@@ -1603,3 +1691,14 @@ if __name__ == "__main__":
     print()
     test_nested_gene_space_nested_gene_type_adaptive_mutation_probability_multi_objective_nsga2()
     print()
+
+    #### Compiled gene space
+    print()
+    test_gene_space_table()
+    print()
+    test_gene_space_repeated_values_weighting()
+    print()
+    test_mutation_by_space_excludes_current_value()
+    print()
+    test_gene_space_global_None()
+    print()
@@ -0,0 +1,108 @@
+import pygad
+import numpy
+import itertools
+
+num_generations = 100
+sol_per_pop = 20
+num_parents_mating = 10
+
+def fitness_func(ga_instance, solution, solution_idx):
+    return [-numpy.sum(solution**2), -numpy.sum((solution - 1)**2)]
+
+def create_ga(stop_criteria=None):
+    ga_instance = pygad.GA(num_generations=num_generations,
+                           sol_per_pop=sol_per_pop,
+                           num_genes=3,
+                           num_parents_mating=num_parents_mating,
+                           fitness_func=fitness_func,
+                           parent_selection_type="nsga2",
+                           stop_criteria=stop_criteria,
+                           suppress_warnings=True,
+                           random_seed=2)
+    return ga_instance
+
+def inclusion_exclusion_hypervolume(points):
+    # The volume of the union of the boxes between the origin and the points.
+    hypervolume = 0
+    for subset_size in range(1, len(points) + 1):
+        for subset in itertools.combinations(range(len(points)), subset_size):
+            hypervolume += (-1)**(subset_size + 1) * numpy.prod(numpy.min(points[list(subset)], axis=0))
+    return hypervolume
+
+def test_hypervolume_exact():
+    ga_instance = create_ga()
+    rng = numpy.random.default_rng(1)
+    for num_objectives in [1, 2, 3]:
+        for trial in range(20):
+            num_solutions = rng.integers(1, 9)
+            # The integer fitness values have many ties and duplicate solutions.
+            if trial % 2 == 0:
+                fitness = rng.random((num_solutions, num_objectives))
+                reference_point = numpy.full(num_objectives, -0.1)
+            else:
+                fitness = rng.integers(0, 4, size=(num_solutions, num_objectives)).astype(float)
+                # Some solutions are not better than the reference point.
+                reference_point = numpy.full(num_objectives, 0.5)
+
+            points = fitness[numpy.all(fitness > reference_point, axis=1)] - reference_point
+            expected = inclusion_exclusion_hypervolume(points) if len(points) > 0 else 0
+            assert numpy.isclose(ga_instance.hypervolume(fitness, reference_point=reference_point), expected)
+
+def test_hypervolume_3d_dominated_points():
+    ga_instance = create_ga()
+    fitness = numpy.array([[2, 2, 2], [1, 1, 1], [3, 1, 1], [1, 3, 1], [1, 1, 3]], dtype=float)
+    # The second solution is dominated by the first one. Each of the last 3 solutions adds a box of volume 1.
+    assert numpy.isclose(ga_instance.hypervolume(fitness, reference_point=[0, 0, 0]), 8 + 3)
+
+def test_hypervolume_monte_carlo():
+    ga_instance = create_ga()
+    fitness = numpy.array([[1, 1, 1, 1], [2, 0.5, 0.5, 0.5]])
+    # Exact hypervolume: 1 + 2 * 0.125 - 0.125 = 1.125
+    state = numpy.random.get_state()
+    estimate = ga_instance.hypervolume(fitness, reference_point=[0, 0, 0, 0])
+    assert abs(estimate - 1.125) < 0.02
+    # The random numbers of the genetic algorithm are not used.
+    assert numpy.array_equal(numpy.random.get_state()[1], state[1])
+    # The same front has the same estimate.
+    assert ga_instance.hypervolume(fitness, reference_point=[0, 0, 0, 0]) == estimate
+
+def test_hv_saturate_stop_criteria():
+    ga_instance = create_ga(stop_criteria="hv_saturate_5_0.01")
+    ga_instance.run()
+    assert ga_instance.generations_completed < num_generations
+    assert len(ga_instance.hypervolumes) == ga_instance.generations_completed
+    best_before = max(ga_instance.hypervolumes[:-5])
+    assert max(ga_instance.hypervolumes[-5:]) - best_before <= 0.01 * abs(best_before)
+    assert ga_instance.hypervolume_reference_point.shape == (2,)
+
+    # The hypervolume is calculated once per generation even if the keyword is used multiple times.
+    ga_instance = create_ga(stop_criteria=["hv_saturate_5_0.01", "hv_saturate_10"])
+    ga_instance.run()
+    assert len(ga_instance.hypervolumes) == ga_instance.generations_completed
+
+    # The hypervolume is not calculated without the 'hv_saturate' keyword.
+    ga_instance = create_ga(stop_criteria="saturate_200")
+    ga_instance.run()
+    assert ga_instance.hypervolumes == []
+
+def test_hv_saturate_stop_criteria_invalid():
+    for stop_criteria in ["hv_saturate", "hv_saturate_5_0.1_2", "hv_5", ["hv_saturate_a"]]:
+        try:
+            create_ga(stop_criteria=stop_criteria)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"No exception raised for stop_criteria={stop_criteria}.")
+
+if __name__ == "__main__":
+    print()
+    test_hypervolume_exact()
+    print()
+    test_hypervolume_3d_dominated_points()
+    print()
+    test_hypervolume_monte_carlo()
+    print()
+    test_hv_saturate_stop_criteria()
+    print()
+    test_hv_saturate_stop_criteria_invalid()
+    print()
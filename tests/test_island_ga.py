@@ -0,0 +1,145 @@
+import pygad
+import numpy
+import cloudpickle
+
+num_generations = 20
+sol_per_pop = 10
+num_parents_mating = 4
+num_islands = 3
+
+def fitness_func(ga_instance, solution, solution_idx):
+    return -numpy.sum((solution - 1) ** 2)
+
+def fitness_func_multi(ga_instance, solution, solution_idx):
+    return [-numpy.sum((solution - 1) ** 2), -numpy.sum((solution + 1) ** 2)]
+
+def create_island_ga(fitness_function=fitness_func,
+                     parent_selection_type="sss",
+                     migration_interval=5,
+                     num_migrants=2,
+                     migration_topology="ring",
+                     on_generation=None,
+                     random_seed=1):
+    island_ga = pygad.IslandGA(num_islands=num_islands,
+                               migration_interval=migration_interval,
+                               num_migrants=num_migrants,
+                               migration_topology=migration_topology,
+                               num_generations=num_generations,
+                               sol_per_pop=sol_per_pop,
+                               num_genes=4,
+                               num_parents_mating=num_parents_mating,
+                               fitness_func=fitness_function,
+                               parent_selection_type=parent_selection_type,
+                               on_generation=on_generation,
+                               suppress_warnings=True,
+                               random_seed=random_seed)
+    return island_ga
+
+def test_island_ga_best_solution():
+    island_ga = create_island_ga()
+    island_ga.run()
+    solution, solution_fitness, island_idx = island_ga.best_solution()
+    assert solution_fitness == fitness_func(None, solution, None)
+    assert solution_fitness == max(island_ga.populations_fitness[island_idx])
+    for island_fitness in island_ga.populations_fitness:
+        assert solution_fitness >= max(island_fitness)
+
+def test_island_ga_combined_best_solutions_fitness():
+    island_ga = create_island_ga()
+    island_ga.run()
+    assert island_ga.islands_generations_completed == [num_generations] * num_islands
+    assert len(island_ga.best_solutions_fitness) == num_generations + 1
+    assert numpy.array_equal(island_ga.best_solutions_fitness,
+                             numpy.max(island_ga.islands_best_solutions_fitness, axis=0))
+
+def test_island_ga_migrations():
+    island_ga = create_island_ga()
+    island_ga.run()
+    # No migration after the last generation.
+    assert island_ga.num_migrations == num_generations // 5 - 1
+
+def test_island_ga_topologies():
+    for migration_topology in ["ring", "fully_connected", "random"]:
+        island_ga = create_island_ga(migration_topology=migration_topology)
+        island_ga.run()
+        assert island_ga.num_migrations == num_generations // 5 - 1
+        for population, population_fitness in zip(island_ga.populations, island_ga.populations_fitness):
+            assert numpy.allclose(population_fitness, [fitness_func(None, solution, None) for solution in population])
+
+def test_island_ga_multi_objective():
+    island_ga = create_island_ga(fitness_function=fitness_func_multi,
+                                 parent_selection_type="nsga2",
+                                 migration_topology="fully_connected")
+    island_ga.run()
+    assert island_ga.populations_fitness[0].shape == (sol_per_pop, 2)
+    assert len(island_ga.best_solution()[1]) == 2
+
+def test_island_ga_reproducible():
+    island_ga_1 = create_island_ga(migration_topology="random")
+    island_ga_1.run()
+    island_ga_2 = create_island_ga(migration_topology="random")
+    island_ga_2.run()
+    for population_1, population_2 in zip(island_ga_1.populations, island_ga_2.populations):
+        assert numpy.array_equal(population_1, population_2)
+
+def test_island_ga_no_random_seed():
+    # Without a seed, each island still gets its own seed. Otherwise, the processes inherit the same random state.
+    island_ga = create_island_ga(num_migrants=0,
+                                 random_seed=None)
+    assert len(set(island_ga.islands_random_seeds)) == num_islands
+    initial_populations = [pygad.GA(**cloudpickle.loads(island_ga.island_kwargs(island_idx))).initial_population for island_idx in range(num_islands)]
+    for island_idx in range(1, num_islands):
+        assert not numpy.array_equal(initial_populations[0], initial_populations[island_idx])
+
+    island_ga.run()
+    for island_idx in range(1, num_islands):
+        assert not numpy.array_equal(island_ga.populations[0], island_ga.populations[island_idx])
+
+def test_island_ga_island_stop():
+    def on_generation(ga_instance):
+        if ga_instance.island_idx == 0 and ga_instance.generations_completed == 7:
+            return "stop"
+
+    # The other islands keep migrating after the island 0 stops.
+    island_ga = create_island_ga(on_generation=on_generation)
+    island_ga.run()
+    assert island_ga.islands_generations_completed == [7] + [num_generations] * (num_islands - 1)
+    assert len(island_ga.best_solutions_fitness) == num_generations + 1
+
+def test_island_ga_invalid():
+    for kwargs in [{"num_islands": 0},
+                   {"num_islands": 2, "migration_topology": "star"},
+                   {"num_islands": 2, "num_migrants": sol_per_pop}]:
+        try:
+            pygad.IslandGA(num_generations=num_generations,
+                           sol_per_pop=sol_per_pop,
+                           num_genes=4,
+                           num_parents_mating=num_parents_mating,
+                           fitness_func=fitness_func,
+                           suppress_warnings=True,
+                           **kwargs)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"No exception raised for {kwargs}.")
+
+if __name__ == "__main__":
+    print()
+    test_island_ga_best_solution()
+    print()
+    test_island_ga_combined_best_solutions_fitness()
+    print()
+    test_island_ga_migrations()
+    print()
+    test_island_ga_topologies()
+    print()
+    test_island_ga_multi_objective()
+    print()
+    test_island_ga_reproducible()
+    print()
+    test_island_ga_no_random_seed()
+    print()
+    test_island_ga_island_stop()
+    print()
+    test_island_ga_invalid()
+    print()
@@ -0,0 +1,166 @@
+import pygad
+import numpy
+
+num_generations = 5
+
+def fitness_func(ga_instance, solution, solution_idx):
+    return [numpy.sum(solution), -numpy.sum(solution**2)]
+
+def create_ga(parent_selection_type="nsga2"):
+    ga_instance = pygad.GA(num_generations=num_generations,
+                           sol_per_pop=20,
+                           num_genes=4,
+                           num_parents_mating=10,
+                           fitness_func=fitness_func,
+                           parent_selection_type=parent_selection_type,
+                           suppress_warnings=True,
+                           random_seed=1)
+    return ga_instance
+
+def brute_force_fronts(fitness):
+    # Peel the fronts by checking the definition of dominance for each pair of solutions.
+    solutions_fronts_indices = numpy.full(len(fitness), -1)
+    remaining = list(range(len(fitness)))
+    front_index = 0
+    while remaining:
+        front = [idx1 for idx1 in remaining if not any([numpy.all(fitness[idx2] >= fitness[idx1]) and numpy.any(fitness[idx2] > fitness[idx1]) for idx2 in remaining])]
+        solutions_fronts_indices[front] = front_index
+        remaining = [idx for idx in remaining if not idx in front]
+        front_index += 1
+    return solutions_fronts_indices
+
+def test_non_dominated_fronts_algorithms():
+    ga_instance = create_ga()
+    rng = numpy.random.default_rng(1)
+    for num_objectives in [2, 3, 4]:
+        # The integer fitness values have many ties and duplicate solutions.
+        for fitness in [rng.random((60, num_objectives)),
+                        rng.integers(0, 4, size=(60, num_objectives)).astype(float)]:
+            expected = brute_force_fronts(fitness)
+            algorithms = ["auto", "matrix", "blocked", "ens"]
+            if num_objectives == 2:
+                algorithms.append("2d")
+            for algorithm in algorithms:
+                pareto_fronts, solutions_fronts_indices = ga_instance.non_dominated_fronts(fitness,
+                                                                                           algorithm=algorithm)
+                assert numpy.array_equal(solutions_fronts_indices, expected)
+                assert len(pareto_fronts) == expected.max() + 1
+                for front_index, front in enumerate(pareto_fronts):
+                    assert front.dtype.kind == "i"
+                    assert front.tolist() == numpy.flatnonzero(expected == front_index).tolist()
+
+def test_non_dominated_ranks_blocked_small_blocks():
+    ga_instance = create_ga()
+    fitness = numpy.random.default_rng(2).random((100, 3))
+    # Force the blocked sorting to compare a few solutions at a time.
+    ga_instance.dominance_max_elements = 150
+    assert numpy.array_equal(ga_instance.non_dominated_ranks_blocked(fitness),
+                             brute_force_fronts(fitness))
+
+def test_non_dominated_sorting_format():
+    ga_instance = create_ga()
+    fitness = numpy.array([[1, 5], [2, 2], [5, 1], [1, 1], [0, 0]], dtype=float)
+    pareto_fronts, solutions_fronts_indices = ga_instance.non_dominated_sorting(fitness)
+    assert solutions_fronts_indices.tolist() == [0, 0, 0, 1, 2]
+    assert [front[:, 0].tolist() for front in pareto_fronts] == [[0, 1, 2], [3], [4]]
+    # Each row has the index of the solution and its fitness.
+    assert numpy.array_equal(pareto_fronts[0][1, 1], [2, 2])
+
+    dominated_set, non_dominated_set = ga_instance.get_non_dominated_set(list(zip(range(5), fitness)))
+    assert [solution[0] for solution in non_dominated_set] == [0, 1, 2]
+    assert [solution[0] for solution in dominated_set] == [3, 4]
+
+def test_non_dominated_fronts_invalid_algorithm():
+    ga_instance = create_ga()
+    for algorithm in ["fast", "2d"]:
+        try:
+            ga_instance.non_dominated_fronts(numpy.zeros((5, 3)),
+                                             algorithm=algorithm)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"No exception raised for algorithm={algorithm}.")
+
+def test_crowding_distance():
+    ga_instance = create_ga()
+    fitness = numpy.array([[0, 4], [1, 3], [3, 1], [4, 0], [2, 2]], dtype=float)
+    pareto_fronts, _ = ga_instance.non_dominated_sorting(fitness)
+    obj_crowding_dist_list, crowding_dist_sum, crowding_dist_front_sorted_indices, crowding_dist_pop_sorted_indices = ga_instance.crowding_distance(pareto_front=pareto_fronts[0],
+                                                                                                                                                   fitness=fitness)
+    # Each objective has a range of 4. The boundary solutions have an infinite distance.
+    assert obj_crowding_dist_list.shape == (2, 5, 3)
+    assert obj_crowding_dist_list[0, :, 2].tolist() == [numpy.inf, 0.5, 0.5, numpy.inf, 0.5]
+    assert crowding_dist_sum[:, 1].tolist() == [numpy.inf, numpy.inf, 1.0, 1.0, 1.0]
+    # The solutions with equal distances keep their order in the front.
+    assert crowding_dist_front_sorted_indices.tolist() == [0, 3, 1, 2, 4]
+    assert crowding_dist_pop_sorted_indices.tolist() == [0, 3, 1, 2, 4]
+
+    # The front can also be passed as an array of the solutions indices.
+    _, _, _, pop_sorted_indices = ga_instance.crowding_distance(pareto_front=numpy.array([4, 1, 3]),
+                                                                fitness=fitness)
+    assert pop_sorted_indices.tolist() == [1, 3, 4]
+
+    # A front with 2 solutions has an infinite distance for both solutions.
+    _, crowding_dist_sum, _, pop_sorted_indices = ga_instance.crowding_distance(pareto_front=numpy.array([3, 0]),
+                                                                                fitness=fitness)
+    assert numpy.all(numpy.isinf(crowding_dist_sum[:, 1]))
+    assert sorted(pop_sorted_indices.tolist()) == [0, 3]
+
+def test_nsga2_ranking_cache():
+    ga_instance = create_ga()
+    fitness = numpy.random.default_rng(3).random((20, 2))
+    ranking = ga_instance.nsga2_ranking(fitness)
+    assert ranking.solutions_fronts_indices.tolist() == brute_force_fronts(fitness).tolist()
+    # The same fitness values reuse the cached ranking.
+    assert ga_instance.nsga2_ranking(fitness.copy()) is ranking
+    pareto_fronts, _ = ga_instance.non_dominated_sorting(fitness)
+    assert ga_instance.nsga2_ranking_cache is ranking
+    assert [front[:, 0].tolist() for front in pareto_fronts] == [front.tolist() for front in ranking.pareto_fronts]
+
+    # Sorting the front by the crowding distance gives the same order as the crowding_distance() method.
+    for front, front_sorted in zip(ranking.pareto_fronts, ranking.fronts_sorted):
+        _, _, _, pop_sorted_indices = ga_instance.crowding_distance(pareto_front=front,
+                                                                    fitness=fitness)
+        assert front_sorted.tolist() == pop_sorted_indices.tolist()
+
+    # Changing the fitness values in-place invalidates the cache.
+    fitness[0] = [2, 2]
+    new_ranking = ga_instance.nsga2_ranking(fitness)
+    assert not (new_ranking is ranking)
+    assert new_ranking.pareto_fronts[0].tolist() == [0]
+
+    # The selection operators use the cached ranking and do not change it.
+    for selection in [ga_instance.nsga2_selection,
+                      ga_instance.tournament_selection_nsga2]:
+        parents, parents_indices = selection(fitness,
+                                             num_parents=10)
+        assert ga_instance.nsga2_ranking_cache is new_ranking
+        assert numpy.array_equal(parents, ga_instance.population[parents_indices])
+        if selection == ga_instance.nsga2_selection:
+            # The only solution in the first front is selected first.
+            assert parents_indices[0] == 0
+
+def test_nsga2_run():
+    for parent_selection_type in ["nsga2", "tournament_nsga2"]:
+        ga_instance = create_ga(parent_selection_type=parent_selection_type)
+        ga_instance.run()
+        fitness = ga_instance.last_generation_fitness
+        _, solutions_fronts_indices = ga_instance.non_dominated_sorting(fitness)
+        assert numpy.array_equal(solutions_fronts_indices, brute_force_fronts(fitness))
+
+if __name__ == "__main__":
+    print()
+    test_non_dominated_fronts_algorithms()
+    print()
+    test_non_dominated_ranks_blocked_small_blocks()
+    print()
+    test_non_dominated_sorting_format()
+    print()
+    test_non_dominated_fronts_invalid_algorithm()
+    print()
+    test_crowding_distance()
+    print()
+    test_nsga2_ranking_cache()
+    print()
+    test_nsga2_run()
+    print()
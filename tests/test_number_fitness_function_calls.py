@@ -22,14 +22,18 @@ def number_calls_fitness_function(keep_elitism=1,
                                   fitness_batch_size=None):
 
     actual_num_fitness_calls = 0
+    # The genomes received by the fitness function.
+    evaluated_genomes = []
     def fitness_func_no_batch_single(ga, solution, idx):
         nonlocal actual_num_fitness_calls
         actual_num_fitness_calls = actual_num_fitness_calls + 1
+        evaluated_genomes.append(tuple(solution))
         return random.random()
 
     def fitness_func_no_batch_multi(ga_instance, solution, solution_idx):
         nonlocal actual_num_fitness_calls
         actual_num_fitness_calls = actual_num_fitness_calls + 1
+        evaluated_genomes.append(tuple(solution))
         return [random.random(), random.random()]
 
     def fitness_func_batch_single(ga_instance, solution, solution_idx):
@@ -37,6 +41,7 @@ def number_calls_fitness_function(keep_elitism=1,
         actual_num_fitness_calls = actual_num_fitness_calls + 1
         f = []
         for sol in solution:
+            evaluated_genomes.append(tuple(sol))
             f.append(random.random())
         return f
 
@@ -45,6 +50,7 @@ def number_calls_fitness_function(keep_elitism=1,
         actual_num_fitness_calls = actual_num_fitness_calls + 1
         f = []
         for sol in solution:
+            evaluated_genomes.append(tuple(sol))
             f.append([random.random(), random.random()])
         return f
 
@@ -119,6 +125,11 @@ def number_calls_fitness_function(keep_elitism=1,
             if mutation_type == "adaptive":
                 expected_num_fitness_calls += num_generations * int(numpy.ceil((sol_per_pop - keep_elitism)/fitness_batch_size))
 
+    if mutation_type == "adaptive":
+        # The adaptive mutation calculates the fitness of the offspring before mutating them. The fitness of every evaluated solution is saved into the fitness cache and reused.
+        # So, no genome is evaluated twice and the expected number of calls is an upper bound.
+        assert len(evaluated_genomes) == len(set(evaluated_genomes))
+
     print(f"Expected number of fitness function calls is {expected_num_fitness_calls}.")
     print(f"Actual number of fitness function calls is {actual_num_fitness_calls}.")
     return actual_num_fitness_calls, expected_num_fitness_calls
@@ -152,19 +163,19 @@ def test_number_calls_fitness_function_no_keep_adaptive_mutation():
                                                      keep_parents=0,
                                                      mutation_type="adaptive",
                                                      mutation_percent_genes=[10, 5])
-    assert actual == expected
+    assert actual <= expected
 
 def test_number_calls_fitness_function_default_adaptive_mutation():
     actual, expected = number_calls_fitness_function(mutation_type="adaptive",
                                                      mutation_percent_genes=[10, 5])
-    assert actual == expected
+    assert actual <= expected
 
 def test_number_calls_fitness_function_both_keep_adaptive_mutation():
     actual, expected = number_calls_fitness_function(keep_elitism=3, 
                                                      keep_parents=4,
                                                      mutation_type="adaptive",
                                                      mutation_percent_genes=[10, 5])
-    assert actual == expected
+    assert actual <= expected
 
 #### Multi Objective
 def test_number_calls_fitness_function_no_keep_multi_objective():
@@ -197,13 +208,13 @@ def test_number_calls_fitness_function_no_keep_adaptive_mutation_multi_objective
                                                      mutation_type="adaptive",
                                                      mutation_percent_genes=[10, 5],
                                                      multi_objective=True)
-    assert actual == expected
+    assert actual <= expected
 
 def test_number_calls_fitness_function_default_adaptive_mutation_multi_objective():
     actual, expected = number_calls_fitness_function(mutation_type="adaptive",
                                                      mutation_percent_genes=[10, 5],
                                                      multi_objective=True)
-    assert actual == expected
+    assert actual <= expected
 
 def test_number_calls_fitness_function_both_keep_adaptive_mutation_multi_objective():
     actual, expected = number_calls_fitness_function(keep_elitism=3, 
@@ -211,7 +222,7 @@ def test_number_calls_fitness_function_both_keep_adaptive_mutation_multi_objecti
                                                      mutation_type="adaptive",
                                                      mutation_percent_genes=[10, 5],
                                                      multi_objective=True)
-    assert actual == expected
+    assert actual <= expected
 
 #### Multi Objective NSGA-II Parent Selection
 def test_number_calls_fitness_function_no_keep_multi_objective_nsga2():
@@ -244,13 +255,13 @@ def test_number_calls_fitness_function_no_keep_adaptive_mutation_multi_objective
                                                      mutation_type="adaptive",
                                                      mutation_percent_genes=[10, 5],
                                                      multi_objective=True)
-    assert actual == expected
+    assert actual <= expected
 
 def test_number_calls_fitness_function_default_adaptive_mutation_multi_objective_nsga2():
     actual, expected = number_calls_fitness_function(mutation_type="adaptive",
                                                      mutation_percent_genes=[10, 5],
                                                      multi_objective=True)
-    assert actual == expected
+    assert actual <= expected
 
 def test_number_calls_fitness_function_both_keep_adaptive_mutation_multi_objective_nsga2():
     actual, expected = number_calls_fitness_function(keep_elitism=3, 
@@ -258,7 +269,7 @@ def test_number_calls_fitness_function_both_keep_adaptive_mutation_multi_objecti
                                                      mutation_type="adaptive",
                                                      mutation_percent_genes=[10, 5],
                                                      multi_objective=True)
-    assert actual == expected
+    assert actual <= expected
 
 
 ######## Batch Fitness Calculation
@@ -303,13 +314,13 @@ def test_number_calls_fitness_function_no_keep_adaptive_mutation_batch_4():
                                                      mutation_type="adaptive",
                                                      mutation_percent_genes=[10, 5],
                                                      fitness_batch_size=4)
-    assert actual == expected
+    assert actual <= expected
 
 def test_number_calls_fitness_function_default_adaptive_mutation_batch_4():
     actual, expected = number_calls_fitness_function(mutation_type="adaptive",
                                                      mutation_percent_genes=[10, 5],
                                                      fitness_batch_size=4)
-    assert actual == expected
+    assert actual <= expected
 
 def test_number_calls_fitness_function_both_keep_adaptive_mutation_batch_4():
     actual, expected = number_calls_fitness_function(keep_elitism=3, 
@@ -317,7 +328,7 @@ def test_number_calls_fitness_function_both_keep_adaptive_mutation_batch_4():
                                                      mutation_type="adaptive",
                                                      mutation_percent_genes=[10, 5],
                                                      fitness_batch_size=4)
-    assert actual == expected
+    assert actual <= expected
 
 #### Multi Objective
 def test_number_calls_fitness_function_no_keep_multi_objective_batch_1():
@@ -376,14 +387,14 @@ def test_number_calls_fitness_function_no_keep_adaptive_mutation_multi_objective
                                                      mutation_percent_genes=[10, 5],
                                                      multi_objective=True,
                                                      fitness_batch_size=4)
-    assert actual == expected
+    assert actual <= expected
 
 def test_number_calls_fitness_function_default_adaptive_mutation_multi_objective_batch_4():
     actual, expected = number_calls_fitness_function(mutation_type="adaptive",
                                                      mutation_percent_genes=[10, 5],
                                                      multi_objective=True,
                                                      fitness_batch_size=4)
-    assert actual == expected
+    assert actual <= expected
 
 def test_number_calls_fitness_function_both_keep_adaptive_mutation_multi_objective_batch_4():
     actual, expected = number_calls_fitness_function(keep_elitism=3, 
@@ -392,7 +403,7 @@ def test_number_calls_fitness_function_both_keep_adaptive_mutation_multi_objecti
                                                      mutation_percent_genes=[10, 5],
                                                      multi_objective=True,
                                                      fitness_batch_size=4)
-    assert actual == expected
+    assert actual <= expected
 
 #### Multi Objective NSGA-II Parent Selection
 def test_number_calls_fitness_function_no_keep_multi_objective_nsga2_batch_1():
@@ -451,14 +462,14 @@ def test_number_calls_fitness_function_no_keep_adaptive_mutation_multi_objective
                                                      mutation_percent_genes=[10, 5],
                                                      multi_objective=True,
                                                      fitness_batch_size=4)
-    assert actual == expected
+    assert actual <= expected
 
 def test_number_calls_fitness_function_default_adaptive_mutation_multi_objective_nsga2_batch_4():
     actual, expected = number_calls_fitness_function(mutation_type="adaptive",
                                                      mutation_percent_genes=[10, 5],
                                                      multi_objective=True,
                                                      fitness_batch_size=4)
-    assert actual == expected
+    assert actual <= expected
 
 def test_number_calls_fitness_function_both_keep_adaptive_mutation_multi_objective_nsga2_batch_4():
     actual, expected = number_calls_fitness_function(keep_elitism=3, 
@@ -467,7 +478,7 @@ def test_number_calls_fitness_function_both_keep_adaptive_mutation_multi_objecti
                                                      mutation_percent_genes=[10, 5],
                                                      multi_objective=True,
                                                      fitness_batch_size=4)
-    assert actual == expected
+    assert actual <= expected
 
 
 if __name__ == "__main__":
@@ -0,0 +1,360 @@
+import pygad
+import numpy
+import concurrent.futures
+import threading
+import os
+import cloudpickle
+import gc
+from multiprocessing import shared_memory
+
+num_generations = 10
+sol_per_pop = 10
+num_parents_mating = 5
+
+#### Define the fitness functions in the top-level of the module so that they are picklable and usable in the process-based parallel processing works.
+#### If the functions are defined inside a class/method/function, they are not picklable and this error is raised: AttributeError: Can't pickle local object
+#### Process-based parallel processing must have the used functions picklable.
+def fitness_func(ga_instance, solution, solution_idx):
+    return numpy.sum(solution)
+
+def fitness_func_thread_name(ga_instance, solution, solution_idx):
+    assert threading.current_thread().name.startswith("pygad_user")
+    return numpy.sum(solution)
+
+def fitness_func_worker_context(ga_instance, solution, solution_idx):
+    assert isinstance(ga_instance, pygad.helper.parallel.WorkerContext)
+    assert ga_instance.num_genes == 6
+    assert not hasattr(ga_instance, "population")
+    assert not hasattr(ga_instance, "solutions")
+    return numpy.sum(solution)
+
+def fitness_func_worker_attributes(ga_instance, solution, solution_idx):
+    assert ga_instance.num_genes == 6
+    assert not hasattr(ga_instance, "sol_per_pop")
+    return numpy.sum(solution)
+
+def fitness_func_multi(ga_instance, solution, solution_idx):
+    return [numpy.sum(solution), -numpy.sum(solution)]
+
+def fitness_func_batch(ga_instance, solutions, solutions_indices):
+    return numpy.sum(solutions, axis=1)
+
+def fitness_func_int(ga_instance, solution, solution_idx):
+    return int(numpy.round(numpy.sum(solution) * 1000))
+
+def fitness_func_int_multi(ga_instance, solution, solution_idx):
+    return [int(numpy.round(numpy.sum(solution) * 1000)), -int(numpy.round(numpy.sum(solution) * 1000))]
+
+def shared_memory_ga(fitness_function=fitness_func,
+                     num_genes=6,
+                     fitness_batch_size=None,
+                     mutation_type="random",
+                     num_generations=num_generations):
+    ga_instance = pygad.GA(num_generations=num_generations,
+                           sol_per_pop=sol_per_pop,
+                           num_genes=num_genes,
+                           num_parents_mating=num_parents_mating,
+                           fitness_func=fitness_function,
+                           fitness_batch_size=fitness_batch_size,
+                           mutation_type=mutation_type,
+                           mutation_num_genes=[3, 1] if mutation_type == "adaptive" else None,
+                           parent_selection_type="nsga2" if fitness_function is fitness_func_multi else "sss",
+                           parallel_processing=["process", 2],
+                           shared_memory=True,
+                           keep_elitism=0,
+                           keep_parents=0,
+                           suppress_warnings=True)
+    ga_instance.run()
+    ga_instance.close()
+    return ga_instance
+
+def create_ga(parallel_processing,
+              fitness_function=fitness_func,
+              mutation_type="random",
+              save_solutions=False,
+              worker_attributes=None):
+    ga_instance = pygad.GA(num_generations=num_generations,
+                           sol_per_pop=sol_per_pop,
+                           num_genes=6,
+                           num_parents_mating=num_parents_mating,
+                           fitness_func=fitness_function,
+                           mutation_type=mutation_type,
+                           mutation_num_genes=[3, 1] if mutation_type == "adaptive" else None,
+                           parallel_processing=parallel_processing,
+                           save_solutions=save_solutions,
+                           worker_attributes=worker_attributes,
+                           suppress_warnings=True)
+    return ga_instance
+
+def test_executor_reused_across_generations():
+    executors = []
+    def on_generation(ga_instance):
+        executors.append(ga_instance.executor)
+
+    ga_instance = create_ga(parallel_processing=["thread", 2])
+    ga_instance.on_generation = on_generation
+    assert ga_instance.executor is None
+    ga_instance.run()
+    ga_instance.run()
+
+    assert len(executors) == 2 * num_generations
+    assert all([executor is executors[0] for executor in executors])
+    assert isinstance(executors[0], concurrent.futures.ThreadPoolExecutor)
+
+    ga_instance.close()
+    assert ga_instance.executor is None
+
+def test_executor_adaptive_mutation():
+    ga_instance = create_ga(parallel_processing=["thread", 2],
+                            mutation_type="adaptive")
+    ga_instance.run()
+    executor = ga_instance.executor
+    assert not (executor is None)
+    assert ga_instance.get_executor() is executor
+    ga_instance.close()
+
+def test_executor_process():
+    ga_instance = create_ga(parallel_processing=["process", 2])
+    ga_instance.run()
+    assert isinstance(ga_instance.executor, concurrent.futures.ProcessPoolExecutor)
+    ga_instance.close()
+    assert ga_instance.executor is None
+
+def test_executor_context_manager():
+    with create_ga(parallel_processing=["thread", 2]) as ga_instance:
+        ga_instance.run()
+        executor = ga_instance.executor
+    assert ga_instance.executor is None
+    try:
+        executor.submit(sum, [1, 2])
+    except RuntimeError:
+        # The executor is shut down.
+        pass
+    else:
+        raise AssertionError("The executor is not shut down after exiting the context manager.")
+
+def test_executor_run_after_close():
+    ga_instance = create_ga(parallel_processing=["thread", 2])
+    ga_instance.run()
+    first_executor = ga_instance.executor
+    ga_instance.close()
+    ga_instance.run()
+    assert not (ga_instance.executor is None)
+    assert not (ga_instance.executor is first_executor)
+    ga_instance.close()
+
+def test_user_executor():
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix="pygad_user") as executor:
+        ga_instance = create_ga(parallel_processing=executor,
+                                fitness_function=fitness_func_thread_name)
+        assert ga_instance.parallel_processing == ["thread", None]
+        ga_instance.run()
+        assert ga_instance.executor is executor
+        ga_instance.close()
+        # The executor passed by the user is not shut down by PyGAD.
+        assert ga_instance.executor is executor
+        assert executor.submit(sum, [1, 2]).result() == 3
+
+def test_save_load_with_executor():
+    filename = "test_save_load_with_executor"
+    ga_instance = create_ga(parallel_processing=["thread", 2])
+    ga_instance.run()
+    ga_instance.save(filename)
+    ga_instance.close()
+
+    loaded_ga_instance = pygad.load(filename)
+    os.remove(filename + ".pkl")
+    assert loaded_ga_instance.executor is None
+    loaded_ga_instance.run()
+    assert not (loaded_ga_instance.executor is None)
+    loaded_ga_instance.close()
+
+def test_process_worker_context():
+    ga_instance = create_ga(parallel_processing=["process", 2],
+                            fitness_function=fitness_func_worker_context)
+    ga_instance.run()
+    ga_instance.close()
+
+def test_process_worker_attributes():
+    ga_instance = create_ga(parallel_processing=["process", 2],
+                            fitness_function=fitness_func_worker_attributes,
+                            worker_attributes=["num_genes"])
+    ga_instance.run()
+    ga_instance.close()
+
+def test_process_local_fitness_function():
+    # The fitness function does not have to be defined at the top level of a module.
+    def local_fitness_func(ga_instance, solution, solution_idx):
+        return numpy.sum(solution)
+
+    ga_instance = create_ga(parallel_processing=["process", 2],
+                            fitness_function=local_fitness_func)
+    ga_instance.run()
+    ga_instance.close()
+
+def test_worker_context_read_only():
+    ga_instance = create_ga(parallel_processing=["process", 2])
+    context = ga_instance.get_worker_context()
+    try:
+        context.num_genes = 10
+    except AttributeError:
+        pass
+    else:
+        raise AssertionError("The worker context is not read-only.")
+
+def test_ipc_stats():
+    ga_instance = create_ga(parallel_processing=["process", 2],
+                            save_solutions=True)
+    ga_instance.run()
+    ga_instance.close()
+
+    assert ga_instance.ipc_stats["context_bytes"] > 0
+    assert ga_instance.ipc_stats["num_tasks"] > 0
+    assert ga_instance.ipc_stats["bytes_received"] > 0
+    # The tasks only carry the solutions and their indices regardless of the number of saved solutions.
+    task_bytes = ga_instance.ipc_stats["bytes_sent"] / ga_instance.ipc_stats["num_tasks"]
+    assert task_bytes < 1000
+    assert task_bytes < len(cloudpickle.dumps(ga_instance)) / 10
+
+def test_shared_memory_single_objective():
+    ga_instance = shared_memory_ga()
+    assert numpy.allclose(ga_instance.last_generation_fitness, numpy.sum(ga_instance.population, axis=1))
+    assert ga_instance.shared_memory_blocks == {}
+
+def test_shared_memory_batch():
+    ga_instance = shared_memory_ga(fitness_function=fitness_func_batch,
+                                   fitness_batch_size=3)
+    assert numpy.allclose(ga_instance.last_generation_fitness, numpy.sum(ga_instance.population, axis=1))
+
+def test_shared_memory_multi_objective():
+    ga_instance = shared_memory_ga(fitness_function=fitness_func_multi)
+    assert ga_instance.shared_memory_num_objectives == 2
+    expected_fitness = numpy.array([fitness_func_multi(ga_instance, solution, None) for solution in ga_instance.population])
+    assert numpy.allclose(ga_instance.last_generation_fitness, expected_fitness)
+
+def test_shared_memory_adaptive_mutation():
+    ga_instance = shared_memory_ga(mutation_type="adaptive")
+    assert numpy.allclose(ga_instance.last_generation_fitness, numpy.sum(ga_instance.population, axis=1))
+
+def test_shared_memory_large_genome():
+    ga_instance = shared_memory_ga(num_genes=20000,
+                                   num_generations=2)
+    assert numpy.allclose(ga_instance.last_generation_fitness, numpy.sum(ga_instance.population, axis=1))
+    # The tasks only carry the range of rows, not the genes.
+    assert ga_instance.ipc_stats["bytes_sent"] / ga_instance.ipc_stats["num_tasks"] < 1000
+
+def test_shared_memory_subset_rows():
+    # Only the rows whose fitness is not known are copied into the shared memory block. The kept elitism is not evaluated again.
+    for fitness_function, fitness_batch_size in [(fitness_func, None),
+                                                 (fitness_func_batch, 3)]:
+        ga_instance = pygad.GA(num_generations=num_generations,
+                               sol_per_pop=sol_per_pop,
+                               num_genes=6,
+                               num_parents_mating=num_parents_mating,
+                               fitness_func=fitness_function,
+                               fitness_batch_size=fitness_batch_size,
+                               parallel_processing=["process", 2],
+                               shared_memory=True,
+                               keep_elitism=3,
+                               suppress_warnings=True)
+        ga_instance.run()
+        ga_instance.close()
+        assert numpy.allclose(ga_instance.last_generation_fitness, numpy.sum(ga_instance.population, axis=1))
+
+def test_shared_memory_integer_fitness():
+    # The integer fitness values keep their data type as if they were pickled.
+    ga_instance = shared_memory_ga(fitness_function=fitness_func_int)
+    assert ga_instance.last_generation_fitness.dtype.kind == "i"
+    expected_fitness = [fitness_func_int(ga_instance, solution, None) for solution in ga_instance.population]
+    assert ga_instance.last_generation_fitness.tolist() == expected_fitness
+
+    ga_instance = shared_memory_ga(fitness_function=fitness_func_int_multi)
+    assert ga_instance.last_generation_fitness.dtype.kind == "i"
+    expected_fitness = [fitness_func_int_multi(ga_instance, solution, None) for solution in ga_instance.population]
+    assert ga_instance.last_generation_fitness.tolist() == expected_fitness
+
+def test_shared_memory_released_without_close():
+    ga_instance = pygad.GA(num_generations=2,
+                           sol_per_pop=sol_per_pop,
+                           num_genes=6,
+                           num_parents_mating=num_parents_mating,
+                           fitness_func=fitness_func,
+                           parallel_processing=["process", 2],
+                           shared_memory=True,
+                           suppress_warnings=True)
+    ga_instance.run()
+    names = [block.name for block in ga_instance.shared_memory_blocks.values()]
+    assert len(names) == 2
+    executor = ga_instance.executor
+
+    # The blocks are released by their finalizers once the instance is garbage collected.
+    del ga_instance
+    gc.collect()
+    executor.shutdown(wait=True)
+    for name in names:
+        try:
+            shared_memory.SharedMemory(name=name)
+        except FileNotFoundError:
+            pass
+        else:
+            raise AssertionError(f"The shared memory block {name} is not released.")
+
+def test_shared_memory_invalid():
+    try:
+        pygad.GA(num_generations=1,
+                 sol_per_pop=sol_per_pop,
+                 num_genes=6,
+                 num_parents_mating=num_parents_mating,
+                 fitness_func=fitness_func,
+                 parallel_processing=["thread", 2],
+                 shared_memory=True,
+                 suppress_warnings=True)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("No exception raised when shared_memory=True is used with threads.")
+
+if __name__ == "__main__":
+    print()
+    test_executor_reused_across_generations()
+    print()
+    test_executor_adaptive_mutation()
+    print()
+    test_executor_process()
+    print()
+    test_executor_context_manager()
+    print()
+    test_executor_run_after_close()
+    print()
+    test_user_executor()
+    print()
+    test_save_load_with_executor()
+    print()
+    test_process_worker_context()
+    print()
+    test_process_worker_attributes()
+    print()
+    test_process_local_fitness_function()
+    print()
+    test_worker_context_read_only()
+    print()
+    test_ipc_stats()
+    print()
+    test_shared_memory_single_objective()
+    print()
+    test_shared_memory_batch()
+    print()
+    test_shared_memory_multi_objective()
+    print()
+    test_shared_memory_adaptive_mutation()
+    print()
+    test_shared_memory_large_genome()
+    print()
+    test_shared_memory_subset_rows()
+    print()
+    test_shared_memory_integer_fitness()
+    print()
+    test_shared_memory_released_without_close()
+    print()
+    test_shared_memory_invalid()
+    print()
@@ -0,0 +1,125 @@
+import pygad
+import numpy
+
+num_generations = 5
+sol_per_pop = 20
+num_parents_mating = 10
+
+def fitness_func(ga_instance, solution, solution_idx):
+    return numpy.sum(solution)
+
+def create_ga(parent_selection_type="sss",
+              gene_type=float,
+              sol_per_pop=sol_per_pop,
+              num_parents_mating=num_parents_mating):
+    ga_instance = pygad.GA(num_generations=num_generations,
+                           sol_per_pop=sol_per_pop,
+                           num_genes=4,
+                           num_parents_mating=num_parents_mating,
+                           fitness_func=fitness_func,
+                           parent_selection_type=parent_selection_type,
+                           gene_type=gene_type,
+                           suppress_warnings=True,
+                           random_seed=1)
+    return ga_instance
+
+def test_wheel_selection_indices():
+    ga_instance = create_ga()
+    probs = numpy.array([0.5, 0.0, 0.2, 0.3])
+    # The wheel is built in ascending order of the probabilities: [0.0, 0.2, 0.3, 0.5].
+    probs_start, probs_end, _ = ga_instance.wheel_cumulative_probs(probs=probs,
+                                                                   num_parents=2)
+    assert numpy.allclose(probs_start, [0.5, 0.0, 0.0, 0.2])
+    assert numpy.allclose(probs_end, [1.0, 0.0, 0.2, 0.5])
+
+    indices = ga_instance.wheel_selection_indices(probs=probs,
+                                                  pointers=numpy.array([0.0, 0.1, 0.2, 0.49, 0.5, 0.99, 1.0]))
+    # The solution with zero probability is never selected. A pointer at the end of the wheel selects the last solution.
+    assert indices.tolist() == [2, 2, 3, 3, 0, 0, 0]
+
+def test_wheel_selection_distribution():
+    ga_instance = create_ga()
+    probs = numpy.array([0.1, 0.6, 0.0, 0.3])
+    indices = ga_instance.wheel_selection_indices(probs=probs,
+                                                  pointers=numpy.random.rand(100000))
+    frequency = numpy.bincount(indices, minlength=4) / 100000
+    assert numpy.allclose(frequency, probs, atol=0.01)
+
+def test_parents_selection():
+    for gene_type in [float, [int, [float, 2], int, [float, 2]]]:
+        for parent_selection_type in ["sss", "rws", "sus", "rank", "random", "tournament"]:
+            ga_instance = create_ga(parent_selection_type=parent_selection_type,
+                                    gene_type=gene_type)
+            fitness = ga_instance.cal_pop_fitness()
+            parents, parents_indices = ga_instance.select_parents(fitness,
+                                                                  num_parents=num_parents_mating)
+            assert parents.shape == (num_parents_mating, 4)
+            assert len(parents_indices) == num_parents_mating
+            assert numpy.array_equal(parents, ga_instance.population[parents_indices])
+            if ga_instance.gene_type_single:
+                assert parents.dtype == gene_type
+            else:
+                assert parents.dtype == object
+
+            # The parents are copies of the solutions.
+            parents[0, 0] = 1000
+            assert ga_instance.population[parents_indices[0], 0] != 1000
+
+def test_stochastic_universal_selection_spacing():
+    ga_instance = create_ga(sol_per_pop=4,
+                            num_parents_mating=4)
+    fitness = numpy.array([1.0, 1.0, 1.0, 1.0])
+    # With equal fitness values and a pointer per solution, each solution is selected once.
+    _, parents_indices = ga_instance.stochastic_universal_selection(fitness,
+                                                                    num_parents=4)
+    assert sorted(parents_indices.tolist()) == [0, 1, 2, 3]
+
+def test_tournament_selection():
+    ga_instance = create_ga(parent_selection_type="tournament")
+    fitness = numpy.random.random(sol_per_pop)
+    numpy.random.seed(5)
+    _, parents_indices = ga_instance.tournament_selection(fitness,
+                                                          num_parents=num_parents_mating)
+    # The same tournaments are drawn again to find the best solution in each tournament.
+    numpy.random.seed(5)
+    rand_indices = numpy.random.randint(low=0, high=sol_per_pop, size=(num_parents_mating, ga_instance.K_tournament))
+    assert parents_indices.tolist() == [tournament[numpy.argmax(fitness[tournament])] for tournament in rand_indices]
+
+    # Multi-objective: The solutions in the first pareto front win against the other solutions.
+    fitness = numpy.array([[1, 1], [3, 3], [2, 2], [3, 3]] * (sol_per_pop // 4), dtype=float)
+    numpy.random.seed(5)
+    _, parents_indices = ga_instance.tournament_selection(fitness,
+                                                          num_parents=num_parents_mating)
+    numpy.random.seed(5)
+    rand_indices = numpy.random.randint(low=0, high=sol_per_pop, size=(num_parents_mating, ga_instance.K_tournament))
+    for tournament, parent_idx in zip(rand_indices, parents_indices):
+        assert parent_idx in tournament
+        assert fitness[parent_idx, 0] == numpy.max(fitness[tournament, 0])
+
+def test_large_population_selection():
+    ga_instance = create_ga(sol_per_pop=20000,
+                            num_parents_mating=10000)
+    fitness = numpy.random.random(20000)
+    for selection in [ga_instance.roulette_wheel_selection,
+                      ga_instance.stochastic_universal_selection,
+                      ga_instance.rank_selection,
+                      ga_instance.tournament_selection]:
+        parents, parents_indices = selection(fitness,
+                                             num_parents=10000)
+        assert parents.shape == (10000, 4)
+        assert numpy.all((parents_indices >= 0) & (parents_indices < 20000))
+
+if __name__ == "__main__":
+    print()
+    test_wheel_selection_indices()
+    print()
+    test_wheel_selection_distribution()
+    print()
+    test_parents_selection()
+    print()
+    test_stochastic_universal_selection_spacing()
+    print()
+    test_tournament_selection()
+    print()
+    test_large_population_selection()
+    print()
@@ -0,0 +1,182 @@
+import pygad
+import numpy
+import os
+
+num_generations = 10
+sol_per_pop = 20
+num_parents_mating = 10
+
+def fitness_func(ga_instance, solution, solution_idx):
+    return [numpy.sum(solution), -numpy.sum(solution**2)]
+
+def fitness_func_3_objectives(ga_instance, solution, solution_idx):
+    return [solution[0], solution[1], -solution[0] - solution[1]]
+
+def create_ga(fitness_function=fitness_func,
+              pareto_archive_size=30,
+              pareto_archive_truncation="crowding"):
+    ga_instance = pygad.GA(num_generations=num_generations,
+                           sol_per_pop=sol_per_pop,
+                           num_genes=3,
+                           num_parents_mating=num_parents_mating,
+                           fitness_func=fitness_function,
+                           parent_selection_type="nsga2",
+                           pareto_archive_size=pareto_archive_size,
+                           pareto_archive_truncation=pareto_archive_truncation,
+                           save_solutions=True,
+                           suppress_warnings=True,
+                           random_seed=1)
+    return ga_instance
+
+def brute_force_non_dominated(fitness):
+    # The indices of the solutions not dominated by any other solution. Out of the solutions with equal fitness, the first one is kept.
+    non_dominated = []
+    for idx1 in range(len(fitness)):
+        dominated = False
+        for idx2 in range(len(fitness)):
+            if idx2 != idx1 and numpy.all(fitness[idx2] >= fitness[idx1]) and (numpy.any(fitness[idx2] > fitness[idx1]) or idx2 < idx1):
+                dominated = True
+                break
+        if not dominated:
+            non_dominated.append(idx1)
+    return non_dominated
+
+def test_pareto_archive_non_dominated():
+    rng = numpy.random.default_rng(1)
+    for num_objectives in [1, 2, 3]:
+        # The integer fitness values have many ties and duplicate solutions.
+        for integer_fitness in [False, True]:
+            archive = pygad.helper.pareto_archive.ParetoArchive()
+            all_fitness = []
+            for batch_idx in range(4):
+                if integer_fitness:
+                    fitness = rng.integers(0, 4, size=(15, num_objectives)).astype(float)
+                else:
+                    fitness = rng.random((15, num_objectives))
+                # Each solution holds its index to know which solutions are archived.
+                solutions = numpy.arange(batch_idx * 15, (batch_idx + 1) * 15).reshape(-1, 1)
+                archive.add(solutions, fitness)
+                all_fitness.append(fitness)
+
+            all_fitness = numpy.concatenate(all_fitness)
+            assert sorted(archive.solutions[:, 0].tolist()) == brute_force_non_dominated(all_fitness)
+            assert numpy.array_equal(archive.fitness, all_fitness[archive.solutions[:, 0]])
+            if num_objectives == 2:
+                # The solutions are sorted by the first objective in descending order.
+                assert numpy.all(numpy.diff(archive.fitness[:, 0]) < 0)
+
+def test_pareto_archive_dominance_blocks():
+    # The archive reuses the dominance checks of the NSGA2 class. A small 'dominance_max_elements' compares the solutions in many blocks.
+    rng = numpy.random.default_rng(2)
+    archive = pygad.helper.pareto_archive.ParetoArchive()
+    archive.dominance_max_elements = 7
+    fitness = rng.integers(0, 5, size=(60, 3)).astype(float)
+    archive.add(numpy.arange(30).reshape(-1, 1), fitness[:30])
+    archive.add(numpy.arange(30, 60).reshape(-1, 1), fitness[30:])
+    assert sorted(archive.solutions[:, 0].tolist()) == brute_force_non_dominated(fitness)
+
+def test_pareto_archive_equal_fitness():
+    archive = pygad.helper.pareto_archive.ParetoArchive()
+    assert archive.add([[1, 1], [2, 2]], [[1, 2], [2, 1]]) == 2
+    # A solution with the same fitness as an archived solution is not inserted.
+    assert archive.add([[3, 3]], [[1, 2]]) == 0
+    assert archive.solutions.tolist() == [[2, 2], [1, 1]]
+    # A solution dominating both archived solutions replaces them.
+    assert archive.add([[4, 4]], [[2, 2]]) == 1
+    assert archive.solutions.tolist() == [[4, 4]]
+    assert archive.num_inserted == 3
+
+def test_pareto_archive_truncation():
+    # The solutions are on a line. So, the solutions at the ends and the evenly spread solutions are kept.
+    first_objective = numpy.array([0, 1, 1.5, 2, 4])
+    fitness = numpy.column_stack((first_objective, 4 - first_objective))
+    for truncation in ["crowding", "hypervolume"]:
+        archive = pygad.helper.pareto_archive.ParetoArchive(max_size=3,
+                                                            truncation=truncation)
+        archive.add(first_objective.reshape(-1, 1), fitness)
+        assert len(archive) == 3
+        assert archive.num_truncated == 2
+        assert sorted(archive.solutions[:, 0].tolist()) == [0, 2, 4]
+
+    # The hypervolume contribution of each solution in a sorted 2-objective front.
+    contributions = pygad.helper.pareto_archive.ParetoArchive.hypervolume_contributions_2d(numpy.array([[3, 0], [2, 2], [1, 3], [0, 4]], dtype=float))
+    assert contributions.tolist() == [numpy.inf, 2, 1, numpy.inf]
+
+def test_pareto_archive_run():
+    for fitness_function in [fitness_func, fitness_func_3_objectives]:
+        for pareto_archive_size in [5, 1000]:
+            ga_instance = create_ga(fitness_function=fitness_function,
+                                    pareto_archive_size=pareto_archive_size)
+            ga_instance.run()
+            archive = ga_instance.pareto_archive
+            assert 0 < len(archive) <= pareto_archive_size
+
+            # The archived solutions do not dominate each other.
+            assert len(brute_force_non_dominated(archive.fitness)) == len(archive)
+            for solution, fitness in zip(archive.solutions, archive.fitness):
+                assert numpy.allclose(fitness_function(ga_instance, solution, None), fitness)
+
+            if pareto_archive_size == 1000:
+                # Without truncation, no explored solution dominates an archived solution and the archive has all the non-dominated solutions explored.
+                solutions_fitness = numpy.array(ga_instance.solutions_fitness)
+                for fitness in archive.fitness:
+                    assert not numpy.any(numpy.all(solutions_fitness >= fitness, axis=1) & numpy.any(solutions_fitness > fitness, axis=1))
+                assert len(archive) == len(brute_force_non_dominated(solutions_fitness))
+
+def test_pareto_archive_steady_state():
+    ga_instance = create_ga()
+    ga_instance.run_steady_state()
+    assert len(ga_instance.pareto_archive) > 0
+    assert ga_instance.pareto_archive.num_inserted >= len(ga_instance.pareto_archive)
+
+def test_pareto_archive_save_load():
+    filename = "test_pareto_archive_save_load"
+    ga_instance = create_ga()
+    ga_instance.run()
+    ga_instance.save(filename)
+
+    loaded_ga_instance = pygad.load(filename)
+    os.remove(filename + ".pkl")
+    assert numpy.array_equal(loaded_ga_instance.pareto_archive.solutions, ga_instance.pareto_archive.solutions)
+    assert numpy.array_equal(loaded_ga_instance.pareto_archive.fitness, ga_instance.pareto_archive.fitness)
+    # The archive keeps growing when the loaded instance continues the evolution.
+    num_inserted = loaded_ga_instance.pareto_archive.num_inserted
+    loaded_ga_instance.run()
+    assert loaded_ga_instance.pareto_archive.num_inserted >= num_inserted
+
+def test_pareto_archive_disabled():
+    ga_instance = create_ga(pareto_archive_size=None)
+    ga_instance.run()
+    assert ga_instance.pareto_archive is None
+
+def test_pareto_archive_invalid():
+    for kwargs, error in [({"pareto_archive_size": 0}, ValueError),
+                          ({"pareto_archive_size": 2.5}, TypeError),
+                          ({"pareto_archive_truncation": "random"}, ValueError)]:
+        try:
+            create_ga(**kwargs)
+        except error:
+            pass
+        else:
+            raise AssertionError(f"No exception raised for {kwargs}.")
+
+if __name__ == "__main__":
+    print()
+    test_pareto_archive_non_dominated()
+    print()
+    test_pareto_archive_dominance_blocks()
+    print()
+    test_pareto_archive_equal_fitness()
+    print()
+    test_pareto_archive_truncation()
+    print()
+    test_pareto_archive_run()
+    print()
+    test_pareto_archive_steady_state()
+    print()
+    test_pareto_archive_save_load()
+    print()
+    test_pareto_archive_disabled()
+    print()
+    test_pareto_archive_invalid()
+    print()
@@ -0,0 +1,145 @@
+import pygad
+import numpy
+
+num_generations = 10
+sol_per_pop = 10
+num_parents_mating = 4
+
+def fitness_func(ga_instance, solution, solution_idx):
+    return numpy.sum(solution)
+
+def fitness_func_batch(ga_instance, solutions, solutions_indices):
+    return numpy.sum(solutions, axis=1)
+
+def create_ga(fitness_function=fitness_func,
+              fitness_batch_size=None,
+              collect_perf_stats=True,
+              on_perf=None,
+              on_generation=None,
+              fitness_cache_size=None,
+              gene_space=None,
+              allow_duplicate_genes=True):
+    ga_instance = pygad.GA(num_generations=num_generations,
+                           sol_per_pop=sol_per_pop,
+                           num_genes=4,
+                           num_parents_mating=num_parents_mating,
+                           fitness_func=fitness_function,
+                           fitness_batch_size=fitness_batch_size,
+                           collect_perf_stats=collect_perf_stats,
+                           on_perf=on_perf,
+                           on_generation=on_generation,
+                           fitness_cache_size=fitness_cache_size,
+                           gene_space=gene_space,
+                           gene_type=int if gene_space is not None else float,
+                           allow_duplicate_genes=allow_duplicate_genes,
+                           suppress_warnings=True,
+                           random_seed=1)
+    return ga_instance
+
+def test_perf_stats_rows():
+    ga_instance = create_ga()
+    ga_instance.run()
+    perf_stats = ga_instance.perf_stats
+    assert perf_stats.dtype == pygad.helper.perf.PERF_STATS_DTYPE
+    # A row for the initial population and a row for each generation.
+    assert numpy.array_equal(perf_stats["generation"], numpy.arange(num_generations + 1))
+    phases_ns = sum([perf_stats[f"{phase}_ns"] for phase in pygad.helper.perf.PERF_PHASES])
+    assert numpy.all(phases_ns <= perf_stats["total_ns"])
+    assert numpy.all(perf_stats["fitness_ns"] > 0)
+    assert numpy.all(perf_stats["evaluations_per_second"] > 0)
+    assert perf_stats["selection_ns"][0] == 0
+    assert numpy.all(perf_stats["selection_ns"][1:] > 0)
+
+    # The rows are extended with each call to the run() method.
+    ga_instance.run()
+    assert len(ga_instance.perf_stats) == 2 * (num_generations + 1)
+
+def test_perf_stats_evaluations():
+    ga_instance = create_ga()
+    ga_instance.run()
+    # The fitness of the elitism (keep_elitism=1) is reused.
+    assert ga_instance.perf_stats["num_evaluations"][0] == sol_per_pop
+    assert numpy.all(ga_instance.perf_stats["num_evaluations"][1:] == sol_per_pop - 1)
+    assert numpy.array_equal(ga_instance.perf_stats["num_fitness_calls"], ga_instance.perf_stats["num_evaluations"])
+
+    for fitness_batch_size, expected_calls in [(4, [3] + [3] * num_generations),
+                                               ("population", [1] * (num_generations + 1))]:
+        ga_instance = create_ga(fitness_function=fitness_func_batch,
+                                fitness_batch_size=fitness_batch_size)
+        ga_instance.run()
+        assert list(ga_instance.perf_stats["num_fitness_calls"]) == expected_calls
+
+def test_perf_stats_cache_hits():
+    # 3**4=81 possible solutions.
+    ga_instance = create_ga(fitness_cache_size=100,
+                            gene_space=[0, 1, 2])
+    ga_instance.run()
+    perf_stats = ga_instance.perf_stats
+    assert perf_stats["cache_hits"].sum() == ga_instance.fitness_cache.hits
+    assert perf_stats["num_evaluations"].sum() == len(ga_instance.fitness_cache)
+
+def test_perf_stats_duplicates():
+    ga_instance = create_ga(gene_space=range(10),
+                            allow_duplicate_genes=False)
+    ga_instance.run()
+    assert ga_instance.perf_stats["duplicates_ns"].sum() > 0
+
+def test_on_perf():
+    records = []
+    def on_perf(ga_instance, record):
+        records.append(record.copy())
+
+    def on_generation(ga_instance):
+        if ga_instance.generations_completed == 3:
+            return "stop"
+
+    ga_instance = create_ga(on_perf=on_perf,
+                            on_generation=on_generation)
+    ga_instance.run()
+    # The statistics of the generation at which the evolution stops are saved.
+    assert len(records) == 4
+    assert numpy.array_equal(numpy.array(records), ga_instance.perf_stats)
+    assert numpy.all(ga_instance.perf_stats["callbacks_ns"][1:] > 0)
+
+def test_perf_stats_disabled():
+    num_calls = 0
+    def on_perf(ga_instance, record):
+        nonlocal num_calls
+        num_calls += 1
+
+    ga_instance = create_ga(collect_perf_stats=False,
+                            on_perf=on_perf)
+    ga_instance.run()
+    assert len(ga_instance.perf_stats) == 0
+    assert num_calls == 0
+
+def test_perf_stats_invalid():
+    def on_perf(ga_instance):
+        pass
+
+    for kwargs in [{"collect_perf_stats": 1},
+                   {"on_perf": on_perf},
+                   {"on_perf": 5}]:
+        try:
+            create_ga(**kwargs)
+        except (TypeError, ValueError):
+            pass
+        else:
+            raise AssertionError(f"No exception raised for {kwargs}.")
+
+if __name__ == "__main__":
+    print()
+    test_perf_stats_rows()
+    print()
+    test_perf_stats_evaluations()
+    print()
+    test_perf_stats_cache_hits()
+    print()
+    test_perf_stats_duplicates()
+    print()
+    test_on_perf()
+    print()
+    test_perf_stats_disabled()
+    print()
+    test_perf_stats_invalid()
+    print()
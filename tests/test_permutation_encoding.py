@@ -0,0 +1,167 @@
+import pygad
+import numpy
+
+num_generations = 10
+sol_per_pop = 10
+num_parents_mating = 4
+num_genes = 12
+
+def fitness_func(ga_instance, solution, solution_idx):
+    # The number of genes in their sorted positions.
+    return numpy.sum(numpy.asarray(solution) == numpy.sort(solution))
+
+def create_ga(crossover_type="ox",
+              mutation_type="swap",
+              gene_space=None,
+              gene_type=int,
+              crossover_probability=None,
+              initial_population=None,
+              allow_duplicate_genes=True,
+              collect_perf_stats=False):
+    ga_instance = pygad.GA(num_generations=num_generations,
+                           sol_per_pop=sol_per_pop,
+                           num_genes=num_genes,
+                           num_parents_mating=num_parents_mating,
+                           fitness_func=fitness_func,
+                           gene_encoding="permutation",
+                           crossover_type=crossover_type,
+                           crossover_probability=crossover_probability,
+                           mutation_type=mutation_type,
+                           gene_space=gene_space,
+                           gene_type=gene_type,
+                           initial_population=initial_population,
+                           allow_duplicate_genes=allow_duplicate_genes,
+                           collect_perf_stats=collect_perf_stats,
+                           suppress_warnings=True,
+                           random_seed=1)
+    return ga_instance
+
+def is_permutation(solutions, values):
+    return numpy.all(numpy.sort(numpy.asarray(solutions, dtype=float), axis=1) == numpy.sort(values))
+
+def test_permutation_initial_population():
+    ga_instance = create_ga()
+    assert is_permutation(ga_instance.population, numpy.arange(num_genes))
+    assert len(numpy.unique(ga_instance.population, axis=0)) == sol_per_pop
+
+    gene_space = [0.5 * value for value in range(100, 100 + num_genes)]
+    ga_instance = create_ga(gene_space=gene_space,
+                            gene_type=[float, 1])
+    assert is_permutation(ga_instance.population, gene_space)
+
+def test_permutation_operators():
+    gene_space = list(range(100, 100 + 10 * num_genes, 10))
+    for crossover_type in pygad.GA.supported_permutation_crossover_types:
+        for mutation_type in pygad.GA.supported_permutation_mutation_types:
+            for crossover_probability in [None, 0.5]:
+                ga_instance = create_ga(crossover_type=crossover_type,
+                                        mutation_type=mutation_type,
+                                        gene_space=gene_space,
+                                        crossover_probability=crossover_probability)
+                ga_instance.run()
+                assert is_permutation(ga_instance.population, gene_space)
+                assert is_permutation(ga_instance.last_generation_offspring_crossover, gene_space)
+
+def test_cycle_crossover():
+    ga_instance = create_ga(crossover_type="cycle")
+    parents = numpy.array([[0, 1, 2, 3, 4, 5, 6, 7],
+                           [7, 2, 1, 0, 6, 5, 3, 4]])
+    offspring = ga_instance.cycle_crossover(parents, (2, 8))
+    # The cycles of the first offspring are {0, 3, 6, 7}, {1, 2}, {4}, and {5}.
+    assert numpy.array_equal(offspring[0], [0, 2, 1, 3, 4, 5, 6, 7])
+    assert numpy.array_equal(offspring[1], [7, 1, 2, 0, 6, 5, 3, 4])
+
+def test_ox_pmx_crossover_segment():
+    ga_instance = create_ga()
+    parents = ga_instance.population[:2]
+    for crossover in [ga_instance.ox_crossover, ga_instance.pmx_crossover]:
+        numpy.random.seed(3)
+        offspring = crossover(parents, (200, num_genes))
+        numpy.random.seed(3)
+        segments_starts, segments_ends, in_segment = ga_instance.permutation_segments((200, num_genes))
+        # The segment is copied from the first parent.
+        assert numpy.all(numpy.where(in_segment, offspring, 0) == numpy.where(in_segment, parents[numpy.arange(200) % 2], 0))
+        assert is_permutation(offspring, numpy.arange(num_genes))
+
+    # Order crossover: the genes outside the segment keep their order in the second parent.
+    numpy.random.seed(3)
+    offspring = ga_instance.ox_crossover(parents, (2, num_genes))
+    numpy.random.seed(3)
+    segments_starts, segments_ends, in_segment = ga_instance.permutation_segments((2, num_genes))
+    rotated_indices = (segments_ends[0, 0] + numpy.arange(num_genes)) % num_genes
+    outside = [gene for gene in offspring[0][rotated_indices] if not gene in offspring[0][in_segment[0]]]
+    assert outside == [gene for gene in parents[1][rotated_indices] if not gene in offspring[0][in_segment[0]]]
+
+def test_edge_crossover():
+    ga_instance = create_ga(crossover_type="edge")
+    parents = ga_instance.population[:2]
+    offspring = ga_instance.edge_crossover(parents, (100, num_genes))
+    assert is_permutation(offspring, numpy.arange(num_genes))
+    # The offspring starts with the first gene of its first parent.
+    assert numpy.all(offspring[:, 0] == parents[numpy.arange(100) % 2, 0])
+
+    def edges(tour):
+        return {frozenset([tour[idx], tour[(idx + 1) % num_genes]]) for idx in range(num_genes)}
+    # Mating a parent with itself gives the same tour (or its reverse).
+    offspring = ga_instance.edge_crossover(parents[:1], (10, num_genes))
+    for solution in offspring:
+        assert edges(solution) == edges(parents[0])
+
+def test_permutation_no_duplicates_repair():
+    ga_instance = create_ga(allow_duplicate_genes=False,
+                            collect_perf_stats=True)
+    ga_instance.run()
+    assert is_permutation(ga_instance.population, numpy.arange(num_genes))
+    assert ga_instance.perf_stats["duplicates_ns"].sum() == 0
+
+def test_permutation_invalid():
+    def gene_constraint(solution, values):
+        return values
+
+    for kwargs in [{"crossover_type": "single_point"},
+                   {"mutation_type": "random"},
+                   {"gene_space": [[0, 1]] * num_genes},
+                   {"gene_space": list(range(num_genes - 1)) + [0]},
+                   {"gene_space": list(range(num_genes + 1))},
+                   {"gene_type": [int] * num_genes},
+                   {"initial_population": [[0] * num_genes] * sol_per_pop}]:
+        try:
+            create_ga(**kwargs)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"No exception raised for {kwargs}.")
+
+    for kwargs in [{"gene_encoding": "binary"},
+                   {"gene_encoding": "permutation", "gene_constraint": [gene_constraint] * num_genes},
+                   {"crossover_type": "ox"}]:
+        try:
+            pygad.GA(num_generations=num_generations,
+                     sol_per_pop=sol_per_pop,
+                     num_genes=num_genes,
+                     num_parents_mating=num_parents_mating,
+                     fitness_func=fitness_func,
+                     mutation_type="swap",
+                     suppress_warnings=True,
+                     **kwargs)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"No exception raised for {kwargs}.")
+
+if __name__ == "__main__":
+    print()
+    test_permutation_initial_population()
+    print()
+    test_permutation_operators()
+    print()
+    test_cycle_crossover()
+    print()
+    test_ox_pmx_crossover_segment()
+    print()
+    test_edge_crossover()
+    print()
+    test_permutation_no_duplicates_repair()
+    print()
+    test_permutation_invalid()
+    print()
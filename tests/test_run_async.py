@@ -0,0 +1,160 @@
+import pygad
+import numpy
+import asyncio
+
+num_generations = 10
+sol_per_pop = 10
+num_parents_mating = 5
+
+def fitness_func(ga_instance, solution, solution_idx):
+    return numpy.sum(solution)
+
+async def fitness_func_async(ga_instance, solution, solution_idx):
+    await asyncio.sleep(0)
+    return numpy.sum(solution)
+
+async def fitness_func_async_batch(ga_instance, solutions, solutions_indices):
+    await asyncio.sleep(0)
+    return numpy.sum(solutions, axis=1)
+
+def create_ga(fitness_function=fitness_func_async,
+              fitness_batch_size=None,
+              on_generation=None):
+    ga_instance = pygad.GA(num_generations=num_generations,
+                           sol_per_pop=sol_per_pop,
+                           num_genes=4,
+                           num_parents_mating=num_parents_mating,
+                           fitness_func=fitness_function,
+                           fitness_batch_size=fitness_batch_size,
+                           on_generation=on_generation,
+                           suppress_warnings=True,
+                           random_seed=1)
+    return ga_instance
+
+def test_run_async_same_as_run():
+    ga_run = create_ga(fitness_function=fitness_func)
+    ga_run.run()
+
+    ga_async = create_ga()
+    asyncio.run(ga_async.run_async())
+
+    assert ga_async.run_completed
+    assert ga_async.generations_completed == num_generations
+    assert numpy.array_equal(ga_async.population, ga_run.population)
+    assert numpy.array_equal(ga_async.last_generation_fitness, ga_run.last_generation_fitness)
+    assert numpy.array_equal(numpy.array(ga_async.best_solutions_fitness), numpy.array(ga_run.best_solutions_fitness))
+
+def test_run_async_batch():
+    for fitness_batch_size in [3, "population"]:
+        ga_instance = create_ga(fitness_function=fitness_func_async_batch,
+                                fitness_batch_size=fitness_batch_size)
+        asyncio.run(ga_instance.run_async())
+        assert numpy.allclose(ga_instance.last_generation_fitness, numpy.sum(ga_instance.population, axis=1))
+
+def test_run_async_max_concurrency():
+    for max_concurrency, expected_in_flight in [(3, 3), (None, sol_per_pop)]:
+        in_flight = 0
+        max_in_flight = 0
+        async def fitness_func_count(ga_instance, solution, solution_idx):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+            return numpy.sum(solution)
+
+        ga_instance = create_ga(fitness_function=fitness_func_count)
+        asyncio.run(ga_instance.run_async(max_concurrency=max_concurrency))
+        assert max_in_flight == expected_in_flight
+
+def test_run_async_timeout():
+    async def fitness_func_slow(ga_instance, solution, solution_idx):
+        if solution_idx == 1:
+            await asyncio.sleep(10)
+        return 1.0
+
+    ga_instance = create_ga(fitness_function=fitness_func_slow)
+    asyncio.run(ga_instance.run_async(timeout=0.01, timeout_fitness=-1.0))
+    assert ga_instance.last_generation_fitness[1] == -1.0
+
+    ga_instance = create_ga(fitness_function=fitness_func_slow)
+    try:
+        asyncio.run(ga_instance.run_async(timeout=0.01))
+    except asyncio.TimeoutError:
+        pass
+    else:
+        raise AssertionError("No exception raised when an evaluation times out without timeout_fitness.")
+
+def test_run_async_cancel_on_failure():
+    cancelled = 0
+    async def fitness_func_fail(ga_instance, solution, solution_idx):
+        nonlocal cancelled
+        if solution_idx == 0:
+            raise ValueError("Evaluation failed.")
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled += 1
+            raise
+        return 1.0
+
+    ga_instance = create_ga(fitness_function=fitness_func_fail)
+    try:
+        asyncio.run(ga_instance.run_async())
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("No exception raised when an evaluation fails.")
+    assert cancelled == sol_per_pop - 1
+
+def test_run_async_on_generation_stop():
+    num_calls = 0
+    async def fitness_func_count(ga_instance, solution, solution_idx):
+        nonlocal num_calls
+        num_calls += 1
+        return numpy.sum(solution)
+
+    def on_generation(ga_instance):
+        if ga_instance.generations_completed == 3:
+            return "stop"
+
+    # keep_elitism=1 reuses the fitness of a single solution in each generation.
+    ga_instance = create_ga(fitness_function=fitness_func_count,
+                            on_generation=on_generation)
+    asyncio.run(ga_instance.run_async())
+    assert ga_instance.generations_completed == 3
+    assert num_calls == sol_per_pop + 3 * (sol_per_pop - 1)
+
+def test_run_async_invalid():
+    ga_instance = create_ga()
+    try:
+        ga_instance.run()
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("No exception raised when run() is used with an async fitness function.")
+
+    ga_instance = create_ga(fitness_function=fitness_func)
+    try:
+        asyncio.run(ga_instance.run_async())
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("No exception raised when run_async() is used with a regular fitness function.")
+
+if __name__ == "__main__":
+    print()
+    test_run_async_same_as_run()
+    print()
+    test_run_async_batch()
+    print()
+    test_run_async_max_concurrency()
+    print()
+    test_run_async_timeout()
+    print()
+    test_run_async_cancel_on_failure()
+    print()
+    test_run_async_on_generation_stop()
+    print()
+    test_run_async_invalid()
+    print()
@@ -0,0 +1,168 @@
+import pygad
+import numpy
+import threading
+import time
+
+num_generations = 10
+sol_per_pop = 10
+num_parents_mating = 4
+
+def fitness_func(ga_instance, solution, solution_idx):
+    return -numpy.sum((solution - 1) ** 2)
+
+def fitness_func_multi(ga_instance, solution, solution_idx):
+    return [-numpy.sum((solution - 1) ** 2), -numpy.sum((solution + 1) ** 2)]
+
+def fitness_func_batch(ga_instance, solutions, solutions_indices):
+    return [-numpy.sum((solution - 1) ** 2) for solution in solutions]
+
+def fitness_func_population(ga_instance, solutions, solutions_indices):
+    return -numpy.sum((solutions - 1) ** 2, axis=1)
+
+def create_ga(fitness_function=fitness_func,
+              parent_selection_type="sss",
+              parallel_processing=None,
+              keep_elitism=1,
+              stop_criteria=None,
+              on_generation=None,
+              fitness_batch_size=None):
+    ga_instance = pygad.GA(num_generations=num_generations,
+                           sol_per_pop=sol_per_pop,
+                           num_genes=4,
+                           num_parents_mating=num_parents_mating,
+                           fitness_func=fitness_function,
+                           parent_selection_type=parent_selection_type,
+                           parallel_processing=parallel_processing,
+                           keep_elitism=keep_elitism,
+                           stop_criteria=stop_criteria,
+                           on_generation=on_generation,
+                           fitness_batch_size=fitness_batch_size,
+                           suppress_warnings=True,
+                           random_seed=1)
+    return ga_instance
+
+def test_steady_state_evaluations():
+    num_calls = 0
+    def fitness_func_count(ga_instance, solution, solution_idx):
+        nonlocal num_calls
+        num_calls += 1
+        return fitness_func(ga_instance, solution, solution_idx)
+
+    ga_instance = create_ga(fitness_function=fitness_func_count)
+    ga_instance.run_steady_state()
+    num_offspring = sol_per_pop - 1
+    assert ga_instance.evaluations_completed == num_generations * num_offspring
+    assert ga_instance.generations_completed == num_generations
+    assert num_calls == sol_per_pop + num_generations * num_offspring
+    assert len(ga_instance.best_solutions_fitness) == num_generations + 1
+    assert ga_instance.run_completed
+    assert numpy.allclose(ga_instance.last_generation_fitness, [fitness_func(ga_instance, solution, None) for solution in ga_instance.population])
+
+    ga_instance.run_steady_state(num_evaluations=5)
+    assert ga_instance.evaluations_completed == num_generations * num_offspring + 5
+
+def test_steady_state_replace_worst():
+    ga_instance = create_ga()
+    ga_instance.run_steady_state(replacement="worst")
+    # Replacing the worst solution never loses the best solution.
+    assert numpy.all(numpy.diff(ga_instance.best_solutions_fitness) >= 0)
+
+def test_steady_state_tournament_replacement():
+    ga_instance = create_ga(keep_elitism=2)
+    ga_instance.run_steady_state(replacement="tournament")
+    # The elitism is never replaced.
+    assert numpy.all(numpy.diff(ga_instance.best_solutions_fitness) >= 0)
+
+def test_steady_state_multi_objective():
+    ga_instance = create_ga(fitness_function=fitness_func_multi,
+                            parent_selection_type="nsga2")
+    ga_instance.run_steady_state()
+    assert ga_instance.last_generation_fitness.shape == (sol_per_pop, 2)
+    assert numpy.allclose(ga_instance.last_generation_fitness, [fitness_func_multi(ga_instance, solution, None) for solution in ga_instance.population])
+
+def test_steady_state_no_generational_barrier():
+    lock = threading.Lock()
+    in_flight = 0
+    max_in_flight = 0
+    def fitness_func_slow(ga_instance, solution, solution_idx):
+        nonlocal in_flight, max_in_flight
+        with lock:
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+        # Heterogeneous evaluation times.
+        time.sleep(numpy.random.uniform(0.001, 0.005))
+        with lock:
+            in_flight -= 1
+        return fitness_func(ga_instance, solution, solution_idx)
+
+    ga_instance = create_ga(fitness_function=fitness_func_slow,
+                            parallel_processing=["thread", 3])
+    ga_instance.run_steady_state()
+    ga_instance.close()
+    assert max_in_flight == 3
+    assert ga_instance.evaluations_completed == num_generations * (sol_per_pop - 1)
+
+def test_steady_state_process():
+    ga_instance = create_ga(parallel_processing=["process", 2])
+    ga_instance.run_steady_state()
+    ga_instance.close()
+    assert ga_instance.ipc_stats["num_tasks"] >= ga_instance.evaluations_completed
+    assert numpy.allclose(ga_instance.last_generation_fitness, [fitness_func(ga_instance, solution, None) for solution in ga_instance.population])
+
+def test_steady_state_batch_fitness():
+    # Each offspring is passed to the batch fitness function as a batch of a single solution.
+    for fitness_function, fitness_batch_size in [(fitness_func_batch, 4),
+                                                 (fitness_func_population, "population")]:
+        for parallel_processing in [None, ["thread", 2]]:
+            ga_instance = create_ga(fitness_function=fitness_function,
+                                    fitness_batch_size=fitness_batch_size,
+                                    parallel_processing=parallel_processing)
+            ga_instance.run_steady_state()
+            ga_instance.close()
+            assert ga_instance.evaluations_completed == num_generations * (sol_per_pop - 1)
+            assert numpy.allclose(ga_instance.last_generation_fitness, [fitness_func(ga_instance, solution, None) for solution in ga_instance.population])
+
+def test_steady_state_stop():
+    ga_instance = create_ga(stop_criteria="reach_-0.5")
+    ga_instance.run_steady_state(num_evaluations=10000)
+    assert ga_instance.evaluations_completed < 10000
+    assert max(ga_instance.last_generation_fitness) >= -0.5
+
+    def on_generation(ga_instance):
+        if ga_instance.generations_completed == 3:
+            return "stop"
+
+    ga_instance = create_ga(on_generation=on_generation)
+    ga_instance.run_steady_state()
+    assert ga_instance.generations_completed == 3
+    assert ga_instance.evaluations_completed == 3 * (sol_per_pop - 1)
+
+def test_steady_state_invalid_replacement():
+    ga_instance = create_ga()
+    try:
+        ga_instance.run_steady_state(replacement="random")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("No exception raised for replacement='random'.")
+
+if __name__ == "__main__":
+    print()
+    test_steady_state_evaluations()
+    print()
+    test_steady_state_replace_worst()
+    print()
+    test_steady_state_tournament_replacement()
+    print()
+    test_steady_state_multi_objective()
+    print()
+    test_steady_state_no_generational_barrier()
+    print()
+    test_steady_state_process()
+    print()
+    test_steady_state_batch_fitness()
+    print()
+    test_steady_state_stop()
+    print()
+    test_steady_state_invalid_replacement()
+    print()
@@ -0,0 +1,132 @@
+import pygad
+import numpy
+
+num_generations = 20
+sol_per_pop = 10
+num_parents_mating = 5
+
+def fitness_func_single(ga_instance, solutions, solutions_indices):
+    return numpy.sum(solutions, axis=1)
+
+def fitness_func_multi(ga_instance, solutions, solutions_indices):
+    return numpy.column_stack((numpy.sum(solutions, axis=1), -numpy.sum(numpy.abs(solutions), axis=1)))
+
+def fitness_func_wrong_shape(ga_instance, solutions, solutions_indices):
+    return numpy.sum(solutions)
+
+def fitness_func_wrong_length(ga_instance, solutions, solutions_indices):
+    return numpy.sum(solutions, axis=1)[:-1]
+
+def vectorized_ga(fitness_function=fitness_func_single,
+                  mutation_type="random",
+                  parent_selection_type="sss",
+                  keep_elitism=1,
+                  fitness_cache_size=None,
+                  gene_space=None):
+    ga_instance = pygad.GA(num_generations=num_generations,
+                           sol_per_pop=sol_per_pop,
+                           num_genes=4,
+                           num_parents_mating=num_parents_mating,
+                           fitness_func=fitness_function,
+                           fitness_batch_size="population",
+                           mutation_type=mutation_type,
+                           mutation_num_genes=[3, 1] if mutation_type == "adaptive" else None,
+                           parent_selection_type=parent_selection_type,
+                           keep_elitism=keep_elitism,
+                           fitness_cache_size=fitness_cache_size,
+                           gene_space=gene_space,
+                           gene_type=int if gene_space is not None else float,
+                           suppress_warnings=True,
+                           random_seed=1)
+    return ga_instance
+
+def test_vectorized_single_objective():
+    ga_instance = vectorized_ga()
+    ga_instance.run()
+    assert isinstance(ga_instance.last_generation_fitness, numpy.ndarray)
+    assert ga_instance.last_generation_fitness.shape == (sol_per_pop,)
+    assert numpy.allclose(ga_instance.last_generation_fitness, numpy.sum(ga_instance.population, axis=1))
+
+def test_vectorized_multi_objective():
+    ga_instance = vectorized_ga(fitness_function=fitness_func_multi,
+                                parent_selection_type="nsga2")
+    ga_instance.run()
+    assert ga_instance.last_generation_fitness.shape == (sol_per_pop, 2)
+    assert numpy.allclose(ga_instance.last_generation_fitness, fitness_func_multi(ga_instance, ga_instance.population, None))
+
+def test_vectorized_one_call_per_generation():
+    num_calls = 0
+    def fitness_func_count(ga_instance, solutions, solutions_indices):
+        nonlocal num_calls
+        num_calls += 1
+        assert solutions.ndim == 2
+        assert len(solutions) == len(solutions_indices)
+        return numpy.sum(solutions, axis=1)
+
+    ga_instance = vectorized_ga(fitness_function=fitness_func_count)
+    ga_instance.run()
+    assert num_calls == num_generations + 1
+
+def test_vectorized_only_unknown_solutions():
+    passed_solutions = []
+    def fitness_func_record(ga_instance, solutions, solutions_indices):
+        passed_solutions.extend([solution.copy() for solution in solutions])
+        assert numpy.array_equal(solutions, ga_instance.population[solutions_indices])
+        return numpy.sum(solutions, axis=1)
+
+    # 3**4=81 possible solutions.
+    ga_instance = vectorized_ga(fitness_function=fitness_func_record,
+                                fitness_cache_size=100,
+                                gene_space=[0, 1, 2])
+    ga_instance.run()
+    # Each solution is passed to the fitness function only once.
+    keys = [pygad.helper.fitness_cache.FitnessCache.key(solution) for solution in passed_solutions]
+    assert len(keys) == len(set(keys))
+    assert len(keys) == len(ga_instance.fitness_cache)
+    assert numpy.allclose(ga_instance.last_generation_fitness, numpy.sum(ga_instance.population, axis=1))
+
+def test_vectorized_adaptive_mutation():
+    ga_instance = vectorized_ga(mutation_type="adaptive")
+    ga_instance.run()
+    assert numpy.allclose(ga_instance.last_generation_fitness, numpy.sum(ga_instance.population, axis=1))
+
+def test_vectorized_invalid_output():
+    for fitness_function in [fitness_func_wrong_shape, fitness_func_wrong_length]:
+        ga_instance = vectorized_ga(fitness_function=fitness_function)
+        try:
+            ga_instance.run()
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"No exception raised for the fitness function {fitness_function.__name__}.")
+
+def test_vectorized_invalid_batch_size():
+    try:
+        pygad.GA(num_generations=1,
+                 sol_per_pop=sol_per_pop,
+                 num_genes=4,
+                 num_parents_mating=num_parents_mating,
+                 fitness_func=fitness_func_single,
+                 fitness_batch_size="all",
+                 suppress_warnings=True)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("No exception raised for fitness_batch_size='all'.")
+
+if __name__ == "__main__":
+    print()
+    test_vectorized_single_objective()
+    print()
+    test_vectorized_multi_objective()
+    print()
+    test_vectorized_one_call_per_generation()
+    print()
+    test_vectorized_only_unknown_solutions()
+    print()
+    test_vectorized_adaptive_mutation()
+    print()
+    test_vectorized_invalid_output()
+    print()
+    test_vectorized_invalid_batch_size()
+    print()